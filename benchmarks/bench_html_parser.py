@@ -0,0 +1,121 @@
+# ------------------------------------------------------------------
+# 작성자 : 최준혁
+# 작성일 : 2026-10-18
+# 기능 : HTML 파서 백엔드(html.parser / lxml) 및 영역 한정 파싱 비용 비교 벤치마크
+# ------------------------------------------------------------------
+# 사용법 (저장소 루트에서):
+#   python benchmarks/bench_html_parser.py
+#
+# 측정 대상 페이지:
+#   1) benchmarks/pages/*.html (직접 저장한 기사 페이지)
+#   2) benchmarks/cassettes/*.json 에 기록된 text/html 응답
+#   3) 둘 다 없으면 300KB 내외의 합성 포털 페이지
+# ------------------------------------------------------------------
+import os
+import sys
+import json
+import glob
+import time
+import base64
+import argparse
+import statistics
+from importlib.util import find_spec
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT_DIR = os.path.dirname(BENCH_DIR)
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+from news.src.utils.html_parser import parse_html  # noqa: E402
+
+# (라벨, only 인자) - only=None 은 전체 파싱
+SCOPES = [
+    ("full", None),
+    ("article", ["h1", "h2", "article"]),
+    ("naver_cp", ["h2.media_end_head_headline", "article#dic_area"]),
+]
+
+
+def _load_pages() -> list:
+    pages = []
+    for path in sorted(glob.glob(os.path.join(BENCH_DIR, "pages", "*.html"))):
+        with open(path, "r", encoding="utf-8", errors="ignore") as f:
+            pages.append((os.path.basename(path), f.read()))
+
+    for path in sorted(glob.glob(os.path.join(BENCH_DIR, "cassettes", "*.json"))):
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except Exception:
+            continue
+        for key, entries in (data.get("interactions") or {}).items():
+            for idx, entry in enumerate(entries):
+                ctype = (entry.get("headers") or {}).get("Content-Type", "") or ""
+                if "html" not in ctype.lower():
+                    continue
+                body = base64.b64decode(entry.get("body_b64") or "")
+                if len(body) < 10_000:
+                    continue
+                encoding = entry.get("encoding") or "utf-8"
+                pages.append((f"{os.path.basename(path)}#{idx}", body.decode(encoding, errors="ignore")))
+
+    if not pages:
+        blocks = "".join(
+            f'<div class="news_item"><a href="/article/{i}">관련 기사 제목 {i}</a>'
+            f'<p class="desc">요약 문단 {i} 입니다. 포털 페이지의 목록/광고/댓글 영역을 흉내낸 텍스트.</p>'
+            f'<ul><li>공유</li><li>댓글 {i}</li></ul></div>'
+            for i in range(1800)
+        )
+        html = (
+            "<html><head><title>합성 페이지</title><meta property='og:title' content='합성 페이지'></head><body>"
+            f"<div id='header'>{blocks[:len(blocks) // 2]}</div>"
+            "<h2 class='media_end_head_headline'>기사 제목</h2>"
+            "<article id='dic_area'>" + "본문 문장입니다. " * 400 + "</article>"
+            f"<div id='footer'>{blocks[len(blocks) // 2:]}</div></body></html>"
+        )
+        pages.append(("synthetic", html))
+    return pages
+
+
+def _time(fn, iterations: int) -> float:
+    samples = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - started)
+    return statistics.median(samples)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="HTML 파서 백엔드/영역 한정 파싱 벤치마크")
+    parser.add_argument("--iterations", type=int, default=5, help="페이지별 반복 횟수 (기본 5)")
+    args = parser.parse_args(argv)
+
+    backends = ["html.parser"]
+    if find_spec("lxml") is not None:
+        backends.append("lxml")
+    else:
+        print("[알림] lxml 미설치 - html.parser만 측정합니다.")
+
+    pages = _load_pages()
+    print(f"{'page':<32} {'KB':>6} " + " ".join(f"{b[:6]}/{label:<8}" for b in backends for label, _ in SCOPES))
+    totals = {}
+    for name, html in pages:
+        cells = []
+        for backend in backends:
+            for label, only in SCOPES:
+                ms = _time(lambda: parse_html(html, only=only, parser=backend), args.iterations) * 1000
+                totals.setdefault((backend, label), []).append(ms)
+                cells.append(f"{ms:>15.1f}")
+        print(f"{name[:32]:<32} {len(html) // 1024:>6} " + " ".join(cells))
+
+    base = statistics.mean(totals[("html.parser", "full")])
+    print("\n평균 (ms, html.parser 전체 파싱 대비 배속)")
+    for (backend, label), values in totals.items():
+        avg = statistics.mean(values)
+        print(f"  {backend:<12} {label:<9} {avg:>8.1f}ms  x{base / avg:.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
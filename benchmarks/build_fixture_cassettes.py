@@ -0,0 +1,170 @@
+# ------------------------------------------------------------------
+# 작성자 : 최준혁
+# 작성일 : 2026-10-18
+# 기능 : 저장소에 포함하는 벤치마크용 고정(fixture) 카세트 생성
+# ------------------------------------------------------------------
+# 실제 사이트를 --record 로 기록한 카세트는 응답 내용이 날마다 달라지고 외부 기사 원문을 포함하므로
+# 저장소에는 합성 응답으로 만든 카세트를 넣는다. 요청 키(메서드 + URL + 본문)는 실제 호출과 같다.
+#
+# - 기사 페이지: benchmarks/fixtures/*.html (네이버 뉴스 / 일반 언론사 / iframe 본문 구조)
+# - 기사 URL: benchmarks/article_urls.txt 와 아래 ARTICLE_PAGES 가 일치해야 재생 시 누락이 없다
+# - 시세/목록 API: 실제 응답과 같은 형태의 JSON/HTML 을 고정 시드로 생성
+#
+# 사용법 (저장소 루트에서):
+#   python benchmarks/build_fixture_cassettes.py
+#   python benchmarks/run_benchmarks.py --update-baseline
+# ------------------------------------------------------------------
+import os
+import sys
+import json
+import random
+from datetime import datetime, timedelta
+
+import requests
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT_DIR = os.path.dirname(BENCH_DIR)
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+from news.src.utils.http_cassette import Cassette  # noqa: E402
+
+FIXTURE_DIR = os.path.join(BENCH_DIR, "fixtures")
+CASSETTE_DIR = os.path.join(BENCH_DIR, "cassettes")
+
+# 기사 URL → 응답 HTML 파일 (iframe 본문 URL 포함)
+ARTICLE_PAGES = {
+    "https://n.news.naver.com/mnews/article/001/0015000001": "naver_news.html",
+    "https://www.example-economy.co.kr/news/articleView.html?idxno=100001": "press_article.html",
+    "https://www.example-daily.co.kr/news/view.php?no=200001": "iframe_outer.html",
+    "https://www.example-daily.co.kr/news/proc_view_body.php?no=200001": "iframe_body.html",
+}
+
+MINUTE_STOCK_CODE = "005930"
+MINUTE_COUNT = 1200
+TOSS_PRODUCTS = 100
+KRX_ROWS = 15
+
+
+def _response(request: requests.PreparedRequest, body: bytes, content_type: str,
+              encoding: str = "utf-8") -> requests.Response:
+    response = requests.Response()
+    response.status_code = 200
+    response.reason = "OK"
+    response.url = request.url
+    response.headers["Content-Type"] = content_type
+    response.encoding = encoding
+    response._content = body
+    return response
+
+
+def _add(cassette: Cassette, method: str, url: str, body: bytes, content_type: str, **request_kwargs):
+    request = requests.Request(method, url, **request_kwargs).prepare()
+    cassette.append(request, _response(request, body, content_type))
+
+
+def _html(name: str) -> bytes:
+    with open(os.path.join(FIXTURE_DIR, name), "rb") as f:
+        return f.read()
+
+
+def _article_cassette(path: str):
+    cassette = Cassette(path, mode="record")
+    for url, name in ARTICLE_PAGES.items():
+        _add(cassette, "GET", url, _html(name), "text/html; charset=UTF-8")
+    cassette.save()
+
+
+def _minute_cassette(path: str, rng: random.Random):
+    # siseJson.naver 응답: 머리행 + [일시, 시가, 고가, 저가, 종가, 거래량, 외국인소진율] (작은따옴표 리스트 텍스트)
+    rows = ["['날짜', '시가', '고가', '저가', '종가', '거래량', '외국인소진율']"]
+    start = datetime(2026, 10, 16, 9, 0)
+    price = 71000
+    for i in range(MINUTE_COUNT):
+        ts = start + timedelta(minutes=i % 390, days=i // 390)
+        o = price
+        c = max(1000, o + rng.choice((-200, -100, 0, 0, 100, 200)))
+        rows.append(f"[\"{ts:%Y%m%d%H%M}\", {o}, {max(o, c) + 100}, {min(o, c) - 100}, {c}, {rng.randint(1000, 90000)}, null]")
+        price = c
+    body = ("[\n" + ",\n".join(rows) + "\n]").encode("utf-8")
+    url = (
+        "https://api.finance.naver.com/siseJson.naver?"
+        f"symbol={MINUTE_STOCK_CODE}&requestType=0&count={MINUTE_COUNT}&timeframe=minute"
+    )
+    cassette = Cassette(path, mode="record")
+    _add(cassette, "GET", url, body, "text/plain; charset=UTF-8")
+    cassette.save()
+
+
+def _toss_cassette(path: str, rng: random.Random):
+    from news.src.services.toss_service import PAYLOAD
+
+    products, prices = [], []
+    for rank in range(1, TOSS_PRODUCTS + 1):
+        if rank % 3 == 0:
+            code = f"US{20200000000 + rank}"
+        else:
+            code = f"A{100000 + rank * 7:06d}"
+        base = rng.randint(2000, 300000)
+        close = round(base * (1 + rng.uniform(-0.15, 0.3)))
+        products.append({"productCode": code, "name": f"종목{rank}", "rank": rank})
+        prices.append({
+            "productCode": code, "base": base, "close": close, "closeKrw": close,
+            "changeType": "UP" if close > base else ("DOWN" if close < base else "FLAT"),
+        })
+
+    cassette = Cassette(path, mode="record")
+    ranking_url = "https://wts-cert-api.tossinvest.com/api/v2/dashboard/wts/overview/ranking"
+    ranking = json.dumps({"result": {"products": products}}, ensure_ascii=False).encode("utf-8")
+    _add(cassette, "POST", ranking_url, ranking, "application/json", json=PAYLOAD)
+
+    codes_str = "%2C".join(p["productCode"] for p in products)
+    price_url = f"https://wts-info-api.tossinvest.com/api/v3/stock-prices?meta=true&productCodes={codes_str}"
+    _add(cassette, "GET", price_url, json.dumps({"result": prices}).encode("utf-8"), "application/json")
+    cassette.save()
+
+
+def _krx_cassette(path: str):
+    # domestic_list.main_process 와 같은 요청 (초기 페이지 GET → 목록 POST)
+    entry_url = "https://kind.krx.co.kr/corpgeneral/corpList.do?method=loadInitPage&marketType=stockMkt"
+    base_url = "https://kind.krx.co.kr/corpgeneral/corpList.do"
+    payload = {
+        'method': 'searchCorpList', 'pageIndex': '1', 'currentPageSize': '15', 'comAbbrv': '',
+        'beginIndex': '', 'orderMode': '3', 'orderStat': 'D', 'isurCd': '', 'repIsuSrtCd': '',
+        'searchCodeType': '', 'marketType': '', 'searchType': '13', 'industry': '',
+        'fiscalYearEnd': 'all', 'comAbbrvTmp': '', 'location': 'all',
+    }
+    rows = "".join(
+        f"<tr><td class='first'><a href='#' title='예시기업{i}' onclick=\"companysummary_open('{400000 + i * 11:06d}');return false;\">예시기업{i}</a></td>"
+        f"<td>제조업</td><td>전자부품</td><td>2026-10-{18 - i % 10:02d}</td><td>12월</td><td>대표{i}</td><td>-</td><td>서울</td></tr>"
+        for i in range(KRX_ROWS)
+    )
+    listing = (
+        "<html><body><table class='list type-00 mt10'><thead><tr><th>회사명</th><th>업종</th><th>주요제품</th>"
+        f"<th>상장일</th></tr></thead><tbody>{rows}</tbody></table></body></html>"
+    ).encode("utf-8")
+
+    cassette = Cassette(path, mode="record")
+    _add(cassette, "GET", entry_url, b"<html><body>KIND</body></html>", "text/html; charset=UTF-8")
+    _add(cassette, "POST", base_url, listing, "text/html; charset=UTF-8", data=payload)
+    cassette.save()
+
+
+def main() -> int:
+    os.makedirs(CASSETTE_DIR, exist_ok=True)
+    rng = random.Random(20261018)
+
+    def out(name):
+        return os.path.join(CASSETTE_DIR, f"{name}.json")
+
+    _article_cassette(out("extract_article_content"))
+    _article_cassette(out("extract_publish_datetime"))
+    _minute_cassette(out("fetch_naver_minute_df"), rng)
+    _toss_cassette(out("get_toss_stock_data"), rng)
+    _krx_cassette(out("domestic_list_main_process"))
+    print(f"고정 카세트 생성 완료: {CASSETTE_DIR}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,262 @@
+# ------------------------------------------------------------------
+# 작성자 : 최준혁
+# 작성일 : 2026-10-18
+# 기능 : 뉴스 파이프라인 오프라인 벤치마크 (HTTP 카세트 재생 기반)
+# ------------------------------------------------------------------
+# 사용법 (저장소 루트에서):
+#   1) 변경마다 재생 모드로 측정 → p95가 기준 대비 --threshold 이상 느려지면 종료 코드 1
+#        python benchmarks/run_benchmarks.py
+#   2) 측정 환경이 바뀌면 기준값(baseline) 다시 저장
+#        python benchmarks/run_benchmarks.py --update-baseline
+#   3) (선택) 실제 사이트 응답으로 카세트 교체
+#        python benchmarks/run_benchmarks.py --record
+#
+# - 카세트: benchmarks/cassettes/<case>.json (저장소에는 build_fixture_cassettes.py 로 만든 고정 카세트 포함)
+# - 기준값: benchmarks/baseline.json (케이스별 p50/p95, 초 단위)
+# - 기사 URL 목록: benchmarks/article_urls.txt (extract_article_content / extract_publish_datetime 용)
+# - 재생 중에는 호스트별 속도 제한을 끄고 추출기 통계/상투 문구 학습을 파일에 쓰지 않는다
+#   (추출기 순서도 기본 순서로 고정 → 반복마다 같은 작업량)
+# - 카세트나 기준값이 없는 케이스, 재생 누락(miss)이 있는 케이스는 실패로 보고 종료 코드 1
+# ------------------------------------------------------------------
+import os
+import sys
+import json
+import math
+import time
+import argparse
+import contextlib
+import statistics
+from urllib.parse import urlsplit
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT_DIR = os.path.dirname(BENCH_DIR)
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+from news.src.utils.http_cassette import use_cassette  # noqa: E402
+
+CASSETTE_DIR = os.path.join(BENCH_DIR, "cassettes")
+BASELINE_PATH = os.path.join(BENCH_DIR, "baseline.json")
+ARTICLE_URLS_PATH = os.path.join(BENCH_DIR, "article_urls.txt")
+
+# 분봉 조회 대상 종목 코드 (삼성전자)
+MINUTE_STOCK_CODE = "005930"
+
+
+def _read_article_urls() -> list:
+    if not os.path.exists(ARTICLE_URLS_PATH):
+        return []
+    with open(ARTICLE_URLS_PATH, "r", encoding="utf-8") as f:
+        return [line.strip() for line in f if line.strip() and not line.strip().startswith("#")]
+
+
+# ------------------------------------------------------------------
+# 벤치마크 케이스: 이름 → 1회 실행 함수
+# 각 함수는 케이스 내부의 모든 요청을 한 번씩 수행한다.
+# ------------------------------------------------------------------
+def _case_extract_article_content():
+    from news.src.utils.article_utils import extract_article_content
+    for url in _read_article_urls():
+        extract_article_content(url)
+
+
+def _case_extract_publish_datetime():
+    from news.src.utils.article_utils import extract_publish_datetime
+    for url in _read_article_urls():
+        extract_publish_datetime(url)
+
+
+def _case_fetch_naver_minute_df():
+    from news.src.utils.domestic_utils import _fetch_naver_minute_df
+    _fetch_naver_minute_df(MINUTE_STOCK_CODE, count=1200)
+
+
+def _case_get_toss_stock_data():
+    from news.src.services.toss_service import get_toss_stock_data
+    get_toss_stock_data()
+
+
+def _case_domestic_list_main_process():
+    from news.src.utils import domestic_list
+    domestic_list.main_process()
+
+
+CASES = {
+    "extract_article_content": _case_extract_article_content,
+    "extract_publish_datetime": _case_extract_publish_datetime,
+    "fetch_naver_minute_df": _case_fetch_naver_minute_df,
+    "get_toss_stock_data": _case_get_toss_stock_data,
+    "domestic_list_main_process": _case_domestic_list_main_process,
+}
+
+
+def _cassette_path(name: str) -> str:
+    return os.path.join(CASSETTE_DIR, f"{name}.json")
+
+
+def _percentile(samples: list, pct: float) -> float:
+    """
+    최근접 순위(nearest-rank) 방식 백분위수.
+    """
+    ordered = sorted(samples)
+    if not ordered:
+        return 0.0
+    rank = max(1, math.ceil(pct / 100.0 * len(ordered)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+def record_case(name: str) -> dict:
+    """
+    실제 네트워크로 케이스를 1회 실행하며 카세트를 새로 기록한다.
+    """
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        with use_cassette(_cassette_path(name), mode="record") as cassette:
+            CASES[name]()
+    return cassette.stats()
+
+
+def _cassette_hosts(path: str) -> set:
+    with open(path, "r", encoding="utf-8") as f:
+        keys = (json.load(f).get("interactions") or {}).keys()
+    hosts = set()
+    for key in keys:
+        parts = key.split(" ")
+        if len(parts) >= 2:
+            hosts.add((urlsplit(parts[1]).hostname or "").lower())
+    return hosts
+
+
+def _isolate_replay(hosts):
+    """
+    재생 측정이 네트워크 정책/디스크 기록에 좌우되지 않도록 설정
+    - 카세트 응답은 즉시 반환되므로 토큰 버킷 대기는 측정 왜곡만 만든다
+    """
+    from news.src.utils import http_client, extractor_stats, boilerplate
+
+    for host in set(hosts) | set(http_client.HOST_RATE_LIMITS):
+        http_client.set_rate_limit(host, 0)
+    extractor_stats.set_persist(False)
+    extractor_stats.EXTRACTOR_ADAPTIVE = False
+    boilerplate.set_persist(False)
+
+
+def run_case(name: str, iterations: int, warmup: int) -> dict:
+    """
+    카세트 재생 모드로 케이스를 반복 실행하고 소요 시간 통계를 반환한다.
+    :return: {"status": "ok"|"skip", "p50":..., "p95":..., "misses":...}
+    """
+    path = _cassette_path(name)
+    if not os.path.exists(path):
+        return {"status": "skip", "reason": "카세트 없음 (build_fixture_cassettes.py 또는 --record 로 생성)"}
+
+    _isolate_replay(_cassette_hosts(path))
+    samples = []
+    misses = 0
+    # 함수 내부 디버그 print가 측정에 섞이지 않도록 stdout을 버림
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        for i in range(warmup + iterations):
+            with use_cassette(path, mode="replay") as cassette:
+                started = time.perf_counter()
+                CASES[name]()
+                elapsed = time.perf_counter() - started
+            misses += len(cassette.misses)
+            if i >= warmup:
+                samples.append(elapsed)
+
+    return {
+        "status": "ok",
+        "iterations": iterations,
+        "p50": statistics.median(samples),
+        "p95": _percentile(samples, 95),
+        "max": max(samples),
+        "misses": misses,
+    }
+
+
+def _load_baseline() -> dict:
+    if not os.path.exists(BASELINE_PATH):
+        return {}
+    with open(BASELINE_PATH, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _save_baseline(results: dict):
+    data = {name: {"p50": r["p50"], "p95": r["p95"]} for name, r in results.items() if r.get("status") == "ok"}
+    with open(BASELINE_PATH, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="뉴스 파이프라인 오프라인 벤치마크")
+    parser.add_argument("--cases", default="", help=f"실행할 케이스(콤마 구분, 기본 전체): {', '.join(CASES)}")
+    parser.add_argument("--record", action="store_true", help="실제 네트워크로 카세트를 새로 기록")
+    parser.add_argument("--iterations", type=int, default=20, help="측정 반복 횟수 (기본 20)")
+    parser.add_argument("--warmup", type=int, default=2, help="측정 전 워밍업 횟수 (기본 2)")
+    parser.add_argument("--threshold", type=float, default=0.20, help="p95 허용 악화 비율 (기본 0.20 = 20%%)")
+    parser.add_argument("--update-baseline", action="store_true", help="이번 측정값을 기준값으로 저장")
+    args = parser.parse_args(argv)
+
+    names = [n.strip() for n in args.cases.split(",") if n.strip()] or list(CASES)
+    unknown = [n for n in names if n not in CASES]
+    if unknown:
+        print(f"알 수 없는 케이스: {', '.join(unknown)}")
+        return 2
+
+    if args.record:
+        for name in names:
+            try:
+                stats = record_case(name)
+                print(f"[record] {name}: {stats['recorded']}건 기록 → {_cassette_path(name)}")
+            except Exception as e:
+                print(f"[record] {name}: 실패 - {e}")
+        return 0
+
+    baseline = _load_baseline()
+    results = {}
+    regressions = []
+    failures = []
+    print(f"{'case':<28} {'p50(ms)':>10} {'p95(ms)':>10} {'base p95':>10} {'diff':>8}  note")
+    for name in names:
+        try:
+            r = run_case(name, args.iterations, args.warmup)
+        except Exception as e:
+            r = {"status": "error", "reason": str(e)}
+        results[name] = r
+        if r["status"] != "ok":
+            failures.append(name)
+            print(f"{name:<28} {'-':>10} {'-':>10} {'-':>10} {'-':>8}  {r['status']}: {r.get('reason', '')}")
+            continue
+
+        note = f"miss={r['misses']}" if r["misses"] else ""
+        if r["misses"]:
+            failures.append(name)
+        base = baseline.get(name)
+        if base and base.get("p95"):
+            diff = (r["p95"] - base["p95"]) / base["p95"]
+            if diff > args.threshold:
+                regressions.append(name)
+                note = (note + " REGRESSION").strip()
+            print(f"{name:<28} {r['p50']*1000:>10.2f} {r['p95']*1000:>10.2f} {base['p95']*1000:>10.2f} {diff:>+8.1%}  {note}")
+        else:
+            if not args.update_baseline:
+                failures.append(name)
+                note = (note + " 기준값 없음").strip()
+            print(f"{name:<28} {r['p50']*1000:>10.2f} {r['p95']*1000:>10.2f} {'-':>10} {'-':>8}  {note}")
+
+    if args.update_baseline:
+        _save_baseline(results)
+        print(f"기준값 저장: {BASELINE_PATH}")
+        return 0
+
+    if failures:
+        print(f"\n❌ 측정 불가 (카세트/기준값 없음 또는 재생 누락): {', '.join(dict.fromkeys(failures))}")
+    if regressions:
+        print(f"\n❌ p95 성능 저하 ({args.threshold:.0%} 초과): {', '.join(regressions)}")
+    if failures or regressions:
+        return 1
+    print("\n✅ 성능 저하 없음")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
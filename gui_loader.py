@@ -15,6 +15,7 @@ from news.src.components.weekly_stock_tab import WeeklyStockTab
 from news.src.components.hwan_tab import HwanTab
 from news.src.components.toss_tab import TossTab
 from news.src.components.settings_dialog import SettingsDialog
+from news.src.utils.task_pool import task_manager
 
 def get_env_path():
     """환경 설정 파일 경로를 반환합니다."""
@@ -117,6 +118,8 @@ class MainWindow(QMainWindow):
         self.status_label = QLabel("✅ 모든 기능이 준비되었습니다.")
         self.status_label.setAlignment(Qt.AlignCenter)
         bottom_layout.addWidget(self.status_label)
+        # 공용 작업 풀의 실행/대기 작업 수를 상태 메시지에 표시
+        task_manager().tasks_changed.connect(self.on_tasks_changed)
         
         # 제작자 정보 (오른쪽 정렬)
         creator_label = QLabel("© 2025 FromAI 최준혁")
@@ -129,6 +132,21 @@ class MainWindow(QMainWindow):
         # 메뉴바 설정
         self.init_menubar()
 
+    def on_tasks_changed(self, count: int):
+        """공용 작업 풀 상태 표시 (툴팁에 작업 목록)"""
+        if count:
+            tasks = task_manager().active()
+            self.status_label.setText(f"⏳ 진행 중인 작업 {count}개")
+            self.status_label.setToolTip("\n".join(f"{t['name']} ({t['state']}, {t['elapsed']}s)" for t in tasks))
+        else:
+            self.status_label.setText("✅ 모든 기능이 준비되었습니다.")
+            self.status_label.setToolTip("")
+
+    def closeEvent(self, event):
+        """종료 시 대기 작업 제거 + 실행 중 작업 취소 후 완료 대기"""
+        task_manager().drain()
+        super().closeEvent(event)
+
     def init_menubar(self):
         """메뉴바 초기화"""
         menubar = self.menuBar()
@@ -0,0 +1,445 @@
+# ------------------------------------------------------------------
+# 작성자 : 최준혁
+# 작성일 : 2026-10-18
+# 기능 : 주식/환율/주간 기사 파이프라인 헤드리스 배치 실행기 (QApplication 없이 동작)
+# ------------------------------------------------------------------
+# 사용 예 (저장소 루트에서 실행):
+#   python -m news.batch stock  --input list.txt
+#   python -m news.batch weekly --input list.txt --workers 2
+#   python -m news.batch fx     --input currencies.txt --aggregate
+#
+# - 입력 파일: 한 줄에 하나(또는 콤마 구분), '#'으로 시작하는 줄은 주석
+# - 진행 상황: stdout에 JSON Lines(한 줄에 이벤트 하나)로 출력
+#   라이브러리 내부 print 출력은 stderr로 돌려 stdout 파싱을 깨지 않도록 함
+# - 체크포인트: 항목별 결과를 JSON 파일에 기록, 재실행 시 성공/건너뜀 항목은 생략(실패 항목만 재시도)
+# - 동시성: --workers N (Selenium 드라이버를 항목마다 띄우므로 2~3 이하 권장), --delay 초 단위 제출 간격
+# - 종료 코드: 0 = 전부 성공/건너뜀, 1 = 실패 항목 존재, 2 = 입력/의존성 오류, 130 = 사용자 중단
+# ------------------------------------------------------------------
+import os
+import sys
+import json
+import time
+import argparse
+import threading
+import contextlib
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+from typing import Optional
+
+from news.src.utils import llm_scheduler
+
+MODES = ("stock", "fx", "weekly")
+
+# 체크포인트에서 재실행 시 건너뛸 상태
+_DONE_STATUSES = ("ok", "skipped")
+
+
+# ------------------------------------------------------------------
+# 작성자 : 최준혁
+# 작성일 : 2026-10-18
+# 기능 : JSON Lines 진행 이벤트 출력기 (스레드 안전)
+# ------------------------------------------------------------------
+class JsonlReporter:
+    def __init__(self, stream, mode: str):
+        self.stream = stream
+        self.mode = mode
+        self._lock = threading.Lock()
+
+    def emit(self, event: str, **fields):
+        """
+        이벤트 한 줄을 출력한다.
+        :param event: 이벤트 이름 (start, item_start, progress, step, item_done, done 등)
+        :param fields: 이벤트별 부가 필드
+        """
+        record = {"ts": datetime.now().isoformat(timespec="seconds"), "mode": self.mode, "event": event}
+        record.update(fields)
+        line = json.dumps(record, ensure_ascii=False, default=str)
+        with self._lock:
+            try:
+                self.stream.write(line + "\n")
+                self.stream.flush()
+            except Exception:
+                pass
+
+
+# ------------------------------------------------------------------
+# 작성자 : 최준혁
+# 작성일 : 2026-10-18
+# 기능 : 항목별 처리 결과를 기록하는 체크포인트 파일 관리
+# ------------------------------------------------------------------
+class Checkpoint:
+    def __init__(self, path: str, mode: str, resume: bool = True):
+        self.path = path
+        self.mode = mode
+        self._lock = threading.Lock()
+        self.items = {}
+        if resume:
+            self._load()
+
+    def _load(self):
+        try:
+            if not os.path.exists(self.path):
+                return
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("mode") == self.mode and isinstance(data.get("items"), dict):
+                self.items = data["items"]
+        except Exception as e:
+            print(f"[WARNING] 체크포인트 로드 실패(새로 시작): {e}")
+            self.items = {}
+
+    def is_done(self, key: str) -> bool:
+        entry = self.items.get(key)
+        return bool(entry) and entry.get("status") in _DONE_STATUSES
+
+    def get(self, key: str) -> Optional[dict]:
+        return self.items.get(key)
+
+    def record(self, key: str, status: str, **fields):
+        """
+        항목 결과를 기록하고 즉시 파일에 반영한다(임시 파일 → 교체로 원자적 저장).
+        """
+        with self._lock:
+            entry = {"status": status, "updated_at": datetime.now().isoformat(timespec="seconds")}
+            entry.update(fields)
+            self.items[key] = entry
+            payload = {"mode": self.mode, "items": self.items}
+            tmp_path = f"{self.path}.tmp"
+            try:
+                folder = os.path.dirname(os.path.abspath(self.path))
+                os.makedirs(folder, exist_ok=True)
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    json.dump(payload, f, ensure_ascii=False, indent=2, default=str)
+                os.replace(tmp_path, self.path)
+            except Exception as e:
+                print(f"[WARNING] 체크포인트 저장 실패: {e}")
+
+
+def read_input_list(path: str) -> list:
+    """
+    입력 파일에서 종목명/통화명 목록을 읽는다. 중복은 처음 등장 순서를 유지하며 제거.
+    :param path: 입력 파일 경로 (UTF-8, 한 줄에 하나 또는 콤마 구분)
+    :return: 키워드 리스트
+    """
+    keywords = []
+    seen = set()
+    with open(path, "r", encoding="utf-8-sig") as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            for token in line.split(","):
+                token = token.strip()
+                if token and token not in seen:
+                    seen.add(token)
+                    keywords.append(token)
+    return keywords
+
+
+def _default_checkpoint_path(input_path: str, mode: str) -> str:
+    base = os.path.splitext(os.path.abspath(input_path))[0]
+    return f"{base}.{mode}.checkpoint.json"
+
+
+# ------------------------------------------------------------------
+# 작성자 : 최준혁
+# 작성일 : 2026-10-18
+# 기능 : 주식/주간 단일 종목 처리 (StockWorker / WeeklyWorker의 run 본문과 동일한 흐름)
+# ------------------------------------------------------------------
+def _run_stock_item(keyword: str, domain: str, reporter: JsonlReporter, stop_event: threading.Event,
+                    custom_save_dir: Optional[str] = None) -> dict:
+    """
+    신규상장/거래금지 확인 후 capture_and_generate_news를 호출한다.
+    :return: {"status": ok|skipped|failed|cancelled, "message": ..., "newly_listed": bool}
+    """
+    from news.src.utils.common_utils import capture_and_generate_news
+    from news.src.utils.domestic_utils import check_investment_restricted, finance
+    from news.src.utils.data_manager import data_manager
+
+    is_newly_listed_stock = False
+    try:
+        stock_code = finance(keyword)
+        if stock_code:
+            try:
+                if data_manager.is_newly_listed(keyword) or data_manager.is_newly_listed(stock_code):
+                    is_newly_listed_stock = True
+                    reporter.emit("progress", item=keyword, message=f"[{keyword}]는 신규상장종목입니다.")
+            except Exception as e:
+                print(f"{keyword}의 신규상장 정보 확인 중 오류: {e}")
+
+            if not is_newly_listed_stock and check_investment_restricted(stock_code, None, keyword):
+                return {"status": "skipped", "message": f"[{keyword}]는 거래금지종목입니다."}
+    except Exception as e:
+        return {"status": "failed", "message": f"{keyword} 거래금지 확인 중 오류 발생: {str(e)}"}
+
+    def progress_callback(msg, k=keyword):
+        reporter.emit("progress", item=k, message=str(msg))
+
+    def step_callback(current, total):
+        reporter.emit("step", item=keyword, current=current, total=total)
+
+    def is_running_callback():
+        return not stop_event.is_set()
+
+    news = capture_and_generate_news(
+        keyword,
+        domain=domain,
+        progress_callback=progress_callback,
+        is_running_callback=is_running_callback,
+        step_callback=step_callback,
+        open_after_save=False,
+        custom_save_dir=custom_save_dir,
+    )
+    if stop_event.is_set():
+        return {"status": "cancelled", "message": "작업이 중지되었습니다."}
+    if not news:
+        return {"status": "failed", "message": f"{keyword}: 기사 생성에 실패했습니다.", "newly_listed": is_newly_listed_stock}
+    return {"status": "ok", "message": f"{keyword} 처리 완료", "chars": len(news), "newly_listed": is_newly_listed_stock}
+
+
+# ------------------------------------------------------------------
+# 작성자 : 최준혁
+# 작성일 : 2026-10-18
+# 기능 : 통화별 FX 처리 (aggregate=False면 FXPerCurrencyWorker와 동일하게 통화별 기사까지 생성)
+# ------------------------------------------------------------------
+def _run_fx_item(currency: str, reporter: JsonlReporter, stop_event: threading.Event, aggregate: bool) -> dict:
+    from news.src.utils.exchange_utils import capture_exchange_chart_with_data, apply_fx_template
+    from news.src.utils.common_utils import save_news_to_file
+
+    def progress_callback(msg, k=currency):
+        reporter.emit("progress", item=k, message=str(msg))
+
+    image_path, data = capture_exchange_chart_with_data(currency, progress_callback=progress_callback)
+    if not image_path:
+        return {"status": "failed", "message": f"'{currency}' 이미지 캡처 실패"}
+    if aggregate:
+        # 종합 기사는 모든 통화 캡처 후 한 번에 생성하므로 캡처 결과만 기록
+        return {"status": "ok", "message": f"'{currency}' 캡처 완료", "image": image_path, "data": data or {}}
+    if stop_event.is_set():
+        return {"status": "cancelled", "message": "작업이 중지되었습니다."}
+
+    from news.src.services.info_LLM import generate_info_news_from_text
+    info_dict = {
+        "통화": currency,
+        "이미지": {currency: image_path},
+        "수치": {currency: data or {}},
+    }
+    reporter.emit("progress", item=currency, message="LLM 기사 생성 중...")
+    news = generate_info_news_from_text(f"{currency} 환율", info_dict, domain="fx")
+    if not news:
+        return {"status": "failed", "message": f"'{currency}' 기사 생성 실패", "image": image_path}
+
+    final_output = apply_fx_template(news)
+    saved = save_news_to_file(f"{currency} 환율", domain="fx", news_content=final_output,
+                              open_after_save=False, custom_save_dir=os.path.dirname(image_path))
+    if not saved:
+        return {"status": "failed", "message": f"'{currency}' 기사 저장 실패", "image": image_path}
+    return {"status": "ok", "message": f"'{currency}' 기사 저장 완료", "image": image_path, "output": saved}
+
+
+def _run_fx_aggregate(checkpoint: Checkpoint, currencies: list, reporter: JsonlReporter) -> dict:
+    """
+    체크포인트에 기록된 통화별 캡처 결과로 종합 환율 기사를 생성/저장한다 (FXNewsWorker와 동일한 흐름).
+    """
+    from news.src.services.info_LLM import generate_info_news_from_text
+    from news.src.utils.exchange_utils import apply_fx_template
+    from news.src.utils.common_utils import save_news_to_file
+
+    images_dict, data_dict = {}, {}
+    for cur in currencies:
+        entry = checkpoint.get(cur) or {}
+        if entry.get("status") == "ok" and entry.get("image") and os.path.exists(entry["image"]):
+            images_dict[cur] = entry["image"]
+            if entry.get("data"):
+                data_dict[cur] = entry["data"]
+    if not images_dict:
+        return {"status": "failed", "message": "환율 차트 캡처 결과가 없습니다."}
+
+    info_dict = {
+        "통화목록": list(images_dict.keys()),
+        "이미지": images_dict,
+        "수치": data_dict,
+    }
+    reporter.emit("progress", item="주요국 환율 종합", message="LLM을 통해 종합 환율 뉴스 생성 중...")
+    news = generate_info_news_from_text("주요국 환율 종합", info_dict, domain="fx")
+    if not news:
+        return {"status": "failed", "message": "LLM 뉴스 생성에 실패했습니다."}
+
+    final_output = apply_fx_template(news)
+    custom_dir = os.path.dirname(next(iter(images_dict.values())))
+    saved = save_news_to_file("주요국 환율 종합", domain="fx", news_content=final_output,
+                              open_after_save=False, custom_save_dir=custom_dir)
+    if not saved:
+        return {"status": "failed", "message": "뉴스 저장에 실패했습니다."}
+    return {"status": "ok", "message": "종합 환율 기사 저장 완료", "output": saved,
+            "currencies": list(images_dict.keys())}
+
+
+def _preload_pipeline(mode: str) -> None:
+    """
+    파이프라인 모듈을 메인 스레드에서 미리 import 한다.
+    워커 스레드들이 동시에 처음 import 하면서 생기는 부분 초기화 오류를 막고, 의존성 누락을 시작 시점에 드러낸다.
+    """
+    import news.src.utils.common_utils  # noqa: F401
+    import news.src.services.info_LLM  # noqa: F401
+    if mode == "fx":
+        import news.src.utils.exchange_utils  # noqa: F401
+    else:
+        import news.src.utils.domestic_utils  # noqa: F401
+        import news.src.utils.data_manager  # noqa: F401
+
+
+def _weekly_save_dir() -> str:
+    # WeeklyWorker와 동일한 주간 전용 저장 폴더
+    from news.src.utils.common_utils import get_today_kst_date_str
+    path = os.path.join(os.getcwd(), "주간 기사", f"기사{get_today_kst_date_str()}")
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def run_batch(mode: str, keywords: list, checkpoint: Checkpoint, reporter: JsonlReporter,
+              workers: int = 1, delay: float = 0.0, aggregate: bool = False,
+              output_dir: Optional[str] = None) -> int:
+    """
+    배치 실행 본체. 항목을 스레드 풀로 처리하며 결과를 체크포인트/리포터에 기록한다.
+    :param mode: 'stock' | 'fx' | 'weekly'
+    :param keywords: 처리할 종목명/통화명 목록
+    :param checkpoint: 체크포인트 객체
+    :param reporter: JSON Lines 리포터
+    :param workers: 동시 처리 개수
+    :param delay: 항목 제출 간 대기(초) - 외부 사이트/LLM 호출 속도 조절용
+    :param aggregate: fx 모드에서 통화별 기사 대신 종합 기사 1건 생성
+    :param output_dir: 기사 저장 폴더(미지정 시 탭과 동일한 기본 경로)
+    :return: 프로세스 종료 코드
+    """
+    stop_event = threading.Event()
+    try:
+        _preload_pipeline(mode)
+    except Exception as e:
+        reporter.emit("error", message=f"파이프라인 모듈을 불러올 수 없습니다: {e}")
+        return 2
+
+    pending = [k for k in keywords if not checkpoint.is_done(k)]
+    skipped = len(keywords) - len(pending)
+    reporter.emit("start", total=len(keywords), pending=len(pending), resumed=skipped,
+                  workers=workers, checkpoint=checkpoint.path)
+
+    if mode == "weekly" and not output_dir:
+        output_dir = _weekly_save_dir()
+
+    def process(keyword: str) -> dict:
+        if stop_event.is_set():
+            return {"status": "cancelled", "message": "작업이 중지되었습니다."}
+        reporter.emit("item_start", item=keyword)
+        started = time.perf_counter()
+        try:
+            # 배치 LLM 호출은 탭(INTERACTIVE) 요청보다 뒤로 양보
+            with llm_scheduler.priority(llm_scheduler.BATCH):
+                if mode == "fx":
+                    result = _run_fx_item(keyword, reporter, stop_event, aggregate)
+                else:
+                    domain = "week" if mode == "weekly" else "stock"
+                    result = _run_stock_item(keyword, domain, reporter, stop_event, custom_save_dir=output_dir)
+        except Exception as e:
+            result = {"status": "failed", "message": f"{keyword} 처리 중 오류: {str(e)}"}
+        result["elapsed_sec"] = round(time.perf_counter() - started, 2)
+        return result
+
+    counts = {"ok": 0, "skipped": 0, "failed": 0, "cancelled": 0}
+    interrupted = False
+    executor = ThreadPoolExecutor(max_workers=max(1, workers))
+    try:
+        futures = {}
+        for idx, keyword in enumerate(pending):
+            if stop_event.is_set():
+                break
+            if idx and delay > 0:
+                time.sleep(delay)
+            futures[executor.submit(process, keyword)] = keyword
+
+        for done_count, future in enumerate(as_completed(futures), 1):
+            keyword = futures[future]
+            result = future.result()
+            status = result.pop("status")
+            counts[status] = counts.get(status, 0) + 1
+            if status != "cancelled":
+                checkpoint.record(keyword, status, **result)
+            reporter.emit("item_done", item=keyword, status=status, index=done_count, total=len(pending), **result)
+    except KeyboardInterrupt:
+        interrupted = True
+        stop_event.set()
+        reporter.emit("interrupted", message="사용자 요청으로 중지합니다. 진행 중인 항목이 끝나면 종료합니다.")
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+    agg_key = "__aggregate__"
+    if mode == "fx" and aggregate and not interrupted and not (checkpoint.is_done(agg_key) and not pending):
+        try:
+            agg = _run_fx_aggregate(checkpoint, keywords, reporter)
+        except Exception as e:
+            agg = {"status": "failed", "message": f"종합 기사 생성 중 오류: {str(e)}"}
+        status = agg.pop("status")
+        counts[status] = counts.get(status, 0) + 1
+        checkpoint.record(agg_key, status, **agg)
+        reporter.emit("item_done", item=agg_key, status=status, **agg)
+
+    reporter.emit("done", resumed=skipped, llm_queue=llm_scheduler.stats(), **counts)
+    if interrupted:
+        return 130
+    return 1 if counts.get("failed") else 0
+
+
+def build_arg_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m news.batch",
+        description="주식/환율/주간 기사 생성 파이프라인을 GUI 없이 일괄 실행합니다.",
+    )
+    parser.add_argument("mode", choices=MODES, help="실행할 파이프라인")
+    parser.add_argument("--input", required=True, help="종목명/통화명 목록 파일 (한 줄에 하나 또는 콤마 구분)")
+    parser.add_argument("--workers", type=int, default=1, help="동시 처리 개수 (기본 1)")
+    parser.add_argument("--delay", type=float, default=0.0, help="항목 제출 간 대기 시간(초)")
+    parser.add_argument("--checkpoint", default=None, help="체크포인트 파일 경로 (기본: <input>.<mode>.checkpoint.json)")
+    parser.add_argument("--no-resume", action="store_true", help="기존 체크포인트를 무시하고 처음부터 실행")
+    parser.add_argument("--output-dir", default=None, help="기사 저장 폴더 (stock/weekly 전용, 기본은 탭과 동일)")
+    parser.add_argument("--aggregate", action="store_true", help="fx: 통화별 기사 대신 주요국 환율 종합 기사 1건 생성")
+    return parser
+
+
+def main(argv=None) -> int:
+    args = build_arg_parser().parse_args(argv)
+    reporter = JsonlReporter(sys.stdout, args.mode)
+
+    try:
+        keywords = read_input_list(args.input)
+    except Exception as e:
+        reporter.emit("error", message=f"입력 파일을 읽을 수 없습니다: {e}")
+        return 2
+    if not keywords:
+        reporter.emit("error", message="유효한 키워드가 없습니다.")
+        return 2
+
+    try:
+        from dotenv import load_dotenv
+        load_dotenv()
+    except Exception:
+        pass
+
+    checkpoint_path = args.checkpoint or _default_checkpoint_path(args.input, args.mode)
+    checkpoint = Checkpoint(checkpoint_path, args.mode, resume=not args.no_resume)
+
+    # 라이브러리 print 출력은 stderr로 보내 stdout의 JSON Lines만 남긴다.
+    with contextlib.redirect_stdout(sys.stderr):
+        return run_batch(
+            args.mode,
+            keywords,
+            checkpoint,
+            reporter,
+            workers=args.workers,
+            delay=args.delay,
+            aggregate=args.aggregate,
+            output_dir=args.output_dir,
+        )
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,7 +1,7 @@
 # hwan_tab.py
 
 from PyQt5.QtWidgets import QWidget, QVBoxLayout, QLabel, QGroupBox, QHBoxLayout, QLineEdit, QPushButton, QMessageBox
-from PyQt5.QtCore import Qt, QThread, pyqtSignal
+from PyQt5.QtCore import Qt, pyqtSignal
 from PyQt5.QtGui import QFont
 import os
 import platform
@@ -14,9 +14,12 @@ from news.src.utils.exchange_utils import (
     capture_multiple_exchange_charts,
     capture_exchange_chart_with_data,
     create_fx_template,
+    apply_fx_template,
 )
 from news.src.services.info_LLM import generate_info_news_from_text
 from news.src.utils.common_utils import save_news_to_file
+from news.src.utils.cancel_token import CancelledError
+from news.src.utils.task_pool import PoolTask
 
 CHATBOT_URL = "https://chatgpt.com/g/g-67a44d9d833c8191bf2974019d233d4e-jeongboseong-gisa-caesbos-culceo-sanggwaneobseum"
 
@@ -26,15 +29,16 @@ CHATBOT_URL = "https://chatgpt.com/g/g-67a44d9d833c8191bf2974019d233d4e-jeongbos
 # 버전 : 1.0.0
 # 기능 : PyQt5에서 환율 차트 캡처 작업 진행 상태 업데이트하는 함수(프론트)
 # ------------------------------------------------------------------
-class ExchangeWorker(QThread):
-    finished = pyqtSignal(str, str)
-    progress = pyqtSignal(str)
+class ExchangeWorker(PoolTask):
+    class Signals(PoolTask.Signals):
+        finished = pyqtSignal(str, str)
+        progress = pyqtSignal(str)
 
     def __init__(self, keyword):
-        super().__init__()
+        super().__init__(group="hwan")
         self.keyword = keyword
 
-    def run(self):
+    def run_task(self):
         try:
             self.progress.emit("환율 차트 검색 중...")
             image_path = capture_exchange_chart(self.keyword)
@@ -54,18 +58,21 @@ class ExchangeWorker(QThread):
 # 작성일 : 2025-10-13
 # 기능 : 여러 통화 차트 캡처 후 텍스트 기반 LLM으로 종합 환율 뉴스 생성 워커(프론트)
 # ------------------------------------------------------------------
-class FXNewsWorker(QThread):
-    finished = pyqtSignal(str, str)  # (saved_path, error)
-    progress = pyqtSignal(str)
+class FXNewsWorker(PoolTask):
+    class Signals(PoolTask.Signals):
+        finished = pyqtSignal(str, str)  # (saved_path, error)
+        progress = pyqtSignal(str)
 
     def __init__(self, currencies: list[str]):
-        super().__init__()
+        super().__init__(group="hwan")
         self.currencies = currencies
 
-    def run(self):
+    # stop(): PoolTask 기본 동작(cancel_token 취소)으로 열린 드라이버를 닫고 다음 단계 진입 전에 종료
+
+    def run_task(self):
         try:
             self.progress.emit("여러 통화 환율 차트 캡처 시작...")
-            images_dict, data_dict = capture_multiple_exchange_charts(self.currencies, progress_callback=self.progress.emit)
+            images_dict, data_dict = capture_multiple_exchange_charts(self.currencies, progress_callback=self.progress.emit, cancel_token=self.cancel_token)
             if not images_dict:
                 self.finished.emit("", "환율 차트 캡처 결과가 없습니다.")
                 return
@@ -76,35 +83,16 @@ class FXNewsWorker(QThread):
                 "이미지": images_dict,
                 "수치": data_dict,
             }
+            self.cancel_token.raise_if_cancelled()
             self.progress.emit("LLM을 통해 종합 환율 뉴스 생성 중...")
             news = generate_info_news_from_text("주요국 환율 종합", info_dict, domain="fx")
+            self.cancel_token.raise_if_cancelled()
             if not news:
                 self.finished.emit("", "LLM 뉴스 생성에 실패했습니다.")
                 return
 
-            # 본문 서두 템플릿 삽입 (날짜/시간은 템플릿에서만 사용)
-            template_text = create_fx_template()
-            import re as _re
-            if _re.search(r'(\[본문\]|본문)', news):
-                replacement_text = f"[본문]\n{template_text} "
-                final_output = _re.sub(r'(\[본문\]|본문)\s+', replacement_text, news, count=1)
-            else:
-                final_output = template_text + '\n\n' + news
-
-            # 중복 선두 템플릿 제거: 모델이 동일 성격의 시간 문구를 한 번 더 생성한 경우
-            try:
-                anchor = "기준, 네이버페이 증권에 따르면"
-                first_idx = final_output.find(anchor)
-                if first_idx != -1:
-                    first_end = first_idx + len(anchor)
-                    second_idx = final_output.find(anchor, first_end)
-                    # 선두 근방(첫 200자 이내)에 동일 앵커가 한 번 더 나오면 첫 번째 이후 ~ 두 번째 앵커까지 제거
-                    if second_idx != -1 and (second_idx - first_end) < 200:
-                        # 두 번째 앵커까지 포함하여 제거
-                        cut_end = second_idx + len(anchor)
-                        final_output = final_output[:first_end] + final_output[cut_end:]
-            except Exception:
-                pass
+            # 본문 서두 템플릿 삽입 및 중복 선두 문구 제거 (날짜/시간은 템플릿에서만 사용)
+            final_output = apply_fx_template(news)
 
             # 집계(종합) 기사는 캡처 이미지가 저장된 오늘자 환율 폴더에 저장
             try:
@@ -125,6 +113,8 @@ class FXNewsWorker(QThread):
                 self.finished.emit(saved_path, "")
             else:
                 self.finished.emit("", "뉴스 저장에 실패했습니다.")
+        except CancelledError as e:
+            self.finished.emit("", str(e))
         except Exception as e:
             self.finished.emit("", f"오류 발생: {str(e)}")
 
@@ -134,24 +124,33 @@ class FXNewsWorker(QThread):
 # 기능 : 콤마로 구분된 통화 목록을 순회하며 통화별 FX 기사 생성 및 저장
 # 저장 위치: 해당 통화의 차트가 저장된 오늘자 환율 폴더(예: 환율차트/환율YYYYMMDD)
 # ------------------------------------------------------------------
-class FXPerCurrencyWorker(QThread):
-    finished = pyqtSignal(str, str)  # (last_saved_path, error)
-    progress = pyqtSignal(str)
+class FXPerCurrencyWorker(PoolTask):
+    class Signals(PoolTask.Signals):
+        finished = pyqtSignal(str, str)  # (last_saved_path, error)
+        progress = pyqtSignal(str)
 
     def __init__(self, currencies: list[str]):
-        super().__init__()
+        super().__init__(group="hwan")
         self.currencies = currencies
 
-    def run(self):
+    # stop(): PoolTask 기본 동작(cancel_token 취소)으로 열린 드라이버를 닫고 다음 단계 진입 전에 종료
+
+    def run_task(self):
         try:
             last_saved = ""
             total = len(self.currencies)
             for i, cur in enumerate(self.currencies, start=1):
+                self.cancel_token.raise_if_cancelled()
                 cur = cur.strip()
                 if not cur:
                     continue
                 self.progress.emit(f"[{i}/{total}] '{cur}' 환율 차트 캡처 및 기사 생성 시작...")
-                image_path, data = capture_exchange_chart_with_data(cur, progress_callback=self.progress.emit)
+                try:
+                    image_path, data = capture_exchange_chart_with_data(cur, progress_callback=self.progress.emit, cancel_token=self.cancel_token)
+                except Exception:
+                    # 취소로 드라이버가 닫힌 경우 취소 사유로 종료, 그 외 오류는 기존대로 상위에서 처리
+                    self.cancel_token.raise_if_cancelled()
+                    raise
                 if not image_path:
                     self.progress.emit(f"[{i}/{total}] '{cur}' 이미지 캡처 실패, 건너뜀")
                     continue
@@ -164,26 +163,13 @@ class FXPerCurrencyWorker(QThread):
                 }
                 self.progress.emit(f"[{i}/{total}] '{cur}' LLM 기사 생성 중...")
                 news = generate_info_news_from_text(f"{cur} 환율", info_dict, domain="fx")
+                self.cancel_token.raise_if_cancelled()
                 if not news:
                     self.progress.emit(f"[{i}/{total}] '{cur}' 기사 생성 실패, 건너뜀")
                     continue
 
                 # 본문 서두 템플릿 삽입 및 중복 제거
-                template_text = create_fx_template()
-                import re as _re
-                if _re.search(r'(\[본문\]|본문)', news):
-                    replacement_text = f"[본문]\n{template_text} "
-                    final_output = _re.sub(r'(\[본문\]|본문)\s+', replacement_text, news, count=1)
-                else:
-                    final_output = template_text + '\n\n' + news
-                anchor = "기준, 네이버페이 증권에 따르면"
-                first_idx = final_output.find(anchor)
-                if first_idx != -1:
-                    first_end = first_idx + len(anchor)
-                    second_idx = final_output.find(anchor, first_end)
-                    if second_idx != -1 and (second_idx - first_end) < 200:
-                        cut_end = second_idx + len(anchor)
-                        final_output = final_output[:first_end] + final_output[cut_end:]
+                final_output = apply_fx_template(news)
 
                 # 저장 경로: 이미지가 저장된 폴더(오늘자 환율 폴더)
                 custom_dir = os.path.dirname(image_path)
@@ -197,6 +183,8 @@ class FXPerCurrencyWorker(QThread):
                 self.finished.emit(last_saved, "")
             else:
                 self.finished.emit("", "처리 가능한 항목이 없습니다.")
+        except CancelledError as e:
+            self.finished.emit("", str(e))
         except Exception as e:
             self.finished.emit("", f"오류 발생: {str(e)}")
 
@@ -210,6 +198,7 @@ class HwanTab(QWidget):
     def __init__(self):
         super().__init__()
         self.worker = None
+        self._cancelled_workers = []
         self.last_image_path = None
         self.init_ui()
 
@@ -380,7 +369,15 @@ class HwanTab(QWidget):
     # ------------------------------------------------------------------
     def cancel_capture(self):
         if self.worker and self.worker.isRunning():
-            self.worker.terminate()
+            if hasattr(self.worker, "stop"):
+                self.worker.stop()
+            try:
+                self.worker.progress.disconnect(self.update_progress)
+                self.worker.finished.disconnect(self.on_capture_finished)
+            except Exception:
+                pass
+            # 종료될 때까지 참조 보관 (실행 중 작업이 GC되지 않도록)
+            self._cancelled_workers = [w for w in self._cancelled_workers if w.isRunning()] + [self.worker]
         self.progress_label.setText("⛔️ 캡처 취소됨")
         self.capture_btn.setEnabled(True)
         self.cancel_btn.setEnabled(False)
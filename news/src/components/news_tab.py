@@ -1,16 +1,19 @@
 # news_tab.py
 
 from PyQt5.QtWidgets import QWidget, QVBoxLayout, QLabel, QGroupBox, QHBoxLayout, QLineEdit, QPushButton, QTextEdit, QMessageBox
-from PyQt5.QtCore import Qt, QThread, pyqtSignal
+from PyQt5.QtCore import Qt, QThread, QTimer, pyqtSignal
 from PyQt5.QtGui import QFont
 import pyperclip
 import webbrowser
 import urllib.parse
 
-from news.src.utils.article_utils import extract_article_content
+from news.src.utils.article_utils import extract_article_content_cached, get_cached_article
+from news.src.utils.cancel_token import CancelToken, CancelledError
 
 CHATBOT_URL = "https://chatgpt.com/g/g-67abdb7e8f1c8191978db654d8a57b86-gisa-jaeguseong-caesbos?model=gpt-4o"
 MIN_BODY_LENGTH = 300
+# URL 입력이 멈춘 뒤 선추출을 시작하기까지 대기 시간(ms)
+PREFETCH_DEBOUNCE_MS = 700
 
 # 지원 불가 뉴스 사이트 패턴 (호스트 일부 포함)
 BLOCKED_SITES = {
@@ -49,11 +52,17 @@ class NewsWorker(QThread):
         super().__init__()
         self.url = url
         self.keyword = keyword
+        self.cancel_token = CancelToken()
+
+    def stop(self):
+        # terminate() 대신 협력적 취소: 진행 중인 추출기 시도가 끝나면 스스로 종료
+        self.cancel_token.cancel("사용자에 의해 취소되었습니다.")
 
     def run(self):
         try:
             self.progress.emit("기사 다운로드 중...")
-            title, body = extract_article_content(self.url, progress_callback=self.progress.emit)
+            title, body = extract_article_content_cached(self.url, progress_callback=self.progress.emit, cancel_token=self.cancel_token)
+            self.cancel_token.raise_if_cancelled()
 
             self.progress.emit("본문 길이 확인 중...")
             if len(body) < MIN_BODY_LENGTH:
@@ -66,10 +75,33 @@ class NewsWorker(QThread):
             self.progress.emit("기사 추출 성공! 결과가 클립보드에 복사되었습니다.")
             self.finished.emit(title, body, "")
 
+        except CancelledError as e:
+            self.finished.emit("", "", str(e))
         except Exception as e:
             self.progress.emit(f"오류 발생: {str(e)}")
             self.finished.emit("", "", f"오류 발생: {str(e)}")
 
+# ------------------------------------------------------------------
+# 작성자 : 최준혁
+# 작성일 : 2026-10-18
+# 기능 : URL 입력 직후 백그라운드에서 기사 본문을 미리 추출해 캐시에 넣는 워커
+# ------------------------------------------------------------------
+class ArticlePrefetchWorker(QThread):
+    def __init__(self, url):
+        super().__init__()
+        self.url = url
+        self.cancel_token = CancelToken()
+
+    def stop(self):
+        self.cancel_token.cancel("URL이 변경되어 미리 추출을 중단했습니다.")
+
+    def run(self):
+        try:
+            extract_article_content_cached(self.url, cancel_token=self.cancel_token)
+        except Exception as e:
+            # 선추출 실패는 조용히 무시 (추출 버튼을 누르면 다시 시도)
+            print(f"[PREFETCH] {self.url} 미리 추출 실패: {e}")
+
 # ------------------------------------------------------------------
 # 작성자 : 최준혁
 # 작성일 : 2025-07-09
@@ -80,6 +112,14 @@ class NewsTab(QWidget):
     def __init__(self):
         super().__init__()
         self.worker = None
+        self.prefetch_worker = None
+        # 취소 후 아직 종료되지 않은 워커 참조 보관 (실행 중 QThread가 GC되지 않도록)
+        self._cancelled_workers = []
+        # URL 입력이 잠시 멈추면 선추출 시작 (디바운스)
+        self._prefetch_timer = QTimer(self)
+        self._prefetch_timer.setSingleShot(True)
+        self._prefetch_timer.setInterval(PREFETCH_DEBOUNCE_MS)
+        self._prefetch_timer.timeout.connect(self._start_prefetch)
         self.init_ui()
 
     # ------------------------------------------------------------------
@@ -105,6 +145,7 @@ class NewsTab(QWidget):
         url_label = QLabel("기사 URL:")
         self.url_input = QLineEdit()
         self.url_input.setPlaceholderText("https://...")
+        self.url_input.textChanged.connect(self._on_url_changed)
         url_layout.addWidget(url_label)
         url_layout.addWidget(self.url_input)
         input_layout.addLayout(url_layout)
@@ -172,11 +213,60 @@ class NewsTab(QWidget):
         self.result_text.clear()
         self.progress_label.setText("")
         self.copy_result_btn.setEnabled(False)
-        if self.worker and self.worker.isRunning():
-            self.worker.terminate()
+        self._stop_worker()
         self.extract_btn.setEnabled(True)
         self.cancel_btn.setEnabled(False)
 
+    # ------------------------------------------------------------------
+    # 작성자 : 최준혁
+    # 작성일 : 2026-10-18
+    # 기능 : 실행 중인 추출 워커 협력적 취소 (결과 시그널 해제 후 종료될 때까지 참조 보관)
+    # ------------------------------------------------------------------
+    def _stop_worker(self):
+        self._cancelled_workers = [w for w in self._cancelled_workers if w.isRunning()]
+        if self.worker and self.worker.isRunning():
+            self.worker.stop()
+            try:
+                self.worker.progress.disconnect(self.update_progress)
+                self.worker.finished.disconnect(self.on_extraction_finished)
+            except Exception:
+                pass
+            self._cancelled_workers.append(self.worker)
+
+    # ------------------------------------------------------------------
+    # 작성자 : 최준혁
+    # 작성일 : 2026-10-18
+    # 기능 : URL 변경 시 진행 중인 선추출 취소 후 디바운스 타이머 재시작
+    # ------------------------------------------------------------------
+    def _on_url_changed(self, text):
+        url = (text or "").strip()
+        if self.prefetch_worker and self.prefetch_worker.isRunning() and self.prefetch_worker.url != url:
+            self.prefetch_worker.stop()
+            self._cancelled_workers.append(self.prefetch_worker)
+            self.prefetch_worker = None
+        self._prefetch_timer.start()
+
+    # ------------------------------------------------------------------
+    # 작성자 : 최준혁
+    # 작성일 : 2026-10-18
+    # 기능 : 유효한 URL이면 백그라운드 선추출 시작 (결과는 추출 캐시에 저장)
+    # ------------------------------------------------------------------
+    def _start_prefetch(self):
+        url = self.url_input.text().strip()
+        try:
+            parsed = urllib.parse.urlparse(url)
+        except Exception:
+            return
+        if parsed.scheme not in ("http", "https") or not parsed.netloc:
+            return
+        if is_blocked_url(url)[0] or get_cached_article(url) is not None:
+            return
+        if self.prefetch_worker and self.prefetch_worker.isRunning():
+            return
+        self._cancelled_workers = [w for w in self._cancelled_workers if w.isRunning()]
+        self.prefetch_worker = ArticlePrefetchWorker(url)
+        self.prefetch_worker.start()
+
     # ------------------------------------------------------------------
     # 작성자 : 최준혁
     # 작성일 : 2025-07-09
@@ -206,6 +296,7 @@ class NewsTab(QWidget):
         self.progress_label.setText("처리 중...")
         self.result_text.clear()
 
+        self._stop_worker()
         self.worker = NewsWorker(url, keyword)
         self.worker.progress.connect(self.update_progress)
         self.worker.finished.connect(self.on_extraction_finished)
@@ -271,8 +362,7 @@ class NewsTab(QWidget):
     # 기능 : PyQt5에서 기사 추출 취소 함수(프론트)
     # ------------------------------------------------------------------
     def cancel_extraction(self):
-        if self.worker and self.worker.isRunning():
-            self.worker.terminate()
+        self._stop_worker()
         self.progress_label.setText("취소됨")
         self.extract_btn.setEnabled(True)
         self.copy_result_btn.setEnabled(False)
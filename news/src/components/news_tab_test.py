@@ -1,5 +1,5 @@
 from PyQt5.QtWidgets import QWidget, QVBoxLayout, QLabel, QGroupBox, QHBoxLayout, QLineEdit, QPushButton, QTextEdit, QMessageBox, QShortcut, QSplitter
-from PyQt5.QtCore import Qt, QThread, pyqtSignal
+from PyQt5.QtCore import Qt, pyqtSignal
 from PyQt5.QtGui import QFont, QKeySequence
 import pyperclip
 import urllib.parse
@@ -11,6 +11,9 @@ import sys
 
 from news.src.utils.article_utils import extract_article_content
 from news.src.services import news_LLM
+from news.src.utils.cancel_token import CancelledError
+from news.src.utils.task_pool import PoolTask
+from news.src.utils.log_view import LogView
 
 BLOCKED_SITES = {
     "ichannela": "채널A",
@@ -36,18 +39,22 @@ def is_blocked_url(url: str):
         return False, ""
 
 # -------------------------- Workers --------------------------
-class NewsCrawlerWorker(QThread):
-    finished = pyqtSignal(str, str, str)  # title, body, error
-    progress = pyqtSignal(str)
+class NewsCrawlerWorker(PoolTask):
+    class Signals(PoolTask.Signals):
+        finished = pyqtSignal(str, str, str)  # title, body, error
+        progress = pyqtSignal(str)
 
     def __init__(self, url: str):
-        super().__init__()
+        super().__init__(group="news_tab_test")
         self.url = url
 
-    def run(self):
+    def stop(self):
+        self.cancel_token.cancel("크롤링이 취소되었습니다.")
+
+    def run_task(self):
         try:
             self.progress.emit("기사 다운로드 중...")
-            title, body = extract_article_content(self.url, progress_callback=self.progress.emit)
+            title, body = extract_article_content(self.url, progress_callback=self.progress.emit, cancel_token=self.cancel_token)
             if self.isInterruptionRequested():
                 self.finished.emit("", "", "크롤링이 취소되었습니다.")
                 return
@@ -56,29 +63,36 @@ class NewsCrawlerWorker(QThread):
                 self.finished.emit("", "", "기사 본문을 추출하지 못했거나 너무 짧습니다.")
                 return
             self.finished.emit(title, body, "")
+        except CancelledError as e:
+            self.finished.emit("", "", str(e))
         except Exception as e:
             self.progress.emit(f"크롤링 중 오류 발생: {str(e)}")
             self.finished.emit("", "", f"크롤링 중 오류 발생: {str(e)}")
 
-class NewsLLMWorker(QThread):
-    finished = pyqtSignal(dict, str)  # result, error
-    progress = pyqtSignal(str)
+class NewsLLMWorker(PoolTask):
+    class Signals(PoolTask.Signals):
+        finished = pyqtSignal(dict, str)  # result, error
+        progress = pyqtSignal(str)
 
     def __init__(self, url: str, keyword: str, title: str, body: str):
-        super().__init__()
+        super().__init__(group="news_tab_test")
         self.url = url
         self.keyword = keyword
         self.title = title
         self.body = body
 
-    def run(self):
+    def stop(self):
+        self.cancel_token.cancel("LLM 처리가 취소되었습니다.")
+
+    def run_task(self):
         try:
             self.progress.emit("LLM을 통한 기사 생성 중...")
             result = news_LLM.generate_article({
                 "url": self.url,
                 "keyword": self.keyword,
                 "title": self.title,
-                "body": self.body
+                "body": self.body,
+                "cancel_token": self.cancel_token
             })
             if self.isInterruptionRequested():
                 self.finished.emit({}, "LLM 처리가 취소되었습니다.")
@@ -183,6 +197,10 @@ class NewsTabTest(QWidget):
 
         layout.addWidget(splitter, 1)  # Stretch factor를 1로 설정하여 남는 공간을 모두 차지하도록 함
 
+        # 추출/생성 단계별 진행 로그 (링 버퍼 + 묶음 갱신)
+        self.log_view = LogView(title="진행 로그", min_height=100)
+        layout.addWidget(self.log_view)
+
         self.setLayout(layout)
 
         # 엔터 단축키
@@ -234,9 +252,9 @@ class NewsTabTest(QWidget):
         self.progress_label.setText("")
 
         if self.crawler_worker and self.crawler_worker.isRunning():
-            self.crawler_worker.requestInterruption()
+            self.crawler_worker.stop()
         if self.llm_worker and self.llm_worker.isRunning():
-            self.llm_worker.requestInterruption()
+            self.llm_worker.stop()
 
         self.extract_btn.setEnabled(True)
         self.extract_btn.setText("📄 기사 추출")
@@ -357,6 +375,7 @@ class NewsTabTest(QWidget):
         else:
             self.progress_label.setStyleSheet("color: black;")
         self.progress_label.setText(message)
+        self.log_view.append(message)
 
     def copy_to_clipboard(self, text_widget: QTextEdit):
         text = text_widget.toPlainText()
@@ -368,9 +387,9 @@ class NewsTabTest(QWidget):
 
     def cancel_extraction(self):
         if self.crawler_worker and self.crawler_worker.isRunning():
-            self.crawler_worker.requestInterruption()
+            self.crawler_worker.stop()
         if self.llm_worker and self.llm_worker.isRunning():
-            self.llm_worker.requestInterruption()
+            self.llm_worker.stop()
         self.progress_label.setText("취소 요청됨 — 작업이 안전하게 종료될 때까지 기다려주세요.")
         self.extract_btn.setEnabled(False)
         self.cancel_btn.setEnabled(False)
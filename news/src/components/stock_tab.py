@@ -1,8 +1,8 @@
 # stock_tab.py
 
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QLabel, QGroupBox, QHBoxLayout, 
-                           QLineEdit, QPushButton, QTextEdit, QMessageBox, QProgressBar)
-from PyQt5.QtCore import Qt, QThread, pyqtSignal
+                           QLineEdit, QPushButton, QMessageBox, QProgressBar)
+from PyQt5.QtCore import Qt, pyqtSignal
 from PyQt5.QtGui import QFont
 import platform
 import os
@@ -11,6 +11,8 @@ from datetime import datetime
 from news.src.utils.common_utils import capture_and_generate_news
 from news.src.utils.domestic_utils import check_investment_restricted, finance
 from news.src.utils.data_manager import data_manager
+from news.src.utils.task_pool import PoolTask
+from news.src.utils.log_view import LogView
 
 # ------------------------------------------------------------------
 # 작성자 : 최준혁
@@ -18,26 +20,28 @@ from news.src.utils.data_manager import data_manager
 # 버전 : 1.0.0
 # 기능 : PyQt5에서 주식 코드 검색 후 차트 캡처하는 기능
 # ------------------------------------------------------------------
-class StockWorker(QThread):
-    # 다중 주식 처리 모드 
-    finished = pyqtSignal(str, str)  # combined_news, error
-    progress = pyqtSignal(str, str)  # message, current_keyword
-    progress_all = pyqtSignal(int, int)  # current, total
-    step_progress = pyqtSignal(int, int)  # current_step, total_steps
+class StockWorker(PoolTask):
+    class Signals(PoolTask.Signals):
+        # 다중 주식 처리 모드 
+        finished = pyqtSignal(str, str)  # combined_news, error
+        progress = pyqtSignal(str, str)  # message, current_keyword
+        progress_all = pyqtSignal(int, int)  # current, total
+        step_progress = pyqtSignal(int, int)  # current_step, total_steps
 
     def __init__(self, keywords):
-        super().__init__()
+        super().__init__(group="stock")
         # 다중 주식 처리 모드 
         self.keywords = [k.strip() for k in keywords.split(',') if k.strip()]
         self.results = []
         self.is_running = True
+        # self.cancel_token: 서비스 함수까지 전달되는 취소 토큰 (취소 시 열린 드라이버도 즉시 종료)
 
     def stop(self):
+        # 풀 스레드를 막고 기다리지 않음 - 토큰 취소로 진행 중 단계가 스스로 빠져나옴
         self.is_running = False
-        self.quit()
-        self.wait()
+        self.cancel_token.cancel("사용자에 의해 취소되었습니다.")
 
-    def run(self):
+    def run_task(self):
         self.results = []
         try:
             if not self.keywords:
@@ -102,16 +106,12 @@ class StockWorker(QThread):
                             return
                         self.step_progress.emit(current, total)
                     
-                    # 취소 확인을 위한 콜백
-                    def is_running_callback():
-                        return self.is_running
-                    
-                    # 비동기로 실행하거나, 실행 중간에 취소 체크를 더 자주 할 수 있도록 수정
+                    # 네트워크 단계 사이마다 취소 토큰 확인
                     news = capture_and_generate_news(
                         keyword, 
                         progress_callback=progress_callback,
-                        is_running_callback=is_running_callback,
-                        step_callback=step_callback
+                        step_callback=step_callback,
+                        cancel_token=self.cancel_token
                     )
                     
                     # 결과 처리 전 취소 확인
@@ -162,6 +162,8 @@ class StockTab(QWidget):
     def __init__(self):
         super().__init__()
         self.worker = None
+        # 취소 후 아직 빠져나오는 중인 작업 (종료될 때까지 참조 보관)
+        self._cancelled_workers = []
         self.last_image_path = None
         self.init_ui()
 
@@ -211,9 +213,8 @@ class StockTab(QWidget):
         self.progress_label.setAlignment(Qt.AlignCenter)
         layout.addWidget(self.progress_label)
 
-        self.result_text = QTextEdit()
-        self.result_text.setReadOnly(True)
-        self.result_text.setMinimumHeight(200)
+        # 진행 로그 (링 버퍼 + 100ms 묶음 갱신 - 긴 배치에서도 UI가 멈칫거리지 않도록)
+        self.result_text = LogView(title="처리 로그", min_height=200)
         layout.addWidget(self.result_text)
 
         # 전체 진행률 프로그레스바
@@ -324,6 +325,19 @@ class StockTab(QWidget):
     def cancel_capture(self):
         if self.worker and self.worker.isRunning():
             self.worker.stop()
+            # 취소된 작업이 빠져나오며 보내는 메시지/완료 신호가 다음 실행의 로그·진행 막대에 섞이지 않도록 연결 해제
+            for signal, slot in (
+                (self.worker.progress, self.update_progress),
+                (self.worker.progress_all, self.update_overall_progress),
+                (self.worker.step_progress, self.update_step_progress),
+                (self.worker.finished, self.on_capture_finished),
+            ):
+                try:
+                    signal.disconnect(slot)
+                except Exception:
+                    pass
+            # 종료될 때까지 참조 보관 (실행 중 작업이 GC되지 않도록)
+            self._cancelled_workers = [w for w in self._cancelled_workers if w.isRunning()] + [self.worker]
         self.progress_label.setText("⛔️ 처리 취소됨")
         self.capture_btn.setEnabled(True)
         self.cancel_btn.setEnabled(False)
@@ -348,10 +362,8 @@ class StockTab(QWidget):
         else:
             self.progress_label.setStyleSheet("")
             
-        # Add important messages to the result text
-        if any(x in message for x in ["✅", "❌", "완료", "실패", "오류"]):
-            self.result_text.append(display_msg)
-            self.result_text.verticalScrollBar().setValue(self.result_text.verticalScrollBar().maximum())
+        # 모든 진행 메시지를 로그에 남기고 표시 범위는 로그 창의 레벨 필터로 조절
+        self.result_text.append(display_msg)
             
     def update_overall_progress(self, current, total):
         self.overall_progress_label.setVisible(True)
@@ -368,7 +380,6 @@ class StockTab(QWidget):
     def append_to_result(self, message, keyword=""):
         display_msg = f"{keyword}: {message}" if keyword else message
         self.result_text.append(display_msg)
-        self.result_text.verticalScrollBar().setValue(self.result_text.verticalScrollBar().maximum())
 
     # ------------------------------------------------------------------
     # 작성자 : 최준혁
@@ -399,7 +410,4 @@ class StockTab(QWidget):
             self.progress_label.setText("기사 생성 완료!")
         else:
             self.result_text.append("\n⚠️ 처리할 결과가 없습니다.")
-            self.progress_label.setText("처리할 결과가 없습니다.")
-            
-        # Scroll to the bottom to show the latest messages
-        self.result_text.verticalScrollBar().setValue(self.result_text.verticalScrollBar().maximum())
\ No newline at end of file
+            self.progress_label.setText("처리할 결과가 없습니다.")
\ No newline at end of file
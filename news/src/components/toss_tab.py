@@ -1,22 +1,26 @@
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QGroupBox, QLineEdit, QPushButton,
-    QMessageBox, QCheckBox, QTableWidget, QTableWidgetItem, QProgressBar, QApplication
+    QMessageBox, QCheckBox, QTableView, QHeaderView, QProgressBar, QApplication
 )
-from PyQt5.QtCore import Qt, QThread, pyqtSignal
+from PyQt5.QtCore import Qt, pyqtSignal
 from PyQt5.QtGui import QFont
 import pandas as pd
 from news.src.services import toss_service
+from news.src.utils.task_pool import PoolTask
+from news.src.utils.log_view import LogView
+from news.src.utils.table_model import DataFrameTableModel, make_proxy
 
 # ------------------------------------------------------------------
 # 작성자 : 최준혁
 # 작성일 : 2025-07-31
 # 기능 : PyQt5에서 토스증권 API를 이용한 종목 데이터 추출하는 워커
 # ------------------------------------------------------------------
-class TossWorker(QThread):
-    finished = pyqtSignal(pd.DataFrame, str)
+class TossWorker(PoolTask):
+    class Signals(PoolTask.Signals):
+        finished = pyqtSignal(pd.DataFrame, str)
 
     def __init__(self, min_pct, max_pct, min_price, up_check, down_check, limit, start_rank=1, end_rank=None, only_domestic=False, only_foreign=False):
-        super().__init__()
+        super().__init__(group="toss")
         self.min_pct = min_pct
         self.max_pct = max_pct
         self.min_price = min_price
@@ -28,7 +32,11 @@ class TossWorker(QThread):
         self.only_domestic = only_domestic
         self.only_foreign = only_foreign
 
-    def run(self):
+    def stop(self):
+        # 강제 종료(terminate) 대신 취소 표시만 하고, 진행 중인 요청이 끝나면 결과를 버린다
+        self.cancel_token.cancel("사용자에 의해 취소되었습니다.")
+
+    def run_task(self):
         try:
             df = toss_service.get_toss_stock_data(
                 start_rank=self.start_rank,
@@ -36,6 +44,8 @@ class TossWorker(QThread):
                 only_domestic=self.only_domestic,
                 only_foreign=self.only_foreign
             )
+            if self.cancel_token.cancelled:
+                return
             filtered = toss_service.filter_toss_data(
                 df,
                 self.min_pct,
@@ -59,17 +69,19 @@ class TossWorker(QThread):
 # 작성일 : 2025-08-09
 # 기능 : 기사 생성을 백그라운드에서 처리하는 워커
 # ------------------------------------------------------------------
-class ArticleGeneratorWorker(QThread):
-    finished = pyqtSignal(int, str)  # 성공 개수, 에러 메시지
-    progress_all = pyqtSignal(int, int, str)  # 현재 진행, 전체 개수, 현재 종목명
-    step_progress = pyqtSignal(int, int) # 현재 단계, 전체 단계
-
-    def __init__(self, names, parent=None):
-        super().__init__(parent)
+class ArticleGeneratorWorker(PoolTask):
+    class Signals(PoolTask.Signals):
+        finished = pyqtSignal(int, str)  # 성공 개수, 에러 메시지
+        progress_all = pyqtSignal(int, int, str)  # 현재 진행, 전체 개수, 현재 종목명
+        step_progress = pyqtSignal(int, int) # 현재 단계, 전체 단계
+        progress = pyqtSignal(str)  # 진행 로그 메시지
+
+    def __init__(self, names):
+        super().__init__(group="toss")
         self.names = names
         self._is_running = True
 
-    def run(self):
+    def run_task(self):
         try:
             total_count = len(self.names)
             success_cnt = 0
@@ -93,16 +105,23 @@ class ArticleGeneratorWorker(QThread):
                         return
                     self.step_progress.emit(current, total)
 
+                def progress_callback(message):
+                    self.progress.emit(f"[{name}] {message}")
+
                 news = capture_and_generate_news(
                     name,
                     domain="toss",
+                    progress_callback=progress_callback,
                     open_after_save=False,
                     custom_save_dir=toss_folder,  # 일일 폴더에 저장하도록 경로 수정
                     step_callback=step_callback,
-                    is_running_callback=lambda: self._is_running
+                    cancel_token=self.cancel_token
                 )
                 if news:
                     success_cnt += 1
+                    self.progress.emit(f"✅ [{name}] 기사 생성 완료 ({i + 1}/{total_count})")
+                else:
+                    self.progress.emit(f"❌ [{name}] 기사 생성 실패 ({i + 1}/{total_count})")
             
             if not self._is_running:
                 self.finished.emit(success_cnt, "기사 생성이 사용자에 의해 취소되었습니다.")
@@ -113,6 +132,20 @@ class ArticleGeneratorWorker(QThread):
 
     def stop(self):
         self._is_running = False
+        self.cancel_token.cancel("기사 생성이 사용자에 의해 취소되었습니다.")
+
+
+def _format_pct(value) -> str:
+    """
+    등락률(%) 표시: 이미 %가 붙어 있지 않으면 소수점 2자리 + %
+    """
+    text = str(value)
+    if text.endswith("%"):
+        return text
+    try:
+        return f"{float(text):.2f}%"
+    except Exception:
+        return text
 
 
 class TossTab(QWidget):
@@ -120,6 +153,8 @@ class TossTab(QWidget):
         super().__init__()
         self.worker = None
         self.article_worker = None
+        # 취소 후 아직 종료되지 않은 워커 참조 보관 (실행 중 작업이 GC되지 않도록)
+        self._cancelled_workers = []
         self.last_df = None
         self.init_ui()
 
@@ -235,8 +270,18 @@ class TossTab(QWidget):
 
         layout.addLayout(button_layout)
 
-        # 결과 표시 테이블
-        self.result_table = QTableWidget()
+        # 결과 표시 테이블 (모델/뷰 - 보이는 행만 그림)
+        self.result_model = DataFrameTableModel(
+            self,
+            formatters={"등락률(%)": _format_pct},
+            foregrounds={"등락": lambda v: {"UP": "red", "DOWN": "blue"}.get(str(v))},
+            alignments={"등락률(%)": Qt.AlignRight | Qt.AlignVCenter},
+        )
+        self.result_table = QTableView()
+        self.result_table.setModel(make_proxy(self.result_model, self))
+        self.result_table.setSortingEnabled(True)
+        self.result_table.setEditTriggers(QTableView.NoEditTriggers)
+        self.result_table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
         layout.addWidget(self.result_table)
 
         # 기사 생성 진행률 표시
@@ -260,6 +305,10 @@ class TossTab(QWidget):
         self.step_progress_bar.setVisible(False)
         layout.addLayout(progress_layout)
 
+        # 기사 생성 진행 로그 (링 버퍼 + 묶음 갱신)
+        self.log_view = LogView(title="기사 생성 로그")
+        layout.addWidget(self.log_view)
+
         self.setLayout(layout)
  
     def reset_inputs(self):
@@ -273,15 +322,21 @@ class TossTab(QWidget):
         self.down_check.setChecked(False)
         self.domestic_check.setChecked(False)
         self.foreign_check.setChecked(False)
-        self.result_table.setRowCount(0)
+        self.result_model.clear()
+        self.log_view.clear()
         self.cancel_generate_button.setEnabled(False)
         self.extract_btn.setEnabled(True)
         self.generate_button.setEnabled(True)
 
     def cancel_extraction(self):
-        # 토스 워커 취소 (Thread 강제 종료)
+        # 토스 워커 취소 (협력적 취소 - 응답이 늦게 와도 결과는 무시)
         if self.worker and self.worker.isRunning():
-            self.worker.terminate()
+            self.worker.stop()
+            try:
+                self.worker.finished.disconnect(self.on_finished)
+            except Exception:
+                pass
+            self._cancelled_workers.append(self.worker)
         self.cancel_generate_button.setEnabled(False)
         self.extract_btn.setEnabled(True)
         self.generate_button.setEnabled(True)
@@ -305,6 +360,7 @@ class TossTab(QWidget):
         self.step_progress_label.setVisible(False)
         self.step_progress_bar.setVisible(False)
 
+        self._cancelled_workers = [w for w in self._cancelled_workers if w.isRunning()]
         self.worker = TossWorker(
             min_pct, max_pct, min_price,
             self.up_check.isChecked(),
@@ -346,7 +402,9 @@ class TossTab(QWidget):
             self.step_progress_bar.setVisible(True)
             self.step_progress_bar.setValue(0)
 
+            self.log_view.append(f"기사 생성 시작: {len(names)}개 종목")
             self.article_worker = ArticleGeneratorWorker(names)
+            self.article_worker.progress.connect(self.log_view.append)
             self.article_worker.progress_all.connect(self.on_overall_progress)
             self.article_worker.step_progress.connect(self.on_step_progress)
             self.article_worker.finished.connect(self.on_article_generation_finished)
@@ -359,20 +417,8 @@ class TossTab(QWidget):
             if self.last_df is not None and not self.last_df.empty and '종목명' in self.last_df.columns:
                 names = [str(x).strip() for x in self.last_df['종목명'].tolist() if str(x).strip()]
             else:
-                # 테이블 위젯에서 '종목명' 컬럼 찾기 후 수집
-                col_idx = -1
-                for c in range(self.result_table.columnCount()):
-                    header_item = self.result_table.horizontalHeaderItem(c)
-                    if header_item and header_item.text() == '종목명':
-                        col_idx = c
-                        break
-                if col_idx >= 0:
-                    for r in range(self.result_table.rowCount()):
-                        item = self.result_table.item(r, col_idx)
-                        if item:
-                            text = item.text().strip()
-                            if text:
-                                names.append(text)
+                # 테이블 모델에서 '종목명' 컬럼 값 수집
+                names = [str(x).strip() for x in self.result_model.column_values('종목명') if str(x).strip()]
         except Exception as e:
             QMessageBox.warning(self, "복사 오류", f"종목명 수집 중 오류가 발생했습니다: {e}")
             return
@@ -408,6 +454,7 @@ class TossTab(QWidget):
         self.overall_progress_bar.setVisible(False)
         self.step_progress_label.setVisible(False)
         self.step_progress_bar.setVisible(False)
+        self.log_view.append(f"기사 생성 종료: 성공 {success_count}개" + (f" - {error_msg}" if error_msg else ""))
 
         if error_msg and "취소" not in error_msg:
             QMessageBox.critical(self, "오류 발생", f"기사 생성 중 오류가 발생했습니다: {error_msg}")
@@ -435,7 +482,6 @@ class TossTab(QWidget):
             QMessageBox.information(self, "폴더 없음", "아직 생성된 토스 기사가 없습니다.")
 
     def on_finished(self, df, error):
-        from PyQt5.QtGui import QColor
         # 최근 조회된 DataFrame 저장 변수 보장
         if not hasattr(self, 'last_df'):
             self.last_df = None
@@ -447,37 +493,11 @@ class TossTab(QWidget):
 
         if df.empty:
             QMessageBox.information(self, "결과 없음", "조건에 맞는 종목이 없습니다.")
-            self.result_table.setRowCount(0)
+            self.result_model.clear()
             return
 
-        self.result_table.setColumnCount(len(df.columns))
-        self.result_table.setRowCount(len(df))
-        self.result_table.setHorizontalHeaderLabels(df.columns)
-
-        for i in range(len(df)):
-            for j, col in enumerate(df.columns):
-                value = str(df.iloc[i, j])
-                item = QTableWidgetItem(value)
-
-                # 등락 컬럼: 색상 적용
-                if col == "등락":
-                    if value == "UP":
-                        item.setForeground(QColor("red"))
-                    elif value == "DOWN":
-                        item.setForeground(QColor("blue"))
-
-                # 등락률(%) 컬럼: 오른쪽 정렬, % 붙이기
-                elif col == "등락률(%)":
-                    # 이미 %가 붙어 있지 않으면 붙이기
-                    if not value.endswith("%"):
-                        try:
-                            value = f"{float(value):.2f}%"
-                            item.setText(value)
-                        except:
-                            pass
-                    item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-
-                self.result_table.setItem(i, j, item)
-
+        # 셀 아이템을 만들지 않고 모델 값만 교체 (등락 색상/등락률 % 표시는 모델 formatter 에서)
+        self.result_table.sortByColumn(-1, Qt.AscendingOrder)
+        self.result_model.set_frame(df)
         self.result_table.resizeColumnsToContents()
 
@@ -11,6 +11,7 @@ from datetime import datetime
 from news.src.utils.common_utils import capture_and_generate_news, get_today_kst_date_str
 from news.src.utils.domestic_utils import check_investment_restricted, finance
 from news.src.utils.data_manager import data_manager
+from news.src.utils.cancel_token import CancelToken
 
 # ------------------------------------------------------------------
 # 기능: 주간(5거래일) 기사 테스트 탭 - stock_tab와 동일한 흐름으로 기사 생성 및 저장
@@ -27,9 +28,12 @@ class WeeklyWorker(QThread):
         self.keywords = [k.strip() for k in keywords.split(',') if k.strip()]
         self.results = []
         self.is_running = True
+        # 서비스 함수까지 전달되는 취소 토큰 (취소 시 열린 드라이버도 즉시 종료)
+        self.cancel_token = CancelToken()
 
     def stop(self):
         self.is_running = False
+        self.cancel_token.cancel("사용자에 의해 취소되었습니다.")
         self.quit()
         self.wait()
 
@@ -93,9 +97,6 @@ class WeeklyWorker(QThread):
                             return
                         self.step_progress.emit(current, total)
 
-                    def is_running_callback():
-                        return self.is_running
-
                     # 주간 전용 저장 폴더를 생성하여 capture_and_generate_news에 전달합니다.
                     today_str = get_today_kst_date_str()
                     weekly_save_dir = os.path.join(os.getcwd(), "주간 기사", f"기사{today_str}")
@@ -104,10 +105,10 @@ class WeeklyWorker(QThread):
                     news = capture_and_generate_news(
                         keyword,
                         progress_callback=progress_callback,
-                        is_running_callback=is_running_callback,
                         step_callback=step_callback,
                         domain="week",  # 주간 전용 도메인
-                        custom_save_dir=weekly_save_dir
+                        custom_save_dir=weekly_save_dir,
+                        cancel_token=self.cancel_token
                     )
 
                     if not self.is_running:
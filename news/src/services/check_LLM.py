@@ -5,6 +5,9 @@ import re
 import time  
 import google.generativeai as genai
 from news.src.utils.common_utils import get_today_kst_str
+from news.src.utils import llm_cache
+from news.src.utils import llm_scheduler
+from news.src.utils.cancel_token import CancelledError
 from dotenv import load_dotenv
 from datetime import datetime
 from pathlib import Path
@@ -158,8 +161,8 @@ def log_and_print(logger, message: str, level: str = "info"):
 # 작성자 : 최준혁
 # 기능 : 사실관계 검증을 위한 시스템 프롬프트 생성
 # ------------------------------------------------------------------
-def generate_check_prompt(keyword: str = "", published_kst: str | None = None) -> str:
-    today_kst = get_today_kst_str()
+def generate_check_prompt(keyword: str = "", published_kst: str | None = None, today_kst: str | None = None) -> str:
+    today_kst = today_kst or get_today_kst_str()
     keyword_info = f"- 키워드: {keyword}\n" if keyword else ""
     published_line = (
         f"- 원문 기사 작성일(사이트 추출): {published_kst}\n"
@@ -475,7 +478,10 @@ def check_article_facts(
     original_article: str,
     keyword: str = "check_LLM",
     source_url: str | None = None,        # ✅ (2) 작성일시 주입을 위한 파라미터 추가
-    published_kst: str | None = None      # ✅ (2) 외부에서 직접 전달 가능
+    published_kst: str | None = None,     # ✅ (2) 외부에서 직접 전달 가능
+    use_cache: bool | None = None,
+    force_refresh: bool = False,
+    cancel_token=None,
 ) -> dict:
     """
     두 기사를 LLM에 전달하여 사실관계 오류를 확인하고, 오류가 있을 경우 수정된 기사를 포함한 JSON을 반환
@@ -484,6 +490,9 @@ def check_article_facts(
     :param keyword: 로깅 및 프롬프트에 사용될 키워드
     :param source_url: 원문 기사 URL(있다면 발행일 재추출 시도)
     :param published_kst: 'YYYY-MM-DD HH:MM' 등 가독형 KST 문자열(우선 주입)
+    :param use_cache: LLM 응답 캐시 사용 여부(None이면 환경변수 LLM_CACHE)
+    :param force_refresh: True면 캐시를 무시하고 새로 검증 후 캐시 갱신
+    :param cancel_token: 취소/마감 토큰 (취소 시 CancelledError를 그대로 전파)
     :return: 검증 결과를 담은 딕셔너리 ('explanation', 'json', 'error' 포함)
     """
     logger, log_filepath = setup_check_logging(keyword)
@@ -515,7 +524,8 @@ def check_article_facts(
     try:
         log_and_print(logger, f"\n🤖 AI 모델 호출:")
         # ✅ (2) 프롬프트에 작성일시 주입
-        system_prompt = generate_check_prompt(keyword=keyword, published_kst=published_kst_str)
+        today_kst = get_today_kst_str()
+        system_prompt = generate_check_prompt(keyword=keyword, published_kst=published_kst_str, today_kst=today_kst)
         user_request = (
             f"생성된 기사: {generated_article}\n" 
             f"=\n" 
@@ -541,28 +551,39 @@ def check_article_facts(
             {'role': 'user', 'parts': [{'text': user_request}]}
         ]
 
-        log_and_print(logger, f"\n⏳ AI 응답 대기 중...")
-        t0 = time.perf_counter()                     # ✅ (1) 시작
-        response = model.generate_content(contents)
-        rtt = time.perf_counter() - t0               # ✅ (1) 경과
-
-        # 토큰 계산
-        usage = getattr(response, "usage_metadata", None)
-        if usage:
-            p = getattr(usage, "prompt_token_count", 0)
-            c = getattr(usage, "candidates_token_count", 0)
-            t = getattr(usage, "total_token_count", 0)
-            th = getattr(usage, "thoughts_token_count", 0)  # ✅ 사고 토큰
-            tu = getattr(usage, "tool_use_prompt_token_count", 0)
-            cc = getattr(usage, "cached_content_token_count", 0)
-            resid = t - (p + c + th + tu)  # 남는다면 API/버전별 집계 차이
-            log_and_print(logger,
-                f"🧾 토큰 상세 | 입력={p}, 출력={c}, 생각={th}, 툴프롬프트={tu}, 캐시={cc}, 합계={t}, 잔차={resid}")
+        # LLM 캐시 조회 (동일 모델/프롬프트/입력이면 이전 검증 응답 재사용)
+        cache_on = llm_cache.is_enabled(use_cache)
+        cache_key = llm_cache.build_key("gemini-2.5-flash", system_prompt, contents, today_kst=today_kst)
+        cached_text = llm_cache.load(cache_key) if (cache_on and not force_refresh) else None
+
+        if cached_text is not None:
+            log_and_print(logger, f"\n💾 LLM 캐시 적중 → Gemini 호출 생략 (key={cache_key[:12]})")
+            full_text = cached_text.strip()
         else:
-            log_and_print(logger, "🧾 usage_metadata 없음", "warning")    
+            log_and_print(logger, f"\n⏳ AI 응답 대기 중...")
+            t0 = time.perf_counter()                     # ✅ (1) 시작
+            response = llm_scheduler.generate_content(model, contents, cancel_token=cancel_token)
+            rtt = time.perf_counter() - t0               # ✅ (1) 경과
+
+            # 토큰 계산
+            usage = getattr(response, "usage_metadata", None)
+            if usage:
+                p = getattr(usage, "prompt_token_count", 0)
+                c = getattr(usage, "candidates_token_count", 0)
+                t = getattr(usage, "total_token_count", 0)
+                th = getattr(usage, "thoughts_token_count", 0)  # ✅ 사고 토큰
+                tu = getattr(usage, "tool_use_prompt_token_count", 0)
+                cc = getattr(usage, "cached_content_token_count", 0)
+                resid = t - (p + c + th + tu)  # 남는다면 API/버전별 집계 차이
+                log_and_print(logger,
+                    f"🧾 토큰 상세 | 입력={p}, 출력={c}, 생각={th}, 툴프롬프트={tu}, 캐시={cc}, 합계={t}, 잔차={resid}")
+            else:
+                log_and_print(logger, "🧾 usage_metadata 없음", "warning")    
 
-        full_text = (response.text or "").strip()
-        log_and_print(logger, f"  - RTT: {rtt*1000:.0f}ms")  # ✅ (1) 밀리초로 기록
+            full_text = (response.text or "").strip()
+            log_and_print(logger, f"  - RTT: {rtt*1000:.0f}ms")  # ✅ (1) 밀리초로 기록
+            if cache_on and full_text:
+                llm_cache.save(cache_key, full_text, meta={"kind": "fact_check", "keyword": keyword, "url": source_url})
 
         log_and_print(logger, f"\n📤 AI 응답 결과:")
         log_and_print(logger, f"  - 응답 길이: {len(full_text)}자")
@@ -653,6 +674,10 @@ def check_article_facts(
 
         return result
 
+    except CancelledError as e:
+        # 취소/마감은 호출 측(generate_article)이 결과를 결정하도록 그대로 전파
+        log_and_print(logger, f"\n⛔ 검증 중단: {str(e)}", "warning")
+        raise
     except Exception as e:
         log_and_print(logger, f"\n❌ 예외 발생: {str(e)}", "error")
         log_and_print(logger, "\n" + "="*80, "error")
@@ -5,6 +5,9 @@ from PIL import Image
 from dotenv import load_dotenv
 from news.src.utils.common_utils import get_today_kst_str, build_stock_prompt
 from news.src.utils.exchange_utils import build_fx_prompt
+from news.src.utils import llm_cache
+from news.src.utils import llm_scheduler
+from news.src.utils.cancel_token import CancelledError, DeadlineExceeded
 from news.src.utils.weekly_stock_utils import (
     get_five_trading_days_ohlc,
     format_weekly_ohlc_for_prompt,
@@ -278,7 +281,7 @@ def generate_info_news(keyword: str, image_path: str, is_stock: bool,
 
     try:
         img = Image.open(image_path)
-        response = model.generate_content([
+        response = llm_scheduler.generate_content(model, [
             user_message,
             img
         ])
@@ -299,7 +302,12 @@ def generate_info_news(keyword: str, image_path: str, is_stock: bool,
 # ------------------------------------------------------------------
 def generate_info_news_from_text(keyword: str, info_dict: dict, domain: str = "generic",
                                  pricing_tier: str = "standard",
-                                 thinking_budget_tokens: int | None = None):
+                                 thinking_budget_tokens: int | None = None,
+                                 use_cache: bool | None = None,
+                                 force_refresh: bool = False,
+                                 cancel_token=None,
+                                 deadline: float | None = None,
+                                 hedge: bool | None = None):
     """
     정제된 텍스트 데이터(딕셔너리)를 기반으로 Gemini 모델을 사용하여 정보성 기사를 생성
     :param keyword: 기사 생성에 사용할 키워드
@@ -307,6 +315,11 @@ def generate_info_news_from_text(keyword: str, info_dict: dict, domain: str = "g
     :param domain: 데이터의 종류 (예: 'stock', 'fx', 'coin', 'week')
     :param pricing_tier: "standard" 또는 "batch" (요금 단가)
     :param thinking_budget_tokens: 추론 토큰 예산 (0=끄기, 예: 256=켜기)
+    :param use_cache: LLM 응답 캐시 사용 여부 (None이면 환경변수 LLM_CACHE)
+    :param force_refresh: True면 캐시를 무시하고 새로 생성 후 캐시 갱신
+    :param cancel_token: 취소 토큰 (취소 시 None 반환)
+    :param deadline: 기사 생성 마감(초). None이면 환경변수 LLM_ARTICLE_DEADLINE, 초과 시 DeadlineExceeded 발생
+    :param hedge: 응답 지연 시 중복 요청 여부 (None이면 환경변수 LLM_HEDGE)
     :return: LLM이 생성한 기사 텍스트
     """
     today_kst = get_today_kst_str()
@@ -461,13 +474,33 @@ def generate_info_news_from_text(keyword: str, info_dict: dict, domain: str = "g
     if thinking_budget_tokens is not None:
         gen_config = {"thinking": {"budgetTokens": thinking_budget_tokens}}
 
+    # 동일 모델/프롬프트/입력/설정이면 캐시된 응답 재사용 (opt-in)
+    cache_on = llm_cache.is_enabled(use_cache)
+    cache_key = llm_cache.build_key('gemini-2.5-flash', system_prompt, user_message, gen_config, today_kst=today_kst)
+    if cache_on and not force_refresh:
+        cached_text = llm_cache.load(cache_key)
+        if cached_text is not None:
+            print(f"[LLM 캐시 적중] Gemini 호출 생략 (key={cache_key[:12]})")
+            print("[LLM 응답 결과]\n" + cached_text + "\n")
+            return cached_text
+
     model = genai.GenerativeModel(
         model_name='gemini-2.5-flash',
         system_instruction=system_prompt,
         generation_config=gen_config
     )
 
-    response = model.generate_content(user_message)
+    token = llm_scheduler.deadline_token(cancel_token, deadline)
+    try:
+        response = llm_scheduler.generate_content(model, user_message, hedge=hedge, cancel_token=token)
+    except DeadlineExceeded:
+        raise
+    except CancelledError:
+        print("[LLM] 작업이 취소되어 기사 생성을 중단합니다.")
+        return None
+    finally:
+        if token is not None and token is not cancel_token:
+            token.close()
     print("[LLM 응답 결과]\n" + response.text + "\n")
     
     # 토큰/비용 출력 (필드가 없으면 보정)
@@ -476,5 +509,8 @@ def generate_info_news_from_text(keyword: str, info_dict: dict, domain: str = "g
         print_token_usage_and_cost(usage, pricing_tier=pricing_tier)
     else:
         print("\n(참고) usage_metadata가 제공되지 않았습니다. SDK/버전을 확인하세요.")
+
+    if cache_on:
+        llm_cache.save(cache_key, response.text, meta={"kind": "info_news", "keyword": keyword, "domain": domain})
     
     return response.text
@@ -2,20 +2,23 @@
 import os
 import sys
 import google.generativeai as genai
-import requests
-from bs4 import BeautifulSoup
+from news.src.utils.html_parser import parse_html
+from news.src.utils import http_client
 from newspaper import Article
 from dotenv import load_dotenv
 from datetime import datetime
 import logging
 from pathlib import Path
 from news.src.utils.common_utils import get_today_kst_str 
+from news.src.utils import llm_cache
+from news.src.utils import llm_scheduler
+from news.src.utils import boilerplate
 from time import perf_counter
  
 
 
 try:
-    from news.src.utils.article_utils import extract_article_content, MIN_BODY_LENGTH as AU_MIN, extract_publish_datetime
+    from news.src.utils.article_utils import extract_article_content_cached as extract_article_content, MIN_BODY_LENGTH as AU_MIN, extract_publish_datetime
 except Exception:
     extract_article_content = None
     extract_publish_datetime = None
@@ -182,6 +185,9 @@ else:
 # model = genai.GenerativeModel("gemini-2.5-flash")
 
 FAST_MODE = os.getenv("FAST_MODE", "0") == "1"
+# 생성 호출 입력(시스템 프롬프트 + 요청) 토큰 예산 / 본문에 최소한 남길 토큰 (0이면 압축 안 함)
+SOURCE_TOKEN_BUDGET = int(os.getenv("SOURCE_TOKEN_BUDGET", "6000"))
+SOURCE_MIN_BODY_TOKENS = int(os.getenv("SOURCE_MIN_BODY_TOKENS", "1500"))
 LOG_LEVEL = os.getenv("NEWS_LOG_LEVEL", "INFO").upper()
 
 # ------------------------------------------------------------------
@@ -341,8 +347,9 @@ def extract_naver_cp_article(url, logger=None):
         log_and_print(logger, f"      🔄 네이버 CP 기사 fallback 처리:")
         log_and_print(logger, f"        - requests로 HTML 직접 다운로드...")
     headers = {'User-Agent': 'Mozilla/5.0'}
-    res = requests.get(url, headers=headers, timeout=7)
-    soup = BeautifulSoup(res.text, 'html.parser')
+    res = http_client.get(url, headers=headers, timeout=(http_client.CONNECT_TIMEOUT, 7))
+    # 제목(h2)과 본문(article) 영역만 트리로 구성
+    soup = parse_html(res.text, only=['h2.media_end_head_headline', 'article#dic_area'])
     if logger:
         log_and_print(logger, f"        - HTML 다운로드 완료: {len(res.text)}자")
     title_tag = soup.select_one('h2.media_end_head_headline')
@@ -515,6 +522,73 @@ def _fast_pass_consistency(generated: str, original: str) -> bool:
         return False
     return True
 
+# ------------------------------------------------------------------
+# 작성자 : 최준혁
+# 기능 : 생성 전 원문 압축 — 토큰 예산 안에서 리드/숫자·인용 문단/마지막 문단 우선 유지, 중복 문단 제거
+# ------------------------------------------------------------------
+# 리드 문단이 예산에서 먼저 확보하는 최대 비율 (리드가 이보다 길면 이 길이로 자른 뒤 나머지 문단을 채움)
+_LEAD_BUDGET_SHARE = 0.5
+
+def _compact_source(body: str, budget_tokens: int) -> tuple[str, dict]:
+    """
+    긴 보도자료/라이브 블로그 본문을 토큰 예산에 맞게 줄인다. (문단 순서는 원문 그대로 유지)
+    우선순위: 첫 문단(리드) > 마지막 문단 > 숫자/인용문이 있는 문단 > 나머지 문단(앞쪽 우선)
+    리드는 항상 유지하며, 예산의 _LEAD_BUDGET_SHARE 보다 길면 그 길이까지만 남긴다.
+    :param body: 추출된 원문 본문
+    :param budget_tokens: 본문에 허용할 추정 토큰 수 (0 이하이면 중복 제거만 수행)
+    :return: (압축된 본문, {"original_tokens", "kept_tokens", "duplicates", "dropped": [문단 미리보기...]})
+    """
+    paragraphs = [p.strip() for p in re.split(r"\n+", body or "") if p.strip()]
+    seen, unique, duplicates = set(), [], 0
+    for p in paragraphs:
+        norm = re.sub(r"\s+", " ", p)
+        if norm in seen:
+            duplicates += 1
+            continue
+        seen.add(norm)
+        unique.append(p)
+
+    info = {"original_tokens": llm_scheduler.estimate_tokens(body or ""), "kept_tokens": 0,
+            "duplicates": duplicates, "dropped": []}
+    costs = [llm_scheduler.estimate_tokens(p) for p in unique]
+    if budget_tokens <= 0 or sum(costs) <= budget_tokens:
+        text = "\n".join(unique)
+        info["kept_tokens"] = llm_scheduler.estimate_tokens(text)
+        return text, info
+
+    # 1) 리드를 먼저 확보 - 너무 길면 리드 몫까지만 자름 (추정치 기준 1토큰 ≈ 2자)
+    lead = unique[0]
+    lead_cap = max(1, int(budget_tokens * _LEAD_BUDGET_SHARE))
+    if costs[0] > lead_cap:
+        lead = lead[:lead_cap * 2]
+        info["dropped"].append(unique[0][len(lead):][:40] + "… (리드 뒷부분)")
+    used = llm_scheduler.estimate_tokens(lead)
+
+    # 2) 남은 예산을 마지막 문단 > 숫자/인용 문단 > 나머지 순으로 채움
+    last = len(unique) - 1
+    def rank(i):
+        if i == last:
+            return 0
+        if _NUM_PAT.search(unique[i]) or _QUOTE_PAT.search(unique[i]):
+            return 1
+        return 2
+
+    kept = set()
+    for i in sorted(range(1, len(unique)), key=lambda i: (rank(i), i)):
+        if used + costs[i] <= budget_tokens:
+            kept.add(i)
+            used += costs[i]
+
+    parts = [lead]
+    for i, p in enumerate(unique[1:], start=1):
+        if i in kept:
+            parts.append(p)
+        else:
+            info["dropped"].append(p[:40] + ("…" if len(p) > 40 else ""))
+    text = "\n".join(p for p in parts if p)
+    info["kept_tokens"] = llm_scheduler.estimate_tokens(text)
+    return text, info
+
 # ------------------------------------------------------------------
 # 작성자 : 최준혁
 # 기능 : Gemini 응답 객체에서 차단/누락을 고려해 안전하게 text 추출
@@ -553,9 +627,10 @@ def generate_article(state: dict) -> dict:
     사실검증을 수행하여 최종 표출 텍스트와 메타 정보를 반환
 
     처리 절차:
-    1) 기사 추출: `article_utils.extract_article_content`(가능 시) → 실패/부족 시 내부 추출기로 폴백
+    1) 기사 추출: `article_utils.extract_article_content_cached`(가능 시, 선추출 캐시 우선) → 실패/부족 시 내부 추출기로 폴백
     2) 발행일 추출(선행): 시제 변환 가이드를 위해 `extract_publish_datetime` 호출 시도
     3) 시스템 프롬프트 구성: `generate_system_prompt`로 시제/형식 규칙 포함 프롬프트 생성
+       - 입력이 SOURCE_TOKEN_BUDGET을 넘으면 `_compact_source`로 원문 압축(리드/숫자·인용/마지막 문단 우선)
     4) Gemini 호출: `gemini-2.5-flash`로 기사 재구성, 응답 텍스트 안전 추출 후 섹션 강제 보정
     5) 사실검증:
        - FAST_MODE=1 이고 숫자/인용문 부분집합 검사(Fast-Pass) 통과 시 바로 기사 채택
@@ -567,6 +642,11 @@ def generate_article(state: dict) -> dict:
         - keyword: 핵심 키워드(로그/프롬프트/해시태그에 사용)
         - title: 사전 제공된 제목(선택)
         - body: 사전 제공된 본문(선택)
+        - use_cache: LLM 응답 캐시 사용 여부(선택, 미지정 시 환경변수 LLM_CACHE)
+        - force_refresh: True면 캐시를 무시하고 새로 생성 후 캐시 갱신(선택)
+        - cancel_token: 취소 토큰(선택). 단계 사이마다 확인하며 취소 시 error에 취소 사유를 담아 반환
+        - deadline: 기사 1건 전체 마감(초, 선택). 미지정 시 환경변수 LLM_ARTICLE_DEADLINE(0=없음), 초과 시 시간 초과 error 반환
+        - hedge: 응답 지연 시 중복 요청 여부(선택, 미지정 시 환경변수 LLM_HEDGE)
     :return: 결과 딕셔너리
         - url, keyword, title, original_body, generated_article
         - fact_check_result(OK/ERROR/UNKNOWN)
@@ -582,6 +662,14 @@ def generate_article(state: dict) -> dict:
 
     title = (state.get("title") or "").strip()
     body = (state.get("body") or "").strip()
+    # 기사 1건 전체 마감이 있으면 워커 토큰의 하위 토큰으로 묶어 추출/생성/검증 모두에 적용
+    cancel_token = llm_scheduler.deadline_token(state.get("cancel_token"), state.get("deadline"))
+    hedge = state.get("hedge")
+
+    # 단계 사이 취소 확인 (취소 시 CancelledError → 아래 except에서 error 결과로 변환)
+    def check_cancel():
+        if cancel_token is not None:
+            cancel_token.raise_if_cancelled()
 
     try:
         log_and_print(logger, "\n" + "="*80)
@@ -606,20 +694,25 @@ def generate_article(state: dict) -> dict:
         genai.configure(api_key=current_api_key)
 
         # 1) 기사 추출
+        check_cancel()
         t_extract_start = perf_counter()
         if (not title or not body) or (len(body) < AU_MIN):
             log_and_print(logger, "\n🔗 기사 추출 단계: 외부 추출 미흡 → article_utils 시도")
             if extract_article_content is not None:
                 try:
-                    t2, b2 = extract_article_content(url, progress_callback=None)
+                    t2, b2 = extract_article_content(url, progress_callback=None, cancel_token=cancel_token)
                     if len(b2 or "") >= AU_MIN:
                         title, body = t2, b2
                         log_and_print(logger, f"  ✅ article_utils 성공: 본문 {len(body)}자")
                 except Exception as e:
                     log_and_print(logger, f"  ⚠️ article_utils 실패: {e}", "warning")
+        check_cancel()
         if not title or not body:
             log_and_print(logger, "  🔁 내부 추출기로 폴백")
             t3, b3 = extract_title_and_body(url, logger)
+            b3, cleaned = boilerplate.clean(url, b3 or "")
+            if cleaned["removed_bytes"]:
+                log_and_print(logger, f"  🧹 상투 문구 제거: {cleaned['removed_bytes']}B {cleaned['rules']}")
             if len((b3 or "")) > len(body or ""):
                 title, body = t3, b3
         if not body:
@@ -628,6 +721,7 @@ def generate_article(state: dict) -> dict:
         log_and_print(logger, f"⏱ 기사 추출 단계 소요: {t_extract:.2f}s")
 
         # 1.5) 발행일 추출 —— 생성 전에 수행
+        check_cancel()
         today_kst = get_today_kst_str()
         published_kst = None
         if extract_publish_datetime is not None:
@@ -642,51 +736,79 @@ def generate_article(state: dict) -> dict:
 
         # 2) 시스템 프롬프트 생성 + 모델 구성 (system_instruction 사용)
         system_prompt = generate_system_prompt(keyword or "", today_kst, published_kst)
-        user_request = f"키워드: {keyword}\n제목: {title}\n본문: {body}"
-
-        model = genai.GenerativeModel(
-            model_name="gemini-2.5-flash",
-            system_instruction=system_prompt
-            # generation_config=GenerationConfig(
-            #     max_output_tokens=
-            # )
-        )
-
-        # 3) 생성 호출
-        t_gen_start = perf_counter()
-        log_and_print(logger, f"\n⏳ Gemini AI 호출 중... 모델: gemini-2.5-flash")
-        # user 입력만 전달
-
-        response = model.generate_content(user_request)
-
-        # 토큰 계산
-        usage = getattr(response, "usage_metadata", None)
-        if usage:
-            p = getattr(usage, "prompt_token_count", 0)
-            c = getattr(usage, "candidates_token_count", 0)
-            t = getattr(usage, "total_token_count", 0)
-            th = getattr(usage, "thoughts_token_count", 0)  
-            tu = getattr(usage, "tool_use_prompt_token_count", 0)
-            cc = getattr(usage, "cached_content_token_count", 0)
-            resid = t - (p + c + th + tu)  # 남는다면 API/버전별 집계 차이
-            log_and_print(logger,
-                f"🧾 토큰 상세 | 입력={p}, 출력={c}, 생각={th}, 툴프롬프트={tu}, 캐시={cc}, 합계={t}, 잔차={resid}")
+
+        # 2.2) 입력 토큰 예산에 맞춰 원문 압축 (Fast-Pass/사실검증은 압축 전 body 기준)
+        source_body = body
+        if SOURCE_TOKEN_BUDGET > 0:
+            body_budget = max(SOURCE_MIN_BODY_TOKENS,
+                              SOURCE_TOKEN_BUDGET - llm_scheduler.estimate_tokens(f"키워드: {keyword}\n제목: {title}", system_prompt))
+            source_body, compact_info = _compact_source(body, body_budget)
+            if compact_info["dropped"] or compact_info["duplicates"]:
+                log_and_print(logger,
+                    f"✂️ 원문 압축: 추정 {compact_info['original_tokens']} → {compact_info['kept_tokens']} 토큰 "
+                    f"(예산 {body_budget}, 중복 문단 {compact_info['duplicates']}개 제거, 생략 문단 {len(compact_info['dropped'])}개)")
+                for preview in compact_info["dropped"]:
+                    log_and_print(logger, f"   - 생략: {preview}")
+        user_request = f"키워드: {keyword}\n제목: {title}\n본문: {source_body}"
+        model_name = "gemini-2.5-flash"
+
+        # 2.5) LLM 캐시 조회 (동일 모델/프롬프트/입력이면 이전 응답 재사용)
+        use_cache = llm_cache.is_enabled(state.get("use_cache"))
+        force_refresh = bool(state.get("force_refresh"))
+        cache_key = llm_cache.build_key(model_name, system_prompt, user_request, today_kst=today_kst)
+        cached_text = llm_cache.load(cache_key) if (use_cache and not force_refresh) else None
+
+        check_cancel()
+        if cached_text is not None:
+            log_and_print(logger, f"\n💾 LLM 캐시 적중 → Gemini 호출 생략 (key={cache_key[:12]})")
+            article_text = cached_text.strip()
         else:
-            log_and_print(logger, "🧾 usage_metadata 없음", "warning")
+            model = genai.GenerativeModel(
+                model_name=model_name,
+                system_instruction=system_prompt
+                # generation_config=GenerationConfig(
+                #     max_output_tokens=
+                # )
+            )
+
+            # 3) 생성 호출
+            t_gen_start = perf_counter()
+            log_and_print(logger, f"\n⏳ Gemini AI 호출 중... 모델: {model_name}")
+            # user 입력만 전달
+
+            response = llm_scheduler.generate_content(model, user_request, hedge=hedge, cancel_token=cancel_token)
+
+            # 토큰 계산
+            usage = getattr(response, "usage_metadata", None)
+            if usage:
+                p = getattr(usage, "prompt_token_count", 0)
+                c = getattr(usage, "candidates_token_count", 0)
+                t = getattr(usage, "total_token_count", 0)
+                th = getattr(usage, "thoughts_token_count", 0)  
+                tu = getattr(usage, "tool_use_prompt_token_count", 0)
+                cc = getattr(usage, "cached_content_token_count", 0)
+                resid = t - (p + c + th + tu)  # 남는다면 API/버전별 집계 차이
+                log_and_print(logger,
+                    f"🧾 토큰 상세 | 입력={p}, 출력={c}, 생각={th}, 툴프롬프트={tu}, 캐시={cc}, 합계={t}, 잔차={resid}")
+            else:
+                log_and_print(logger, "🧾 usage_metadata 없음", "warning")
 
-        t_gen = perf_counter() - t_gen_start
-        log_and_print(logger, f"⏱ 기사 생성 소요: {t_gen:.2f}s")
+            t_gen = perf_counter() - t_gen_start
+            log_and_print(logger, f"⏱ 기사 생성 소요: {t_gen:.2f}s")
 
-        # 응답 안전 추출 
-        article_text = _safe_response_text(response).strip()
-        if not article_text:
-            log_and_print(logger, "⚠️ LLM 응답이 비어 있음(차단/빈 후보 가능성).", "warning")
+            # 응답 안전 추출 
+            article_text = _safe_response_text(response).strip()
+            if not article_text:
+                log_and_print(logger, "⚠️ LLM 응답이 비어 있음(차단/빈 후보 가능성).", "warning")
+            elif use_cache:
+                llm_cache.save(cache_key, article_text, meta={"kind": "news_article", "keyword": keyword, "url": url})
 
         # 섹션 강제 보정
         article_text = ensure_output_sections(article_text, keyword or "", title)
         log_and_print(logger, f"\n📊 기사 길이 비교: 원본 {len(body)}자 → 재구성 {len(article_text)}자")
 
         # 4) 사실검증(Fast-Pass 우선)
+        check_cancel()
         if FAST_MODE and _fast_pass_consistency(article_text, body):
             # Fast-Pass 내부 진단 로그 강화
             log_and_print(
@@ -706,6 +828,9 @@ def generate_article(state: dict) -> dict:
                 (keyword or "check_LLM"),
                 source_url=url,                  # 원문 링크 전달 (로깅/추적용)
                 published_kst=published_kst,     # 시제 참고용
+                use_cache=use_cache,
+                force_refresh=force_refresh,
+                cancel_token=cancel_token,
             )
             t_factcheck = perf_counter() - t_fc_start
             log_and_print(logger, f"⏱ 사실검증 소요: {t_factcheck:.2f}s")
@@ -793,6 +918,10 @@ def generate_article(state: dict) -> dict:
             "display_kind": "error",
             "error": str(e)
         }
+    finally:
+        # 마감용으로 만든 하위 토큰의 타이머 정리
+        if cancel_token is not None and cancel_token is not state.get("cancel_token"):
+            cancel_token.close()
 
 if __name__ == "__main__":
     print("🔗 기사 URL과 키워드를 입력하면 Gemini가 재작성한 기사로 변환해줍니다.")
@@ -1,5 +1,5 @@
-import requests
 import pandas as pd
+from news.src.utils import http_client
 
 HEADERS = {
     "User-Agent": "Mozilla/5.0",
@@ -81,7 +81,7 @@ def filter_by_market(df, only_domestic=False, only_foreign=False):
 
 def get_toss_stock_data(debug=False, start_rank=1, end_rank=None, abs_min=None, abs_max=None, only_down=False, only_domestic=False, only_foreign=False):
     ranking_url = "https://wts-cert-api.tossinvest.com/api/v2/dashboard/wts/overview/ranking"
-    res = requests.post(ranking_url, headers=HEADERS, json=PAYLOAD)
+    res = http_client.post(ranking_url, headers=HEADERS, json=PAYLOAD)
     products = res.json().get("result", {}).get("products", [])
 
     # 🔹 productCode → (name, rank) 매핑 생성
@@ -89,7 +89,7 @@ def get_toss_stock_data(debug=False, start_rank=1, end_rank=None, abs_min=None,
 
     codes_str = "%2C".join(code_to_info.keys())
     price_url = f"https://wts-info-api.tossinvest.com/api/v3/stock-prices?meta=true&productCodes={codes_str}"
-    res2 = requests.get(price_url, headers=HEADERS)
+    res2 = http_client.get(price_url, headers=HEADERS)
     items = res2.json().get("result", [])
 
     rows = []
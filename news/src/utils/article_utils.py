@@ -3,14 +3,20 @@
 # 기능 : 기사 본문 + 작성일 추출 모듈
 # ------------------------------------------------------------------
 from .driver_utils import initialize_driver
-import requests
-from bs4 import BeautifulSoup
+from . import extractor_stats
+from . import boilerplate
+from .html_parser import parse_html
+from . import http_client
+from bs4 import BeautifulSoup, Tag, Comment
 from newspaper import Article
-from typing import Callable, Optional, Tuple, List, Iterable
+from typing import Callable, Optional, Tuple, List
 import re
 import json
 from urllib.parse import urljoin
 import os
+import time
+import threading
+from collections import OrderedDict
 from datetime import datetime, timezone
 from email.utils import parsedate_to_datetime
 
@@ -52,27 +58,43 @@ HEADERS = {
 # ------------------------------------------------------------------
 def extract_article_content(
     url: str,
-    progress_callback: Optional[Callable[[str], None]] = None
+    progress_callback: Optional[Callable[[str], None]] = None,
+    cancel_token=None
 ) -> Tuple[str, str]:
     """
     주어진 기사 URL에서 제목과 본문을 추출.
     여러 방식으로 시도해 충분한 길이의 본문을 얻으면 성공.
     :param url: 뉴스 기사 URL
     :param progress_callback: (선택 사항) 진행 상태를 알리기 위한 콜백 함수
+    :param cancel_token: (선택 사항) 취소 토큰. 추출기 시도 사이마다 확인하며 취소 시 CancelledError 발생
     :return: (제목, 본문)
     """
-    extractors = [
-        extract_with_newspaper,
-        extract_with_smart_parser,
-        extract_with_iframe,
-    ]
-
-    for extractor in extractors:
+    extractors = {
+        "newspaper": extract_with_newspaper,
+        "smart_parser": extract_with_smart_parser,
+        "iframe": extract_with_iframe,
+    }
+
+    # 도메인별 과거 성공률/지연 통계로 시도 순서 결정 (통계 없으면 기본 순서)
+    order = extractor_stats.order_extractors(url, list(extractors))
+
+    for name in order:
+        if cancel_token is not None:
+            cancel_token.raise_if_cancelled()
+        extractor = extractors[name]
+        started = time.perf_counter()
         try:
             if progress_callback:
                 progress_callback(f"[본문] {extractor.__name__} 시도")
-            title, body = extractor(url)
-            if len(body) >= MIN_BODY_LENGTH:
+            title, raw_body = extractor(url)
+            # 바이라인/저작권 문구/관련기사 목록 등을 먼저 걷어낸 뒤 길이 검사
+            body, cleaned = boilerplate.clean(url, raw_body or "")
+            success = len(body) >= MIN_BODY_LENGTH
+            extractor_stats.record(url, name, success, time.perf_counter() - started)
+            if cleaned["removed_bytes"] and progress_callback:
+                progress_callback(f"[본문] 상투 문구 제거 {cleaned['removed_bytes']}B {cleaned['rules']}")
+            if success:
+                boilerplate.learn(url, raw_body)
                 if progress_callback:
                     progress_callback(f"[본문] {extractor.__name__} 성공 (len={len(body)})")
                 return title, body
@@ -80,12 +102,101 @@ def extract_article_content(
                 if progress_callback:
                     progress_callback(f"[본문] {extractor.__name__} 본문 짧음 (len={len(body)})")
         except Exception as e:
+            extractor_stats.record(url, name, False, time.perf_counter() - started)
             if progress_callback:
                 progress_callback(f"[본문] {extractor.__name__} 예외: {e}")
             continue
 
     raise ValueError("기사 본문 추출 실패")
 
+# ------------------------------------------------------------------
+# 작성자 : 최준혁
+# 작성일 : 2026-10-18
+# 기능 : 기사 추출 결과 메모리 캐시 (URL 입력 즉시 선추출 → 버튼 클릭 시 재사용)
+# ------------------------------------------------------------------
+# 최근 추출 결과 보관 개수 / 유효 시간(초)
+EXTRACTION_CACHE_SIZE = 32
+EXTRACTION_CACHE_TTL = 15 * 60
+
+_extraction_cache: "OrderedDict[str, Tuple[float, str, str]]" = OrderedDict()
+_extraction_inflight = {}
+_extraction_lock = threading.Lock()
+
+
+def _cache_key(url: str) -> str:
+    return (url or "").strip().split("#", 1)[0]
+
+
+def get_cached_article(url: str) -> Optional[Tuple[str, str]]:
+    """
+    캐시된 (제목, 본문) 반환. 없거나 만료되었으면 None
+    """
+    key = _cache_key(url)
+    with _extraction_lock:
+        entry = _extraction_cache.get(key)
+        if not entry:
+            return None
+        saved_at, title, body = entry
+        if time.monotonic() - saved_at > EXTRACTION_CACHE_TTL:
+            del _extraction_cache[key]
+            return None
+        _extraction_cache.move_to_end(key)
+        return title, body
+
+
+def cache_article(url: str, title: str, body: str):
+    key = _cache_key(url)
+    with _extraction_lock:
+        _extraction_cache[key] = (time.monotonic(), title, body)
+        _extraction_cache.move_to_end(key)
+        while len(_extraction_cache) > EXTRACTION_CACHE_SIZE:
+            _extraction_cache.popitem(last=False)
+
+
+def extract_article_content_cached(
+    url: str,
+    progress_callback: Optional[Callable[[str], None]] = None,
+    cancel_token=None
+) -> Tuple[str, str]:
+    """
+    캐시를 먼저 확인하고, 없으면 extract_article_content 로 추출 후 캐시에 저장.
+    같은 URL을 다른 스레드(선추출 워커 등)가 이미 추출 중이면 새로 요청하지 않고 그 결과를 기다린다.
+    :param url: 뉴스 기사 URL
+    :param progress_callback: (선택 사항) 진행 상태 콜백
+    :param cancel_token: (선택 사항) 취소 토큰
+    :return: (제목, 본문)
+    """
+    key = _cache_key(url)
+    while True:
+        cached = get_cached_article(key)
+        if cached is not None:
+            if progress_callback:
+                progress_callback(f"[본문] 미리 추출된 결과 사용 (len={len(cached[1])})")
+            return cached
+
+        with _extraction_lock:
+            pending = _extraction_inflight.get(key)
+            if pending is None:
+                done = _extraction_inflight[key] = threading.Event()
+                break
+
+        # 진행 중인 추출이 끝날 때까지 대기 (취소되면 즉시 중단)
+        if progress_callback:
+            progress_callback("[본문] 미리 추출 중인 결과 대기...")
+        while not pending.wait(0.2):
+            if cancel_token is not None:
+                cancel_token.raise_if_cancelled()
+        # 선행 추출이 실패/취소되었으면 캐시가 비어 있으므로 루프에서 직접 추출
+
+    try:
+        title, body = extract_article_content(url, progress_callback=progress_callback, cancel_token=cancel_token)
+        cache_article(key, title, body)
+        return title, body
+    finally:
+        with _extraction_lock:
+            _extraction_inflight.pop(key, None)
+        done.set()
+
 # ------------------------------------------------------------------
 # 기능 : newspaper 라이브러리 사용(기존)
 # ------------------------------------------------------------------
@@ -99,8 +210,8 @@ def extract_with_newspaper(url: str) -> tuple[str, str]:
 # 기능 : BeautifulSoup 스마트 파싱(기존)
 # ------------------------------------------------------------------
 def extract_with_smart_parser(url: str) -> tuple[str, str]:
-    res = requests.get(url, headers=HEADERS, timeout=10)
-    soup = BeautifulSoup(res.text, 'html.parser')
+    res = http_client.get(url, headers=HEADERS)
+    soup = parse_html(res.text)
 
     title = "제목 없음"
     for selector in ['h1', '.article-title', '.news-title', '.entry-title', 'meta[property="og:title"]', 'meta[name="title"]']:
@@ -131,8 +242,9 @@ def extract_with_smart_parser(url: str) -> tuple[str, str]:
 # 기능 : iframe 처리(기존)
 # ------------------------------------------------------------------
 def extract_with_iframe(url: str) -> tuple[str, str]:
-    res = requests.get(url, headers=HEADERS, timeout=10)
-    soup = BeautifulSoup(res.text, 'html.parser')
+    res = http_client.get(url, headers=HEADERS)
+    # 제목과 iframe 위치만 필요하므로 해당 태그만 트리로 구성
+    soup = parse_html(res.text, only=['h1', 'title', 'meta', 'iframe'])
     
     title_tag = soup.select_one('h1') or soup.select_one('title') or soup.select_one('meta[property="og:title"]')
     if title_tag and getattr(title_tag, 'name', '') == 'meta':
@@ -146,8 +258,8 @@ def extract_with_iframe(url: str) -> tuple[str, str]:
     for iframe in iframes:
         iframe_url = urljoin(url, iframe.get("src"))
         try:
-            iframe_res = requests.get(iframe_url, headers=HEADERS, timeout=10)
-            iframe_soup = BeautifulSoup(iframe_res.text, 'html.parser')
+            iframe_res = http_client.get(iframe_url, headers=HEADERS)
+            iframe_soup = parse_html(iframe_res.text)
             body = ""
             for selector in ['article', '.articleBody', '.view_content', '.post-content', '#articleBody', '#news_body', '.news_body']:
                 body_area = iframe_soup.select_one(selector)
@@ -263,115 +375,6 @@ def _to_kst_string(dt: datetime) -> str:
 def _clean_text(s: str) -> str:
     return re.sub(r'\s+', ' ', s or '').strip()
 
-def _iter_ldjson_objects(soup: BeautifulSoup) -> Iterable[dict]:
-    for tag in soup.find_all('script', type=lambda t: t and 'ld+json' in t):
-        try:
-            txt = tag.string or tag.get_text() or ''
-            if not txt.strip():
-                continue
-            # 일부 사이트는 여러 JSON 객체를 배열로 묶기도 함
-            data = json.loads(txt)
-            if isinstance(data, dict):
-                yield data
-            elif isinstance(data, list):
-                for obj in data:
-                    if isinstance(obj, dict):
-                        yield obj
-        except Exception:
-            continue
-
-def _extract_from_ldjson(soup: BeautifulSoup) -> Optional[datetime]:
-    for obj in _iter_ldjson_objects(soup):
-        t = (obj.get('datePublished')
-             or obj.get('dateCreated')
-             or (obj.get('publication', {}) or {}).get('datePublished'))
-        if isinstance(t, str) and t.strip():
-            dt = _try_parse_datetime(t)
-            if dt:
-                return dt
-    return None
-
-def _extract_from_meta(soup: BeautifulSoup) -> Optional[datetime]:
-    # property / name 둘 다 검사
-    for key in _META_DATE_KEYS:
-        # property
-        for tag in soup.select(f'meta[property="{key}"]'):
-            val = tag.get('content') or ''
-            if val.strip():
-                dt = _try_parse_datetime(val)
-                if dt:
-                    return dt
-        # name
-        for tag in soup.select(f'meta[name="{key}"]'):
-            val = tag.get('content') or ''
-            if val.strip():
-                dt = _try_parse_datetime(val)
-                if dt:
-                    return dt
-
-    # 일반적인 meta[name="date"] 변형
-    for tag in soup.find_all('meta'):
-        name = (tag.get('name') or tag.get('property') or '').lower()
-        if any(k in name for k in ['date', 'time', 'published', 'issued', 'created']):
-            val = tag.get('content') or ''
-            if val.strip():
-                dt = _try_parse_datetime(val)
-                if dt:
-                    return dt
-    return None
-
-def _extract_from_time_tags(soup: BeautifulSoup) -> Optional[datetime]:
-    for t in soup.find_all('time'):
-        # <time datetime="..."> 가 가장 신뢰도 높음
-        val = t.get('datetime') or ''
-        if val.strip():
-            dt = _try_parse_datetime(val)
-            if dt:
-                return dt
-        # 텍스트 노드에 날짜가 들어 있는 경우
-        txt = _clean_text(t.get_text())
-        if txt:
-            dt = _try_parse_datetime(txt)
-            if dt:
-                return dt
-    return None
-
-def _extract_from_text_patterns(soup: BeautifulSoup) -> Optional[datetime]:
-    # 흔히 쓰는 위치들만 제한적으로 검사(오탐 줄이기)
-    candidates: List[str] = []
-    for sel in ['.date', '.byline', '.timestamp', '.article_info', '.news_date', '.write', '.author', '.info', '#news_date']:
-        for tag in soup.select(sel):
-            txt = _clean_text(tag.get_text())
-            if txt:
-                candidates.append(txt)
-
-    # 상단/하단에 있는 작은 텍스트들도 가끔 날짜 포함
-    for tag in soup.find_all(['span', 'em', 'p', 'div'], limit=80):
-        txt = _clean_text(tag.get_text())
-        if any(key in txt for key in ['입력', '게재', '발행', '업데이트', '수정', 'Published', 'Updated']):
-            candidates.append(txt)
-
-    for text in candidates:
-        # 직접 파서 시도
-        dt = _try_parse_datetime(text)
-        if dt:
-            return dt
-        # 정규식 보조
-        for rx in _TEXT_DATE_REGEXES:
-            m = rx.search(text)
-            if m:
-                try:
-                    y = int(m.group(1))
-                    mo = int(m.group(2))
-                    d = int(m.group(3))
-                    hh = int(m.group(4)) if m.lastindex and m.lastindex >= 4 and m.group(4) else 0
-                    mm = int(m.group(5)) if m.lastindex and m.lastindex >= 5 and m.group(5) else 0
-                    dt = datetime(y, mo, d, hh, mm, tzinfo=KST)
-                    return dt
-                except Exception:
-                    continue
-    return None
-
 def _extract_from_url(url: str) -> Optional[datetime]:
     for rx in _URL_DATE_REGEXES:
         m = rx.search(url)
@@ -388,50 +391,232 @@ def _extract_from_url(url: str) -> Optional[datetime]:
                 continue
     return None
 
-def extract_publish_datetime_from_html(html: str, base_url: Optional[str] = None) -> Optional[str]:
+# ----- 단일 패스 날짜 추출 엔진 -------------------------------------
+# DOM을 한 번만 순회하며 ld+json / meta / <time> / 날짜 블록 / '입력·수정' 문구 후보를 모으고,
+# 출처 신뢰도 순으로 파싱한다. ld+json 또는 최상위 meta(article/og:published_time)가 파싱되면 즉시 종료.
+_CONF_LDJSON = 100
+_CONF_META_TOP = 95          # article:published_time / og:published_time
+_CONF_META = 90              # _META_DATE_KEYS (목록 순서대로 감점)
+_CONF_META_GENERIC = 65      # 이름에 date/time/published 등이 포함된 meta
+_CONF_TIME_ATTR = 60         # <time datetime="...">
+_CONF_TIME_TEXT = 55         # <time>텍스트</time>
+_CONF_TEXT_PUBLISHED = 45    # '입력/게재/발행/등록 2025.09.02 11:30'
+_CONF_DATE_BLOCK = 40        # .date / .byline 등 날짜 블록 텍스트
+_CONF_TEXT_UPDATED = 35      # '수정/업데이트/Updated ...'
+_CONF_URL = 10
+
+_META_KEY_RANK = {k.lower(): i for i, k in enumerate(_META_DATE_KEYS)}
+_META_TOP_KEYS = {'article:published_time', 'og:published_time'}
+_META_GENERIC_HINTS = ('date', 'time', 'published', 'issued', 'created')
+
+_DATE_BLOCK_CLASSES = {'date', 'byline', 'timestamp', 'article_info', 'news_date', 'write', 'author', 'info'}
+_DATE_BLOCK_IDS = {'news_date'}
+_SKIP_TEXT_PARENTS = {'script', 'style', 'noscript', 'template'}
+
+# 날짜 문구 앞에 붙는 키워드로 앵커링한 정규식 (그룹: 키워드, 연, 월, 일, 오전/오후, 시, 분)
+_ANCHORED_DATE_RX = re.compile(
+    r'(입력|게재|발행|등록|승인|Published|수정|업데이트|Updated)\s*(?:일시|시간)?\s*[:：]?\s*'
+    r'(\d{4})\s*[.\-/년]\s*(\d{1,2})\s*[.\-/월]\s*(\d{1,2})\s*[일.]?\s*'
+    r'(?:\([^)]{1,3}\)\s*)?(?:(오전|오후|AM|PM)\s*)?(?:(\d{1,2})\s*[:시]\s*(\d{2}))?',
+    re.IGNORECASE,
+)
+_DATE_KEYWORD_RX = re.compile(r'입력|게재|발행|등록|승인|수정|업데이트|Published|Updated', re.IGNORECASE)
+_UPDATED_KEYWORDS = {'수정', '업데이트', 'updated'}
+
+# 후보 텍스트 검사 상한 (날짜 문구는 짧으므로 긴 블록 전체를 정규식에 돌리지 않음)
+_MAX_CANDIDATE_TEXT = 300
+_MAX_KEYWORD_CANDIDATES = 20
+
+
+def _ldjson_date_values(txt: str) -> List[str]:
+    values = []
+    try:
+        data = json.loads(txt)
+    except Exception:
+        return values
+    objs = data if isinstance(data, list) else [data]
+    for obj in objs:
+        if not isinstance(obj, dict):
+            continue
+        # @graph 로 묶인 경우도 처리
+        graph = obj.get('@graph')
+        if isinstance(graph, list):
+            objs.extend(g for g in graph if isinstance(g, dict))
+        t = (obj.get('datePublished')
+             or obj.get('dateCreated')
+             or (obj.get('publication', {}) or {}).get('datePublished'))
+        if isinstance(t, str) and t.strip():
+            values.append(t.strip())
+    return values
+
+
+def _datetime_from_match(m: re.Match, offset: int = 0) -> Optional[datetime]:
     """
-    HTML 문자열에서 기사 작성일을 추출하여 'YYYYMMDD HH:MM'(KST)로 반환.
-    실패시 None.
+    (연, 월, 일, [오전/오후], [시], [분]) 그룹을 datetime(KST)로 변환. offset은 앞선 그룹 수.
     """
-    if not html:
+    try:
+        y = int(m.group(offset + 1))
+        mo = int(m.group(offset + 2))
+        d = int(m.group(offset + 3))
+        ampm = m.group(offset + 4)
+        hh = int(m.group(offset + 5)) if m.group(offset + 5) else 0
+        mm = int(m.group(offset + 6)) if m.group(offset + 6) else 0
+        if ampm and ampm.upper() in ('오후', 'PM') and hh < 12:
+            hh += 12
+        elif ampm and ampm.upper() in ('오전', 'AM') and hh == 12:
+            hh = 0
+        return datetime(y, mo, d, hh, mm, tzinfo=KST)
+    except Exception:
         return None
-    soup = BeautifulSoup(html, 'html.parser')
 
-    # 1) ld+json
-    dt = _extract_from_ldjson(soup)
-    if dt:
-        return _to_kst_string(dt)
 
-    # 2) meta
-    dt = _extract_from_meta(soup)
-    if dt:
-        return _to_kst_string(dt)
+def _datetime_from_text_regexes(text: str) -> Optional[datetime]:
+    for rx in _TEXT_DATE_REGEXES:
+        m = rx.search(text)
+        if m:
+            try:
+                y, mo, d = int(m.group(1)), int(m.group(2)), int(m.group(3))
+                hh = int(m.group(4)) if m.lastindex and m.lastindex >= 4 and m.group(4) else 0
+                mm = int(m.group(5)) if m.lastindex and m.lastindex >= 5 and m.group(5) else 0
+                return datetime(y, mo, d, hh, mm, tzinfo=KST)
+            except Exception:
+                continue
+    return None
 
-    # 3) <time>
-    dt = _extract_from_time_tags(soup)
-    if dt:
-        return _to_kst_string(dt)
 
-    # 4) 텍스트 패턴
-    dt = _extract_from_text_patterns(soup)
-    if dt:
-        return _to_kst_string(dt)
+def _collect_date_candidates(soup: BeautifulSoup) -> Tuple[Optional[datetime], List[tuple]]:
+    """
+    DOM을 한 번 순회하며 날짜 후보를 수집한다.
+    :return: (조기 종료 시 확정 datetime 또는 None, [(신뢰도, 순번, 종류, 값)] 후보 목록)
+    종류: 'raw'(파서로 해석할 문자열) | 'block'(정규식 검사할 블록 텍스트) | 'dt'(이미 해석된 datetime)
+    """
+    candidates: List[tuple] = []
+    seq = 0
+    keyword_hits = 0
+
+    for node in soup.descendants:
+        if isinstance(node, Tag):
+            name = node.name
+            if name == 'script':
+                if 'ld+json' in (node.get('type') or ''):
+                    for value in _ldjson_date_values(node.string or node.get_text() or ''):
+                        dt = _try_parse_datetime(value)
+                        if dt:
+                            return dt, candidates
+                continue
+            if name == 'meta':
+                val = (node.get('content') or '').strip()
+                if not val:
+                    continue
+                key = (node.get('property') or node.get('name') or node.get('itemprop') or '').strip().lower()
+                if key in _META_TOP_KEYS:
+                    dt = _try_parse_datetime(val)
+                    if dt:
+                        return dt, candidates
+                elif key in _META_KEY_RANK:
+                    candidates.append((_CONF_META - _META_KEY_RANK[key] * 0.1, seq, 'raw', val))
+                elif any(h in key for h in _META_GENERIC_HINTS):
+                    candidates.append((_CONF_META_GENERIC, seq, 'raw', val))
+                seq += 1
+                continue
+            if name == 'time':
+                val = (node.get('datetime') or '').strip()
+                if val:
+                    candidates.append((_CONF_TIME_ATTR, seq, 'raw', val))
+                txt = _clean_text(node.get_text())
+                if txt:
+                    candidates.append((_CONF_TIME_TEXT, seq, 'raw', txt[:_MAX_CANDIDATE_TEXT]))
+                seq += 1
+                continue
+            classes = node.get('class') or []
+            if (_DATE_BLOCK_CLASSES.intersection(classes)) or node.get('id') in _DATE_BLOCK_IDS:
+                txt = _clean_text(node.get_text())
+                if txt:
+                    candidates.append((_CONF_DATE_BLOCK, seq, 'block', txt[:_MAX_CANDIDATE_TEXT]))
+                    seq += 1
+            continue
 
-    # 5) URL 패턴
-    if base_url:
-        dt = _extract_from_url(base_url)
+        # 텍스트 노드: '입력/수정' 등 키워드가 있는 경우만 부모 문맥과 함께 앵커 정규식 적용
+        if keyword_hits >= _MAX_KEYWORD_CANDIDATES or isinstance(node, Comment):
+            continue
+        parent = node.parent
+        if parent is None or parent.name in _SKIP_TEXT_PARENTS:
+            continue
+        if not _DATE_KEYWORD_RX.search(node):
+            continue
+        # '<span>입력</span> 2025.09.02' 처럼 키워드와 날짜가 형제 노드로 나뉜 경우를 위해 2단계까지 상위 문맥 확인
+        m = None
+        scope = parent
+        for _ in range(2):
+            if scope is None:
+                break
+            context = _clean_text(scope.get_text())
+            if len(context) > _MAX_CANDIDATE_TEXT:
+                break
+            m = _ANCHORED_DATE_RX.search(context)
+            if m:
+                break
+            scope = scope.parent
+        if m is None:
+            m = _ANCHORED_DATE_RX.search(_clean_text(str(node)))
+        if m:
+            dt = _datetime_from_match(m, offset=1)
+            if dt:
+                conf = _CONF_TEXT_UPDATED if m.group(1).lower() in _UPDATED_KEYWORDS else _CONF_TEXT_PUBLISHED
+                candidates.append((conf, seq, 'dt', dt))
+                seq += 1
+                keyword_hits += 1
+
+    return None, candidates
+
+
+def extract_publish_datetime_from_soup(soup: BeautifulSoup, base_url: Optional[str] = None) -> Optional[datetime]:
+    """
+    파싱된 문서(BeautifulSoup)에서 기사 작성일 datetime을 추출 (단일 DOM 순회).
+    이미 받아 둔 문서를 재사용할 수 있도록 soup을 직접 받는다.
+    :param soup: 파싱된 기사 문서
+    :param base_url: 기사 URL (문서에서 못 찾으면 URL 패턴으로 보조 추출)
+    :return: datetime 또는 None
+    """
+    if soup is None:
+        return None
+    confident, candidates = _collect_date_candidates(soup)
+    if confident:
+        return confident
+
+    # 신뢰도 높은 순 → 같은 신뢰도면 문서 앞쪽 우선
+    for _conf, _seq, kind, value in sorted(candidates, key=lambda c: (-c[0], c[1])):
+        if kind == 'dt':
+            return value
+        if kind == 'raw':
+            dt = _try_parse_datetime(value)
+        else:
+            dt = _datetime_from_text_regexes(value)
         if dt:
-            return _to_kst_string(dt)
+            return dt
 
+    if base_url:
+        return _extract_from_url(base_url)
     return None
 
+def extract_publish_datetime_from_html(html: str, base_url: Optional[str] = None) -> Optional[str]:
+    """
+    HTML 문자열에서 기사 작성일을 추출하여 'YYYYMMDD HH:MM'(KST)로 반환.
+    실패시 None.
+    """
+    if not html:
+        return None
+    soup = parse_html(html)
+    dt = extract_publish_datetime_from_soup(soup, base_url=base_url)
+    return _to_kst_string(dt) if dt else None
+
 def extract_publish_datetime(url: str) -> Optional[str]:
     """
     주어진 기사 URL에서 작성일(발행일)을 'YYYYMMDD HH:MM'(KST)로 반환.
     실패 시 None.
     """
     try:
-        res = requests.get(url, headers=HEADERS, timeout=10)
+        res = http_client.get(url, headers=HEADERS)
     except Exception:
         # URL 패턴만이라도 시도
         dt = _extract_from_url(url)
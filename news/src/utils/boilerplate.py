@@ -0,0 +1,277 @@
+# ------------------------------------------------------------------
+# 작성자 : 최준혁
+# 작성일 : 2026-10-18
+# 기능 : 추출된 기사 본문의 상투 문구(바이라인/저작권 문구/관련기사 목록/광고·공유 문구) 규칙 기반 제거
+# ------------------------------------------------------------------
+# 추출기가 돌려준 본문에는 "홍길동 기자 hong@..." / "무단전재 및 재배포 금지" / 관련기사 목록 등이 섞여
+# MIN_BODY_LENGTH 검사를 잘못 통과시키고 Gemini 입력 토큰만 늘린다.
+#
+# - 1단계: 미리 컴파일한 정규식으로 줄 단위 제거 — 줄 전체가 상투 문구일 때만 (본문 문장 속 단어는 그대로)
+#   관련기사 머리줄(머리줄만 있는 줄)이 본문 뒤쪽에 있으면 바로 아래의 짧은 목록 줄까지만 제거
+# - 2단계: 도메인별 줄 빈도 — 성공한 추출 결과에서 같은 줄이 여러 기사(BOILERPLATE_MIN_ARTICLES 이상,
+#   비율 BOILERPLATE_MIN_RATIO 이상)에 반복되면 그 사이트의 고정 문구로 보고 제거
+#   줄 키는 도메인당 _MAX_LINES_PER_DOMAIN개까지, 넘치면 가장 오래 안 나온 줄부터 제거(LRU)
+#   비율의 분모는 도메인별 학습 기사 수(articles) — _ARTICLE_WINDOW에 닿으면 기사 수와 줄 빈도를 함께 절반으로 줄여
+#   최근 기사 기준 비율을 유지 (줄 빈도만 계속 커져 본문 소제목까지 고정 문구로 잡히지 않도록)
+# - 결과: clean()은 (정제 본문, {"removed_bytes", "rules": {규칙: 줄 수}}) 반환, 누적치는 stats()
+# - 비활성: 환경변수 BOILERPLATE_CLEAN=0
+# - 저장 위치: CWD/.cache_pressai/boilerplate_lines.json
+#   (학습마다 쓰지 않고 _SAVE_INTERVAL 초에 한 번 + 프로세스 종료 시 flush(), set_persist(False)면 메모리에만 유지)
+# ------------------------------------------------------------------
+import os
+import re
+import json
+import time
+import atexit
+import hashlib
+import threading
+from collections import Counter
+from typing import Dict, Optional, Tuple
+
+from .extractor_stats import domain_of
+
+BOILERPLATE_CLEAN = os.getenv("BOILERPLATE_CLEAN", "1") != "0"
+BOILERPLATE_MIN_ARTICLES = int(os.getenv("BOILERPLATE_MIN_ARTICLES", "3"))
+BOILERPLATE_MIN_RATIO = float(os.getenv("BOILERPLATE_MIN_RATIO", "0.5"))
+
+# 도메인별로 기억할 줄 수 / 최근 URL 수 (같은 기사를 두 번 학습하지 않도록)
+_MAX_LINES_PER_DOMAIN = 500
+_MAX_URLS_PER_DOMAIN = 200
+# 학습 기사 수가 이 값에 닿으면 기사 수/줄 빈도를 절반으로 (비율은 유지, 오래된 기사의 비중만 줄어듦)
+_ARTICLE_WINDOW = 2 * _MAX_URLS_PER_DOMAIN
+# 이보다 긴 줄은 본문 문장일 가능성이 높아 빈도 학습/제거 대상에서 제외
+_MAX_LEARN_LINE = 200
+
+# (규칙 이름, 줄 전체 매칭 정규식, 적용할 최대 줄 길이)
+# 줄의 시작(^)이나 끝($)에 고정해 "카카오톡 공유 기능을 개편" 같은 본문 문장은 건드리지 않는다
+_LINE_RULES = [
+    # "<저작권자 ⓒ 연합뉴스 ...>", "Copyright ⓒ ...", "... 무단 전재 및 재배포 금지", "All rights reserved."
+    ("copyright", re.compile(r"^[\[<(]?\s*(?:저작권자\s*)?(?:[ⓒ©]|\(c\)|copyright\b)"
+                             r"|(?:무단\s*(?:전재|복제)|재배포)[^.!?]{0,40}금지[\s.\])>]*$"
+                             r"|all\s+rights\s+reserved\.?\s*[\])>]?\s*$", re.I), 120),
+    ("byline", re.compile(r"^[\[(]?[가-힣]{2,4}\s*(?:선임|수석|인턴|객원)?\s*(?:기자|특파원|논설위원|에디터)\s*[\])]?\s*(?:[\w.+-]+@[\w-]+(?:\.[\w-]+)+)?\s*$"), 120),
+    ("email", re.compile(r"^[\[(<]?\s*[\w.+-]+@[\w-]+(?:\.[\w-]+)+\s*[\])>]?$"), 120),
+    # 공유 버튼 줄: "카카오톡 공유 페이스북 공유 링크 복사" 처럼 버튼 이름만 나열된 줄
+    ("share", re.compile(r"^(?:(?:카카오톡|카카오스토리|페이스북|트위터|네이버\s*블로그|밴드|링크|URL)\s*(?:공유|보내기|복사)?\s*[|/·,]?\s*)+$"
+                         r"|^(공유하기|스크랩|인쇄|글자\s*크기|댓글|좋아요|구독|기사\s*제보|제보하기)\s*$"), 40),
+    ("ad", re.compile(r"^(광고|AD|ADVERTISEMENT|Advertisement|sponsored|Sponsored)\s*$|^▶.*(바로가기|구독|클릭|다운로드)|^☞"), 120),
+]
+# 관련기사 머리줄: 머리말만 있는 줄 ("[관련기사]", "관련 뉴스 더보기", "【많이 본 뉴스】")
+_RELATED_HEADER = re.compile(r"^\s*[\[<【]?\s*(관련\s*기사|관련\s*뉴스|함께\s*보면\s*좋은\s*(?:기사|뉴스)?|많이\s*본\s*뉴스|추천\s*기사|인기\s*기사"
+                             r"|이\s*시각\s*주요\s*뉴스|주요\s*뉴스)\s*[\]>】]?\s*(?:더\s*보기|보기)?\s*[:：]?\s*$")
+# 머리줄 아래 목록 항목으로 볼 최대 길이 / 문장 끝 표시 (이런 줄이 나오면 목록이 끝난 것으로 봄)
+_RELATED_ITEM_MAX = 80
+_SENTENCE_END = re.compile(r"(다|요|니다|습니다)[.!?]?[\"'”’)]*$")
+_RULE_LINE_MAX = 120
+
+# 파일 저장 최소 간격(초)
+_SAVE_INTERVAL = 30.0
+
+_lock = threading.Lock()
+_store: Optional[Dict[str, dict]] = None
+_totals: Dict[str, dict] = {}
+_dirty = False
+_last_save = 0.0
+_persist = True
+
+
+def _get_store_path() -> str:
+    base = os.path.join(os.getcwd(), ".cache_pressai")
+    try:
+        os.makedirs(base, exist_ok=True)
+    except Exception:
+        pass
+    return os.path.join(base, "boilerplate_lines.json")
+
+
+def _load() -> Dict[str, dict]:
+    global _store
+    if _store is None:
+        try:
+            with open(_get_store_path(), "r", encoding="utf-8") as f:
+                data = json.load(f)
+            _store = data if isinstance(data, dict) else {}
+        except Exception:
+            _store = {}
+    return _store
+
+
+def _save_locked():
+    global _dirty, _last_save
+    _dirty = False
+    _last_save = time.monotonic()
+    if not _persist:
+        return
+    path = _get_store_path()
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(_store, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+    except Exception as e:
+        print(f"[WARNING] 상투 문구 통계 저장 실패: {e}")
+
+
+def flush():
+    """
+    학습한 줄 빈도를 즉시 파일에 저장 (종료 시 자동 호출)
+    """
+    with _lock:
+        if _dirty:
+            _save_locked()
+
+
+def set_persist(enabled: bool):
+    """
+    파일 저장 여부 설정 (벤치마크/재생 실행에서 디스크 기록을 막을 때 False)
+    """
+    global _persist
+    with _lock:
+        _persist = bool(enabled)
+
+
+atexit.register(flush)
+
+
+def _normalize(line: str) -> str:
+    return re.sub(r"\s+", " ", line).strip()
+
+
+def _line_key(line: str) -> str:
+    return hashlib.sha1(_normalize(line).encode("utf-8")).hexdigest()[:16]
+
+
+def _articles(entry: dict) -> int:
+    """
+    줄 빈도와 같은 기간의 학습 기사 수
+    :param entry: 도메인 항목
+    :return: 기사 수 (이전 형식은 학습 순번/URL 수/최대 줄 빈도 중 큰 값으로 추정)
+    """
+    if "articles" in entry:
+        return entry["articles"]
+    counts = [_line_count(v) for v in entry.get("lines", {}).values()]
+    return max([entry.get("seq", 0), len(entry.get("urls", []))] + counts)
+
+
+def _frequent_keys(domain: str) -> set:
+    with _lock:
+        entry = _load().get(domain)
+        if not entry:
+            return set()
+        articles = _articles(entry)
+        if articles < BOILERPLATE_MIN_ARTICLES:
+            return set()
+        threshold = max(BOILERPLATE_MIN_ARTICLES, BOILERPLATE_MIN_RATIO * articles)
+        return {k for k, v in entry.get("lines", {}).items() if _line_count(v) >= threshold}
+
+
+def _line_count(value) -> int:
+    # 줄 값: [등장 기사 수, 마지막 등장 순번] (이전 형식은 등장 기사 수 정수)
+    return value[0] if isinstance(value, list) else int(value)
+
+
+def _rule_for(line: str) -> Optional[str]:
+    for name, rx, max_len in _LINE_RULES:
+        if len(line) <= max_len and rx.search(line):
+            return name
+    return None
+
+
+def clean(url: str, body: str) -> Tuple[str, dict]:
+    """
+    본문에서 상투 문구 줄을 제거한다. (길이 검사/프롬프트 구성 전에 호출)
+    :param url: 기사 URL (도메인별 빈도 규칙 조회용)
+    :param body: 추출된 본문
+    :return: (정제된 본문, {"removed_bytes": 제거 바이트 수, "rules": {규칙 이름: 제거 줄 수}})
+    """
+    report = {"removed_bytes": 0, "rules": {}}
+    if not BOILERPLATE_CLEAN or not body:
+        return body, report
+
+    lines = body.split("\n")
+    frequent = _frequent_keys(domain_of(url))
+    rules = Counter()
+    kept = []
+    related_cut = False
+    for idx, line in enumerate(lines):
+        stripped = line.strip()
+        if not stripped:
+            kept.append(line)
+            continue
+        if related_cut:
+            # 머리줄 아래의 짧은 제목 목록만 제거, 문장이 나오면 목록이 끝난 것
+            if len(stripped) <= _RELATED_ITEM_MAX and not _SENTENCE_END.search(stripped):
+                rules["related"] += 1
+                continue
+            related_cut = False
+        if len(stripped) <= _RULE_LINE_MAX and _RELATED_HEADER.match(stripped):
+            rules["related"] += 1
+            # 본문 뒤쪽(60% 이후)에 나온 관련기사 머리줄이면 아래 목록까지 모두 제거
+            related_cut = idx >= len(lines) * 0.6
+            continue
+        rule = _rule_for(stripped)
+        if rule is None and frequent and len(stripped) <= _MAX_LEARN_LINE and _line_key(stripped) in frequent:
+            rule = "domain_frequent"
+        if rule:
+            rules[rule] += 1
+            continue
+        kept.append(line)
+
+    cleaned = re.sub(r"\n{3,}", "\n\n", "\n".join(kept)).strip()
+    removed = len(body.encode("utf-8")) - len(cleaned.encode("utf-8"))
+    report["removed_bytes"] = max(0, removed)
+    report["rules"] = dict(rules)
+
+    domain = domain_of(url)
+    with _lock:
+        total = _totals.setdefault(domain, {"articles": 0, "removed_bytes": 0})
+        total["articles"] += 1
+        total["removed_bytes"] += report["removed_bytes"]
+    return cleaned, report
+
+
+def learn(url: str, raw_body: str):
+    """
+    성공한 추출 결과(정제 전 본문)의 짧은 줄들을 도메인별 빈도 통계에 반영
+    """
+    if not BOILERPLATE_CLEAN or not raw_body:
+        return
+    domain = domain_of(url)
+    url_key = _line_key((url or "").split("#", 1)[0])
+    keys = {_line_key(s) for s in (l.strip() for l in raw_body.split("\n")) if s and len(s) <= _MAX_LEARN_LINE}
+    global _dirty
+    with _lock:
+        entry = _load().setdefault(domain, {"urls": [], "lines": {}})
+        if url_key in entry["urls"]:
+            return
+        entry["urls"] = (entry["urls"] + [url_key])[-_MAX_URLS_PER_DOMAIN:]
+        articles = _articles(entry) + 1
+        seq = entry["seq"] = entry.get("seq", 0) + 1
+        lines = entry["lines"]
+        for key in keys:
+            lines[key] = [_line_count(lines[key]) + 1 if key in lines else 1, seq]
+        while articles >= _ARTICLE_WINDOW:
+            # 기사 수와 줄 빈도를 함께 절반으로 → 비율 유지, 0이 된 줄은 제거
+            articles //= 2
+            lines = {k: [_line_count(v) // 2, v[1] if isinstance(v, list) else 0]
+                     for k, v in lines.items() if _line_count(v) >= 2}
+            entry["lines"] = lines
+        entry["articles"] = articles
+        if len(lines) > _MAX_LINES_PER_DOMAIN:
+            # 가장 오래 나오지 않은 줄부터 제거 → 새 줄도 자리를 얻고, 매 기사 반복되는 고정 문구는 계속 남는다
+            keep = sorted(lines.items(), key=lambda kv: (kv[1][1] if isinstance(kv[1], list) else 0, _line_count(kv[1])),
+                          reverse=True)[:_MAX_LINES_PER_DOMAIN]
+            entry["lines"] = dict(keep)
+        _dirty = True
+        if time.monotonic() - _last_save >= _SAVE_INTERVAL:
+            _save_locked()
+
+
+def stats(url: Optional[str] = None) -> dict:
+    """
+    이번 실행 동안 도메인별 정제 누적치 사본
+    :return: {도메인: {"articles", "removed_bytes"}}
+    """
+    domain = domain_of(url) if url else None
+    with _lock:
+        return {d: dict(v) for d, v in _totals.items() if domain is None or d == domain}
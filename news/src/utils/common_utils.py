@@ -113,9 +113,8 @@ def save_news_to_file(keyword: str, domain: str, news_content: str, save_dir: st
     file_path = os.path.join(full_save_dir, filename)
     
     try:
-        # 파일을 UTF-8 인코딩으로 저장
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write(news_content)
+        # 파일을 UTF-8 인코딩으로 저장 (작업 중단 시에도 반쯤 쓰인 파일이 남지 않도록 원자적 교체)
+        write_text_atomic(file_path, news_content)
             
         # 파일 자동 열기 기능
         try:
@@ -135,16 +134,40 @@ def save_news_to_file(keyword: str, domain: str, news_content: str, save_dir: st
         print(f"뉴스 기사 저장 중 오류 발생: {e}")
         return None # 실패 시 None 반환
 
+# ------------------------------------------------------------------
+# 작성자 : 최준혁
+# 작성일 : 2026-10-18
+# 기능 : 임시 파일에 쓴 뒤 교체하는 원자적 텍스트 저장 (임시 파일은 finally에서 항상 정리)
+# ------------------------------------------------------------------
+def write_text_atomic(path: str, text: str):
+    """
+    텍스트를 임시 파일에 먼저 쓰고 os.replace로 교체한다.
+    :param path: 최종 저장 경로
+    :param text: 저장할 내용
+    """
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            try:
+                os.remove(tmp_path)
+            except Exception:
+                pass
+
 # ------------------------------------------------------------------
 # 작성자 : 곽은규
 # 작성일 : 2025-07-30
 # 기능 : 검색(KFinanceDataReader) 통해 종목 코드를 찾는 함수
 # ------------------------------------------------------------------
-def get_stock_info_from_search(keyword: str):
+def get_stock_info_from_search(keyword: str, cancel_token=None):
     """
     키워드를 이용해 종목 코드를 찾는다. FinanceDataReader를 먼저 시도하고,
     실패하면 Naver 검색을 통해 찾는다.
     :param keyword: 종목명 또는 검색어 (예: "삼성전자", "삼성전자 주가")
+    :param cancel_token: 취소 토큰 (취소 시 드라이버를 즉시 종료)
     :return: 6자리 종목 코드, 찾지 못하면 None
     """
     from selenium import webdriver
@@ -176,6 +199,8 @@ def get_stock_info_from_search(keyword: str):
     options.add_argument("--headless") 
     options.add_argument("--no-sandbox") 
     driver = webdriver.Chrome(options=options)
+    # 취소되면 driver.get() 대기 중이라도 바로 빠져나오도록 종료 콜백 등록
+    quit_cb = cancel_token.add_callback(driver.quit) if cancel_token is not None else None
     try:
         search_url = f"https://search.naver.com/search.naver?query={search_keyword}"
         driver.get(search_url)
@@ -194,7 +219,12 @@ def get_stock_info_from_search(keyword: str):
     except Exception:
         return None
     finally:
-        driver.quit() # 드라이버 종료
+        if quit_cb is not None:
+            cancel_token.remove_callback(quit_cb)
+        try:
+            driver.quit() # 드라이버 종료
+        except Exception:
+            pass
 
 # ------------------------------------------------------------------
 # 작성자 : 최준혁
@@ -309,7 +339,7 @@ def create_template(keyword: str, is_foreign: bool, now_kst_dt: datetime = None)
 # 작성일 : 2025-07-25
 # 기능 : 차트를 캡처하고 LLM을 통해 뉴스를 생성하는 함수
 # ------------------------------------------------------------------
-def capture_and_generate_news(keyword: str, domain: str = "stock", progress_callback=None, is_running_callback=None, step_callback=None, debug=True, open_after_save=True, custom_save_dir: Optional[str] = None):
+def capture_and_generate_news(keyword: str, domain: str = "stock", progress_callback=None, is_running_callback=None, step_callback=None, debug=True, open_after_save=True, custom_save_dir: Optional[str] = None, cancel_token=None):
     """
     주식 정보 조회, 차트 이미지 캡처, LLM을 통한 기사 생성을 총괄하는 메인 함수.
     :param keyword: 검색할 종목명
@@ -320,11 +350,40 @@ def capture_and_generate_news(keyword: str, domain: str = "stock", progress_call
     :param debug: 디버그 정보 출력 여부
     :param open_after_save: 저장 후 파일 자동 열기 여부
     :param custom_save_dir: 사용자 지정 저장 경로
+    :param cancel_token: 취소 토큰 (네트워크 단계 사이마다 확인, 취소 시 None 반환)
+    :return: 생성된 뉴스 기사 텍스트, 실패 시 None
+    """
+    from news.src.utils.cancel_token import from_callback
+
+    # 토큰/기존 is_running_callback을 하나로 정규화
+    token = from_callback(cancel_token, is_running_callback)
+    try:
+        return _capture_and_generate_news(
+            keyword, domain, token, progress_callback=progress_callback, step_callback=step_callback,
+            debug=debug, open_after_save=open_after_save, custom_save_dir=custom_save_dir,
+        )
+    finally:
+        # 여기서 만든 하위 토큰은 부모 토큰의 자식 목록에서 해제 (호출 측 토큰은 그대로 둠)
+        if token is not cancel_token:
+            token.close()
+
+
+def _capture_and_generate_news(keyword: str, domain: str, token, progress_callback=None, step_callback=None, debug=True, open_after_save=True, custom_save_dir: Optional[str] = None):
+    """
+    capture_and_generate_news 본체 (정규화된 토큰을 받아 실제 처리를 수행)
+    :param token: from_callback으로 정규화된 취소 토큰
     :return: 생성된 뉴스 기사 텍스트, 실패 시 None
     """
     from news.src.services.info_LLM import generate_info_news_from_text
     from news.src.utils.foreign_utils import capture_naver_foreign_stock_chart
 
+    # 단계 사이 취소 확인용 내부 함수
+    def cancelled():
+        if token.cancelled:
+            if progress_callback: progress_callback(token.reason or "작업이 취소되었습니다.")
+            return True
+        return False
+
     total_steps = 3 # 전체 프로세스 단계 수: 1.정보조회, 2.이미지캡처, 3.기사생성
     current_step = 0
 
@@ -351,11 +410,10 @@ def capture_and_generate_news(keyword: str, domain: str = "stock", progress_call
             full_dir = os.path.join(base_dir, sub_dir)
         os.makedirs(full_dir, exist_ok=True)
 
-        # 기사 텍스트 파일 저장
+        # 기사 텍스트 파일 저장 (임시 파일에 쓴 뒤 교체 → 중단되어도 반쯤 쓰인 파일이 남지 않음)
         safe_k = safe_filename(keyword)
         news_path = os.path.join(full_dir, f"{safe_k}_{domain}_news.txt")
-        with open(news_path, "w", encoding="utf-8") as f:
-            f.write(news)
+        write_text_atomic(news_path, news)
             
         # 저장 후 파일 열기
         if open_after_save:
@@ -374,23 +432,31 @@ def capture_and_generate_news(keyword: str, domain: str = "stock", progress_call
 
     # 도메인이 'stock' 또는 'toss'인 경우
     if domain in ["stock", "toss", "week"]:
-        stock_code = get_stock_info_from_search(keyword)
+        stock_code = get_stock_info_from_search(keyword, cancel_token=token)
         report_step() # 1. 정보 조회 완료
+        if cancelled():
+            return None
 
         if not stock_code:
             # 🔹 해외 주식 처리
             if progress_callback: progress_callback(f"{keyword} 해외주식 정보 조회 중...")
             image_path, stock_data, success = capture_naver_foreign_stock_chart(keyword, progress_callback=progress_callback, custom_save_dir=custom_save_dir)
             report_step() # 2. 이미지 캡처 완료
+            if cancelled():
+                return None
             
             if not image_path or not stock_data:
                 if progress_callback: progress_callback("해외주식 데이터 수집 실패")
                 return None
             
             info_dict = stock_data
+            if cancelled():
+                return None
             if progress_callback: progress_callback("LLM 기사 생성 중...")
-            news = generate_info_news_from_text(keyword, info_dict, domain) # LLM 기사 생성
+            news = generate_info_news_from_text(keyword, info_dict, domain, cancel_token=token) # LLM 기사 생성
             report_step() # 3. 기사 생성 완료
+            if cancelled():
+                return None
             
             if news:
                 # 1. 템플릿(기사 서두) 문구 생성 (해외 주식용)
@@ -421,15 +487,17 @@ def capture_and_generate_news(keyword: str, domain: str = "stock", progress_call
                 toss_save_dir = os.path.join(os.getcwd(), "Toss기사", f"기사{today_str}")
             image_path, is_stock, chart_text, invest_info_text, chart_info, invest_info, summary_info_text = capture_wrap_company_area(
                 stock_code, progress_callback=progress_callback, debug=debug,
-                custom_save_dir=toss_save_dir, is_running_callback=is_running_callback
+                custom_save_dir=toss_save_dir, is_running_callback=token.is_running, cancel_token=token
             )
         else: # 일반 'stock' / 'week' 탭의 경우
             if progress_callback: progress_callback(f"{keyword} 국내주식 정보 조회 중...")
             image_path, is_stock, chart_text, invest_info_text, chart_info, invest_info, summary_info_text = capture_wrap_company_area(
                 stock_code, progress_callback=progress_callback, debug=debug, 
-                custom_save_dir=custom_save_dir, is_running_callback=is_running_callback
+                custom_save_dir=custom_save_dir, is_running_callback=token.is_running, cancel_token=token
             )
         report_step() # 2. 이미지 캡처 완료
+        if cancelled():
+            return None
         
         if not image_path:
             if progress_callback: progress_callback("국내주식 이미지 캡처 실패")
@@ -471,9 +539,13 @@ def capture_and_generate_news(keyword: str, domain: str = "stock", progress_call
         if debug:
             print("[DEBUG] 국내 주식 info_dict keys:", list(info_dict.keys()))
             print("[DEBUG] 국내 주식 정보:\n", info_dict)
+        if cancelled():
+            return None
         if progress_callback: progress_callback("LLM 기사 생성 중...")
-        news = generate_info_news_from_text(keyword, info_dict, domain) # LLM 기사 생성
+        news = generate_info_news_from_text(keyword, info_dict, domain, cancel_token=token) # LLM 기사 생성
         report_step() # 3. 기사 생성 완료
+        if cancelled():
+            return None
         
         if news:
             # 1. 템플릿 문구 생성 (국내 주식용)
@@ -494,6 +566,8 @@ def capture_and_generate_news(keyword: str, domain: str = "stock", progress_call
         report_step() # 1. 정보 조회 완료 (별도 조회 단계 없음)
         image_path, stock_data, success = capture_naver_foreign_stock_chart(keyword, progress_callback=progress_callback, custom_save_dir=custom_save_dir)
         report_step() # 2. 이미지 캡처 완료
+        if cancelled():
+            return None
         
         if not image_path or not success:
             if progress_callback: progress_callback("이미지 캡처 실패")
@@ -501,8 +575,12 @@ def capture_and_generate_news(keyword: str, domain: str = "stock", progress_call
             
         info_dict = {"이미지": image_path, "키워드": keyword}
         if debug: print("[DEBUG] 기타 도메인 정보:\n", info_dict)
+        if cancelled():
+            return None
         if progress_callback: progress_callback("LLM 기사 생성 중...")
-        news = generate_info_news_from_text(keyword, info_dict, domain) # LLM 기사 생성
+        news = generate_info_news_from_text(keyword, info_dict, domain, cancel_token=token) # LLM 기사 생성
+        if cancelled():
+            return None
         
         if news:
             # 해외 주식과 동일한 로직으로 템플릿 생성 및 후처리
@@ -14,8 +14,8 @@ from selenium.webdriver.support import expected_conditions as EC
 from news.src.utils.driver_utils import initialize_driver
 import FinanceDataReader as fdr
 import pandas as pd
-from bs4 import BeautifulSoup
-import requests
+from news.src.utils.html_parser import parse_html
+from news.src.utils import http_client
 import ast
 try:
     import pyperclip
@@ -45,7 +45,7 @@ def _fetch_naver_minute_df(stock_code: str, count: int = 400, debug: bool = Fals
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0 Safari/537.36",
             "Referer": "https://finance.naver.com/",
         }
-        res = requests.get(url, headers=headers, timeout=10)
+        res = http_client.get(url, headers=headers)
         text = res.text.strip()
         if not text:
             if debug:
@@ -423,7 +423,7 @@ def _resolve_code_via_naver_search(stock_name: str, debug: bool = False):
     }
 
     try:
-        r = requests.get(url, params=params, headers=headers, timeout=8)
+        r = http_client.get(url, params=params, headers=headers)
         html = r.text or ""
         m = re.search(r"finance\.naver\.com/item/main\.naver\?code=(\d{6})", html)
         if m:
@@ -658,7 +658,7 @@ def parse_invest_info_text(invest_info_text, debug=False):
 # 작성일 : 2025-07-09
 # 기능 : 네이버 금융 종목 상세 페이지에서 wrap_company 영역을 캡처하고 저장하는 함수(주식 차트)
 # ------------------------------------------------------------------
-def capture_wrap_company_area(stock_code: str, progress_callback=None, debug=False, is_running_callback=None, custom_save_dir: str = None):
+def capture_wrap_company_area(stock_code: str, progress_callback=None, debug=False, is_running_callback=None, custom_save_dir: str = None, cancel_token=None):
     """
     Selenium을 사용하여 네이버 금융 페이지의 주식 정보 영역을 캡처하고, 관련 텍스트 데이터를 추출.
     :param stock_code: 캡처할 6자리 종목 코드
@@ -666,6 +666,7 @@ def capture_wrap_company_area(stock_code: str, progress_callback=None, debug=Fal
     :param debug: 디버깅 로그 출력 여부
     :param is_running_callback: 작업 취소 여부를 확인하는 콜백 함수
     :param custom_save_dir: 이미지를 저장할 특정 경로
+    :param cancel_token: 취소 토큰 (취소 시 드라이버를 즉시 종료)
     :return: (이미지 경로, 성공 여부, 차트 텍스트, 투자정보 텍스트, 차트 정보 딕셔너리, 투자 정보 딕셔너리, 기업개요 텍스트) 튜플
     """
     # 로그 기록을 위한 내부 함수
@@ -683,6 +684,7 @@ def capture_wrap_company_area(stock_code: str, progress_callback=None, debug=Fal
 
     # 반환할 변수들 초기화
     driver = None
+    quit_cb = None
     chart_text, invest_info_text, summary_info_text = "", "", ""
     chart_info, invest_info = {}, {}
 
@@ -691,6 +693,9 @@ def capture_wrap_company_area(stock_code: str, progress_callback=None, debug=Fal
             return "", False, "", "", {}, {}, ""
 
         driver = initialize_driver()  # Selenium 웹 드라이버 초기화
+        if cancel_token is not None:
+            # 취소되면 페이지 로딩 대기 중이라도 드라이버를 바로 종료
+            quit_cb = cancel_token.add_callback(driver.quit)
 
         if check_cancellation():
             driver.quit()
@@ -758,7 +763,7 @@ def capture_wrap_company_area(stock_code: str, progress_callback=None, debug=Fal
         try:
             summary_info_el = driver.find_element(By.CSS_SELECTOR, "div#summary_info")
             html = summary_info_el.get_attribute('innerHTML')
-            soup = BeautifulSoup(html, 'html.parser')
+            soup = parse_html(html, only='p')
             p_tags = soup.find_all('p')
             summary_info_text = "\n".join([p.get_text(strip=True) for p in p_tags if p.get_text(strip=True)])
         except Exception as e:
@@ -827,6 +832,8 @@ def capture_wrap_company_area(stock_code: str, progress_callback=None, debug=Fal
         log(f"오류 발생: {e}")
         return None, False, chart_text, invest_info_text, chart_info, invest_info, summary_info_text
     finally:
+        if quit_cb is not None:
+            cancel_token.remove_callback(quit_cb)
         # 드라이버가 실행 중이면 항상 종료
         if driver:
             try:
@@ -5,6 +5,7 @@
 import os
 import time
 import io
+import re
 from datetime import datetime
 from PIL import Image
 from selenium.webdriver.common.by import By
@@ -166,17 +167,53 @@ def create_fx_template(now_kst_dt=None) -> str:
         time_status = f"{_dt.now().day}일"
     return f"{time_status} 기준, 네이버페이 증권에 따르면"
 
+# ------------------------------------------------------------------
+# 작성자 : 최준혁
+# 작성일 : 2026-10-18
+# 기능 : LLM이 생성한 FX 기사에 본문 선두 템플릿 삽입 및 중복 선두 문구 제거
+# 설명 : hwan_tab 워커와 헤드리스 배치(news.batch)에서 공통으로 사용
+# ------------------------------------------------------------------
+def apply_fx_template(news: str, now_kst_dt=None) -> str:
+    """
+    '[본문]' 마커 뒤에 create_fx_template() 문구를 삽입한다(마커가 없으면 맨 앞에 추가).
+    모델이 같은 성격의 시간 문구를 한 번 더 생성한 경우 선두 근방(200자 이내)의 중복 앵커를 제거한다.
+    :param news: LLM 생성 기사 텍스트
+    :param now_kst_dt: 템플릿 기준 시각(없으면 현재 KST)
+    :return: 템플릿이 적용된 최종 기사 텍스트
+    """
+    template_text = create_fx_template(now_kst_dt)
+    if re.search(r'(\[본문\]|본문)', news):
+        replacement_text = f"[본문]\n{template_text} "
+        final_output = re.sub(r'(\[본문\]|본문)\s+', replacement_text, news, count=1)
+    else:
+        final_output = template_text + '\n\n' + news
+
+    try:
+        anchor = "기준, 네이버페이 증권에 따르면"
+        first_idx = final_output.find(anchor)
+        if first_idx != -1:
+            first_end = first_idx + len(anchor)
+            second_idx = final_output.find(anchor, first_end)
+            if second_idx != -1 and (second_idx - first_end) < 200:
+                cut_end = second_idx + len(anchor)
+                final_output = final_output[:first_end] + final_output[cut_end:]
+    except Exception:
+        pass
+    return final_output
+
 # ------------------------------------------------------------------
 # 작성자 : 최준혁
 # 작성일 : 2025-10-13
 # 기능 : 환율 차트 캡처 + 상단 텍스트 파싱하여 수치 데이터 동시 반환
 # 반환: (output_path, data_dict)
 # ------------------------------------------------------------------
-def capture_exchange_chart_with_data(keyword: str, progress_callback=None):
+def capture_exchange_chart_with_data(keyword: str, progress_callback=None, cancel_token=None):
     if progress_callback:
         progress_callback("네이버 검색 페이지 접속 중...")
     key = make_exchange_keyword(keyword)
     driver = initialize_driver()
+    # 취소되면 페이지 로딩 대기 중이라도 드라이버를 바로 종료
+    quit_cb = cancel_token.add_callback(driver.quit) if cancel_token is not None else None
     try:
         url = f"https://search.naver.com/search.naver?query={key}"
         driver.get(url)
@@ -239,7 +276,12 @@ def capture_exchange_chart_with_data(keyword: str, progress_callback=None):
         copy_image_to_clipboard(output_path)
         return output_path, data
     finally:
-        driver.quit()
+        if quit_cb is not None:
+            cancel_token.remove_callback(quit_cb)
+        try:
+            driver.quit()
+        except Exception:
+            pass
 
 def _parse_exchange_top_text(text: str) -> dict:
     """상단 텍스트에서 통화/현재가/등락/등락률을 휴리스틱으로 추출
@@ -370,21 +412,24 @@ def build_fx_prompt(today_kst: str, include_aggregate_tag: bool = False) -> str:
 # 작성일 : 2025-10-13
 # 기능 : 여러 통화의 환율 차트를 일괄 캡처
 # ------------------------------------------------------------------
-def capture_multiple_exchange_charts(keywords: list[str], progress_callback=None):
+def capture_multiple_exchange_charts(keywords: list[str], progress_callback=None, cancel_token=None):
     """
     주어진 통화 키워드 목록에 대해 환율 차트를 순차 캡처합니다.
     :param keywords: 통화명 리스트 (예: ['달러','엔','유로', ...])
     :param progress_callback: 진행 상태 콜백
+    :param cancel_token: 취소 토큰 (통화 사이마다 확인, 취소 시 CancelledError 발생)
     :return: {통화키워드: 이미지경로} 딕셔너리 (실패 항목은 누락)
     """
     images = {}
     datas = {}
     total = len(keywords)
     for idx, kw in enumerate(keywords, start=1):
+        if cancel_token is not None:
+            cancel_token.raise_if_cancelled()
         try:
             if progress_callback:
                 progress_callback(f"[{idx}/{total}] '{kw}' 환율 차트 캡처 시작")
-            path, data = capture_exchange_chart_with_data(kw, progress_callback=progress_callback)
+            path, data = capture_exchange_chart_with_data(kw, progress_callback=progress_callback, cancel_token=cancel_token)
             if path:
                 images[kw] = path
                 if data:
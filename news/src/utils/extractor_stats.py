@@ -0,0 +1,189 @@
+# ------------------------------------------------------------------
+# 작성자 : 최준혁
+# 작성일 : 2026-10-18
+# 기능 : 언론사 도메인별 본문 추출기(newspaper / smart_parser / iframe) 성공률·지연 통계 저장소
+# ------------------------------------------------------------------
+# extract_article_content 가 도메인마다 과거에 가장 잘 통한 추출기부터 시도하도록 순서를 정해준다.
+#
+# - 통계: (도메인, 추출기)별 지수이동평균(EMA) 성공률 / 성공 시 평균 지연(초) / 시도 횟수
+#   EMA를 쓰므로 사이트 개편 등으로 오래된 통계는 자연스럽게 희석됨
+# - 순서: 성공률을 사전값(_PRIOR_OK, 가상 시도 _PRIOR_WEIGHT회)으로 보정한 추정치 순
+#   → 아직 시도하지 않은 추출기(추정 0.5)가 계속 실패한 추출기보다 앞에 온다
+# - 탐색: EXTRACTOR_EXPLORE 확률(기본 0.1)로 최선이 아닌 추출기 하나를 맨 앞으로 보내 통계를 갱신
+# - 비활성: 환경변수 EXTRACTOR_ADAPTIVE=0 이면 항상 기본 순서 사용
+# - 저장 위치: CWD/.cache_pressai/extractor_stats.json
+#   (시도마다 쓰지 않고 _SAVE_INTERVAL 초에 한 번 + 프로세스 종료 시 flush(), set_persist(False)면 메모리에만 유지)
+# ------------------------------------------------------------------
+import os
+import json
+import time
+import atexit
+import random
+import threading
+from typing import Dict, List, Optional
+from urllib.parse import urlsplit
+
+EXTRACTOR_ADAPTIVE = os.getenv("EXTRACTOR_ADAPTIVE", "1") != "0"
+EXTRACTOR_EXPLORE = float(os.getenv("EXTRACTOR_EXPLORE", "0.1"))
+
+# 최근 결과 가중치 (0.3 → 최근 몇 번의 결과가 성공률을 주도)
+_EMA_ALPHA = 0.3
+# 성공률 사전값과 그 가중치(가상 시도 횟수) - 시도가 적을수록 추정치가 사전값에 가깝다
+_PRIOR_OK = 0.5
+_PRIOR_WEIGHT = 2
+# 파일 저장 최소 간격(초)
+_SAVE_INTERVAL = 30.0
+
+_lock = threading.Lock()
+_stats: Optional[Dict[str, Dict[str, dict]]] = None
+_dirty = False
+_last_save = 0.0
+_persist = True
+
+
+def _get_stats_path() -> str:
+    base = os.path.join(os.getcwd(), ".cache_pressai")
+    try:
+        os.makedirs(base, exist_ok=True)
+    except Exception:
+        pass
+    return os.path.join(base, "extractor_stats.json")
+
+
+def _load() -> Dict[str, Dict[str, dict]]:
+    global _stats
+    if _stats is None:
+        try:
+            with open(_get_stats_path(), "r", encoding="utf-8") as f:
+                data = json.load(f)
+            _stats = data if isinstance(data, dict) else {}
+        except Exception:
+            _stats = {}
+    return _stats
+
+
+def _save_locked():
+    global _dirty, _last_save
+    _dirty = False
+    _last_save = time.monotonic()
+    if not _persist:
+        return
+    path = _get_stats_path()
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(_stats, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+    except Exception as e:
+        print(f"[WARNING] 추출기 통계 저장 실패: {e}")
+
+
+def domain_of(url: str) -> str:
+    """
+    통계 키로 쓸 도메인 (소문자, 'www.' 제거 / 모바일 'm.'은 페이지 구조가 달라 별도 유지)
+    """
+    try:
+        host = (urlsplit(url).hostname or "").lower()
+    except Exception:
+        host = ""
+    return host[4:] if host.startswith("www.") else host
+
+
+def flush():
+    """
+    변경된 통계를 즉시 파일에 저장 (종료 시 자동 호출)
+    """
+    with _lock:
+        if _dirty:
+            _save_locked()
+
+
+def set_persist(enabled: bool):
+    """
+    파일 저장 여부 설정 (벤치마크/재생 실행에서 디스크 기록을 막을 때 False)
+    """
+    global _persist
+    with _lock:
+        _persist = bool(enabled)
+
+
+atexit.register(flush)
+
+
+def _score(entry: Optional[dict], default_rank: int) -> tuple:
+    n = entry.get("n", 0) if entry else 0
+    ok = entry.get("ok", 0.0) if n else 0.0
+    # 시도 횟수만큼만 관측값을 믿고 나머지는 사전값으로 채운 성공률 추정치
+    estimate = (ok * n + _PRIOR_OK * _PRIOR_WEIGHT) / (n + _PRIOR_WEIGHT)
+    latency = entry.get("latency", 0.0) if n else 0.0
+    # 추정 성공률 우선, 같으면 빠른 쪽, 그래도 같으면 기본 순서
+    return (round(estimate, 6), -latency, -default_rank)
+
+
+def order_extractors(url: str, names: List[str], explore: Optional[float] = None) -> List[str]:
+    """
+    도메인 통계로 추출기 시도 순서를 정한다.
+    :param url: 기사 URL
+    :param names: 기본 순서의 추출기 이름 목록
+    :param explore: 탐색 확률 (None이면 EXTRACTOR_EXPLORE)
+    :return: 재정렬된 추출기 이름 목록
+    """
+    if not EXTRACTOR_ADAPTIVE or len(names) < 2:
+        return list(names)
+    explore = EXTRACTOR_EXPLORE if explore is None else explore
+
+    with _lock:
+        per_domain = dict(_load().get(domain_of(url), {}))
+
+    if not any(per_domain.get(name, {}).get("n", 0) for name in names):
+        return list(names)
+
+    ordered = sorted(names, key=lambda name: _score(per_domain.get(name), names.index(name)), reverse=True)
+
+    if explore > 0 and random.random() < explore:
+        pick = random.choice(ordered[1:])
+        ordered.remove(pick)
+        ordered.insert(0, pick)
+    return ordered
+
+
+def record(url: str, name: str, success: bool, latency: float):
+    """
+    추출 시도 결과를 기록한다.
+    :param url: 기사 URL
+    :param name: 추출기 이름
+    :param success: 최소 본문 길이를 만족했는지 여부
+    :param latency: 소요 시간(초)
+    """
+    global _dirty
+    if not EXTRACTOR_ADAPTIVE:
+        return
+    domain = domain_of(url)
+    if not domain:
+        return
+    with _lock:
+        stats = _load()
+        entry = stats.setdefault(domain, {}).setdefault(name, {"ok": 0.0, "latency": 0.0, "n": 0})
+        if entry["n"] == 0:
+            entry["ok"] = 1.0 if success else 0.0
+        else:
+            entry["ok"] = (1 - _EMA_ALPHA) * entry["ok"] + _EMA_ALPHA * (1.0 if success else 0.0)
+        if success:
+            prev = entry.get("latency") or latency
+            entry["latency"] = round((1 - _EMA_ALPHA) * prev + _EMA_ALPHA * latency, 4)
+        entry["ok"] = round(entry["ok"], 4)
+        entry["n"] = entry["n"] + 1
+        _dirty = True
+        if time.monotonic() - _last_save >= _SAVE_INTERVAL:
+            _save_locked()
+
+
+def snapshot(url: Optional[str] = None) -> dict:
+    """
+    현재 통계 사본 반환 (url 지정 시 해당 도메인만)
+    """
+    with _lock:
+        stats = _load()
+        if url is None:
+            return json.loads(json.dumps(stats))
+        return json.loads(json.dumps(stats.get(domain_of(url), {})))
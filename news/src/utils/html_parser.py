@@ -0,0 +1,96 @@
+# ------------------------------------------------------------------
+# 작성자 : 최준혁
+# 작성일 : 2026-10-18
+# 기능 : BeautifulSoup 파서 백엔드 선택 + 영역 한정(scoped) 파싱 공통 헬퍼
+# ------------------------------------------------------------------
+# - lxml 이 설치되어 있으면 lxml(C 구현), 없거나 실패하면 'html.parser'로 자동 폴백
+# - only 인자로 SoupStrainer 또는 단순 CSS 선택자(예: 'article#dic_area', ['h2', 'article'])를 받아
+#   해당 영역만 트리로 만든다 → 300KB급 포털 페이지에서 트리 생성 비용을 크게 줄임
+# - 영역 한정 파싱 결과가 비어 있으면 전체 파싱으로 다시 시도 (호출 측은 차이를 신경 쓰지 않아도 됨)
+# - 환경변수 HTML_PARSER=html.parser 로 백엔드 강제 지정 가능
+# ------------------------------------------------------------------
+import os
+import re
+import importlib.util
+from typing import Iterable, Optional, Union
+
+from bs4 import BeautifulSoup, SoupStrainer
+
+_FALLBACK_PARSER = "html.parser"
+
+# '태그', '태그#id', '태그.class', '#id', '.class' 형태의 단순 선택자만 SoupStrainer로 변환
+_SIMPLE_SELECTOR_RX = re.compile(r'^(?P<tag>[a-zA-Z][a-zA-Z0-9]*)?(?:#(?P<id>[\w\-]+))?(?:\.(?P<cls>[\w\-]+))?$')
+
+ScopeType = Union[None, SoupStrainer, str, Iterable[str]]
+
+
+def _detect_default_parser() -> str:
+    forced = (os.getenv("HTML_PARSER") or "").strip()
+    if forced:
+        return forced
+    return "lxml" if importlib.util.find_spec("lxml") is not None else _FALLBACK_PARSER
+
+
+DEFAULT_PARSER = _detect_default_parser()
+
+
+def _strainer_from_scope(only: ScopeType) -> Optional[SoupStrainer]:
+    """
+    only 인자를 SoupStrainer로 변환. 변환할 수 없는 복합 선택자면 None(전체 파싱).
+    - 단일 선택자: 태그/ID/클래스 조건을 모두 반영
+    - 여러 선택자: 태그명 목록으로 변환(상위 집합) → 파싱 후 select로 좁히면 됨
+    """
+    if only is None or isinstance(only, SoupStrainer):
+        return only
+    selectors = [only] if isinstance(only, str) else list(only)
+    parsed = []
+    for sel in selectors:
+        m = _SIMPLE_SELECTOR_RX.match((sel or "").strip())
+        if not m or not any(m.groupdict().values()):
+            return None
+        parsed.append(m.groupdict())
+
+    if len(parsed) == 1:
+        p = parsed[0]
+        attrs = {}
+        if p["id"]:
+            attrs["id"] = p["id"]
+        if p["cls"]:
+            attrs["class"] = p["cls"]
+        return SoupStrainer(p["tag"] or True, attrs=attrs)
+
+    names = [p["tag"] for p in parsed]
+    if not all(names):
+        return None
+    return SoupStrainer(list(dict.fromkeys(names)))
+
+
+def _build(text, parser: str, strainer: Optional[SoupStrainer]) -> BeautifulSoup:
+    if strainer is not None:
+        return BeautifulSoup(text, parser, parse_only=strainer)
+    return BeautifulSoup(text, parser)
+
+
+def parse_html(text, only: ScopeType = None, parser: Optional[str] = None) -> BeautifulSoup:
+    """
+    HTML 문자열을 BeautifulSoup 객체로 파싱한다.
+    :param text: HTML 문자열(또는 bytes)
+    :param only: 파싱 영역 한정 (SoupStrainer, 단순 CSS 선택자 문자열 또는 목록). None이면 전체
+    :param parser: 파서 백엔드 강제 지정 (기본: lxml 있으면 lxml, 없으면 html.parser)
+    :return: BeautifulSoup 객체
+    """
+    parser = parser or DEFAULT_PARSER
+    strainer = _strainer_from_scope(only)
+
+    try:
+        soup = _build(text or "", parser, strainer)
+    except Exception:
+        if parser == _FALLBACK_PARSER:
+            raise
+        parser = _FALLBACK_PARSER
+        soup = _build(text or "", parser, strainer)
+
+    # 영역 한정 결과가 비어 있으면(선택자 불일치 등) 전체 파싱으로 재시도
+    if strainer is not None and soup.find(True) is None:
+        soup = _build(text or "", parser, None)
+    return soup
@@ -0,0 +1,189 @@
+# ------------------------------------------------------------------
+# 작성자 : 최준혁
+# 작성일 : 2026-10-18
+# 기능 : requests 기반 HTTP 요청 기록/재생(cassette) 유틸리티
+# ------------------------------------------------------------------
+# 네트워크 없이 크롤링/파싱 함수를 재현 가능하게 측정하기 위한 도구.
+# requests.Session.send 를 가로채므로 requests.get/post, Session, newspaper3k(download) 모두 적용된다.
+#
+#   with use_cassette("benchmarks/cassettes/toss.json", mode="record"):
+#       get_toss_stock_data()          # 실제 요청 + 응답 기록
+#   with use_cassette("benchmarks/cassettes/toss.json"):
+#       get_toss_stock_data()          # 기록된 응답으로 재생 (네트워크 미사용)
+#
+# - 요청 키: METHOD + 정규화 URL(쿼리 정렬) + 본문 sha1
+# - 같은 키가 여러 번 기록되면 재생 시 기록 순서대로 반환하고, 소진되면 마지막 응답을 반복
+# - 재생 중 기록에 없는 요청은 CassetteMissError(ConnectionError 하위) 발생 → 기존 오프라인 예외 처리 경로를 그대로 탐
+# ------------------------------------------------------------------
+import os
+import json
+import base64
+import hashlib
+import threading
+import contextlib
+from datetime import timedelta
+from typing import Optional
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+_CASSETTE_FORMAT_VERSION = 1
+
+# 재생에 필요 없는/매 요청마다 달라지는 응답 헤더는 기록하지 않음
+_SKIP_RESPONSE_HEADERS = {"set-cookie", "date", "content-encoding", "transfer-encoding", "content-length", "connection"}
+
+# 동시에 하나의 카세트만 활성화 (Session.send 전역 패치)
+_patch_lock = threading.Lock()
+
+
+class CassetteMissError(requests.exceptions.ConnectionError):
+    """재생 모드에서 기록되지 않은 요청을 만났을 때 발생"""
+
+
+def _normalize_url(url: str) -> str:
+    parts = urlsplit(url)
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path, query, ""))
+
+
+def request_key(method: str, url: str, body=None) -> str:
+    """
+    요청을 식별하는 키 생성.
+    :param method: HTTP 메서드
+    :param url: 요청 URL (쿼리 포함)
+    :param body: 요청 본문 (bytes/str/None)
+    :return: 'GET https://host/path?a=1 <본문해시>' 형태의 문자열
+    """
+    if body is None:
+        digest = "-"
+    else:
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+        digest = hashlib.sha1(body).hexdigest()[:16]
+    return f"{method.upper()} {_normalize_url(url)} {digest}"
+
+
+class Cassette:
+    """
+    요청/응답 기록 파일 하나를 표현.
+    :param path: 카세트 JSON 파일 경로
+    :param mode: 'replay'(기본) | 'record'(항상 실제 요청 후 덮어쓰기) | 'auto'(없는 요청만 실제 요청 후 추가)
+    """
+
+    def __init__(self, path: str, mode: str = "replay"):
+        if mode not in ("replay", "record", "auto"):
+            raise ValueError(f"알 수 없는 카세트 모드: {mode}")
+        self.path = path
+        self.mode = mode
+        self.interactions = {}
+        self.hits = 0
+        self.misses = []
+        self.recorded = 0
+        self._cursor = {}
+        self._lock = threading.Lock()
+        if mode != "record":
+            self._load()
+
+    # --- 파일 입출력 ---------------------------------------------------
+    def _load(self):
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("version") == _CASSETTE_FORMAT_VERSION:
+            self.interactions = data.get("interactions", {})
+
+    def save(self):
+        folder = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(folder, exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"version": _CASSETTE_FORMAT_VERSION, "interactions": self.interactions},
+                      f, ensure_ascii=False, indent=1)
+        os.replace(tmp_path, self.path)
+
+    # --- 직렬화 --------------------------------------------------------
+    @staticmethod
+    def _serialize(response: requests.Response) -> dict:
+        headers = {k: v for k, v in response.headers.items() if k.lower() not in _SKIP_RESPONSE_HEADERS}
+        return {
+            "status": response.status_code,
+            "reason": response.reason,
+            "url": response.url,
+            "headers": headers,
+            "encoding": response.encoding,
+            "body_b64": base64.b64encode(response.content or b"").decode("ascii"),
+        }
+
+    @staticmethod
+    def _deserialize(entry: dict, request: requests.PreparedRequest) -> requests.Response:
+        response = requests.Response()
+        response.status_code = entry.get("status", 200)
+        response.reason = entry.get("reason") or ""
+        response.url = entry.get("url") or request.url
+        response.headers = CaseInsensitiveDict(entry.get("headers") or {})
+        response.encoding = entry.get("encoding")
+        response._content = base64.b64decode(entry.get("body_b64") or "")
+        response._content_consumed = True
+        response.request = request
+        response.elapsed = timedelta(0)
+        return response
+
+    # --- 조회/기록 -----------------------------------------------------
+    def lookup(self, request: requests.PreparedRequest) -> Optional[requests.Response]:
+        key = request_key(request.method, request.url, request.body)
+        with self._lock:
+            entries = self.interactions.get(key)
+            if not entries:
+                return None
+            idx = self._cursor.get(key, 0)
+            self._cursor[key] = idx + 1
+            self.hits += 1
+            entry = entries[min(idx, len(entries) - 1)]
+        return self._deserialize(entry, request)
+
+    def append(self, request: requests.PreparedRequest, response: requests.Response):
+        key = request_key(request.method, request.url, request.body)
+        entry = self._serialize(response)
+        with self._lock:
+            self.interactions.setdefault(key, []).append(entry)
+            self.recorded += 1
+
+    def stats(self) -> dict:
+        return {"hits": self.hits, "misses": len(self.misses), "recorded": self.recorded}
+
+
+@contextlib.contextmanager
+def use_cassette(path: str, mode: str = "replay"):
+    """
+    with 블록 동안 requests 전역 요청을 카세트로 기록/재생한다.
+    :param path: 카세트 JSON 파일 경로
+    :param mode: 'replay' | 'record' | 'auto'
+    :return: Cassette 객체 (stats()로 적중/누락 확인)
+    """
+    cassette = Cassette(path, mode=mode)
+    with _patch_lock:
+        original_send = requests.Session.send
+
+        def patched_send(session, request, **kwargs):
+            if cassette.mode != "record":
+                replayed = cassette.lookup(request)
+                if replayed is not None:
+                    return replayed
+                if cassette.mode == "replay":
+                    cassette.misses.append(request_key(request.method, request.url, request.body))
+                    raise CassetteMissError(f"카세트에 기록되지 않은 요청: {request.method} {request.url}")
+            response = original_send(session, request, **kwargs)
+            # 본문을 미리 읽어 두어야 직렬화 가능 (stream=True 요청 포함)
+            _ = response.content
+            cassette.append(request, response)
+            return response
+
+        requests.Session.send = patched_send
+        try:
+            yield cassette
+        finally:
+            requests.Session.send = original_send
+            if cassette.mode in ("record", "auto") and cassette.recorded:
+                cassette.save()
@@ -0,0 +1,156 @@
+# ------------------------------------------------------------------
+# 작성자 : 최준혁
+# 작성일 : 2026-10-18
+# 기능 : LLM 생성 결과 콘텐츠 주소 기반(해시 키) 디스크 캐시
+# ------------------------------------------------------------------
+# 동일 입력(모델, 시스템 프롬프트, 사용자 입력, 생성 설정)으로 Gemini를
+# 다시 호출하는 경우(에디터의 '재시도' 클릭 등) 이전 응답 텍스트를 재사용한다.
+#
+# - 기본 비활성(opt-in): 환경변수 LLM_CACHE=1 또는 호출 시 use_cache=True
+# - 유효 기간: 환경변수 LLM_CACHE_TTL(초, 기본 21600 = 6시간)
+# - 강제 갱신: 호출 측에서 force_refresh=True 전달 시 조회를 건너뛰고 새 응답으로 덮어씀
+# - 저장 위치: CWD/.cache_pressai/llm/{sha256}.json (domestic_utils 디스크 캐시와 동일 루트)
+# - 키 정규화: 프롬프트에 들어가는 현재 시각(today_kst, 'YYYYMMDD HH:MM')은 날짜까지만 반영
+#   → 1분 뒤 재시도해도 같은 키 (같은 날 안에서만 재사용)
+# ------------------------------------------------------------------
+import os
+import json
+import time
+import hashlib
+from typing import Optional
+
+LLM_CACHE_ENABLED = os.getenv("LLM_CACHE", "0") == "1"
+LLM_CACHE_TTL = int(os.getenv("LLM_CACHE_TTL", "21600"))
+
+# 캐시 포맷 변경 시 올려서 기존 항목을 자연스럽게 무효화
+_CACHE_FORMAT_VERSION = 1
+
+
+def _get_cache_dir() -> str:
+    """
+    LLM 캐시 폴더 경로 반환.
+    - PyInstaller/배포 환경에서도 쓰기 가능한 경로를 쓰기 위해 CWD 기반으로 생성.
+    """
+    base = os.path.join(os.getcwd(), ".cache_pressai", "llm")
+    try:
+        os.makedirs(base, exist_ok=True)
+    except Exception:
+        pass
+    return base
+
+
+def is_enabled(use_cache: Optional[bool] = None) -> bool:
+    """
+    캐시 사용 여부 판단. 호출 측 명시값(use_cache)이 있으면 우선, 없으면 환경변수 설정을 따른다.
+    """
+    if use_cache is None:
+        return LLM_CACHE_ENABLED
+    return bool(use_cache)
+
+
+def build_key(model_name: str, system_prompt: Optional[str], contents, generation_config=None,
+              today_kst: Optional[str] = None) -> str:
+    """
+    (모델, 시스템 프롬프트, 사용자 입력, 생성 설정)을 정규화해 sha256 해시 키를 생성.
+    :param model_name: 모델명 (예: 'gemini-2.5-flash')
+    :param system_prompt: system_instruction 문자열 (없으면 None)
+    :param contents: generate_content에 전달하는 입력(문자열 또는 role/parts 리스트)
+    :param generation_config: 생성 설정 딕셔너리 (없으면 None)
+    :param today_kst: 프롬프트에 넣은 현재 시각 문자열('YYYYMMDD HH:MM'). 주면 키에서는 날짜(앞 8자리)로 치환
+    :return: 64자리 16진수 해시 문자열
+    """
+    payload = {
+        "v": _CACHE_FORMAT_VERSION,
+        "model": model_name,
+        "system": system_prompt or "",
+        "contents": contents,
+        "config": generation_config or {},
+    }
+    raw = json.dumps(payload, ensure_ascii=False, sort_keys=True, default=str)
+    if today_kst and len(today_kst) > 8:
+        raw = raw.replace(today_kst, today_kst[:8])
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def _entry_path(key: str) -> str:
+    return os.path.join(_get_cache_dir(), f"{key}.json")
+
+
+def load(key: str, ttl: Optional[int] = None) -> Optional[str]:
+    """
+    캐시에서 응답 텍스트를 조회. 없거나 만료/손상된 경우 None.
+    :param key: build_key로 만든 해시 키
+    :param ttl: 유효 기간(초). None이면 LLM_CACHE_TTL 사용
+    """
+    ttl = LLM_CACHE_TTL if ttl is None else ttl
+    path = _entry_path(key)
+    try:
+        if not os.path.exists(path):
+            return None
+        with open(path, "r", encoding="utf-8") as f:
+            entry = json.load(f)
+        created_at = float(entry.get("created_at", 0))
+        if ttl >= 0 and (time.time() - created_at) > ttl:
+            try:
+                os.remove(path)
+            except Exception:
+                pass
+            return None
+        text = entry.get("text")
+        return text if isinstance(text, str) and text.strip() else None
+    except Exception:
+        return None
+
+
+def save(key: str, text: str, meta: Optional[dict] = None) -> None:
+    """
+    응답 텍스트를 캐시에 저장(빈 응답은 저장하지 않음).
+    임시 파일에 먼저 쓰고 교체하여, 동시 저장 시에도 손상된 파일이 남지 않도록 한다.
+    :param key: build_key로 만든 해시 키
+    :param text: LLM 응답 텍스트
+    :param meta: 추적용 부가 정보(도메인, 키워드 등)
+    """
+    if not isinstance(text, str) or not text.strip():
+        return
+    path = _entry_path(key)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    entry = {"created_at": time.time(), "text": text, "meta": meta or {}}
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(entry, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+    except Exception:
+        try:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+        except Exception:
+            pass
+
+
+def purge_expired(ttl: Optional[int] = None) -> int:
+    """
+    만료된 캐시 파일을 정리하고 삭제한 개수를 반환.
+    """
+    ttl = LLM_CACHE_TTL if ttl is None else ttl
+    if ttl < 0:
+        return 0
+    removed = 0
+    cache_dir = _get_cache_dir()
+    now = time.time()
+    try:
+        names = os.listdir(cache_dir)
+    except Exception:
+        return 0
+    for name in names:
+        if not name.endswith(".json"):
+            continue
+        path = os.path.join(cache_dir, name)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                created_at = float(json.load(f).get("created_at", 0))
+            if (now - created_at) > ttl:
+                os.remove(path)
+                removed += 1
+        except Exception:
+            continue
+    return removed
@@ -0,0 +1,452 @@
+# ------------------------------------------------------------------
+# 작성자 : 최준혁
+# 작성일 : 2026-10-18
+# 기능 : 프로세스 전역 Gemini 호출 스케줄러 (RPM/TPM 토큰 버킷 + 우선순위 큐 + 대기 시간 지표)
+# ------------------------------------------------------------------
+# 여러 탭/워커/배치 스레드가 동시에 generate_content 를 호출하면 분당 한도를 넘겨 429가 난다.
+# 모든 호출을 submit()으로 통과시켜 다음을 보장한다.
+#
+# - 분당 요청 수(GEMINI_RPM, 기본 60) / 분당 추정 토큰 수(GEMINI_TPM, 기본 250000) 토큰 버킷
+#   · 호출 전 입력 길이로 토큰을 추정해 차감, 응답의 usage_metadata.total_token_count 로 사후 보정
+# - 우선순위: INTERACTIVE(탭에서 사용자가 누른 작업) > BATCH(news.batch 등 대량 작업)
+#   · 대기열에서 항상 우선순위가 높은(먼저 온) 요청부터 허가
+#   · 스레드 단위 기본 우선순위는 with priority(BATCH): 블록으로 지정
+# - 429(ResourceExhausted) 응답 시 전체 호출을 잠시 멈추고(백오프) 한 번에 하나씩 재시도
+# - 지표: 우선순위별 요청 수 / 평균·최대 대기 시간 / 429 횟수 → stats()
+# - 헤징(LLM_HEDGE=1, 기본 꺼짐): 호출이 최근 지연 p90(LLM_HEDGE_QUANTILE)을 넘기면 같은 요청을 한 번 더 보내
+#   먼저 도착한 응답을 사용하고 나머지는 버린다 (버린 응답의 토큰은 stats()["hedge"]에 추가 비용으로 집계)
+# - 마감: cancel_token(예: deadline_token(timeout=LLM_ARTICLE_DEADLINE))을 넘기면 마감 시 DeadlineExceeded 발생
+# - 테스트: LLMScheduler(rpm=..., tpm=...) 인스턴스에 generate_content 를 가진 가짜 모델을 넘기면 됨
+# ------------------------------------------------------------------
+import os
+import time
+import queue
+import heapq
+import itertools
+import threading
+import contextlib
+from collections import deque
+from typing import Optional
+
+from news.src.utils.cancel_token import CancelToken, DeadlineExceeded
+
+GEMINI_RPM = float(os.getenv("GEMINI_RPM", "60"))
+GEMINI_TPM = float(os.getenv("GEMINI_TPM", "250000"))
+
+INTERACTIVE = 0
+BATCH = 1
+_PRIORITY_NAMES = {INTERACTIVE: "interactive", BATCH: "batch"}
+
+# 429 재시도 횟수 / 첫 백오프(초, 이후 2배씩)
+RATE_LIMIT_RETRIES = 2
+RATE_LIMIT_BACKOFF = 10.0
+
+# 헤징: 켜기 여부 / 기준 분위수 / 최소 표본 수 / 최소 대기(초) - 표본이 모이기 전에는 헤징하지 않음
+HEDGE_ENABLED = os.getenv("LLM_HEDGE", "0") == "1"
+HEDGE_QUANTILE = float(os.getenv("LLM_HEDGE_QUANTILE", "0.9"))
+HEDGE_MIN_SAMPLES = int(os.getenv("LLM_HEDGE_MIN_SAMPLES", "20"))
+HEDGE_MIN_DELAY = float(os.getenv("LLM_HEDGE_MIN_DELAY", "3"))
+LATENCY_WINDOW = 200
+
+# 기사 1건당 전체 마감(초, 0이면 마감 없음)
+ARTICLE_DEADLINE = float(os.getenv("LLM_ARTICLE_DEADLINE", "0"))
+
+# 이미지 1장당 토큰 추정치
+_IMAGE_TOKENS = 258
+
+_local = threading.local()
+
+
+def current_priority() -> int:
+    return getattr(_local, "priority", INTERACTIVE)
+
+
+@contextlib.contextmanager
+def priority(level: int):
+    """
+    현재 스레드에서 호출되는 LLM 요청의 기본 우선순위 지정
+    예) with priority(BATCH): capture_and_generate_news(...)
+    """
+    previous = current_priority()
+    _local.priority = level
+    try:
+        yield
+    finally:
+        _local.priority = previous
+
+
+def estimate_tokens(contents, system_instruction: Optional[str] = None) -> int:
+    """
+    입력 크기로 토큰 수를 대략 추정 (한국어 기준 약 2자당 1토큰, 이미지는 장당 고정값)
+    :param contents: generate_content 입력 (문자열 / 리스트 / role·parts 딕셔너리)
+    :param system_instruction: 시스템 프롬프트
+    :return: 추정 토큰 수
+    """
+    # GenerativeModel._system_instruction 은 Content 객체일 수 있어 문자열로 변환해 길이만 본다
+    chars = len(system_instruction if isinstance(system_instruction, str) else str(system_instruction or ""))
+    images = 0
+    stack = [contents]
+    while stack:
+        item = stack.pop()
+        if item is None:
+            continue
+        if isinstance(item, str):
+            chars += len(item)
+        elif isinstance(item, dict):
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple)):
+            stack.extend(item)
+        else:
+            images += 1
+    return max(1, chars // 2 + images * _IMAGE_TOKENS)
+
+
+def deadline_token(parent: Optional[CancelToken] = None, timeout: Optional[float] = None) -> Optional[CancelToken]:
+    """
+    기사 1건 처리용 마감 토큰 생성
+    :param parent: 워커가 넘긴 취소 토큰 (없으면 None)
+    :param timeout: 마감(초). None이면 ARTICLE_DEADLINE, 0 이하이면 마감 없이 parent 그대로 반환
+    :return: 마감이 걸린 하위 토큰 또는 parent
+    """
+    timeout = ARTICLE_DEADLINE if timeout is None else timeout
+    if not timeout or timeout <= 0:
+        return parent
+    return CancelToken(timeout=timeout, parent=parent)
+
+
+def _is_rate_limited(error: Exception) -> bool:
+    text = f"{type(error).__name__} {error}"
+    return "429" in text or "ResourceExhausted" in text or "RESOURCE_EXHAUSTED" in text
+
+
+class LLMScheduler:
+    def __init__(self, rpm: float = GEMINI_RPM, tpm: float = GEMINI_TPM):
+        """
+        :param rpm: 분당 요청 수 한도 (0 이하이면 제한 없음)
+        :param tpm: 분당 토큰 수 한도 (0 이하이면 제한 없음)
+        """
+        self.rpm = rpm
+        self.tpm = tpm
+        self._cond = threading.Condition()
+        self._queue = []
+        self._seq = itertools.count()
+        self._req_tokens = float(rpm) if rpm > 0 else 0.0
+        self._tok_tokens = float(tpm) if tpm > 0 else 0.0
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._metrics = {}
+        self._latencies = {}
+        self._hedge = {"fired": 0, "won": 0, "extra_requests": 0, "extra_tokens": 0, "deadline_exceeded": 0}
+
+    # ------------------------------------------------------------------
+    # 토큰 버킷
+    # ------------------------------------------------------------------
+    def _refill_locked(self):
+        now = time.monotonic()
+        elapsed = now - self._updated
+        self._updated = now
+        if self.rpm > 0:
+            self._req_tokens = min(self.rpm, self._req_tokens + elapsed * self.rpm / 60.0)
+        if self.tpm > 0:
+            self._tok_tokens = min(self.tpm, self._tok_tokens + elapsed * self.tpm / 60.0)
+
+    def _wait_time_locked(self, tokens: int) -> float:
+        """
+        지금 허가할 수 있으면 0, 아니면 기다려야 할 시간(초)
+        """
+        now = time.monotonic()
+        waits = [max(0.0, self._paused_until - now)]
+        if self.rpm > 0 and self._req_tokens < 1:
+            waits.append((1 - self._req_tokens) * 60.0 / self.rpm)
+        if self.tpm > 0 and self._tok_tokens < tokens:
+            waits.append((tokens - self._tok_tokens) * 60.0 / self.tpm)
+        return max(waits)
+
+    def acquire(self, tokens: int, level: Optional[int] = None, cancel_token: Optional[CancelToken] = None) -> float:
+        """
+        요청 1건 + 추정 토큰만큼 허가될 때까지 대기
+        :param cancel_token: 대기 중 취소/마감되면 CancelledError(DeadlineExceeded) 발생
+        :return: 대기한 시간(초)
+        """
+        level = current_priority() if level is None else level
+        if self.tpm > 0:
+            tokens = min(tokens, int(self.tpm))  # 한도보다 큰 요청이 영원히 막히지 않도록
+        started = time.monotonic()
+        entry = (level, next(self._seq))
+        with self._cond:
+            heapq.heappush(self._queue, entry)
+            try:
+                while True:
+                    if cancel_token is not None:
+                        cancel_token.raise_if_cancelled()
+                    self._refill_locked()
+                    if self._queue[0] == entry:
+                        wait = self._wait_time_locked(tokens)
+                        if wait <= 0:
+                            if self.rpm > 0:
+                                self._req_tokens -= 1
+                            if self.tpm > 0:
+                                self._tok_tokens -= tokens
+                            break
+                        self._cond.wait(min(wait, 1.0))
+                    else:
+                        self._cond.wait(1.0)
+            finally:
+                self._queue.remove(entry)
+                heapq.heapify(self._queue)
+                self._cond.notify_all()
+        waited = time.monotonic() - started
+        self._record(level, waited=waited)
+        return waited
+
+    def settle(self, estimated: int, actual: Optional[int]):
+        """
+        응답의 실제 토큰 수로 추정치 보정 (초과분은 추가 차감, 남은 분은 반환)
+        """
+        if not actual or self.tpm <= 0:
+            return
+        with self._cond:
+            self._refill_locked()
+            self._tok_tokens = min(self.tpm, self._tok_tokens - (actual - min(estimated, int(self.tpm))))
+            self._cond.notify_all()
+
+    def backoff(self, seconds: float):
+        """
+        429 수신 시 모든 요청 일시 정지
+        """
+        with self._cond:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+            self._req_tokens = min(self._req_tokens, 0.0)
+            self._cond.notify_all()
+
+    # ------------------------------------------------------------------
+    # 호출
+    # ------------------------------------------------------------------
+    def submit(self, model, contents, level: Optional[int] = None, estimated_tokens: Optional[int] = None,
+               hedge: Optional[bool] = None, cancel_token: Optional[CancelToken] = None, **kwargs):
+        """
+        model.generate_content(contents, **kwargs) 를 한도 내에서 실행
+        :param model: generate_content 메서드를 가진 객체 (genai.GenerativeModel 또는 테스트용 가짜)
+        :param contents: generate_content 입력
+        :param level: INTERACTIVE / BATCH (None이면 현재 스레드 기본값)
+        :param estimated_tokens: 토큰 추정치 (None이면 입력 크기로 추정)
+        :param hedge: 지연 시 중복 요청 여부 (None이면 환경변수 LLM_HEDGE)
+        :param cancel_token: 취소/마감 토큰 (취소 시 CancelledError, 마감 시 DeadlineExceeded)
+        :return: generate_content 응답
+        """
+        level = current_priority() if level is None else level
+        if estimated_tokens is None:
+            estimated_tokens = estimate_tokens(contents, getattr(model, "_system_instruction", None))
+        hedge = HEDGE_ENABLED if hedge is None else hedge
+
+        if not hedge and cancel_token is None:
+            return self._call(model, contents, level, estimated_tokens, None, None, kwargs)
+        return self._hedged(model, contents, level, estimated_tokens, hedge, cancel_token, kwargs)
+
+    def _call(self, model, contents, level, estimated_tokens, cancel_token, on_start, kwargs):
+        """
+        허가 대기 → 호출 → 토큰 보정 (429 시 전체 백오프 후 재시도)
+        :param on_start: 허가를 받아 실제 호출을 시작할 때 호출할 함수 (헤징 기준 시각 기록용)
+        """
+        key = getattr(model, "model_name", None) or "default"
+        backoff = RATE_LIMIT_BACKOFF
+        for attempt in range(RATE_LIMIT_RETRIES + 1):
+            self.acquire(estimated_tokens, level, cancel_token)
+            if on_start is not None:
+                on_start()
+            started = time.monotonic()
+            try:
+                response = model.generate_content(contents, **kwargs)
+            except Exception as e:
+                if not _is_rate_limited(e) or attempt >= RATE_LIMIT_RETRIES:
+                    raise
+                self._record(level, rate_limited=True)
+                print(f"[LLM 스케줄러] 429 응답 → {backoff:.0f}초 전체 대기 후 재시도 ({attempt + 1}/{RATE_LIMIT_RETRIES})")
+                self.backoff(backoff)
+                backoff *= 2
+                continue
+            self._record_latency(key, time.monotonic() - started)
+            usage = getattr(response, "usage_metadata", None)
+            self.settle(estimated_tokens, getattr(usage, "total_token_count", None) if usage else None)
+            return response
+
+    def _hedged(self, model, contents, level, estimated_tokens, hedge, cancel_token, kwargs):
+        """
+        별도 스레드에서 호출하고, 지연 p90을 넘기면 같은 요청을 한 번 더 보내 먼저 온 응답을 사용.
+        늦게 도착한 응답은 버리되 토큰은 추가 비용으로 집계한다. (진행 중인 HTTP 호출은 SDK에서 중단할 수 없음)
+        """
+        key = getattr(model, "model_name", None) or "default"
+        hedge_delay = self.hedge_delay(key) if hedge else None
+        results = queue.Queue()
+        state = {"winner": None, "primary_started": None}
+        state_lock = threading.Lock()
+
+        def run(tag):
+            def on_start():
+                if tag == "primary":
+                    state["primary_started"] = time.monotonic()
+            try:
+                response = self._call(model, contents, level, estimated_tokens, cancel_token, on_start, kwargs)
+            except Exception as e:
+                results.put((tag, None, e))
+                return
+            with state_lock:
+                lost = state["winner"] is not None
+            if lost:
+                usage = getattr(response, "usage_metadata", None)
+                tokens = getattr(usage, "total_token_count", None) if usage else None
+                self._record_hedge(extra_tokens=tokens or estimated_tokens)
+            results.put((tag, response, None))
+
+        def launch(tag):
+            threading.Thread(target=run, args=(tag,), daemon=True, name=f"llm-{tag}").start()
+
+        launch("primary")
+        pending = 1
+        hedged = False
+        last_error = None
+        while True:
+            timeout = 0.5
+            remaining = cancel_token.remaining() if cancel_token is not None else None
+            if remaining is not None:
+                timeout = min(timeout, remaining + 0.01)
+            if hedge_delay is not None and not hedged and state["primary_started"] is not None:
+                timeout = min(timeout, max(0.0, state["primary_started"] + hedge_delay - time.monotonic()))
+            try:
+                tag, response, error = results.get(timeout=timeout)
+            except queue.Empty:
+                if cancel_token is not None and cancel_token.cancelled:
+                    self._abandon(cancel_token)
+                if (hedge_delay is not None and not hedged and state["primary_started"] is not None
+                        and time.monotonic() - state["primary_started"] >= hedge_delay):
+                    hedged = True
+                    pending += 1
+                    self._record_hedge(fired=True)
+                    print(f"[LLM 스케줄러] 응답 지연({hedge_delay:.1f}s 초과) → 동일 요청 추가 전송")
+                    launch("hedge")
+                continue
+
+            pending -= 1
+            if error is None:
+                with state_lock:
+                    state["winner"] = tag
+                if tag == "hedge":
+                    self._record_hedge(won=True)
+                return response
+            last_error = error
+            if pending <= 0:
+                if cancel_token is not None and cancel_token.cancelled:
+                    self._abandon(cancel_token)
+                raise last_error
+            # 헤지 요청이 남아 있으면 그쪽 결과를 기다림
+
+    def _abandon(self, cancel_token: CancelToken):
+        """
+        취소/마감으로 대기를 포기 (남은 호출은 백그라운드에서 끝나고 결과는 버려짐)
+        """
+        try:
+            cancel_token.raise_if_cancelled()
+        except DeadlineExceeded:
+            self._record_hedge(deadline_exceeded=True)
+            raise
+
+    # ------------------------------------------------------------------
+    # 지연 / 헤징 지표
+    # ------------------------------------------------------------------
+    def _record_latency(self, key: str, latency: float):
+        with self._cond:
+            window = self._latencies.get(key)
+            if window is None:
+                window = self._latencies[key] = deque(maxlen=LATENCY_WINDOW)
+            window.append(latency)
+
+    def _quantile(self, key: str, q: float) -> Optional[float]:
+        with self._cond:
+            samples = sorted(self._latencies.get(key) or ())
+        if not samples:
+            return None
+        return samples[min(len(samples) - 1, int(q * len(samples)))]
+
+    def hedge_delay(self, key: str = "default") -> Optional[float]:
+        """
+        헤지 요청을 보낼 기준 시간(초) = 최근 지연의 HEDGE_QUANTILE 분위수 (표본 부족 시 None)
+        """
+        with self._cond:
+            count = len(self._latencies.get(key) or ())
+        if count < HEDGE_MIN_SAMPLES:
+            return None
+        return max(HEDGE_MIN_DELAY, self._quantile(key, HEDGE_QUANTILE))
+
+    def _record_hedge(self, fired: bool = False, won: bool = False, extra_tokens: int = 0,
+                      deadline_exceeded: bool = False):
+        with self._cond:
+            if fired:
+                self._hedge["fired"] += 1
+                self._hedge["extra_requests"] += 1
+            if won:
+                self._hedge["won"] += 1
+            if deadline_exceeded:
+                self._hedge["deadline_exceeded"] += 1
+            self._hedge["extra_tokens"] += int(extra_tokens or 0)
+
+    # ------------------------------------------------------------------
+    # 지표
+    # ------------------------------------------------------------------
+    def _record(self, level: int, waited: Optional[float] = None, rate_limited: bool = False):
+        name = _PRIORITY_NAMES.get(level, str(level))
+        with self._cond:
+            entry = self._metrics.setdefault(name, {"requests": 0, "total_wait": 0.0, "max_wait": 0.0, "rate_limited": 0})
+            if rate_limited:
+                entry["rate_limited"] += 1
+            if waited is not None:
+                entry["requests"] += 1
+                entry["total_wait"] += waited
+                entry["max_wait"] = max(entry["max_wait"], waited)
+
+    def stats(self) -> dict:
+        """
+        :return: {"interactive"|"batch": {"requests", "avg_wait", "max_wait", "rate_limited"}, "queued": N,
+                  "hedge": {"fired", "won", "extra_requests", "extra_tokens", "deadline_exceeded"},
+                  "latency": {모델명: {"p50", "p90"}}}
+        """
+        with self._cond:
+            result = {name: dict(v) for name, v in self._metrics.items()}
+            queued = len(self._queue)
+            hedge = dict(self._hedge)
+            keys = list(self._latencies)
+        for entry in result.values():
+            entry["avg_wait"] = round(entry["total_wait"] / entry["requests"], 3) if entry["requests"] else 0.0
+            entry["max_wait"] = round(entry["max_wait"], 3)
+            del entry["total_wait"]
+        result["queued"] = queued
+        result["hedge"] = hedge
+        result["latency"] = {
+            key: {"p50": round(self._quantile(key, 0.5) or 0.0, 3), "p90": round(self._quantile(key, 0.9) or 0.0, 3)}
+            for key in keys
+        }
+        return result
+
+
+_scheduler: Optional[LLMScheduler] = None
+_scheduler_lock = threading.Lock()
+
+
+def get_scheduler() -> LLMScheduler:
+    global _scheduler
+    with _scheduler_lock:
+        if _scheduler is None:
+            _scheduler = LLMScheduler()
+        return _scheduler
+
+
+def generate_content(model, contents, level: Optional[int] = None, estimated_tokens: Optional[int] = None,
+                     hedge: Optional[bool] = None, cancel_token: Optional[CancelToken] = None, **kwargs):
+    """
+    전역 스케줄러를 통해 model.generate_content 호출 (기존 호출부를 그대로 대체)
+    """
+    return get_scheduler().submit(model, contents, level=level, estimated_tokens=estimated_tokens,
+                                  hedge=hedge, cancel_token=cancel_token, **kwargs)
+
+
+def stats() -> dict:
+    return get_scheduler().stats()
@@ -0,0 +1,127 @@
+# ------------------------------------------------------------------
+# 작성자 : 최준혁
+# 작성일 : 2026-10-18
+# 기능 : DataFrame 결과 표시용 테이블 모델 (QTableWidget 셀 아이템 대신 QAbstractTableModel + 정렬 프록시)
+# ------------------------------------------------------------------
+# QTableWidget 에 행 x 열 만큼 QTableWidgetItem 을 만들면 결과가 많을 때 채우는 동안 UI가 멈춘다.
+# 이 모델은 DataFrame 값을 한 번 배열로 잡아 두고 화면에 보이는 칸만 data()에서 문자열로 만든다.
+#
+# - 표시 형식: formatters {컬럼명: 값 → 문자열}, 글자색: foregrounds {컬럼명: 값 → 색 이름/None}
+# - 정렬: SORT_ROLE 로 원래 값(숫자는 숫자)을 돌려주므로 make_proxy()의 프록시가 숫자 순으로 정렬
+# - 호출부: set_frame(df) / clear() / column_values(컬럼명)
+# ------------------------------------------------------------------
+from typing import Callable, Dict, Optional
+
+import pandas as pd
+from PyQt5.QtCore import QAbstractTableModel, QModelIndex, QSortFilterProxyModel, Qt
+from PyQt5.QtGui import QColor
+
+SORT_ROLE = Qt.UserRole
+
+
+class DataFrameTableModel(QAbstractTableModel):
+    """
+    읽기 전용 DataFrame 테이블 모델
+    """
+
+    def __init__(self, parent=None, formatters: Optional[Dict[str, Callable]] = None,
+                 foregrounds: Optional[Dict[str, Callable]] = None,
+                 alignments: Optional[Dict[str, int]] = None):
+        """
+        :param formatters: {컬럼명: 값을 표시 문자열로 바꾸는 함수} (없으면 str)
+        :param foregrounds: {컬럼명: 값에 따라 글자색 이름(또는 None)을 돌려주는 함수}
+        :param alignments: {컬럼명: Qt 정렬 플래그}
+        """
+        super().__init__(parent)
+        self._columns = []
+        self._values = []
+        self._formatters = formatters or {}
+        self._foregrounds = foregrounds or {}
+        self._alignments = alignments or {}
+        self._colors: Dict[str, QColor] = {}
+
+    # ------------------------------------------------------------------
+    # Qt 모델 인터페이스
+    # ------------------------------------------------------------------
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._values)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._columns)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal and 0 <= section < len(self._columns):
+            return self._columns[section]
+        return super().headerData(section, orientation, role)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        column = self._columns[index.column()]
+        value = self._values[index.row()][index.column()]
+
+        if role == Qt.DisplayRole:
+            formatter = self._formatters.get(column)
+            if formatter is not None:
+                try:
+                    return formatter(value)
+                except Exception:
+                    pass
+            return str(value)
+        if role == SORT_ROLE:
+            # NaN/None 은 맨 앞으로, 숫자는 숫자끼리 비교되도록 그대로
+            if value is None or (isinstance(value, float) and value != value):
+                return ""
+            return value.item() if hasattr(value, "item") else value
+        if role == Qt.ForegroundRole and column in self._foregrounds:
+            name = self._foregrounds[column](value)
+            if name:
+                color = self._colors.get(name)
+                if color is None:
+                    color = self._colors[name] = QColor(name)
+                return color
+            return None
+        if role == Qt.TextAlignmentRole and column in self._alignments:
+            return int(self._alignments[column])
+        return None
+
+    # ------------------------------------------------------------------
+    # 데이터
+    # ------------------------------------------------------------------
+    def set_frame(self, df: Optional[pd.DataFrame]):
+        """
+        표시할 DataFrame 교체 (값은 복사해 두므로 이후 df 변경과 무관)
+        """
+        self.beginResetModel()
+        if df is None or df.empty:
+            self._columns = [] if df is None else [str(c) for c in df.columns]
+            self._values = []
+        else:
+            self._columns = [str(c) for c in df.columns]
+            self._values = df.to_numpy(dtype=object).tolist()
+        self.endResetModel()
+
+    def clear(self):
+        self.beginResetModel()
+        self._values = []
+        self.endResetModel()
+
+    def column_values(self, column: str) -> list:
+        """
+        :return: 해당 컬럼의 원래 값 목록 (모델 순서, 컬럼이 없으면 빈 목록)
+        """
+        try:
+            col = self._columns.index(column)
+        except ValueError:
+            return []
+        return [row[col] for row in self._values]
+
+
+def make_proxy(model: QAbstractTableModel, parent=None) -> QSortFilterProxyModel:
+    """
+    SORT_ROLE 기준으로 정렬하는 프록시 생성 (QTableView.setModel 에 연결)
+    """
+    proxy = QSortFilterProxyModel(parent)
+    proxy.setSortRole(SORT_ROLE)
+    proxy.setSourceModel(model)
+    return proxy
@@ -0,0 +1,21 @@
+# ------------------------------------------------------------------
+# 작성자 : 최준혁
+# 작성일 : 2026-10-18
+# 기능 : news 테스트 공통 설정 (news.src... 절대 import를 위해 저장소 루트를 검색 경로에 추가)
+# ------------------------------------------------------------------
+# 실행 (저장소 루트에서): python -m pytest news/tests
+# 이 폴더의 news.py 스크립트가 news 패키지(__init__.py 없는 네임스페이스 패키지)를 가리므로
+# 폴더를 검색 경로에서 잠시 빼고 news 패키지를 먼저 로드해 둔다
+# ------------------------------------------------------------------
+import os
+import sys
+import importlib
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT_DIR = os.path.dirname(os.path.dirname(TESTS_DIR))
+
+_saved_path = list(sys.path)
+sys.path[:] = [ROOT_DIR] + [p for p in _saved_path if os.path.abspath(p or os.getcwd()) not in (TESTS_DIR, ROOT_DIR)]
+sys.modules.pop("news", None)
+importlib.import_module("news.src")
+sys.path[:] = [ROOT_DIR] + [p for p in _saved_path if os.path.abspath(p or os.getcwd()) != ROOT_DIR]
@@ -0,0 +1,71 @@
+# ------------------------------------------------------------------
+# 작성자 : 최준혁
+# 작성일 : 2026-10-18
+# 기능 : boilerplate 도메인별 줄 빈도 학습 검증 (_MAX_URLS_PER_DOMAIN 보다 많은 기사 학습 시 비율 유지)
+# ------------------------------------------------------------------
+import pytest
+
+from news.src.utils import boilerplate
+
+DOMAIN_URL = "https://www.example-news.co.kr/news/articleView.html?idxno={}"
+FOOTER = "예시뉴스 구독하고 최신 소식 받아보기"
+SUBHEADING = "■ 시장 전망"
+
+
+@pytest.fixture(autouse=True)
+def memory_store(monkeypatch):
+    """파일을 읽거나 쓰지 않는 빈 메모리 저장소로 학습"""
+    monkeypatch.setattr(boilerplate, "_store", {})
+    monkeypatch.setattr(boilerplate, "_persist", False)
+    monkeypatch.setattr(boilerplate, "BOILERPLATE_CLEAN", True)
+    yield
+
+
+def _body(i, *extra):
+    return "\n".join([f"기사 {i}번의 첫 문단입니다.", *extra, f"기사 {i}번의 마지막 문단입니다."])
+
+
+def _frequent(url):
+    return boilerplate._frequent_keys(boilerplate.domain_of(url))
+
+
+def test_rare_line_not_frequent_after_many_articles():
+    # 5% 기사에만 나오는 소제목은 _MAX_URLS_PER_DOMAIN 을 넘겨 학습해도 고정 문구가 되지 않아야 함
+    total = 10 * boilerplate._MAX_URLS_PER_DOMAIN
+    for i in range(total):
+        extra = [SUBHEADING] if i % 20 == 0 else []
+        boilerplate.learn(DOMAIN_URL.format(i), _body(i, *extra, FOOTER))
+
+    frequent = _frequent(DOMAIN_URL.format(0))
+    assert boilerplate._line_key(FOOTER) in frequent
+    assert boilerplate._line_key(SUBHEADING) not in frequent
+
+    entry = boilerplate._load()[boilerplate.domain_of(DOMAIN_URL.format(0))]
+    assert entry["articles"] < boilerplate._ARTICLE_WINDOW
+
+    cleaned, report = boilerplate.clean(DOMAIN_URL.format(total), _body(total, SUBHEADING, FOOTER))
+    assert SUBHEADING in cleaned
+    assert FOOTER not in cleaned
+    assert report["rules"] == {"domain_frequent": 1}
+
+
+def test_new_footer_learned_after_window_rolls_over():
+    # 학습 기사가 많이 쌓인 뒤 새로 붙기 시작한 고정 문구도 최근 기사 비율로 학습되어야 함
+    start = 5 * boilerplate._MAX_URLS_PER_DOMAIN
+    for i in range(start):
+        boilerplate.learn(DOMAIN_URL.format(i), _body(i))
+    for i in range(start, start + boilerplate._ARTICLE_WINDOW):
+        boilerplate.learn(DOMAIN_URL.format(i), _body(i, FOOTER))
+
+    assert boilerplate._line_key(FOOTER) in _frequent(DOMAIN_URL.format(0))
+
+
+def test_legacy_entry_uses_learned_count():
+    # articles 필드가 없는 이전 형식: 줄 빈도가 URL 수(최대 _MAX_URLS_PER_DOMAIN)보다 커도 과대 판정하지 않음
+    domain = boilerplate.domain_of(DOMAIN_URL.format(0))
+    boilerplate._load()[domain] = {
+        "urls": [str(i) for i in range(boilerplate._MAX_URLS_PER_DOMAIN)],
+        "seq": 2000,
+        "lines": {boilerplate._line_key(SUBHEADING): [100, 1990]},
+    }
+    assert boilerplate._line_key(SUBHEADING) not in _frequent(DOMAIN_URL.format(0))
@@ -49,6 +49,7 @@ from visitor_reviews_utils import normalize_review_for_ui
 from weather_api import WeatherAPI
 import db_manager
 import chatbot_app
+from task_pool import task_manager
 import shutil
 import tempfile
 
@@ -81,6 +82,8 @@ class ArticleGeneratorApp(QWidget):
                 f"DB 파일을 찾을 수 없습니다:\n{self.db_path}\n\nDB를 같은 폴더에 넣어주세요.")
             raise FileNotFoundError(self.db_path)
 
+        # 스키마 보강(구버전 DB 마이그레이션)은 시작 시 한 번
+        db_manager.prepare_database(self.db_path)
         self.category_mapping = db_manager.get_category_mapping(self.db_path)
         self.dong_mapping = {}  # 동 매핑 초기화
         self.weather_api = WeatherAPI()  # WeatherAPI 인스턴스 생성
@@ -107,6 +110,12 @@ class ArticleGeneratorApp(QWidget):
         main_layout.addWidget(tabs)
         self.setLayout(main_layout)
 
+    def closeEvent(self, event):
+        """종료 시 공용 작업 풀 정리 (대기 작업 제거 + 실행 중 작업 취소 후 완료 대기)"""
+        task_manager().drain()
+        db_manager.close_read_connections()
+        super().closeEvent(event)
+
 
 if __name__ == '__main__':
     if sys.stdout:
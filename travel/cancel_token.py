@@ -0,0 +1,223 @@
+# cancel_token.py - 워커 스레드 협력적 취소 토큰
+# ===================================================================================
+# 파일명     : cancel_token.py
+# 작성자     : 하승주, 홍석원
+# 최초작성일 : 2026-10-18
+# 설명       : 크롤링 워커 ↔ realtime_crawler 간 협력적 취소(CancelToken) 및
+#              장소별 마감 시간(deadline) 지원
+# ===================================================================================
+#
+# 【주요 기능】
+# - cancel(): 작업 취소 표시 + 등록된 정리 함수(driver.quit 등) 즉시 호출
+# - cancelled / raise_if_cancelled(): 단계 사이 취소 확인
+# - child(timeout): 장소별 마감 시간을 둔 하위 토큰 (마감 시 자동 취소)
+# - wait(seconds): 취소되면 바로 깨어나는 time.sleep 대체
+#
+# 【도입 배경】
+# - 강제 종료된 크롤링 스레드가 chromedriver 프로세스를 남겨 메모리를 잠식
+# - 드라이버 정리는 항상 finally에서 수행하고, 취소는 토큰으로만 전달
+#
+# 【사용처】
+# - travel_logic.py: CrawlerWorker (장소별 하위 토큰 생성)
+# - realtime_crawler.py: crawl_introduction(cancel_token=...)
+#
+# ※ news 앱의 news/src/utils/cancel_token.py 와 동일한 동작 (travel 앱은 독립 실행)
+# ===================================================================================
+
+import time
+import threading
+from typing import Callable, List, Optional
+
+
+class CancelledError(Exception):
+    """작업이 취소되었을 때 발생"""
+
+
+class DeadlineExceeded(CancelledError):
+    """마감 시간이 지나 작업이 취소되었을 때 발생"""
+
+
+class CancelToken:
+    def __init__(self, timeout: Optional[float] = None, parent: Optional["CancelToken"] = None,
+                 is_running_callback: Optional[Callable[[], bool]] = None):
+        """
+        :param timeout: 마감 시간(초). None이면 마감 없음 (부모 마감은 그대로 적용)
+        :param parent: 상위 토큰. 부모가 취소되면 이 토큰도 취소됨
+        :param is_running_callback: 기존 방식의 실행 상태 콜백 (False 반환 시 취소로 간주)
+        """
+        self._event = threading.Event()
+        self._lock = threading.Lock()
+        self._callbacks: List[Callable[[], None]] = []
+        self._children: List["CancelToken"] = []
+        self._reason = ""
+        self._exc_type = CancelledError
+        self._is_running_callback = is_running_callback
+        self._parent = parent
+        self._timer = None
+
+        self.deadline = (time.monotonic() + timeout) if timeout is not None else None
+        if parent is not None:
+            if parent.deadline is not None and (self.deadline is None or parent.deadline < self.deadline):
+                self.deadline = parent.deadline
+            parent._add_child(self)
+
+        # 마감 시각에 콜백(driver.quit 등)이 바로 실행되도록 타이머로 자동 취소
+        if timeout is not None and not self._event.is_set():
+            self._timer = threading.Timer(max(0.0, timeout), self._expire)
+            self._timer.daemon = True
+            self._timer.start()
+
+    # ------------------------------------------------------------------
+    # 상태 조회
+    # ------------------------------------------------------------------
+    @property
+    def cancelled(self) -> bool:
+        if self._event.is_set():
+            return True
+        if self.deadline is not None and time.monotonic() >= self.deadline:
+            self._expire()
+            return True
+        if self._is_running_callback is not None:
+            try:
+                if not self._is_running_callback():
+                    self.cancel("사용자에 의해 취소되었습니다.")
+                    return True
+            except Exception:
+                pass
+        return False
+
+    @property
+    def reason(self) -> str:
+        return self._reason
+
+    def is_running(self) -> bool:
+        """
+        is_running_callback 자리에 그대로 넘길 수 있는 어댑터
+        """
+        return not self.cancelled
+
+    def remaining(self) -> Optional[float]:
+        """
+        마감까지 남은 시간(초). 마감이 없으면 None
+        """
+        if self.deadline is None:
+            return None
+        return max(0.0, self.deadline - time.monotonic())
+
+    def raise_if_cancelled(self):
+        """
+        취소되었으면 CancelledError(마감 초과 시 DeadlineExceeded) 발생
+        """
+        if self.cancelled:
+            raise self._exc_type(self._reason or "작업이 취소되었습니다.")
+
+    def wait(self, timeout: float) -> bool:
+        """
+        time.sleep 대체. 취소되면 즉시 깨어난다.
+        :return: 대기 중 취소되었으면 True
+        """
+        remaining = self.remaining()
+        if remaining is not None:
+            timeout = min(timeout, remaining)
+        self._event.wait(max(0.0, timeout))
+        return self.cancelled
+
+    # ------------------------------------------------------------------
+    # 취소 / 정리
+    # ------------------------------------------------------------------
+    def cancel(self, reason: str = "작업이 취소되었습니다."):
+        self._cancel(reason, CancelledError)
+
+    def _expire(self):
+        self._cancel("처리 시간이 초과되어 작업을 중단했습니다.", DeadlineExceeded)
+
+    def _cancel(self, reason: str, exc_type):
+        with self._lock:
+            if self._event.is_set():
+                return
+            self._reason = reason
+            self._exc_type = exc_type
+            self._event.set()
+            callbacks, self._callbacks = self._callbacks, []
+            children, self._children = self._children, []
+        if self._timer is not None:
+            self._timer.cancel()
+        for child in children:
+            child._cancel(reason, exc_type)
+        # 등록 역순(나중에 연 자원부터)으로 정리
+        for callback in reversed(callbacks):
+            try:
+                callback()
+            except Exception as e:
+                print(f"[WARNING] 취소 콜백 실행 실패: {e}")
+
+    def add_callback(self, callback: Callable[[], None]) -> Callable[[], None]:
+        """
+        취소 시 호출할 정리 함수 등록 (이미 취소된 상태면 즉시 호출)
+        :return: 등록한 콜백 (remove_callback에 그대로 전달)
+        """
+        with self._lock:
+            if not self._event.is_set():
+                self._callbacks.append(callback)
+                return callback
+        try:
+            callback()
+        except Exception as e:
+            print(f"[WARNING] 취소 콜백 실행 실패: {e}")
+        return callback
+
+    def remove_callback(self, callback: Callable[[], None]):
+        with self._lock:
+            try:
+                self._callbacks.remove(callback)
+            except ValueError:
+                pass
+
+    def child(self, timeout: Optional[float] = None) -> "CancelToken":
+        """
+        항목(종목/장소)별 마감 시간을 둔 하위 토큰 생성
+        """
+        return CancelToken(timeout=timeout, parent=self)
+
+    def _add_child(self, child: "CancelToken"):
+        with self._lock:
+            if not self._event.is_set():
+                self._children.append(child)
+                return
+        child._cancel(self._reason, self._exc_type)
+
+    def close(self):
+        """
+        작업이 정상 종료되었을 때 타이머/부모 참조 정리
+        """
+        if self._timer is not None:
+            self._timer.cancel()
+        parent = self._parent
+        if parent is not None:
+            with parent._lock:
+                try:
+                    parent._children.remove(self)
+                except ValueError:
+                    pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+
+def from_callback(cancel_token: Optional[CancelToken] = None,
+                  is_running_callback: Optional[Callable[[], bool]] = None) -> CancelToken:
+    """
+    서비스 함수 진입 시 토큰/기존 콜백을 하나의 토큰으로 정규화
+    :param cancel_token: 호출 측이 넘긴 토큰 (없으면 새로 생성)
+    :param is_running_callback: 기존 방식의 실행 상태 콜백
+    :return: 항상 사용 가능한 CancelToken
+    """
+    if cancel_token is None:
+        return CancelToken(is_running_callback=is_running_callback)
+    if is_running_callback is None:
+        return cancel_token
+    return CancelToken(parent=cancel_token, is_running_callback=is_running_callback)
@@ -36,6 +36,7 @@
   # - selenium: 웹 브라우저 자동화
   # - pandas: (파일에는 import 되어 있으나 직접적인 사용은 없음)
   # - db_manager.py: SQLite DB 연결 및 데이터 저장/조회
+  # - place_intro_http.py: '소개' HTTP 우선 수집 (실패 시 Selenium 정보 탭)
   #
   # 【사용법】
   # - 스크립트를 직접 실행: python crawl_main.py
@@ -61,6 +62,7 @@ from selenium.webdriver.common.action_chains import ActionChains
 
 # 새로 생성한 DB 매니저 임포트
 import db_manager as db_manager
+import place_intro_http
 
 # --- 설정값 ---
 SAVE_DIR = r"C:\Users\TDI\Desktop\0909_여행&날씨 기사생성기\crw_data"
@@ -306,6 +308,12 @@ def crawl_place_details(driver, db_conn, search_query, place_name):
             data["주소"] = "정보 없음"
 
 
+    # 소개: 모바일 페이지 HTTP 요청으로 먼저 시도 (실패 시에만 아래 Selenium 정보 탭 추출)
+    #  - 이 경로의 '소개'는 정보 탭 소개만 저장 (홈 탭 요약으로 대체하지 않음)
+    http_intro, started = None, None
+    if place_intro_http.HTTP_INTRO_ENABLED and data["naver_place_id"].isdigit():
+        http_intro, _ = place_intro_http.fetch_introduction(data["naver_place_id"], fallback_summary=False)
+
     # --- Improved Info Tab Handling ---
     try:
         # 1. Try to find the "정보" tab directly.
@@ -342,35 +350,43 @@ def crawl_place_details(driver, db_conn, search_query, place_name):
                     break
         
         # 3. Click the info tab if found
+        #    (키워드가 정보 탭에 표시되므로 탭 이동은 유지, 소개는 HTTP로 얻었으면 펼쳐보기/추출 생략)
         if info_tab:
             driver.execute_script("arguments[0].click();", info_tab)
-            WebDriverWait(driver, 5).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "div.AX_W3"))
-            )
-            time.sleep(1)
-
-            # 4. Click the "expand" button if it exists
-            try:
-                unfold_btn = WebDriverWait(driver, 2).until(
-                    EC.element_to_be_clickable((By.CSS_SELECTOR, "a.OWPIf"))
+            if http_intro:
+                data["소개"] = http_intro
+            else:
+                started = time.perf_counter()
+                WebDriverWait(driver, 5).until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, "div.AX_W3"))
                 )
-                if unfold_btn.is_displayed():
-                    driver.execute_script("arguments[0].click();", unfold_btn)
-                    print("  [INFO] '펼쳐보기' 버튼을 클릭했습니다.")
-                    time.sleep(1)
-            except TimeoutException:
-                pass # No expand button, which is fine.
-
-            # 5. Scrape the introduction text
-            info_element = WebDriverWait(driver, 3).until(EC.presence_of_element_located((By.CSS_SELECTOR, "div.AX_W3")))
-            data["소개"] = info_element.text.strip() or "소개 정보 없음"
+                time.sleep(1)
+
+                # 4. Click the "expand" button if it exists
+                try:
+                    unfold_btn = WebDriverWait(driver, 2).until(
+                        EC.element_to_be_clickable((By.CSS_SELECTOR, "a.OWPIf"))
+                    )
+                    if unfold_btn.is_displayed():
+                        driver.execute_script("arguments[0].click();", unfold_btn)
+                        print("  [INFO] '펼쳐보기' 버튼을 클릭했습니다.")
+                        time.sleep(1)
+                except TimeoutException:
+                    pass # No expand button, which is fine.
+
+                # 5. Scrape the introduction text
+                info_element = WebDriverWait(driver, 3).until(EC.presence_of_element_located((By.CSS_SELECTOR, "div.AX_W3")))
+                data["소개"] = info_element.text.strip() or "소개 정보 없음"
+                place_intro_http.record("selenium", data["소개"] != "소개 정보 없음", time.perf_counter() - started)
         else:
             print("  [ERROR] '정보' 탭을 찾을 수 없습니다.")
-            data["소개"] = "정보 없음"
+            data["소개"] = http_intro or "정보 없음"
 
     except Exception as e:
         print(f"  [ERROR] 정보 탭 처리 중 오류 발생: {e}")
-        data["소개"] = "정보 없음"
+        if started is not None:
+            place_intro_http.record("selenium", False, time.perf_counter() - started)
+        data["소개"] = http_intro or "정보 없음"
 
     # --- Keyword and other info scraping ---
     # Try to find representative keywords first
@@ -20,12 +20,41 @@
 #   * naver_place_id, name, category, address
 #   * total_visitor_reviews_count, total_blog_reviews_count  
 #   * introduction, keywords, visitor_reviews
+#   * province, city, dong: 주소에서 파싱한 정규화 지역 (저장 시 채움, 기존 DB는 최초 연결 시 마이그레이션)
+#     - province: 강원/전북 단일 표기, dong: 숫자 번지는 '', 도로명은 '도로명'
+#     - 복합 인덱스 idx_places_region (province, city, dong)
+#   * ui_category: normalize_category_for_ui 기준 UI 카테고리 (저장 시 계산, 인덱스 idx_places_ui_category)
+#     - 키워드 사전이 바뀌면 `python db_manager.py backfill-categories <DB 경로>`로 전체 재계산
+#   * review_tags: visitor_reviews 를 normalize_review_for_ui 로 변환한 태그 집합 '|태그1|태그2|' (저장 시 계산)
+#     - 리뷰 태그 필터를 SQL에서 처리해야 리뷰 수 상위 N% 컷도 SQL 창 함수로 계산할 수 있음
+#   * introduction_updated_at: 실시간 크롤링으로 소개를 마지막으로 갱신한 시각 (UTC, 없으면 NULL)
+#     - get_fresh_introductions()가 TTL 안에 갱신된 소개를 돌려주면 크롤링을 건너뜀
+# - places_fts 가상 테이블: FTS5(trigram) 전문 검색 인덱스 (name, keywords, introduction)
+#   * places 를 원본(content)으로 쓰고 INSERT/UPDATE/DELETE 트리거로 동기화
+#   * trigram 토크나이저라 한글 부분 문자열도 인덱스로 검색 (3글자 미만은 LIKE 검색)
+#   * FTS5/trigram 을 지원하지 않는 SQLite(3.34 미만)에서는 만들지 않고 LIKE 검색 유지
+# - regions 테이블: 도/시/동 계층별 장소 수 (드롭다운/자동완성용 집계)
+#   * (province, '', '') = 도 단위, (province, city, '') = 시 단위, (province, city, dong) = 동 단위
+#   * save_places_to_db()가 새 장소만큼 증분 갱신, 장소 수/최대 id가 달라지면(외부 삭제 등) 전체 재집계
+# - db_meta 테이블: 집계 기준값 등 키/값 메타 정보
+#
+# 【연결 관리】
+# - create_connection(): 새 연결 (쓰기/크롤링용, 호출 측이 close)
+# - get_read_connection(): 스레드별로 재사용하는 읽기 연결 (드롭다운/검색 도우미가 사용, close 하지 않음)
+# - 모든 연결에 WAL 저널 + synchronous=NORMAL + 큰 cache_size/mmap_size + busy_timeout 적용
+#   → crawl_main 이 쓰는 동안 여행 탭 조회가 "database is locked" 로 멈추지 않음
+# - prepare_database(): 앱/크롤러 시작 시 한 번 스키마 마이그레이션 (경로별 1회)
 #
 # 【핵심 검색 기능】
 # - get_province_list(): 도/특별시 목록 (장소 수 순 정렬)
 # - get_city_list(): 특정 도의 시/군/구 목록
 # - get_dong_list(): 특정 시의 읍/면/동 목록
-# - search_places_advanced_with_dong(): 다단계 지역 필터 검색
+# - get_cities_for() / get_dongs_for(): 여러 도/시 선택을 한 번의 쿼리로 조회
+# - get_region_counts(): 자동완성 인덱스용 전체 계층 (장소 수 순)
+# - search_places_by_region(): 도/시/동(다중 선택) + 카테고리 + 리뷰 태그 + 이름 + 리뷰 수 조건을 한 번의 쿼리로 검색
+#   * top_fraction 지정 시 (이름, 주소) 중복 제거 + 리뷰 수 상위 N% 컷까지 창 함수(ROW_NUMBER/COUNT OVER)로 처리
+#   * 창 함수 미지원 SQLite(3.25 미만)에서는 컷 없이 반환 → 호출 측이 파이썬으로 컷 (WINDOW_FUNCTIONS)
+# - search_places_advanced_with_dong(): 단일 도/시/동 검색 (search_places_by_region 래퍼)
 #
 # 【지역 정규화】
 # - 강원특별자치도 ↔ 강원도 통합 처리
@@ -35,7 +64,11 @@
 # 【데이터 관리】
 # - save_places_to_db(): 크롤링 데이터 저장
 # - update_introduction(): 실시간 크롤링으로 소개 정보 업데이트
+# - update_introductions(): 여러 장소 소개를 executemany 한 번(한 트랜잭션)으로 갱신
+# - get_fresh_introductions(): TTL 안에 갱신된 소개 조회 (재크롤링 생략용)
 # - check_place_exists(): 중복 체크
+# - rebuild_regions(): regions 집계 테이블 재생성
+# - backfill_ui_categories(): ui_category / review_tags 컬럼 채우기/재계산
 #
 # 【사용처】
 # - travel_logic.py: 장소 검색 및 필터링
@@ -45,20 +78,102 @@
 
 import os
 import sqlite3
+import threading
 from collections import defaultdict
 from typing import List, Dict, Tuple, Iterable, Optional
 from category_utils import normalize_category_for_ui
+from visitor_reviews_utils import normalize_review_for_ui
 
 # ---------------------------
-# [크롤링 단계] DB 연결/초기화
+# [공용] DB 연결 관리
 # ---------------------------
-def create_connection(db_path: str) -> Optional[sqlite3.Connection]:
+BUSY_TIMEOUT_MS = 10000
+# 연결 설정 (cache_size 음수 = KiB 단위)
+_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA cache_size=-32000",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA temp_store=MEMORY",
+    f"PRAGMA busy_timeout={BUSY_TIMEOUT_MS}",
+)
+
+_local = threading.local()
+_schema_lock = threading.Lock()
+
+def _open(db_path: str) -> Optional[sqlite3.Connection]:
     try:
-        return sqlite3.connect(db_path, timeout=10)
+        conn = sqlite3.connect(db_path, timeout=BUSY_TIMEOUT_MS / 1000)
     except sqlite3.Error as e:
         print(f"[DB ERROR] 연결 실패: {e}")
         return None
+    try:
+        # WAL: 읽기와 쓰기가 서로를 막지 않음 (DB 파일에 기록되는 설정이라 한 번 바뀌면 유지)
+        conn.execute("PRAGMA journal_mode=WAL")
+    except sqlite3.Error as e:
+        print(f"[DB] WAL 전환 실패(읽기 전용 DB 등) - 기본 저널 사용: {e}")
+    for pragma in _PRAGMAS:
+        try:
+            conn.execute(pragma)
+        except sqlite3.Error:
+            pass
+    return conn
+
+def prepare_database(db_path: str) -> None:
+    """
+    시작 시 한 번 호출: 구버전 DB 스키마 보강(지역/카테고리 컬럼, 인덱스, 집계/전문 검색 테이블)
+    같은 경로는 프로세스당 한 번만 실행된다.
+    """
+    if db_path in _migrated_paths:
+        return
+    with _schema_lock:
+        if db_path in _migrated_paths:
+            return
+        conn = _open(db_path)
+        if not conn: return
+        try:
+            if _migrate_places(conn):
+                _migrated_paths.add(db_path)
+        finally:
+            conn.close()
+
+def create_connection(db_path: str) -> Optional[sqlite3.Connection]:
+    """
+    새 연결 (쓰기/크롤링용). 호출 측에서 close 한다.
+    """
+    prepare_database(db_path)
+    return _open(db_path)
+
+def get_read_connection(db_path: str) -> Optional[sqlite3.Connection]:
+    """
+    현재 스레드에서 재사용하는 읽기 연결 (close 하지 말 것)
+    드롭다운/검색처럼 자주 불리는 조회가 호출마다 연결을 새로 열지 않도록 한다.
+    """
+    conns = getattr(_local, "conns", None)
+    if conns is None:
+        conns = _local.conns = {}
+    conn = conns.get(db_path)
+    if conn is None:
+        prepare_database(db_path)
+        conn = _open(db_path)
+        if conn is not None:
+            conns[db_path] = conn
+    return conn
 
+def close_read_connections() -> None:
+    """
+    현재 스레드의 읽기 연결 정리 (앱 종료 시)
+    """
+    conns = getattr(_local, "conns", None) or {}
+    for conn in conns.values():
+        try:
+            conn.close()
+        except Exception:
+            pass
+    conns.clear()
+
+# ---------------------------
+# [크롤링 단계] DB 초기화
+# ---------------------------
 def initialize_db(db_path: str) -> None:
     conn = create_connection(db_path)
     if not conn: return
@@ -77,9 +192,17 @@ def initialize_db(db_path: str) -> None:
             keywords TEXT,
             visitor_reviews TEXT,
             search_keyword TEXT NOT NULL,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            province TEXT,
+            city TEXT,
+            dong TEXT,
+            ui_category TEXT,
+            review_tags TEXT,
+            introduction_updated_at TIMESTAMP
         );
         """)
+        if _migrate_places(conn):
+            _migrated_paths.add(db_path)
         conn.commit()
         print(f"[DB] '{os.path.basename(db_path)}' 초기화 완료")
     except sqlite3.Error as e:
@@ -144,6 +267,256 @@ def _is_numeric_token(tok: str) -> bool:
     t = (tok or "").replace("-", "")
     return t.isdigit()
 
+def _region_columns(addr: str) -> Tuple[str, str, str]:
+    """
+    주소 → (province, city, dong) 컬럼 값. 드롭다운 목록과 같은 규칙으로 정규화
+    """
+    parts = (addr or "").split()
+    p = _canon_province(parts[0]) if parts else ""
+    c = parts[1] if len(parts) >= 2 else ""
+    d = ""
+    if len(parts) >= 3 and not _is_numeric_token(parts[2]):
+        d = _normalize_dong_for_ui(parts[2])
+    return p, c, d
+
+def _ui_category(category: Optional[str], name: Optional[str], keywords: Optional[str]) -> str:
+    """
+    장소의 UI 카테고리 (travel_logic._extract_place_categories 와 같은 2단계 규칙)
+    1) category 필드만으로 정규화 2) '기타'면 이름/키워드까지 합쳐 재시도
+    """
+    raw = category or ""
+    if raw:
+        ui = normalize_category_for_ui(raw)
+        if ui != "기타":
+            return ui
+    return normalize_category_for_ui(f"{name or ''} {raw} {keywords or ''}".strip())
+
+def _review_tags(visitor_reviews: Optional[str]) -> str:
+    """
+    방문자 리뷰 문자열 → '|태그1|태그2|' (travel_logic._extract_review_tags 와 같은 규칙, 태그 없으면 '')
+    """
+    raw = str(visitor_reviews or "").strip()
+    if not raw:
+        return ""
+    tags = {normalize_review_for_ui(t.strip()) for t in raw.split(",") if t.strip()}
+    tags = sorted(t for t in tags if t and t != "정보 없음")
+    return f"|{'|'.join(tags)}|" if tags else ""
+
+# ---------------------------
+# 공용 유틸: 스키마 마이그레이션
+# ---------------------------
+_PLACE_EXTRA_COLUMNS = [("province", "TEXT"), ("city", "TEXT"), ("dong", "TEXT"), ("ui_category", "TEXT"),
+                        ("review_tags", "TEXT"), ("introduction_updated_at", "TIMESTAMP")]
+_migrated_paths = set()
+
+def _migrate_places(conn: sqlite3.Connection) -> bool:
+    """
+    places 테이블에 지역/UI 카테고리 컬럼과 인덱스를 보강하고 비어 있는 행을 채운다.
+    :return: places 테이블이 있어 마이그레이션을 마쳤으면 True (테이블이 아직 없으면 False)
+    """
+    try:
+        cols = {row[1] for row in conn.execute("PRAGMA table_info(places)")}
+        if not cols:
+            return False
+        for name, col_type in _PLACE_EXTRA_COLUMNS:
+            if name not in cols:
+                conn.execute(f"ALTER TABLE places ADD COLUMN {name} {col_type}")
+        rows = conn.execute("SELECT id, address FROM places WHERE province IS NULL").fetchall()
+        if rows:
+            conn.executemany("UPDATE places SET province = ?, city = ?, dong = ? WHERE id = ?",
+                             [(*_region_columns(addr), pid) for pid, addr in rows])
+            print(f"[DB] 지역 컬럼 채움: {len(rows)}건")
+        _backfill_ui_categories(conn, force=False)
+        _backfill_review_tags(conn, force=False)
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_places_region ON places (province, city, dong)")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_places_city ON places (city, dong)")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_places_ui_category ON places (ui_category)")
+        _create_region_tables(conn)
+        _create_fts(conn)
+        conn.commit()
+        return True
+    except sqlite3.Error as e:
+        print(f"[DB ERROR] 스키마 마이그레이션 실패: {e}")
+        return False
+
+def _create_fts(conn: sqlite3.Connection) -> bool:
+    """
+    places_fts(FTS5, trigram) 생성 + 동기화 트리거 등록. 처음 만들 때 기존 행 전체 색인
+    :return: 전문 검색 인덱스를 쓸 수 있으면 True
+    """
+    if conn.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'places_fts'").fetchone():
+        return True
+    try:
+        conn.execute("""
+        CREATE VIRTUAL TABLE places_fts USING fts5(
+            name, keywords, introduction,
+            content='places', content_rowid='id', tokenize='trigram'
+        );
+        """)
+    except sqlite3.Error as e:
+        print(f"[DB] 전문 검색(FTS5 trigram) 미지원 - LIKE 검색 사용: {e}")
+        return False
+    conn.executescript("""
+    CREATE TRIGGER IF NOT EXISTS places_fts_ai AFTER INSERT ON places BEGIN
+        INSERT INTO places_fts (rowid, name, keywords, introduction)
+        VALUES (new.id, new.name, new.keywords, new.introduction);
+    END;
+    CREATE TRIGGER IF NOT EXISTS places_fts_ad AFTER DELETE ON places BEGIN
+        INSERT INTO places_fts (places_fts, rowid, name, keywords, introduction)
+        VALUES ('delete', old.id, old.name, old.keywords, old.introduction);
+    END;
+    CREATE TRIGGER IF NOT EXISTS places_fts_au AFTER UPDATE OF name, keywords, introduction ON places BEGIN
+        INSERT INTO places_fts (places_fts, rowid, name, keywords, introduction)
+        VALUES ('delete', old.id, old.name, old.keywords, old.introduction);
+        INSERT INTO places_fts (rowid, name, keywords, introduction)
+        VALUES (new.id, new.name, new.keywords, new.introduction);
+    END;
+    """)
+    conn.execute("INSERT INTO places_fts (places_fts) VALUES ('rebuild')")
+    print("[DB] 전문 검색 인덱스 생성 완료")
+    return True
+
+def _backfill_ui_categories(conn: sqlite3.Connection, force: bool = False) -> int:
+    where = "" if force else " WHERE ui_category IS NULL"
+    rows = conn.execute(f"SELECT id, category, name, keywords FROM places{where}").fetchall()
+    if rows:
+        conn.executemany("UPDATE places SET ui_category = ? WHERE id = ?",
+                         [(_ui_category(cat, name, kw), pid) for pid, cat, name, kw in rows])
+        print(f"[DB] UI 카테고리 채움: {len(rows)}건")
+    return len(rows)
+
+def _backfill_review_tags(conn: sqlite3.Connection, force: bool = False) -> int:
+    where = "" if force else " WHERE review_tags IS NULL"
+    rows = conn.execute(f"SELECT id, visitor_reviews FROM places{where}").fetchall()
+    if rows:
+        conn.executemany("UPDATE places SET review_tags = ? WHERE id = ?",
+                         [(_review_tags(vr), pid) for pid, vr in rows])
+        print(f"[DB] 리뷰 태그 채움: {len(rows)}건")
+    return len(rows)
+
+def backfill_ui_categories(db_path: str, force: bool = True) -> int:
+    """
+    ui_category / review_tags 컬럼 채우기 (category_utils / visitor_reviews_utils 사전을 바꾼 뒤 실행)
+    :param force: True면 이미 채워진 행까지 모두 재계산, False면 비어 있는 행만
+    :return: 갱신한 행 수
+    """
+    conn = create_connection(db_path)
+    if not conn: return 0
+    try:
+        count = _backfill_ui_categories(conn, force=force)
+        _backfill_review_tags(conn, force=force)
+        conn.commit()
+        return count
+    except sqlite3.Error as e:
+        print(f"[DB ERROR] UI 카테고리 채우기 실패: {e}")
+        return 0
+    finally:
+        conn.close()
+
+# ---------------------------
+# 공용 유틸: 지역 계층 집계(regions)
+#   드롭다운이 바뀔 때마다 places 전체 주소를 다시 읽어 토큰화하던 것을
+#   (도, 시, 동)별 장소 수를 미리 집계한 테이블 조회로 대체
+# ---------------------------
+def _create_region_tables(conn: sqlite3.Connection) -> None:
+    conn.execute("""
+    CREATE TABLE IF NOT EXISTS regions (
+        province TEXT NOT NULL,
+        city TEXT NOT NULL DEFAULT '',
+        dong TEXT NOT NULL DEFAULT '',
+        place_count INTEGER NOT NULL DEFAULT 0,
+        PRIMARY KEY (province, city, dong)
+    );
+    """)
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_regions_level ON regions (province, city, place_count DESC)")
+    conn.execute("CREATE TABLE IF NOT EXISTS db_meta (key TEXT PRIMARY KEY, value TEXT)")
+
+def _region_keys(addr: str) -> List[Tuple[str, str, str]]:
+    """
+    주소 하나가 속한 (도, 시, 동) 집계 키 목록 - places 지역 컬럼과 같은 규칙
+    """
+    p, c, d = _region_columns(addr)
+    if not p:
+        return []
+    keys = [(p, "", "")]
+    if c:
+        keys.append((p, c, ""))
+        if d:
+            keys.append((p, c, d))
+    return keys
+
+def _places_fingerprint(conn: sqlite3.Connection) -> str:
+    count, max_id = conn.execute("SELECT COUNT(*), COALESCE(MAX(id), 0) FROM places").fetchone()
+    return f"{count}:{max_id}"
+
+def _set_regions_fingerprint(conn: sqlite3.Connection) -> None:
+    conn.execute("INSERT OR REPLACE INTO db_meta (key, value) VALUES ('regions_fingerprint', ?)",
+                 (_places_fingerprint(conn),))
+
+def _add_region_counts(conn: sqlite3.Connection, addresses: Iterable[str]) -> None:
+    cnt = defaultdict(int)
+    for addr in addresses:
+        for key in _region_keys(addr):
+            cnt[key] += 1
+    if not cnt:
+        return
+    conn.executemany("""
+        INSERT INTO regions (province, city, dong, place_count) VALUES (?, ?, ?, ?)
+        ON CONFLICT(province, city, dong) DO UPDATE SET place_count = place_count + excluded.place_count
+    """, [(p, c, d, n) for (p, c, d), n in cnt.items()])
+
+def rebuild_regions(conn_or_path) -> int:
+    """
+    regions 집계 테이블을 places 전체 주소로 다시 만든다.
+    :param conn_or_path: 열린 연결 또는 DB 경로
+    :return: 집계된 (도, 시, 동) 행 수
+    """
+    conn = conn_or_path if isinstance(conn_or_path, sqlite3.Connection) else create_connection(conn_or_path)
+    if not conn: return 0
+    try:
+        _create_region_tables(conn)
+        conn.execute("DELETE FROM regions")
+        # 지역 컬럼이 채워져 있으므로 집계는 SQL GROUP BY 로
+        base = "FROM places WHERE address IS NOT NULL AND address != '' AND province != ''"
+        conn.execute(f"INSERT INTO regions SELECT province, '', '', COUNT(*) {base} GROUP BY province")
+        conn.execute(f"INSERT INTO regions SELECT province, city, '', COUNT(*) {base} AND city != '' GROUP BY province, city")
+        conn.execute(f"INSERT INTO regions SELECT province, city, dong, COUNT(*) {base} AND city != '' AND dong != '' GROUP BY province, city, dong")
+        _set_regions_fingerprint(conn)
+        conn.commit()
+        rows = conn.execute("SELECT COUNT(*) FROM regions").fetchone()[0]
+        print(f"[DB] 지역 집계 재생성: {rows}건")
+        return rows
+    except sqlite3.Error as e:
+        conn.rollback()
+        print(f"[DB ERROR] 지역 집계 재생성 실패: {e}")
+        return 0
+    finally:
+        if not isinstance(conn_or_path, sqlite3.Connection):
+            conn.close()
+
+# 조회 중 재집계할 때 쓰기 잠금 대기 한도(ms) - 크롤러가 쓰는 중이면 기다리지 않고 기존 집계로 답한다
+_READ_REBUILD_TIMEOUT_MS = 200
+
+def _ensure_regions(conn: sqlite3.Connection, wait: bool = True) -> None:
+    """
+    집계가 없거나 places 가 집계 이후 바뀌었으면(brand_remove 등 외부 삭제 포함) 재집계
+    :param wait: False면 쓰기 잠금을 잠깐만 기다림 (UI 조회 경로)
+    """
+    try:
+        row = conn.execute("SELECT value FROM db_meta WHERE key = 'regions_fingerprint'").fetchone()
+        if row is not None and row[0] == _places_fingerprint(conn):
+            return
+        if wait:
+            rebuild_regions(conn)
+            return
+        conn.execute(f"PRAGMA busy_timeout={_READ_REBUILD_TIMEOUT_MS}")
+        try:
+            rebuild_regions(conn)
+        finally:
+            conn.execute(f"PRAGMA busy_timeout={BUSY_TIMEOUT_MS}")
+    except sqlite3.Error as e:
+        print(f"[DB ERROR] 지역 집계 확인 실패: {e}")
+
 # ---------------------------
 # [크롤링 단계] 중복 검사 / 저장 / 업데이트
 # ---------------------------
@@ -151,15 +524,12 @@ def check_place_exists(conn_or_path, naver_place_id: str) -> bool:
     try:
         if isinstance(conn_or_path, sqlite3.Connection):
             cur = conn_or_path.cursor()
-            close = False
         else:
-            conn = create_connection(conn_or_path)
+            conn = get_read_connection(conn_or_path)
             if not conn: return False
-            cur, close = conn.cursor(), True
+            cur = conn.cursor()
         cur.execute("SELECT 1 FROM places WHERE naver_place_id = ?", (naver_place_id,))
-        ok = cur.fetchone() is not None
-        if close: conn.close()
-        return ok
+        return cur.fetchone() is not None
     except sqlite3.Error as e:
         print(f"[DB ERROR] 존재 확인 실패: {e}")
         return False
@@ -167,13 +537,16 @@ def check_place_exists(conn_or_path, naver_place_id: str) -> bool:
 def save_places_to_db(conn: sqlite3.Connection, places_data: List[Dict]) -> int:
     if not places_data: return 0
     try:
+        _ensure_regions(conn)
         before = conn.execute("SELECT COUNT(*) FROM places").fetchone()[0]
+        before_max_id = conn.execute("SELECT COALESCE(MAX(id), 0) FROM places").fetchone()[0]
         conn.executemany("""
             INSERT OR IGNORE INTO places (
               naver_place_id, name, category, address,
               total_visitor_reviews_count, total_blog_reviews_count,
-              introduction, keywords, visitor_reviews, search_keyword
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+              introduction, keywords, visitor_reviews, search_keyword,
+              province, city, dong, ui_category, review_tags
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
         """, [(
             p.get("naver_place_id"),
             p.get("장소명"),
@@ -185,7 +558,14 @@ def save_places_to_db(conn: sqlite3.Connection, places_data: List[Dict]) -> int:
             p.get("키워드"),
             p.get("방문자 리뷰"),
             p.get("검색어"),
+            *_region_columns(p.get("주소")),
+            _ui_category(p.get("카테고리"), p.get("장소명"), p.get("키워드")),
+            _review_tags(p.get("방문자 리뷰")),
         ) for p in places_data])
+        # 새로 들어간 장소만 지역 집계에 더한다 (INSERT OR IGNORE 로 건너뛴 중복은 제외)
+        _add_region_counts(conn, (addr for (addr,) in conn.execute(
+            "SELECT address FROM places WHERE id > ? AND address IS NOT NULL AND address != ''", (before_max_id,))))
+        _set_regions_fingerprint(conn)
         conn.commit()
         after = conn.execute("SELECT COUNT(*) FROM places").fetchone()[0]
         saved = after - before
@@ -197,6 +577,17 @@ def save_places_to_db(conn: sqlite3.Connection, places_data: List[Dict]) -> int:
         return 0
 
 def update_introduction(conn_or_path, naver_place_id: str, new_introduction: str) -> None:
+    update_introductions(conn_or_path, [(naver_place_id, new_introduction)])
+
+def update_introductions(conn_or_path, items: Iterable[Tuple[str, str]]) -> int:
+    """
+    여러 장소의 소개를 한 트랜잭션에서 갱신하고 introduction_updated_at 을 현재 시각으로 기록
+    :param items: [(naver_place_id, 새 소개)]
+    :return: 갱신 요청 건수 (실패 시 0)
+    """
+    rows = [(intro, str(pid)) for pid, intro in items if pid and intro]
+    if not rows:
+        return 0
     conn = None
     internal = False
     try:
@@ -207,139 +598,267 @@ def update_introduction(conn_or_path, naver_place_id: str, new_introduction: str
             internal = True
             if not conn: 
                 print("[DB ERROR] 연결 실패로 소개 업데이트 중단")
-                return
-        conn.execute("UPDATE places SET introduction = ? WHERE naver_place_id = ?",
-                     (new_introduction, naver_place_id))
+                return 0
+        conn.executemany("UPDATE places SET introduction = ?, introduction_updated_at = CURRENT_TIMESTAMP "
+                         "WHERE naver_place_id = ?", rows)
         if internal:
             conn.commit()
+        return len(rows)
     except sqlite3.Error as e:
-        print(f"[DB ERROR] 소개 업데이트 실패(ID={naver_place_id}): {e}")
+        if internal and conn:
+            conn.rollback()
+        print(f"[DB ERROR] 소개 업데이트 실패({len(rows)}건): {e}")
+        return 0
     finally:
         if conn and internal:
             conn.close()
 
+# IN (...) 한 번에 넣을 ID 수 (구버전 SQLite 변수 개수 제한 999 이하)
+_IN_CHUNK = 500
+
+def get_fresh_introductions(db_path: str, place_ids: Iterable[str], ttl_seconds: float) -> Dict[str, str]:
+    """
+    TTL 안에 실시간 크롤링으로 갱신된 소개 조회
+    :param place_ids: 네이버 장소 ID 목록
+    :param ttl_seconds: 이 시간(초) 안에 갱신된 소개만 (0 이하이면 항상 빈 결과)
+    :return: {naver_place_id: 소개}
+    """
+    ids = sorted({str(pid) for pid in place_ids if pid})
+    if not ids or ttl_seconds <= 0:
+        return {}
+    conn = get_read_connection(db_path)
+    if not conn: return {}
+    out: Dict[str, str] = {}
+    try:
+        for i in range(0, len(ids), _IN_CHUNK):
+            chunk = ids[i:i + _IN_CHUNK]
+            rows = conn.execute(
+                f"SELECT naver_place_id, introduction FROM places "
+                f"WHERE naver_place_id IN ({','.join('?' * len(chunk))}) "
+                f"AND introduction_updated_at >= datetime('now', ?) "
+                f"AND introduction IS NOT NULL AND introduction != ''",
+                chunk + [f"-{int(ttl_seconds)} seconds"]).fetchall()
+            out.update({pid: intro for pid, intro in rows})
+    except sqlite3.Error as e:
+        print(f"[DB ERROR] 소개 갱신 시각 조회 실패: {e}")
+    return out
+
 # ---------------------------
 # [앱 실행 단계] 지역 리스트 (장소 많은 순 정렬)
 # ---------------------------
-def get_province_list(db_path: str) -> List[str]:
-    conn = create_connection(db_path)
+def _query_regions(db_path: str, sql: str, params: Iterable = ()) -> List[tuple]:
+    conn = get_read_connection(db_path)
     if not conn: return []
     try:
-        cnt = defaultdict(int)
-        for addr in _iter_addresses(conn):
-            p = _canon_province(_first_token(addr))
-            if p: cnt[p] += 1
-        # 장소 수 내림차순, 이름 오름차순
-        return [p for p, _ in sorted(cnt.items(), key=lambda x: (-x[1], x[0]))]
-    finally:
-        conn.close()
+        _ensure_regions(conn, wait=False)
+        return conn.execute(sql, list(params)).fetchall()
+    except sqlite3.Error as e:
+        print(f"[DB ERROR] 지역 목록 조회 실패: {e}")
+        return []
+
+def get_province_list(db_path: str) -> List[str]:
+    # 장소 수 내림차순, 이름 오름차순
+    rows = _query_regions(db_path, """
+        SELECT province FROM regions WHERE city = '' AND dong = ''
+        ORDER BY place_count DESC, province
+    """)
+    return [p for (p,) in rows]
 
 def get_city_list(province: str, db_path: str) -> List[str]:
-    conn = create_connection(db_path)
-    if not conn: return []
-    try:
-        aliases = _aliases_for_province(_canon_province(province))
-        cnt = defaultdict(int)
-        for addr in _iter_addresses(conn):
-            p = _first_token(addr)
-            if p not in aliases: 
-                # 별칭이 짧은 '전북'이 주소에 직접 들어갈 수도 있어 보조 체크
-                if _canon_province(p) != _canon_province(province):
-                    continue
-            c = _nth_token(addr, 1)
-            if c: cnt[c] += 1
-        return [c for c, _ in sorted(cnt.items(), key=lambda x: (-x[1], x[0]))]
-    finally:
-        conn.close()
+    rows = _query_regions(db_path, """
+        SELECT city FROM regions WHERE province = ? AND city != '' AND dong = ''
+        ORDER BY place_count DESC, city
+    """, (_canon_province(province),))
+    return [c for (c,) in rows]
 
 def get_dong_list(province: str, city: str, db_path: str) -> List[str]:
-    conn = create_connection(db_path)
-    if not conn: return []
-    try:
-        aliases = _aliases_for_province(_canon_province(province))
-        cnt = defaultdict(int)
-        for addr in _iter_addresses(conn):
-            p = _first_token(addr)
-            if (p not in aliases) and (_canon_province(p) != _canon_province(province)):
-                continue
-            if _nth_token(addr, 1) != city:
-                continue
-            d = _nth_token(addr, 2)
-            if not d or _is_numeric_token(d):
-                continue
-            d = _normalize_dong_for_ui(d)
-            cnt[d] += 1
-        return [d for d, _ in sorted(cnt.items(), key=lambda x: (-x[1], x[0]))]
-    finally:
-        conn.close()
+    rows = _query_regions(db_path, """
+        SELECT dong FROM regions WHERE province = ? AND city = ? AND dong != ''
+        ORDER BY place_count DESC, dong
+    """, (_canon_province(province), city))
+    return [d for (d,) in rows]
+
+def get_cities_for(provinces: List[str], db_path: str) -> List[str]:
+    """
+    여러 도(없으면 전체)에 속한 시/군/구 목록 (이름순, 중복 제거)
+    """
+    sql = "SELECT DISTINCT city FROM regions WHERE city != '' AND dong = ''"
+    params = [_canon_province(p) for p in provinces or []]
+    if params:
+        sql += f" AND province IN ({','.join('?' * len(params))})"
+    return [c for (c,) in _query_regions(db_path, sql + " ORDER BY city", params)]
+
+def get_dongs_for(provinces: List[str], cities: List[str], db_path: str) -> List[str]:
+    """
+    여러 도/시(없으면 전체)에 속한 읍/면/동 목록 (이름순, 중복 제거)
+    """
+    sql = "SELECT DISTINCT dong FROM regions WHERE dong != ''"
+    params: List[str] = []
+    provs = [_canon_province(p) for p in provinces or []]
+    if provs:
+        sql += f" AND province IN ({','.join('?' * len(provs))})"
+        params += provs
+    if cities:
+        sql += f" AND city IN ({','.join('?' * len(cities))})"
+        params += list(cities)
+    return [d for (d,) in _query_regions(db_path, sql + " ORDER BY dong", params)]
+
+def get_region_counts(db_path: str) -> List[Tuple[str, Optional[str], Optional[str], int]]:
+    """
+    자동완성 인덱스용 전체 계층 [(도, 시|None, 동|None, 장소 수)] (장소 수 내림차순)
+    """
+    rows = _query_regions(db_path, "SELECT province, city, dong, place_count FROM regions ORDER BY place_count DESC, province, city, dong")
+    return [(p, c or None, d or None, n) for p, c, d, n in rows]
 
 # ---------------------------
-# [앱 실행 단계] 장소 검색 (도/시/동) — 주소 기반
-#   * province='강원' → 강원/강원특별자치도 모두 매칭
-#   * city/dong 미지정(None) 허용
+# [앱 실행 단계] 장소 검색 (도/시/동) — 지역 컬럼 기반
+#   * province='강원' → 저장 시 '강원'으로 정규화되어 있어 별칭 LIKE 불필요
+#   * 도/시/동은 다중 선택 가능(빈 목록 = 전체), 동 '도로명'은 도로명 주소 전체
 # ---------------------------
-def search_places_advanced_with_dong(
-    db_path: str, province: Optional[str], city: Optional[str], dong: Optional[str], categories: List[str]
+_PLACE_COLS = ["name","category","address","keywords","total_visitor_reviews_count","total_blog_reviews_count","visitor_reviews","introduction","naver_place_id","ui_category"]
+
+def _in_clause(column: str, values: List[str], params: List) -> str:
+    params.extend(values)
+    return f"{column} IN ({','.join('?' * len(values))})"
+
+def _like_escape(term: str) -> str:
+    return term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+# 창 함수(ROW_NUMBER/COUNT OVER)는 SQLite 3.25 이상
+WINDOW_FUNCTIONS = sqlite3.sqlite_version_info >= (3, 25, 0)
+
+_TOTAL_REVIEWS_SQL = "(COALESCE(total_visitor_reviews_count, 0) + COALESCE(total_blog_reviews_count, 0))"
+
+def search_places_by_region(
+    db_path: str,
+    provinces: Optional[List[str]] = None,
+    cities: Optional[List[str]] = None,
+    dongs: Optional[List[str]] = None,
+    categories: Optional[List[str]] = None,
+    name_terms: Optional[List[str]] = None,
+    min_reviews: int = 0,
+    review_tags: Optional[List[str]] = None,
+    top_fraction: Optional[float] = None,
 ) -> List[Dict]:
-    conn = create_connection(db_path)
+    """
+    지역/카테고리/리뷰 태그/이름/리뷰 수 조건을 한 번의 파라미터 쿼리로 검색 (리뷰 수 합계 내림차순)
+    :param provinces: 도/특별시 목록 (별칭 자동 정규화)
+    :param cities: 시/군/구 목록
+    :param dongs: 읍/면/동 목록 ('도로명' 포함 가능)
+    :param categories: UI 카테고리 목록 (normalize_category_for_ui 기준)
+    :param name_terms: 이름 또는 원본 카테고리에 포함될 검색어 (하나라도 포함되면 통과)
+    :param min_reviews: 방문자+블로그 리뷰 수 합계 하한
+    :param review_tags: 리뷰 UI 태그 목록 (하나라도 가진 장소만, 태그 없는 장소는 제외)
+    :param top_fraction: 0~1. 지정 시 (이름, 주소) 중복을 제거한 뒤 리뷰 수 상위 max(1, int(N * 비율))개만 반환
+                         (창 함수 미지원 SQLite에서는 무시 → WINDOW_FUNCTIONS 확인 후 호출 측에서 처리)
+    """
+    conn = get_read_connection(db_path)
     if not conn: return []
     try:
-        sql = "SELECT name, category, address, keywords, total_visitor_reviews_count, total_blog_reviews_count, visitor_reviews, introduction, naver_place_id FROM places"
-        where = []
-        params: List[str] = []
+        where: List[str] = []
+        params: List = []
+        provs = sorted({_canon_province(p) for p in provinces or [] if p})
+        if provs:
+            where.append(_in_clause("province", provs, params))
+        if cities:
+            where.append(_in_clause("city", list(cities), params))
+        if dongs:
+            where.append(_in_clause("dong", list(dongs), params))
+        terms = [t.strip() for t in name_terms or [] if t and t.strip()]
+        if terms:
+            likes = []
+            for term in terms:
+                likes.append("(name LIKE ? ESCAPE '\\' OR category LIKE ? ESCAPE '\\')")
+                params += [f"%{_like_escape(term)}%"] * 2
+            where.append("(" + " OR ".join(likes) + ")")
+        if min_reviews > 0:
+            where.append(f"{_TOTAL_REVIEWS_SQL} >= ?")
+            params.append(int(min_reviews))
+        if categories:
+            # 저장 시 계산해 둔 ui_category 인덱스 컬럼으로 거른다
+            where.append(_in_clause("ui_category", list(categories), params))
+        # review_tags = '|태그1|태그2|' 에서 '|태그|' 포함 여부
+        tag_sql = "(" + " OR ".join("instr(review_tags, ?) > 0" for _ in review_tags) + ")" if review_tags else ""
+        tag_params = [f"|{t}|" for t in review_tags or []]
 
-        # 주소 LIKE 조건(별칭 포함)
-        if province:
-            aliases = _aliases_for_province(_canon_province(province))
+        cols = ", ".join(_PLACE_COLS)
+        where_sql = (" WHERE " + " AND ".join(where)) if where else ""
+        if top_fraction is not None and WINDOW_FUNCTIONS:
+            # 1) (이름, 주소)별 리뷰 수 1순위만 남기고 2) 리뷰 태그로 거른 뒤 3) 순위/전체 수를 붙여 상위 N% 컷
+            #    - 파이썬 구현(중복 제거 → 태그 필터 → 정렬 후 [:max(1, int(N * 비율))])과 같은 순서/개수가 되도록
+            #      ROW_NUMBER + COUNT(*) OVER () 사용 (PERCENT_RANK/NTILE 은 동점/반올림 처리가 달라 개수가 어긋남)
+            sql = f"""
+                WITH matched AS (
+                    SELECT {cols}, id, review_tags, {_TOTAL_REVIEWS_SQL} AS total_reviews,
+                           ROW_NUMBER() OVER (PARTITION BY name, address ORDER BY {_TOTAL_REVIEWS_SQL} DESC, id) AS dup_rank
+                    FROM places{where_sql}
+                ), ranked AS (
+                    SELECT {cols}, ROW_NUMBER() OVER (ORDER BY total_reviews DESC, id) AS review_rank,
+                           COUNT(*) OVER () AS matched_count
+                    FROM matched WHERE dup_rank = 1{" AND " + tag_sql if tag_sql else ""}
+                )
+                SELECT {cols} FROM ranked
+                WHERE review_rank <= MAX(1, CAST(matched_count * ? AS INTEGER))
+                ORDER BY review_rank
+            """
+            params += tag_params + [float(top_fraction)]
         else:
-            aliases = []
-
-        # 경우의 수(도/시/동 조합)
-        like_blocks = []
-        if aliases:
-            for a in aliases:
-                prefix = a
-                if city:  prefix += f" {city}"
-                if dong:  prefix += f" {dong}"
-                like_blocks.append("address LIKE ?")
-                params.append(prefix + "%")
-        elif city or dong:
-            # 도 없이 시/동만 온 특수 케이스(드뭄)
-            prefix = ""
-            if city: prefix += f"% {city}"
-            if dong: prefix += f" {dong}"
-            if prefix:
-                like_blocks.append("address LIKE ?")
-                params.append(prefix + "%")
-
-        if like_blocks:
-            where.append("(" + " OR ".join(like_blocks) + ")")
-
-        if where:
-            sql += " WHERE " + " AND ".join(where)
-
+            if tag_sql:
+                where_sql += (" AND " if where_sql else " WHERE ") + tag_sql
+                params += tag_params
+            sql = f"SELECT {cols} FROM places{where_sql} ORDER BY {_TOTAL_REVIEWS_SQL} DESC, id"
         rows = conn.execute(sql, params).fetchall()
-        cols = ["name","category","address","keywords","total_visitor_reviews_count","total_blog_reviews_count","visitor_reviews","introduction","naver_place_id"]
-        return [dict(zip(cols, r)) for r in rows]
-    finally:
-        conn.close()
+        return [dict(zip(_PLACE_COLS, r)) for r in rows]
+    except sqlite3.Error as e:
+        print(f"[DB ERROR] 장소 검색 실패: {e}")
+        return []
+
+def search_places_advanced_with_dong(
+    db_path: str, province: Optional[str], city: Optional[str], dong: Optional[str], categories: List[str]
+) -> List[Dict]:
+    return search_places_by_region(
+        db_path,
+        [province] if province else None,
+        [city] if city else None,
+        [dong] if dong else None,
+        categories,
+    )
+
+# 전문 검색 가중치 (name, keywords, introduction) - 이름 일치를 가장 앞에
+_FTS_WEIGHTS = (10.0, 3.0, 1.0)
+# trigram 토크나이저는 3글자 이상만 인덱스로 찾을 수 있음
+_FTS_MIN_TERM = 3
 
 def search_places_by_name(db_path: str, search_term: str) -> List[Dict]:
     """
     장소 이름으로 장소를 검색합니다.
+    - 3글자 이상: places_fts(이름/키워드/소개) 전문 검색, bm25 점수 순 (이름 일치 가중치 최대)
+    - 3글자 미만 또는 FTS 미지원 DB: 기존처럼 name LIKE 검색
     """
-    conn = create_connection(db_path)
+    conn = get_read_connection(db_path)
     if not conn:
         return []
+    term = (search_term or "").strip()
     try:
-        sql = "SELECT name, category, address, keywords, total_visitor_reviews_count, total_blog_reviews_count, visitor_reviews, introduction, naver_place_id FROM places WHERE name LIKE ?"
-        params = [f"%{search_term}%"]
-        rows = conn.execute(sql, params).fetchall()
-        cols = ["name", "category", "address", "keywords", "total_visitor_reviews_count", "total_blog_reviews_count", "visitor_reviews", "introduction", "naver_place_id"]
-        return [dict(zip(cols, r)) for r in rows]
-    finally:
-        if conn:
-            conn.close()
+        has_fts = conn.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'places_fts'").fetchone()
+        if has_fts and len(term) >= _FTS_MIN_TERM:
+            cols = ", ".join(f"p.{c}" for c in _PLACE_COLS)
+            # 검색어 전체를 하나의 구문으로 (따옴표 이스케이프) - 연산자/특수문자 해석 방지
+            match = '"' + term.replace('"', '""') + '"'
+            sql = f"""
+                SELECT {cols} FROM places_fts
+                JOIN places p ON p.id = places_fts.rowid
+                WHERE places_fts MATCH ?
+                ORDER BY bm25(places_fts, {', '.join(map(str, _FTS_WEIGHTS))})
+            """
+            rows = conn.execute(sql, [match]).fetchall()
+        else:
+            sql = f"SELECT {', '.join(_PLACE_COLS)} FROM places WHERE name LIKE ? ESCAPE '\\'"
+            rows = conn.execute(sql, [f"%{_like_escape(term)}%"]).fetchall()
+        return [dict(zip(_PLACE_COLS, r)) for r in rows]
+    except sqlite3.Error as e:
+        print(f"[DB ERROR] 이름 검색 실패: {e}")
+        return []
 
 # ---------------------------
 # [앱 실행 단계] 기사/통계용 매핑
@@ -350,15 +869,15 @@ def get_category_mapping(db_path: str) -> Dict[str, List[Tuple[str, str]]]:
     * 간결화: category를 normalize_category_for_ui로만 정규화
     """
     out: Dict[str, List[Tuple[str, str]]] = defaultdict(list)
-    conn = create_connection(db_path)
+    conn = get_read_connection(db_path)
     if not conn: return out
     try:
         for name, cat, addr in conn.execute("SELECT name, category, address FROM places WHERE name IS NOT NULL"):
             ui = normalize_category_for_ui(cat or "")
             dong = _nth_token(addr or "", 2)
             out[ui].append((name, dong))
-    finally:
-        conn.close()
+    except sqlite3.Error as e:
+        print(f"[DB ERROR] 카테고리 매핑 조회 실패: {e}")
     return out
 
 def get_dong_mapping(db_path: str) -> Dict[str, List[str]]:
@@ -367,7 +886,7 @@ def get_dong_mapping(db_path: str) -> Dict[str, List[str]]:
     (UI 검색 자동완성/기사용 간단 통계)
     """
     out: Dict[str, List[str]] = defaultdict(list)
-    conn = create_connection(db_path)
+    conn = get_read_connection(db_path)
     if not conn: return out
     try:
         for name, addr in conn.execute("SELECT name, address FROM places WHERE address IS NOT NULL AND address != ''"):
@@ -375,6 +894,35 @@ def get_dong_mapping(db_path: str) -> Dict[str, List[str]]:
             if len(parts) >= 3:
                 key = f"{_canon_province(parts[0])} {parts[1]} {parts[2]}"
                 out[key].append(name)
-    finally:
-        conn.close()
+    except sqlite3.Error as e:
+        print(f"[DB ERROR] 동 매핑 조회 실패: {e}")
     return out
+
+# ---------------------------
+# 명령행: 기존 DB 보정
+#   python db_manager.py backfill-categories <DB 경로>
+#   python db_manager.py rebuild-regions <DB 경로>
+#   python db_manager.py rebuild-fts <DB 경로>
+# ---------------------------
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="여행지 DB 보정 도구")
+    parser.add_argument("command", choices=["backfill-categories", "rebuild-regions", "rebuild-fts"])
+    parser.add_argument("db_path")
+    args = parser.parse_args()
+
+    if args.command == "backfill-categories":
+        print(f"[DB] UI 카테고리 재계산 완료: {backfill_ui_categories(args.db_path, force=True)}건")
+    elif args.command == "rebuild-fts":
+        conn = create_connection(args.db_path)
+        if conn:
+            try:
+                if _create_fts(conn):
+                    conn.execute("INSERT INTO places_fts (places_fts) VALUES ('rebuild')")
+                    conn.commit()
+                    print("[DB] 전문 검색 인덱스 재생성 완료")
+            finally:
+                conn.close()
+    else:
+        rebuild_regions(args.db_path)
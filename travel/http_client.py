@@ -0,0 +1,220 @@
+# http_client.py - 호스트별 공유 HTTP 세션 풀
+# ===================================================================================
+# 파일명     : http_client.py
+# 작성자     : 하승주, 홍석원
+# 최초작성일 : 2026-10-18
+# 설명       : 호스트별 Session 재사용 + 기본 타임아웃 + 재시도 + 속도 제한 + 지연 통계
+# ===================================================================================
+#
+# 【주요 기능】
+# - 호스트마다 Session 하나를 유지하여 TCP/TLS 연결 재사용
+# - 기본 타임아웃 (연결 3.05초 / 읽기 10초, 호출 측 timeout 지정 시 그 값 우선)
+# - 429/5xx 및 연결 오류 시 지수 백오프 재시도 (weather_warning.py와 같은 Retry 방식)
+# - 호스트별 토큰 버킷 속도 제한 (기본 5 req/s)
+# - 호스트별 요청 수/오류 수/평균·최대 지연 통계: stats()
+#
+# 【환경변수】
+# - HTTP_CONNECT_TIMEOUT, HTTP_READ_TIMEOUT, HTTP_RETRIES, HTTP_BACKOFF
+# - HTTP_RATE, HTTP_BURST, HTTP_POOL_MAXSIZE
+#
+# 【사용처】
+# - weather_api.py: 카카오 좌표 변환, 기상청 초단기실황/단기예보
+#
+# ※ news 앱의 news/src/utils/http_client.py 와 동일한 동작 (travel 앱은 독립 실행)
+# ===================================================================================
+
+import os
+import time
+import threading
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter, Retry
+
+CONNECT_TIMEOUT = float(os.getenv("HTTP_CONNECT_TIMEOUT", "3.05"))
+READ_TIMEOUT = float(os.getenv("HTTP_READ_TIMEOUT", "10"))
+DEFAULT_TIMEOUT = (CONNECT_TIMEOUT, READ_TIMEOUT)
+
+HTTP_RETRIES = int(os.getenv("HTTP_RETRIES", "3"))
+HTTP_BACKOFF = float(os.getenv("HTTP_BACKOFF", "0.5"))
+RETRY_STATUS = (429, 500, 502, 503, 504)
+
+# 기본 초당 요청 수 / 버스트 (0 이하이면 속도 제한 없음)
+DEFAULT_RATE = float(os.getenv("HTTP_RATE", "5"))
+DEFAULT_BURST = int(os.getenv("HTTP_BURST", "5"))
+
+# 호스트별 (초당 요청 수, 버스트) - 차단에 민감한 검색 페이지는 더 보수적으로
+HOST_RATE_LIMITS: Dict[str, Tuple[float, int]] = {
+    "apis.data.go.kr": (5.0, 5),
+    "dapi.kakao.com": (5.0, 5),
+}
+
+# 연결 풀 크기
+POOL_MAXSIZE = int(os.getenv("HTTP_POOL_MAXSIZE", "16"))
+
+
+class _TokenBucket:
+    """
+    초당 rate개씩 채워지고 최대 burst개까지 쌓이는 토큰 버킷
+    """
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.capacity = max(1, burst)
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """
+        토큰 1개를 얻을 때까지 대기
+        :return: 대기한 시간(초)
+        """
+        if self.rate <= 0:
+            return 0.0
+        waited = 0.0
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return waited
+                delay = (1 - self.tokens) / self.rate
+            time.sleep(delay)
+            waited += delay
+
+
+_lock = threading.Lock()
+_sessions: Dict[str, requests.Session] = {}
+_buckets: Dict[str, _TokenBucket] = {}
+_stats: Dict[str, dict] = {}
+
+
+def _host_of(url: str) -> str:
+    try:
+        return (urlsplit(url).hostname or "").lower()
+    except Exception:
+        return ""
+
+
+def _new_session() -> requests.Session:
+    session = requests.Session()
+    retries = Retry(total=HTTP_RETRIES, connect=HTTP_RETRIES, read=HTTP_RETRIES,
+                    backoff_factor=HTTP_BACKOFF,
+                    status_forcelist=list(RETRY_STATUS),
+                    allowed_methods=["GET", "HEAD"],
+                    respect_retry_after_header=True,
+                    raise_on_status=False)
+    adapter = HTTPAdapter(max_retries=retries, pool_connections=4, pool_maxsize=POOL_MAXSIZE)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def get_session(url: str) -> requests.Session:
+    """
+    URL 호스트에 해당하는 공유 Session 반환 (없으면 생성)
+    """
+    host = _host_of(url)
+    with _lock:
+        session = _sessions.get(host)
+        if session is None:
+            session = _sessions[host] = _new_session()
+        return session
+
+
+def _get_bucket(host: str) -> _TokenBucket:
+    with _lock:
+        bucket = _buckets.get(host)
+        if bucket is None:
+            rate, burst = HOST_RATE_LIMITS.get(host, (DEFAULT_RATE, DEFAULT_BURST))
+            bucket = _buckets[host] = _TokenBucket(rate, burst)
+        return bucket
+
+
+def set_rate_limit(host: str, rate: float, burst: int = 1):
+    """
+    호스트별 속도 제한 변경 (rate <= 0 이면 제한 해제)
+    """
+    host = host.lower()
+    with _lock:
+        HOST_RATE_LIMITS[host] = (rate, burst)
+        _buckets[host] = _TokenBucket(rate, burst)
+
+
+def _record(host: str, latency: float, waited: float, ok: bool):
+    with _lock:
+        entry = _stats.setdefault(host, {"requests": 0, "errors": 0, "total_latency": 0.0,
+                                         "max_latency": 0.0, "throttled": 0.0})
+        entry["requests"] += 1
+        if not ok:
+            entry["errors"] += 1
+        entry["total_latency"] += latency
+        entry["max_latency"] = max(entry["max_latency"], latency)
+        entry["throttled"] += waited
+
+
+def request(method: str, url: str, **kwargs) -> requests.Response:
+    """
+    공유 세션으로 HTTP 요청을 보낸다. requests.request 와 같은 인자를 받는다.
+    :param method: 'GET', 'POST' 등
+    :param url: 요청 URL
+    :param kwargs: requests 인자 (timeout 미지정 시 DEFAULT_TIMEOUT 적용)
+    :return: requests.Response
+    """
+    host = _host_of(url)
+    kwargs.setdefault("timeout", DEFAULT_TIMEOUT)
+    waited = _get_bucket(host).acquire()
+    started = time.perf_counter()
+    ok = False
+    try:
+        response = get_session(url).request(method, url, **kwargs)
+        ok = response.status_code < 400
+        return response
+    finally:
+        _record(host, time.perf_counter() - started, waited, ok)
+
+
+def get(url: str, **kwargs) -> requests.Response:
+    return request("GET", url, **kwargs)
+
+
+def post(url: str, **kwargs) -> requests.Response:
+    return request("POST", url, **kwargs)
+
+
+def stats(host: Optional[str] = None) -> dict:
+    """
+    호스트별 지연 통계 사본
+    :return: {host: {"requests", "errors", "avg_latency", "max_latency", "throttled"}}
+    """
+    with _lock:
+        items = {h: dict(v) for h, v in _stats.items() if host is None or h == host}
+    for entry in items.values():
+        entry["avg_latency"] = round(entry["total_latency"] / entry["requests"], 4) if entry["requests"] else 0.0
+        entry["total_latency"] = round(entry["total_latency"], 4)
+        entry["max_latency"] = round(entry["max_latency"], 4)
+        entry["throttled"] = round(entry["throttled"], 4)
+    return items
+
+
+def reset_stats():
+    with _lock:
+        _stats.clear()
+
+
+def close_all():
+    """
+    모든 공유 세션 종료 (프로그램 종료 시)
+    """
+    with _lock:
+        sessions = list(_sessions.values())
+        _sessions.clear()
+    for session in sessions:
+        try:
+            session.close()
+        except Exception:
+            pass
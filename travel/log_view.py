@@ -0,0 +1,212 @@
+# log_view.py - 진행 로그 공용 위젯
+# ===================================================================================
+# 파일명     : log_view.py
+# 작성자     : 하승주, 홍석원
+# 최초작성일 : 2026-10-18
+# 설명       : 작업 진행 메시지를 고정 크기 링 버퍼에 보관하고 타이머로 묶어서 화면에 반영하는
+#              로그 위젯 (QTextEdit 에 메시지마다 append 하던 방식 대체)
+# ===================================================================================
+#
+# 【주요 기능】
+# - 링 버퍼: 최근 LOG_VIEW_MAX_LINES(기본 2000)줄만 보관, 위젯도 같은 줄 수로 제한
+# - 묶음 갱신: append()는 대기 목록에만 쌓고 LOG_VIEW_FLUSH_MS(기본 100ms)마다 한 번에 반영
+# - 레벨 필터: ✅/❌/⚠️ 및 '실패'/'오류' 표시로 레벨 추정, 콤보로 최소 레벨 선택
+# - 파일 기록: spill_path 또는 환경변수 LOG_VIEW_SPILL_DIR 지정 시 전체 로그를 파일에 이어 씀
+#
+# 【사용처】
+# - travel_tab.py: 실시간 정보 수집(크롤링) 진행 로그
+# - weather_tab.py: 날씨/특보 조회 및 기사 생성 작업 로그
+#
+# ※ news 앱의 news/src/utils/log_view.py 와 동일한 동작 (travel 앱은 독립 실행)
+# ===================================================================================
+
+import os
+import re
+from collections import deque
+from datetime import datetime
+from typing import Optional
+
+from PyQt5.QtCore import QTimer, pyqtSlot
+from PyQt5.QtWidgets import QComboBox, QHBoxLayout, QLabel, QPlainTextEdit, QVBoxLayout, QWidget
+
+MAX_LINES = int(os.getenv("LOG_VIEW_MAX_LINES", "2000"))
+FLUSH_MS = int(os.getenv("LOG_VIEW_FLUSH_MS", "100"))
+SPILL_DIR = os.getenv("LOG_VIEW_SPILL_DIR", "")
+
+DEBUG, INFO, WARNING, ERROR = 10, 20, 30, 40
+LEVEL_NAMES = {DEBUG: "DEBUG", INFO: "INFO", WARNING: "WARNING", ERROR: "ERROR"}
+# 콤보 표시 이름 → 최소 레벨
+_FILTERS = [("전체", DEBUG), ("정보 이상", INFO), ("경고 이상", WARNING), ("오류만", ERROR)]
+_DEBUG_PREFIX = re.compile(r"^\s*\[(본문|날짜|추출)\]")
+
+
+def infer_level(message: str) -> int:
+    """
+    메시지 표시(이모지/키워드)로 레벨 추정 - 기존 탭의 색상 규칙과 같은 기준
+    """
+    if "❌" in message or "실패" in message or "오류" in message:
+        return ERROR
+    if "⚠️" in message or "⛔" in message or "경고" in message:
+        return WARNING
+    # 추출 단계 세부 진단([본문] 후보 점수, [날짜] 발행일 판정 등)
+    if _DEBUG_PREFIX.match(message):
+        return DEBUG
+    return INFO
+
+
+class LogView(QWidget):
+    """
+    진행 로그 위젯. 워커 시그널을 append 에 바로 연결해도 된다.
+    """
+
+    def __init__(self, parent=None, title: str = "진행 로그", max_lines: int = MAX_LINES,
+                 flush_ms: int = FLUSH_MS, spill_path: Optional[str] = None, min_height: int = 120):
+        """
+        :param title: 위젯 위쪽에 표시할 제목
+        :param max_lines: 링 버퍼/위젯에 보관할 최대 줄 수
+        :param flush_ms: 화면 갱신 주기(ms)
+        :param spill_path: 로그를 이어 쓸 파일 경로 (None이면 LOG_VIEW_SPILL_DIR/<제목>_<날짜>.log, 둘 다 없으면 기록 안 함)
+        :param min_height: 텍스트 영역 최소 높이
+        """
+        super().__init__(parent)
+        self._max_lines = max(1, max_lines)
+        self._buffer = deque(maxlen=self._max_lines)  # (level, line)
+        self._pending = []
+        self._min_level = DEBUG
+        self._spill_path = spill_path or self._default_spill_path(title)
+        self._spill_file = None
+
+        self.text = QPlainTextEdit()
+        self.text.setReadOnly(True)
+        self.text.setMaximumBlockCount(self._max_lines)
+        self.text.setMinimumHeight(min_height)
+        self.text.setUndoRedoEnabled(False)
+
+        self.level_combo = QComboBox()
+        for name, _ in _FILTERS:
+            self.level_combo.addItem(name)
+        self.level_combo.currentIndexChanged.connect(lambda idx: self.set_min_level(_FILTERS[idx][1]))
+
+        header = QHBoxLayout()
+        header.addWidget(QLabel(title))
+        header.addStretch()
+        header.addWidget(self.level_combo)
+
+        layout = QVBoxLayout()
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.addLayout(header)
+        layout.addWidget(self.text)
+        self.setLayout(layout)
+
+        self._timer = QTimer(self)
+        self._timer.setInterval(max(10, flush_ms))
+        self._timer.timeout.connect(self._flush)
+
+    @staticmethod
+    def _default_spill_path(title: str) -> Optional[str]:
+        if not SPILL_DIR:
+            return None
+        safe = "".join(c if c.isalnum() else "_" for c in title).strip("_") or "log"
+        return os.path.join(SPILL_DIR, f"{safe}_{datetime.now().strftime('%Y%m%d')}.log")
+
+    # ------------------------------------------------------------------
+    # 기록
+    # ------------------------------------------------------------------
+    @pyqtSlot(str)
+    def append(self, message: str, level: Optional[int] = None):
+        """
+        로그 추가 (화면 반영은 다음 타이머 주기에 묶어서)
+        :param message: 여러 줄이면 줄마다 같은 레벨로 기록
+        :param level: DEBUG/INFO/WARNING/ERROR. None이면 메시지로 추정
+        """
+        message = str(message)
+        if level is None:
+            level = infer_level(message)
+        stamp = datetime.now().strftime("%H:%M:%S")
+        for raw in message.split("\n"):
+            line = f"[{stamp}] {raw}" if raw.strip() else raw
+            self._buffer.append((level, line))
+            self._pending.append((level, line))
+        # 한 주기 안에 버퍼보다 많이 쌓이면 앞부분은 어차피 밀려나므로 잘라 둔다
+        if len(self._pending) > self._max_lines:
+            self._spill(self._pending[:-self._max_lines])
+            del self._pending[:-self._max_lines]
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def _flush(self):
+        pending, self._pending = self._pending, []
+        if not pending:
+            self._timer.stop()
+            return
+        self._spill(pending)
+        lines = [line for level, line in pending if level >= self._min_level]
+        if lines:
+            self._append_lines(lines)
+
+    def _append_lines(self, lines):
+        bar = self.text.verticalScrollBar()
+        at_bottom = bar.value() >= bar.maximum() - 4
+        # 한 번의 appendPlainText 로 넣어야 레이아웃 계산이 한 번만 일어난다
+        self.text.appendPlainText("\n".join(lines))
+        if at_bottom:
+            bar.setValue(bar.maximum())
+
+    def _spill(self, entries):
+        if not self._spill_path:
+            return
+        try:
+            if self._spill_file is None:
+                os.makedirs(os.path.dirname(self._spill_path) or ".", exist_ok=True)
+                self._spill_file = open(self._spill_path, "a", encoding="utf-8")
+            self._spill_file.write("".join(f"{LEVEL_NAMES.get(level, level)}\t{line}\n" for level, line in entries))
+            self._spill_file.flush()
+        except Exception as e:
+            print(f"[WARNING] 로그 파일 기록 실패 ({self._spill_path}): {e}")
+            self._spill_path = None
+
+    # ------------------------------------------------------------------
+    # 설정 / 정리
+    # ------------------------------------------------------------------
+    def set_min_level(self, level: int):
+        """
+        최소 표시 레벨 변경 - 링 버퍼에서 다시 그린다
+        """
+        self._min_level = level
+        self._spill(self._pending)
+        self._pending = []
+        self.text.clear()
+        lines = [line for lv, line in self._buffer if lv >= level]
+        if lines:
+            self._append_lines(lines)
+
+    def set_spill_path(self, path: Optional[str]):
+        self.close_spill()
+        self._spill_path = path
+
+    def clear(self):
+        """
+        화면/버퍼 비우기 (파일 기록은 유지)
+        """
+        self._flush()
+        self._buffer.clear()
+        self.text.clear()
+
+    def lines(self):
+        """
+        현재 링 버퍼 내용 사본 [(level, line)]
+        """
+        return list(self._buffer)
+
+    def close_spill(self):
+        self._flush()
+        if self._spill_file is not None:
+            try:
+                self._spill_file.close()
+            except Exception:
+                pass
+            self._spill_file = None
+
+    def closeEvent(self, event):
+        self.close_spill()
+        super().closeEvent(event)
@@ -0,0 +1,250 @@
+# place_intro_http.py - 브라우저 없이 네이버 장소 소개 수집
+# ===================================================================================
+# 파일명     : place_intro_http.py
+# 작성자     : 하승주, 홍석원
+# 최초작성일 : 2026-10-18
+# 설명       : 네이버 장소 모바일 페이지를 requests로 받아 내장 상태 JSON/HTML에서
+#              소개·요약 필드를 파싱하는 경량 수집 경로 + 경로별 성공률/지연 통계
+# ===================================================================================
+#
+# 【주요 기능】
+# - fetch_introduction(): m.place.naver.com 정보 페이지 1회 요청으로 소개/요약 추출 (Selenium 불필요)
+# - parse_place_html(): 저장된 HTML만으로 동작하는 순수 파서 (네트워크 없이 검증 가능)
+# - record() / stats(): 수집 경로(http / selenium)별 시도·성공 수, 평균·최대 지연
+#
+# 【파싱 순서】
+# 1. window.__APOLLO_STATE__ 내장 JSON → 해당 장소 객체의 description(소개), microReviews(요약)
+#    (장소 ID를 넘겼는데 상태에 그 장소가 없으면 다른 장소 값을 쓰지 않고 빈 결과)
+# 2. 서버 렌더링 HTML의 div.AX_W3(소개) / .place_summary(요약) 텍스트
+# - 두 필드가 모두 비면 호출 측(realtime_crawler, crawl_main)이 Selenium 경로로 대체
+#
+# 【저장 HTML로 확인】
+# - python place_intro_http.py fetch <장소 ID> [--save <디렉토리>]  : 실제 요청 + HTML 저장
+# - python place_intro_http.py parse <HTML 파일>...                 : 저장 HTML 파싱 결과 출력
+#   (파일명이 숫자 ID로 시작하면 그 ID 기준으로 파싱)
+#
+# 【환경변수】
+# - REALTIME_HTTP_INTRO=0 : HTTP 경로 끄기 (항상 Selenium)
+#
+# 【사용처】
+# - realtime_crawler.py: RealtimeIntroCrawler.crawl_one() 에서 먼저 시도
+# - crawl_main.py: crawl_place_details() 의 '정보' 탭 처리 전 시도
+# ===================================================================================
+
+import os
+import re
+import json
+import time
+import html
+import threading
+from typing import Dict, Iterator, Optional, Tuple
+
+HTTP_INTRO_ENABLED = os.environ.get("REALTIME_HTTP_INTRO", "1") != "0"
+
+INFO_URL = "https://m.place.naver.com/place/{place_id}/information"
+MOBILE_UA = ("Mozilla/5.0 (iPhone; CPU iPhone OS 17_0 like Mac OS X) AppleWebKit/605.1.15 "
+             "(KHTML, like Gecko) Version/17.0 Mobile/15E148 Safari/604.1")
+HTTP_TIMEOUT = (3.05, 8)
+
+_INTRO_FIELDS = ("description", "introduction")
+_SUMMARY_FIELDS = ("microReviews", "summary")
+_STATE_MARKERS = ("window.__APOLLO_STATE__", "__APOLLO_STATE__")
+
+_TAG_RE = re.compile(r"<[^>]+>")
+_BR_RE = re.compile(r"<br\s*/?>", re.I)
+_AX_W3_RE = re.compile(r'<div[^>]*class="[^"]*\bAX_W3\b[^"]*"[^>]*>(.*?)</div>', re.S)
+_SUMMARY_RE = re.compile(r'<(div|span|p)[^>]*class="[^"]*\bplace_summary\b[^"]*"[^>]*>(.*?)</\1>', re.S)
+
+# =========================
+# 파싱 (네트워크 없음)
+# =========================
+def _load_state(page: str) -> Optional[dict]:
+    """HTML 안의 window.__APOLLO_STATE__ = {...}; JSON 객체"""
+    for marker in _STATE_MARKERS:
+        idx = page.find(marker)
+        if idx < 0:
+            continue
+        start = page.find("{", idx)
+        if start < 0:
+            continue
+        try:
+            state, _ = json.JSONDecoder().raw_decode(page, start)
+            return state if isinstance(state, dict) else None
+        except ValueError:
+            continue
+    return None
+
+def _text_value(value) -> str:
+    if isinstance(value, str):
+        return value.strip()
+    if isinstance(value, list):
+        return "\n".join(v.strip() for v in value if isinstance(v, str) and v.strip())
+    return ""
+
+def _iter_objects(obj) -> Iterator[dict]:
+    if isinstance(obj, dict):
+        yield obj
+        for v in obj.values():
+            yield from _iter_objects(v)
+    elif isinstance(obj, list):
+        for v in obj:
+            yield from _iter_objects(v)
+
+def _pick(objects, fields) -> str:
+    for obj in objects:
+        for field in fields:
+            text = _text_value(obj.get(field))
+            if text:
+                return text
+    return ""
+
+def _from_state(state: dict, place_id: Optional[str]) -> Optional[Dict[str, str]]:
+    # ID가 있으면 해당 장소 객체(키가 ':<ID>'로 끝나거나 id 필드 일치)와 그 하위 객체에서만 찾는다.
+    # 상태에 해당 장소가 없으면 다른 장소(추천/주변 장소)의 소개를 가져오지 않도록 None 반환
+    if place_id:
+        own = [value for key, value in state.items()
+               if isinstance(value, dict) and (key.endswith(f":{place_id}") or str(value.get("id", "")) == place_id)]
+        if not own:
+            return None
+        objects = [o for obj in own for o in _iter_objects(obj)]
+    else:
+        objects = list(_iter_objects(state))
+    return {"introduction": _pick(objects, _INTRO_FIELDS), "summary": _pick(objects, _SUMMARY_FIELDS)}
+
+def _strip_html(fragment: str) -> str:
+    text = _TAG_RE.sub("", _BR_RE.sub("\n", fragment))
+    lines = [re.sub(r"[ \t]+", " ", line).strip() for line in html.unescape(text).split("\n")]
+    return "\n".join(line for line in lines if line)
+
+def parse_place_html(page: str, place_id: Optional[str] = None) -> Dict[str, str]:
+    """
+    장소 페이지 HTML에서 소개/요약 추출
+    :param page: m.place.naver.com 페이지 HTML
+    :param place_id: 네이버 장소 ID (내장 상태에서 해당 장소 객체를 고르는 데 사용)
+    :return: {"introduction": 소개, "summary": 요약} (없으면 빈 문자열)
+             내장 상태가 있는데 place_id 장소가 없으면 다른 장소 페이지로 보고 둘 다 빈 문자열 (→ Selenium 경로)
+    """
+    out = {"introduction": "", "summary": ""}
+    if not page:
+        return out
+    state = _load_state(page)
+    if state:
+        found = _from_state(state, str(place_id) if place_id else None)
+        if found is None:
+            return out
+        out = found
+    if not out["introduction"]:
+        m = _AX_W3_RE.search(page)
+        if m:
+            out["introduction"] = _strip_html(m.group(1))
+    if not out["summary"]:
+        m = _SUMMARY_RE.search(page)
+        if m:
+            out["summary"] = _strip_html(m.group(2))
+    return out
+
+def pick_introduction(fields: Dict[str, str]) -> Optional[str]:
+    """Selenium 경로와 같은 우선순위: 정보 탭 소개 → 홈 탭 요약"""
+    return fields.get("introduction") or fields.get("summary") or None
+
+# =========================
+# 요청
+# =========================
+def fetch_place_html(place_id: str, timeout=HTTP_TIMEOUT) -> Optional[str]:
+    import http_client  # requests 의존성은 실제 요청 때만 필요 (파서는 단독 사용 가능)
+
+    url = INFO_URL.format(place_id=place_id)
+    headers = {
+        "User-Agent": MOBILE_UA,
+        "Accept-Language": "ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7",
+        "Referer": "https://m.place.naver.com/",
+    }
+    response = http_client.get(url, headers=headers, timeout=timeout)
+    if response.status_code != 200:
+        print(f"  [HTTP] ID {place_id}: 응답 코드 {response.status_code}")
+        return None
+    return response.text
+
+def fetch_introduction(place_id: str, timeout=HTTP_TIMEOUT,
+                       fallback_summary: bool = True) -> Tuple[Optional[str], Dict[str, str]]:
+    """
+    HTTP 경로로 소개 수집 (결과와 지연을 'http' 경로 통계에 기록)
+    :param fallback_summary: 소개가 없을 때 요약으로 대체할지 여부 (False면 정보 탭 소개만 성공으로 취급)
+    :return: (소개 또는 None, {"introduction", "summary"} 원본 필드)
+    """
+    started = time.perf_counter()
+    fields = {"introduction": "", "summary": ""}
+    try:
+        page = fetch_place_html(str(place_id), timeout=timeout)
+        if page:
+            fields = parse_place_html(page, str(place_id))
+    except Exception as e:
+        print(f"  [HTTP] ID {place_id}: 요청/파싱 실패 - {e}")
+    intro = pick_introduction(fields) if fallback_summary else (fields.get("introduction") or None)
+    record("http", bool(intro), time.perf_counter() - started)
+    return intro, fields
+
+# =========================
+# 경로별 통계
+# =========================
+_lock = threading.Lock()
+_stats: Dict[str, dict] = {}
+
+def record(path: str, success: bool, latency: float):
+    """
+    :param path: 'http' / 'selenium'
+    :param success: 소개를 얻었는지 여부
+    :param latency: 소요 시간(초)
+    """
+    with _lock:
+        entry = _stats.setdefault(path, {"attempts": 0, "success": 0, "total_latency": 0.0, "max_latency": 0.0})
+        entry["attempts"] += 1
+        if success:
+            entry["success"] += 1
+        entry["total_latency"] += latency
+        entry["max_latency"] = max(entry["max_latency"], latency)
+
+def stats() -> Dict[str, dict]:
+    """
+    :return: {경로: {"attempts", "success", "success_rate", "avg_latency", "max_latency"}}
+    """
+    with _lock:
+        items = {p: dict(v) for p, v in _stats.items()}
+    for entry in items.values():
+        n = entry["attempts"]
+        entry["success_rate"] = round(entry["success"] / n, 4) if n else 0.0
+        entry["avg_latency"] = round(entry.pop("total_latency") / n, 4) if n else 0.0
+        entry["max_latency"] = round(entry["max_latency"], 4)
+    return items
+
+def reset_stats():
+    with _lock:
+        _stats.clear()
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="네이버 장소 소개 HTTP 수집/파싱 확인")
+    sub = parser.add_subparsers(dest="command", required=True)
+    p_fetch = sub.add_parser("fetch")
+    p_fetch.add_argument("place_id")
+    p_fetch.add_argument("--save", help="받은 HTML을 <디렉토리>/<ID>.html 로 저장")
+    p_parse = sub.add_parser("parse")
+    p_parse.add_argument("files", nargs="+")
+    args = parser.parse_args()
+
+    if args.command == "fetch":
+        page = fetch_place_html(args.place_id)
+        if page and args.save:
+            os.makedirs(args.save, exist_ok=True)
+            with open(os.path.join(args.save, f"{args.place_id}.html"), "w", encoding="utf-8") as f:
+                f.write(page)
+        print(json.dumps(parse_place_html(page or "", args.place_id), ensure_ascii=False, indent=2))
+    else:
+        for path in args.files:
+            with open(path, encoding="utf-8") as f:
+                page = f.read()
+            m = re.match(r"(\d+)", os.path.basename(path))
+            fields = parse_place_html(page, m.group(1) if m else None)
+            print(f"--- {path}")
+            print(json.dumps(fields, ensure_ascii=False, indent=2))
@@ -24,16 +24,24 @@
 # - 차단 감지 시 자동 쿨다운 (25-50초)
 #
 # 【크롤링 절차】
-# 1. 웜업: 네이버 지도 홈 먼저 방문
+# 0. place_intro_http 경량 경로: 모바일 페이지를 requests로 받아 소개/요약 파싱 (성공 시 Selenium 생략)
+# 1. 웜업: 네이버 지도 홈 먼저 방문 (드라이버 생성 시 한 번)
 # 2. 대상 장소 페이지 로드
 # 3. entryIframe으로 전환
 # 4. '정보' 탭 클릭 → 펼쳐보기 → 내용 추출
 # 5. 실패 시 홈 탭의 place_summary 시도
+# - 단계 사이 고정 sleep 없이 WebDriverWait 명시적 대기만 사용
+#
+# 【동시 처리 - RealtimeIntroCrawler】
+# - 웜업된 드라이버 N개(REALTIME_CRAWL_WORKERS, 기본 3)를 풀로 유지하며 장소마다 재사용
+# - crawl_many(): 장소 ID 목록을 동시에 처리하고 끝나는 순서대로 결과를 돌려줌
+# - 장소별 마감(REALTIME_PLACE_TIMEOUT, 기본 90초) 초과 시 해당 드라이버만 종료 후 교체
+# - crawl_introduction(): 기존 단건 호출 호환 (드라이버 1개짜리 크롤러)
 #
 # 【오류 처리】
 # - 타임아웃: 페이지 로드 20초, 요소 검색 2-5초
 # - 재시도: 최대 3회, 각 단계별 독립적 재시도
-# - 차단 감지: 특정 키워드 패턴 감지 시 중단
+# - 차단 감지: 특정 키워드 패턴 감지 시 중단, 모든 작업이 쿨다운 동안 대기
 #
 # 【사용처】
 # - travel_logic.py: 기사 생성 전 최신 정보 업데이트
@@ -43,9 +51,12 @@
 import os
 import re
 import time
+import queue
 import random
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Iterable, Iterator, Optional, Tuple
 
 from selenium import webdriver
 from selenium.webdriver.common.by import By
@@ -53,6 +64,9 @@ from selenium.webdriver.support.wait import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException
 
+import place_intro_http
+from cancel_token import CancelToken
+
 # =========================
 # 설정
 # =========================
@@ -71,12 +85,26 @@ FIXED_UA = os.environ.get("CRAWL_UA",
 # 차단 감지 → 쿨다운 범위(초)
 COOLDOWN_ON_BLOCK = (25, 50)
 
+# RealtimeIntroCrawler 동시 드라이버 수 / 장소 1곳당 마감(초)
+CRAWL_WORKERS = int(os.environ.get("REALTIME_CRAWL_WORKERS", "3"))
+PLACE_TIMEOUT = float(os.environ.get("REALTIME_PLACE_TIMEOUT", "90"))
+
+# 이 시간(시간 단위) 안에 실시간 크롤링으로 갱신된 소개는 다시 수집하지 않음 (0이면 항상 수집)
+INTRO_TTL_HOURS = float(os.environ.get("REALTIME_INTRO_TTL_HOURS", "24"))
+
 # =========================
 # 유틸
 # =========================
 def randsleep(a=0.25, b=0.6):
     time.sleep(random.uniform(a, b))
 
+def cooldown(seconds: float, cancel_token=None):
+    """차단 쿨다운 대기 (취소 토큰이 있으면 취소 즉시 깨어남)"""
+    if cancel_token is not None:
+        cancel_token.wait(seconds)
+    else:
+        time.sleep(seconds)
+
 def looks_like_blocked(text: str) -> bool:
     if not text:
         return False
@@ -89,8 +117,12 @@ def looks_like_blocked(text: str) -> bool:
 # =========================
 # 드라이버
 # =========================
-def setup_driver() -> Optional[webdriver.Chrome]:
-    """셀레니움 웹드라이버를 설정하고 반환합니다."""
+def setup_driver(profile_dir: Optional[str] = None) -> Optional[webdriver.Chrome]:
+    """
+    셀레니움 웹드라이버를 설정하고 반환합니다.
+    :param profile_dir: 크롬 프로필 디렉토리 (None이면 PROFILE_DIR, 동시에 띄우는 드라이버는 서로 달라야 함)
+    """
+    profile_dir = profile_dir or PROFILE_DIR
     options = webdriver.ChromeOptions()
     options.add_argument('--headless=new')  # 필요시 사용(차단에는 headful 권장)
     options.add_argument('--no-sandbox')
@@ -103,8 +135,8 @@ def setup_driver() -> Optional[webdriver.Chrome]:
     options.add_experimental_option('useAutomationExtension', False)
 
     # 세션 일관성(쿠키/스토리지 유지)
-    Path(PROFILE_DIR).mkdir(parents=True, exist_ok=True)
-    options.add_argument(f'--user-data-dir={PROFILE_DIR}')
+    Path(profile_dir).mkdir(parents=True, exist_ok=True)
+    options.add_argument(f'--user-data-dir={profile_dir}')
     # 고정 UA
     options.add_argument(f'--user-agent={FIXED_UA}')
     # 언어/알림
@@ -140,159 +172,326 @@ def setup_driver() -> Optional[webdriver.Chrome]:
         return None
 
 def warmup(driver):
-    """맵 홈 먼저 방문하여 쿠키/리소스 적재 (직행 패턴 완화)"""
+    """맵 홈 먼저 방문하여 쿠키/리소스 적재 (직행 패턴 완화) - 문서 로드 완료까지 대기"""
     try:
         driver.get(MAP_HOME)
-        randsleep(0.6, 1.2)
+        WebDriverWait(driver, PAGELOAD_TIMEOUT).until(
+            lambda d: d.execute_script("return document.readyState") == "complete"
+        )
     except Exception as e:
         print(f"[WARMUP] 실패: {e}")
 
 # =========================
 # 메인 크롤링
 # =========================
-def crawl_introduction(naver_place_id: str) -> Optional[str]:
+def _valid_place_id(naver_place_id) -> bool:
+    return bool(naver_place_id) and str(naver_place_id).isdigit()
+
+def _page_blocked(driver) -> bool:
+    try:
+        return looks_like_blocked(driver.find_element(By.TAG_NAME, "body").text)
+    except Exception:
+        return False
+
+def _click(driver, element):
+    driver.execute_script("arguments[0].scrollIntoView({block:'center'});", element)
+    driver.execute_script("arguments[0].click();", element)
+
+def _extract_introduction(driver, naver_place_id: str, cancelled: Callable[[], bool]):
     """
-    안정성을 강화한 크롤러. 타임아웃/로그/웜업/라이트 스텔스 적용.
-    셀렉터는 고정: 정보탭 veBoZ, 펼쳐보기 a.OWPIf
+    웜업된 드라이버로 장소 페이지를 열어 소개 텍스트 추출 (고정 대기 없이 명시적 대기만 사용)
+    셀렉터는 고정: 정보탭 veBoZ, 펼쳐보기 a.OWPIf, 본문 div.AX_W3 / 홈 탭 .place_summary
+    :param cancelled: 단계 사이마다 확인할 취소 여부 함수
+    :return: (소개 텍스트 또는 None, 차단 감지 여부)
     """
-    if not naver_place_id or not naver_place_id.isdigit():
-        print(f"[VALIDATION] 유효하지 않은 ID: {naver_place_id}")
-        return None
-
     url = f"https://map.naver.com/p/entry/place/{naver_place_id}"
-    driver = setup_driver()
-    if not driver:
-        return None
-        
-    print(f"[CRAWL] ID {naver_place_id} 처리 시작.")
-    
+
+    # 1. 페이지 로드 (get 은 load 이벤트까지 대기)
     try:
-        # 0. 웜업
-        warmup(driver)
+        print(f"  [STEP 1] ID {naver_place_id} 페이지 로드 시도...")
+        driver.switch_to.default_content()
+        driver.get(url)
+    except TimeoutException:
+        print(f"  [FAIL] 페이지 로드 시간 초과 ({PAGELOAD_TIMEOUT}초). URL: {url}")
+        return None, False
+    if _page_blocked(driver):
+        print("  [BLOCK] 상위 문서 차단 신호")
+        return None, True
 
-        # 1. 페이지 로드
-        try:
-            print("  [STEP 1] 페이지 로드 시도...")
-            driver.get(url)
-            randsleep(0.4, 0.8)
-            try:
-                if looks_like_blocked(driver.find_element(By.TAG_NAME, "body").text):
-                    cool = random.uniform(*COOLDOWN_ON_BLOCK)
-                    print(f"  [BLOCK] 상위 문서 차단 신호 → {cool:.1f}s 대기")
-                    time.sleep(cool)
-                    return None
-            except:
-                pass
-            print("  [STEP 1] 페이지 로드 완료.")
-        except TimeoutException:
-            print(f"  [FAIL] 페이지 로드 시간 초과 ({PAGELOAD_TIMEOUT}초). URL: {url}")
-            return None
+    # 2. IFrame 전환 → iframe 문서 본문이 붙을 때까지 대기
+    if cancelled():
+        return None, False
+    try:
+        WebDriverWait(driver, IFRAME_TIMEOUT).until(
+            EC.frame_to_be_available_and_switch_to_it((By.ID, "entryIframe"))
+        )
+        WebDriverWait(driver, IFRAME_TIMEOUT).until(EC.presence_of_element_located((By.TAG_NAME, "body")))
+    except TimeoutException:
+        print(f"  [FAIL] ID {naver_place_id}: IFrame(entryIframe)을 찾지 못했습니다.")
+        return None, False
+    if _page_blocked(driver):
+        print("  [BLOCK] iframe 차단 신호")
+        return None, True
+
+    introduction_text = None
+
+    # 3. '정보' 탭 시도
+    if cancelled():
+        return None, False
+    try:
+        info_tab = WebDriverWait(driver, FIND_TIMEOUT_S).until(
+            EC.element_to_be_clickable((By.XPATH, '//span[@class="veBoZ" and contains(text(),"정보")]'))
+        )
+        _click(driver, info_tab)
 
-        # 2. IFrame 전환
+        # 펼쳐보기 (없어도 됨)
         try:
-            print("  [STEP 2] IFrame으로 전환 시도...")
-            WebDriverWait(driver, IFRAME_TIMEOUT).until(
-                EC.frame_to_be_available_and_switch_to_it((By.ID, "entryIframe"))
+            unfold_btn = WebDriverWait(driver, FIND_TIMEOUT_S).until(
+                EC.element_to_be_clickable((By.CSS_SELECTOR, "a.OWPIf"))
             )
-            randsleep(0.2, 0.4)
-            try:
-                if looks_like_blocked(driver.find_element(By.TAG_NAME, "body").text):
-                    cool = random.uniform(*COOLDOWN_ON_BLOCK)
-                    print(f"  [BLOCK] iframe 차단 신호 → {cool:.1f}s 대기")
-                    time.sleep(cool)
-                    return None
-            except:
-                pass
-            print("  [STEP 2] IFrame 전환 완료.")
+            _click(driver, unfold_btn)
         except TimeoutException:
-            print("  [FAIL] IFrame(entryIframe)을 찾지 못했습니다.")
-            return None
+            pass
 
-        introduction_text = None
+        info_element = WebDriverWait(driver, FIND_TIMEOUT_M).until(
+            EC.visibility_of_element_located((By.CSS_SELECTOR, "div.AX_W3"))
+        )
+        introduction_text = info_element.text.strip()
+    except TimeoutException:
+        print(f"  [STEP 3] ID {naver_place_id}: '정보' 탭을 찾지 못함. 홈 탭으로 대체 탐색합니다.")
 
-        # 3. '정보' 탭 시도 (고정 셀렉터 유지)
+    # 4. 홈 탭 place_summary (대체)
+    if cancelled():
+        return None, False
+    if not introduction_text:
         try:
-            print("  [STEP 3] '정보' 탭 탐색 시도...")
-            info_tab = WebDriverWait(driver, FIND_TIMEOUT_S).until(
-                EC.element_to_be_clickable((By.XPATH, '//span[@class="veBoZ" and contains(text(),"정보")]'))
+            summary_element = WebDriverWait(driver, FIND_TIMEOUT_M).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, ".place_summary"))
             )
-            driver.execute_script("arguments[0].scrollIntoView({block:'center'});", info_tab)
-            randsleep(0.15, 0.35)
-            driver.execute_script("arguments[0].click();", info_tab)
-            print("  [STEP 3] '정보' 탭 클릭 완료.")
-            
-            # 펼쳐보기 (고정 셀렉터 유지)
+            introduction_text = summary_element.text.strip()
+
+            # 더보기 버튼 → 요약 텍스트가 바뀔 때까지 대기 (고정 0.5초 대기 대체)
             try:
                 unfold_btn = WebDriverWait(driver, FIND_TIMEOUT_S).until(
-                    EC.element_to_be_clickable((By.CSS_SELECTOR, "a.OWPIf"))
+                    EC.element_to_be_clickable((By.CSS_SELECTOR, ".Z4f_p"))
+                )
+                before = introduction_text
+                _click(driver, unfold_btn)
+                WebDriverWait(driver, FIND_TIMEOUT_S).until(
+                    lambda d: d.find_element(By.CSS_SELECTOR, ".place_summary").text.strip() != before
                 )
-                driver.execute_script("arguments[0].scrollIntoView({block:'center'});", unfold_btn)
-                randsleep(0.15, 0.35)
-                driver.execute_script("arguments[0].click();", unfold_btn)
+                introduction_text = driver.find_element(By.CSS_SELECTOR, ".place_summary").text.strip()
             except TimeoutException:
-                pass  # 없어도 됨
+                pass
+        except TimeoutException:
+            print(f"  [STEP 4] ID {naver_place_id}: 홈 탭에서도 'place_summary'를 찾지 못했습니다.")
 
-            info_element = WebDriverWait(driver, FIND_TIMEOUT_M).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "div.AX_W3"))
-            )
-            introduction_text = info_element.text.strip()
+    return introduction_text or None, False
 
-        except TimeoutException:
-            print("  [STEP 3] '정보' 탭을 찾지 못함. 홈 탭으로 대체 탐색합니다.")
+def crawl_introduction(naver_place_id: str, cancel_token=None) -> Optional[str]:
+    """
+    장소 1곳의 소개 정보 크롤링 (드라이버를 새로 띄우고 끝나면 종료)
+    여러 장소는 RealtimeIntroCrawler 사용 - 웜업된 드라이버를 재사용하고 동시에 처리한다.
+    cancel_token: 취소/마감 토큰. 취소되면 드라이버를 즉시 종료하고 단계 사이에서 None 반환
+    """
+    with RealtimeIntroCrawler(workers=1) as crawler:
+        return crawler.crawl_one(naver_place_id, cancel_token=cancel_token)
 
-        # 4. 홈 탭 시도 (대체)
-        if not introduction_text:
-            try:
-                print("  [STEP 4] 홈 탭에서 'place_summary' 탐색 시도...")
-                summary_element = WebDriverWait(driver, FIND_TIMEOUT_M).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, ".place_summary"))
-                )
-                introduction_text = summary_element.text.strip()
-                print("  [STEP 4] 'place_summary' 내용 추출 성공.")
 
-                # 더보기 버튼
+class RealtimeIntroCrawler:
+    """
+    웜업된 크롬 드라이버 N개를 유지하며 여러 장소의 소개 정보를 동시에 크롤링
+    - 드라이버는 처음 필요할 때 만들고 웜업, 작업이 끝나면 풀에 돌려줘 다음 장소에 재사용
+    - 장소별 마감(place_timeout): 넘기면 해당 드라이버를 종료(블로킹 호출 탈출)하고 폐기 → 다음 작업에서 새로 생성
+    - 차단 신호: 모든 작업이 쿨다운 동안 대기
+    - 드라이버마다 프로필 디렉토리를 따로 씀 (같은 user-data-dir 는 동시에 열 수 없음)
+
+    사용 예:
+        with RealtimeIntroCrawler(workers=3) as crawler:
+            for place_id, intro in crawler.crawl_many(ids, cancel_token=token):
+                ...
+    """
+
+    def __init__(self, workers: int = CRAWL_WORKERS, place_timeout: Optional[float] = PLACE_TIMEOUT):
+        """
+        :param workers: 동시에 띄울 드라이버(작업) 수
+        :param place_timeout: 장소 1곳당 마감 시간(초). None이면 마감 없음
+        """
+        self.workers = max(1, int(workers))
+        self.place_timeout = place_timeout
+        self._idle = queue.Queue()
+        self._lock = threading.Lock()
+        self._slots = list(range(self.workers))   # 아직 드라이버가 없는 프로필 번호
+        self._drivers = {}                         # id(driver) → 프로필 번호
+        self._cooldown_until = 0.0
+        self._closed = False
+
+    # ------------------------------------------------------------------
+    # 드라이버 풀
+    # ------------------------------------------------------------------
+    def _acquire(self, cancelled: Callable[[], bool]):
+        """
+        쉬는 드라이버를 꺼내거나, 빈 자리가 있으면 새로 만들어 웜업
+        :return: (driver, 프로필 번호) 또는 (None, None)
+        """
+        while not cancelled():
+            try:
+                return self._idle.get_nowait()
+            except queue.Empty:
+                pass
+            with self._lock:
+                slot = self._slots.pop(0) if self._slots else None
+            if slot is None:
                 try:
-                    unfold_btn = WebDriverWait(driver, FIND_TIMEOUT_S).until(
-                        EC.element_to_be_clickable((By.CSS_SELECTOR, ".Z4f_p"))
-                    )
-                    driver.execute_script("arguments[0].scrollIntoView({block:'center'});", unfold_btn)
-                    randsleep(0.15, 0.35)
-                    driver.execute_script("arguments[0].click();", unfold_btn)
-                    time.sleep(0.5)
-                    summary_element = WebDriverWait(driver, FIND_TIMEOUT_S).until(
-                        EC.presence_of_element_located((By.CSS_SELECTOR, ".place_summary"))
-                    )
-                    introduction_text = summary_element.text.strip()
-                except TimeoutException:
-                    pass  # 없어도 됨
+                    return self._idle.get(timeout=0.2)
+                except queue.Empty:
+                    continue
+            profile = PROFILE_DIR if slot == 0 else f"{PROFILE_DIR}_{slot}"
+            driver = setup_driver(profile)
+            if driver is None:
+                self._release_slot(slot)
+                return None, None
+            warmup(driver)
+            return driver, slot
+        return None, None
 
-            except TimeoutException:
-                print("  [STEP 4] 홈 탭에서도 'place_summary'를 찾지 못했습니다.")
-
-        # 5. 최종 결과 반환
-        if introduction_text:
-            print(f"  [SUCCESS] 최종 소개 정보 추출 완료.")
-            return introduction_text
-        else:
-            print("  [FAIL] 모든 단계에서 소개 정보를 찾지 못했습니다.")
-            return None
+    def _release_slot(self, slot: int):
+        with self._lock:
+            self._slots.append(slot)
 
-    except Exception as e:
-        print(f"  [UNEXPECTED] 예측하지 못한 오류 발생: {e}")
-        return None
-    finally:
-        # 6. 드라이버 종료 보장
-        if driver:
-            print("[CLEANUP] 드라이버 및 관련 프로세스를 종료합니다.")
+    def _discard(self, driver, slot: int):
+        try:
             driver.quit()
-            print("[CLEANUP] 모든 프로세스가 정상적으로 종료되었습니다.")
+        except Exception:
+            pass
+        self._release_slot(slot)
+
+    def close(self):
+        """쉬고 있는 드라이버 모두 종료"""
+        self._closed = True
+        while True:
+            try:
+                driver, slot = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._discard(driver, slot)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+    # ------------------------------------------------------------------
+    # 크롤링
+    # ------------------------------------------------------------------
+    def _wait_cooldown(self, token) -> bool:
+        """
+        :return: 쿨다운 대기 중 취소되었으면 True
+        """
+        remaining = self._cooldown_until - time.monotonic()
+        if remaining <= 0:
+            return False
+        if token is not None:
+            return token.wait(remaining)
+        time.sleep(remaining)
+        return False
+
+    def crawl_one(self, naver_place_id: str, cancel_token=None) -> Optional[str]:
+        """
+        장소 1곳 크롤링 (풀의 드라이버 사용)
+        :param cancel_token: 상위 취소 토큰. place_timeout 마감은 이 토큰의 하위 토큰으로 적용
+        """
+        if not _valid_place_id(naver_place_id):
+            print(f"[VALIDATION] 유효하지 않은 ID: {naver_place_id}")
+            return None
+        naver_place_id = str(naver_place_id)
+
+        token = cancel_token.child(timeout=self.place_timeout) if cancel_token is not None else \
+            (CancelToken(timeout=self.place_timeout) if self.place_timeout is not None else None)
+
+        def cancelled() -> bool:
+            if token is not None and token.cancelled:
+                print(f"  [CANCEL] ID {naver_place_id}: {token.reason or '작업 취소'}")
+                return True
+            return False
+
+        try:
+            if self._wait_cooldown(token) or cancelled():
+                return None
+            # 경량 경로: 모바일 페이지 1회 요청으로 충분하면 드라이버를 잡지 않는다
+            if place_intro_http.HTTP_INTRO_ENABLED:
+                intro, _ = place_intro_http.fetch_introduction(naver_place_id)
+                if intro:
+                    print(f"  [SUCCESS] ID {naver_place_id} 소개 정보 추출 완료 (HTTP).")
+                    return intro
+                if cancelled():
+                    return None
+            driver, slot = self._acquire(cancelled)
+            if driver is None:
+                return None
+            # 취소/마감 시 driver.get() 등 블로킹 단계도 즉시 빠져나오도록 종료 콜백 등록
+            quit_cb = token.add_callback(driver.quit) if token is not None else None
+            healthy, intro = False, None
+            started = time.perf_counter()
+            try:
+                print(f"[CRAWL] ID {naver_place_id} 처리 시작.")
+                intro, blocked = _extract_introduction(driver, naver_place_id, cancelled)
+                if blocked:
+                    cool = random.uniform(*COOLDOWN_ON_BLOCK)
+                    print(f"  [BLOCK] {cool:.1f}s 동안 전체 작업 대기")
+                    with self._lock:
+                        self._cooldown_until = max(self._cooldown_until, time.monotonic() + cool)
+                healthy = not cancelled()
+                if intro:
+                    print(f"  [SUCCESS] ID {naver_place_id} 소개 정보 추출 완료.")
+                else:
+                    print(f"  [FAIL] ID {naver_place_id}: 모든 단계에서 소개 정보를 찾지 못했습니다.")
+                return intro if healthy else None
+            except Exception as e:
+                if not cancelled():
+                    print(f"  [UNEXPECTED] ID {naver_place_id} 예측하지 못한 오류 발생: {e}")
+                return None
+            finally:
+                place_intro_http.record("selenium", bool(intro) and healthy, time.perf_counter() - started)
+                if quit_cb is not None:
+                    token.remove_callback(quit_cb)
+                # 마감/오류로 종료됐을 수 있는 드라이버는 폐기, 정상이면 다음 장소에 재사용
+                if healthy and not self._closed:
+                    self._idle.put((driver, slot))
+                else:
+                    self._discard(driver, slot)
+        finally:
+            if token is not None:
+                token.close()
+
+    def crawl_many(self, place_ids: Iterable[str], cancel_token=None) -> Iterator[Tuple[str, Optional[str]]]:
+        """
+        여러 장소를 workers 개씩 동시에 크롤링하고 끝나는 순서대로 (ID, 소개 또는 None) 반환
+        :param cancel_token: 전체 취소 토큰 (취소 시 진행 중인 드라이버 종료, 대기 작업은 None)
+        """
+        ids = [str(pid) for pid in place_ids]
+        if not ids:
+            return
+        with ThreadPoolExecutor(max_workers=min(self.workers, len(ids)),
+                                thread_name_prefix="intro-crawler") as executor:
+            futures = {executor.submit(self.crawl_one, pid, cancel_token): pid for pid in ids}
+            for future in as_completed(futures):
+                pid = futures[future]
+                try:
+                    yield pid, future.result()
+                except Exception as e:
+                    print(f"  [UNEXPECTED] ID {pid} 작업 오류: {e}")
+                    yield pid, None
 
 if __name__ == '__main__':
     test_place_ids = ["18967604"]
-    for place_id in test_place_ids:
-        print(f"\n--- 테스트 시작: ID {place_id} ---")
-        intro = crawl_introduction(place_id)
-        if intro:
-            print(f"\n[결과] ID {place_id}\n{intro[:200]}...")
-        else:
-            print(f"\n[결과] ID {place_id}: 실패")
+    started = time.monotonic()
+    with RealtimeIntroCrawler() as crawler:
+        for place_id, intro in crawler.crawl_many(test_place_ids):
+            if intro:
+                print(f"\n[결과] ID {place_id}\n{intro[:200]}...")
+            else:
+                print(f"\n[결과] ID {place_id}: 실패")
+    print(f"\n총 {len(test_place_ids)}곳, {time.monotonic() - started:.1f}초")
@@ -0,0 +1,224 @@
+# task_pool.py - 공용 QThreadPool 작업 프레임워크
+# ===================================================================================
+# 파일명     : task_pool.py
+# 작성자     : 하승주, 홍석원
+# 최초작성일 : 2026-10-18
+# 설명       : 작업마다 QThread 를 띄우는 대신 전역 QThreadPool(APP_MAX_WORKERS, 기본 4)에서
+#              실행하여 동시 실행 수를 제한하고, 실행 중 작업을 한 곳에서 관리
+# ===================================================================================
+#
+# 【주요 기능】
+# - PoolTask: QRunnable 기반 작업 클래스 (Signals(QObject)에 시그널 선언, run_task() 구현)
+#   · self.<시그널> 접근은 self.signals 로 전달되어 기존 QThread 워커 코드 그대로 사용
+#   · start() / stop() / isRunning() / wait() 는 QThread 와 같은 의미
+# - 작업별 cancel_token(CancelToken): stop() 시 취소
+# - task_manager(): active() 작업 목록, tasks_changed(int) 시그널, 종료 시 drain()
+#
+# 【도입 배경】
+# - 17개 시·도 날씨를 한 번에 조회하면 WeatherThread 17개가 동시에 실행됨
+#
+# 【사용처】
+# - weather_tab.py: 날씨/특보 조회, AI 기사 생성 작업
+# - article_generator_app.py: 종료 시 drain()
+#
+# ※ news 앱의 news/src/utils/task_pool.py 와 동일한 동작 (travel 앱은 독립 실행)
+# ===================================================================================
+
+import os
+import time
+import threading
+from typing import List, Optional
+
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+
+from cancel_token import CancelToken
+
+MAX_WORKERS = int(os.getenv("APP_MAX_WORKERS", "4"))
+
+
+class PoolTask(QRunnable):
+    """
+    공용 스레드 풀에서 실행되는 작업 기반 클래스
+    - 하위 클래스: Signals(QObject)에 시그널 선언, run_task()에 작업 본문 구현
+    - 호출부: task.start() / task.stop() / task.isRunning() / task.wait() 는 QThread 와 같은 의미
+    """
+
+    class Signals(QObject):
+        pass
+
+    def __init__(self, name: Optional[str] = None, group: Optional[str] = None):
+        """
+        :param name: 작업 목록에 표시할 이름 (기본: 클래스 이름)
+        :param group: 탭 단위 일괄 취소용 그룹 이름
+        """
+        super().__init__()
+        # 풀이 실행 후 C++ 객체를 지우지 않도록 (호출부가 참조를 계속 들고 있음)
+        self.setAutoDelete(False)
+        self.signals = self.Signals()
+        self.cancel_token = CancelToken()
+        self.name = name or type(self).__name__
+        self.group = group
+        self.state = "created"
+        self.submitted_at = None
+        self.started_at = None
+        self._done = threading.Event()
+
+    def __getattr__(self, item):
+        # 선언된 시그널은 self.signals 에서 찾는다 (self.finished.emit(...) / task.progress.connect(...))
+        signals = self.__dict__.get("signals")
+        if signals is not None and item != "signals":
+            try:
+                return getattr(signals, item)
+            except AttributeError:
+                pass
+        raise AttributeError(f"{type(self).__name__} has no attribute '{item}'")
+
+    # ------------------------------------------------------------------
+    # QThread 호환 인터페이스
+    # ------------------------------------------------------------------
+    def start(self):
+        task_manager().submit(self)
+
+    def stop(self, reason: str = "작업이 취소되었습니다."):
+        self.cancel_token.cancel(reason)
+
+    def requestInterruption(self):
+        self.stop()
+
+    def isInterruptionRequested(self) -> bool:
+        return self.cancel_token.cancelled
+
+    def isRunning(self) -> bool:
+        return self.state in ("queued", "running")
+
+    def isFinished(self) -> bool:
+        return self._done.is_set()
+
+    def wait(self, msecs: Optional[int] = None) -> bool:
+        """
+        :param msecs: 최대 대기 시간(ms). None이면 끝날 때까지
+        :return: 작업이 끝났으면 True
+        """
+        if self.state == "created":
+            return True
+        return self._done.wait(None if msecs is None else msecs / 1000.0)
+
+    # ------------------------------------------------------------------
+    # 실행
+    # ------------------------------------------------------------------
+    def run_task(self):
+        raise NotImplementedError
+
+    def run(self):
+        manager = task_manager()
+        manager._mark_running(self)
+        try:
+            self.run_task()
+        except Exception as e:
+            # 작업 본문에서 처리하지 못한 예외가 풀 스레드를 죽이지 않도록
+            print(f"[작업 풀] {self.name} 처리되지 않은 예외: {e}")
+        finally:
+            self.cancel_token.close()
+            manager._mark_done(self)
+            self._done.set()
+
+
+class TaskManager(QObject):
+    # 실행 + 대기 중인 작업 수
+    tasks_changed = pyqtSignal(int)
+
+    def __init__(self, max_workers: int = MAX_WORKERS):
+        super().__init__()
+        self.pool = QThreadPool()
+        self.pool.setMaxThreadCount(max(1, max_workers))
+        self._lock = threading.Lock()
+        self._tasks: List[PoolTask] = []
+
+    def set_max_workers(self, count: int):
+        self.pool.setMaxThreadCount(max(1, count))
+
+    def submit(self, task: PoolTask) -> PoolTask:
+        with self._lock:
+            task.state = "queued"
+            task.submitted_at = time.monotonic()
+            self._tasks.append(task)
+            count = len(self._tasks)
+        self.pool.start(task)
+        self.tasks_changed.emit(count)
+        return task
+
+    def _mark_running(self, task: PoolTask):
+        with self._lock:
+            task.state = "running"
+            task.started_at = time.monotonic()
+
+    def _mark_done(self, task: PoolTask):
+        with self._lock:
+            task.state = "cancelled" if task.cancel_token.cancelled else "done"
+            try:
+                self._tasks.remove(task)
+            except ValueError:
+                pass
+            count = len(self._tasks)
+        self.tasks_changed.emit(count)
+
+    def active(self) -> List[dict]:
+        """
+        :return: [{"name", "group", "state", "waited", "elapsed"}] (대기/실행 시간은 초)
+        """
+        now = time.monotonic()
+        with self._lock:
+            tasks = list(self._tasks)
+        result = []
+        for task in tasks:
+            started = task.started_at
+            result.append({
+                "name": task.name,
+                "group": task.group,
+                "state": task.state,
+                "waited": round((started or now) - (task.submitted_at or now), 2),
+                "elapsed": round(now - started, 2) if started else 0.0,
+            })
+        return result
+
+    def cancel(self, group: Optional[str] = None, reason: str = "작업이 취소되었습니다."):
+        """
+        그룹(None이면 전체) 작업 취소. 대기 중인 작업도 실행되자마자 취소 상태를 보고 끝난다.
+        """
+        with self._lock:
+            tasks = [t for t in self._tasks if group is None or t.group == group]
+        for task in tasks:
+            task.stop(reason)
+
+    def drain(self, timeout_ms: int = 5000) -> bool:
+        """
+        프로그램 종료 시 호출: 대기 작업 제거 → 실행 중 작업 취소 → 완료 대기
+        :return: 제한 시간 안에 모두 끝났으면 True
+        """
+        self.pool.clear()
+        with self._lock:
+            queued = [t for t in self._tasks if t.state == "queued"]
+            for task in queued:
+                self._tasks.remove(task)
+                task.state = "cancelled"
+                task._done.set()
+        self.cancel(reason="프로그램 종료로 작업을 중단합니다.")
+        finished = self.pool.waitForDone(timeout_ms)
+        if not finished:
+            print(f"[작업 풀] 종료 대기 시간 초과 - 남은 작업: {[t['name'] for t in self.active()]}")
+        return finished
+
+
+_manager: Optional[TaskManager] = None
+_manager_lock = threading.Lock()
+
+
+def task_manager() -> TaskManager:
+    """
+    전역 TaskManager (처음 호출은 메인(GUI) 스레드에서 해야 시그널이 UI 스레드로 전달됨)
+    """
+    global _manager
+    with _manager_lock:
+        if _manager is None:
+            _manager = TaskManager()
+        return _manager
@@ -0,0 +1,18 @@
+# conftest.py - travel 테스트 공통 설정
+# ===================================================================================
+# 파일명     : conftest.py
+# 작성자     : 하승주, 홍석원
+# 최초작성일 : 2026-10-18
+# 설명       : travel 모듈은 평면 import(import db_manager 등)를 사용하므로
+#              테스트 실행 시 travel 디렉터리를 모듈 검색 경로에 추가
+# ===================================================================================
+#
+# 【실행】
+# - 저장소 루트에서: python -m pytest travel/tests
+# ===================================================================================
+import os
+import sys
+
+TRAVEL_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if TRAVEL_DIR not in sys.path:
+    sys.path.insert(0, TRAVEL_DIR)
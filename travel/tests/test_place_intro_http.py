@@ -0,0 +1,80 @@
+# test_place_intro_http.py - 저장 HTML 기반 장소 소개 파서 검증
+# ===================================================================================
+# 파일명     : test_place_intro_http.py
+# 작성자     : 하승주, 홍석원
+# 최초작성일 : 2026-10-18
+# 설명       : tests/fixtures/*.html (m.place.naver.com 정보 페이지 형태)로
+#              parse_place_html / pick_introduction 결과를 네트워크 없이 확인
+# ===================================================================================
+#
+# 【픽스처】
+# - 1234567_apollo_state.html  : __APOLLO_STATE__ 에 해당 장소 + 주변 장소가 함께 있음
+# - 7654321_server_rendered.html : 내장 상태 없이 div.AX_W3 / .place_summary 만 있음
+# - 1111111_other_place.html   : 내장 상태/HTML 모두 다른 장소(2222222)의 값만 있음
+# - 3333333_summary_only.html  : 소개 없이 요약(microReviews)만 있음
+# - 4444444_empty.html         : 소개/요약 모두 없음
+# - 파일명 앞의 숫자가 장소 ID (python place_intro_http.py parse 와 같은 규칙)
+# ===================================================================================
+import os
+
+import pytest
+
+import place_intro_http
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+
+def _load(name):
+    with open(os.path.join(FIXTURE_DIR, name), encoding="utf-8") as f:
+        return f.read()
+
+
+@pytest.mark.parametrize("name, place_id, expected", [
+    ("1234567_apollo_state.html", "1234567", {
+        "introduction": "바다가 보이는 카페입니다.\n루프탑 좌석을 운영합니다.",
+        "summary": "뷰 맛집\n노을 명소",
+    }),
+    ("7654321_server_rendered.html", "7654321", {
+        "introduction": "조용한 숲길 산책로 & 전망대\n주차 가능\n반려동물 동반 가능",
+        "summary": "사계절 명소",
+    }),
+    ("1111111_other_place.html", "1111111", {"introduction": "", "summary": ""}),
+    ("3333333_summary_only.html", "3333333", {"introduction": "", "summary": "가족 나들이 추천"}),
+    ("4444444_empty.html", "4444444", {"introduction": "", "summary": ""}),
+])
+def test_parse_place_html(name, place_id, expected):
+    assert place_intro_http.parse_place_html(_load(name), place_id) == expected
+
+
+def test_other_place_state_is_not_used():
+    # 요청한 장소가 상태에 없으면 주변/추천 장소의 소개를 가져오지 않아야 함 (호출 측이 Selenium으로 대체)
+    fields = place_intro_http.parse_place_html(_load("1111111_other_place.html"), "1111111")
+    assert place_intro_http.pick_introduction(fields) is None
+
+
+def test_parse_without_place_id_scans_whole_state():
+    # ID를 모르면 상태 전체에서 처음 찾은 값을 사용 (CLI parse 에서 파일명에 ID가 없을 때)
+    fields = place_intro_http.parse_place_html(_load("1111111_other_place.html"))
+    assert fields["introduction"] == "요청하지 않은 장소의 소개입니다."
+
+
+def test_pick_introduction_falls_back_to_summary():
+    fields = place_intro_http.parse_place_html(_load("3333333_summary_only.html"), "3333333")
+    assert place_intro_http.pick_introduction(fields) == "가족 나들이 추천"
+
+
+def test_empty_page():
+    assert place_intro_http.parse_place_html("", "1234567") == {"introduction": "", "summary": ""}
+
+
+def test_fetch_introduction_without_summary_fallback(monkeypatch):
+    # crawl_main 경로: 정보 탭 소개가 없으면 요약이 있어도 None (→ Selenium 정보 탭), http 통계도 실패로 기록
+    monkeypatch.setattr(place_intro_http, "fetch_place_html", lambda place_id, timeout=None: _load("3333333_summary_only.html"))
+    place_intro_http.reset_stats()
+    intro, fields = place_intro_http.fetch_introduction("3333333", fallback_summary=False)
+    assert intro is None and fields["summary"] == "가족 나들이 추천"
+    assert place_intro_http.stats()["http"]["success"] == 0
+
+    intro, _ = place_intro_http.fetch_introduction("3333333")
+    assert intro == "가족 나들이 추천"
+    place_intro_http.reset_stats()
@@ -0,0 +1,138 @@
+# test_review_range_filter.py - 리뷰 수 상위 N% 컷 SQL/파이썬 구현 일치 검증
+# ===================================================================================
+# 파일명     : test_review_range_filter.py
+# 작성자     : 하승주, 홍석원
+# 최초작성일 : 2026-10-18
+# 설명       : search_places_by_region(top_fraction) 창 함수 경로와
+#              TravelLogic._apply_review_count_filter 파이썬 경로가 같은 장소를 같은 순서로 반환하는지 확인
+# ===================================================================================
+#
+# 【검증 방법】
+# - 임시 SQLite DB에 고정 시드로 만든 장소(중복 이름/주소, 동점 리뷰 수, 리뷰 태그 없음 포함)를 저장
+# - 같은 필터로 TravelLogic.search_places 를 db_manager.WINDOW_FUNCTIONS = True / False 로 각각 호출
+#   (False 이면 중복 제거 → 리뷰 태그 → _apply_review_count_filter 순서의 파이썬 경로)
+# - 리뷰 범위(상위 10/30/50%, 전체) × 지역/카테고리/리뷰 태그/이름 조합마다 naver_place_id 목록 비교
+# ===================================================================================
+import random
+import sqlite3
+
+import pytest
+
+pytest.importorskip("PyQt5")
+pytest.importorskip("pandas")
+
+import db_manager  # noqa: E402
+from category_utils import normalize_category_for_ui  # noqa: E402
+from travel_logic import TravelLogic  # noqa: E402
+
+pytestmark = pytest.mark.skipif(
+    sqlite3.sqlite_version_info < (3, 25, 0), reason="창 함수 미지원 SQLite"
+)
+
+REVIEW_RANGES = ["상위 10%", "상위 30%", "상위 50%", "전체"]
+REVIEW_CATEGORIES = [
+    "가격/가성비", "맛/음식", "분위기/경관", "시설/청결", "서비스/친절",
+    "활동/경험", "접근성/편의성", "상품/제품", "대상", "아이 관련", "반려동물 관련", "기타"
+]
+RAW_CATEGORIES = ["한식", "카페", "공원", "박물관", "미술관", "호텔", "기타상점"]
+REVIEW_TEXTS = [
+    "가성비가 좋아요", "음식이 맛있어요", "뷰가 좋아요", "매장이 청결해요", "친절해요",
+    "아이와 가기 좋아요", "반려동물과 가기 좋아요", "주차하기 편해요", "사진이 잘 나와요", "특이해요",
+]
+
+# (도/특별시, 시/군/구, 읍/면/동, UI 카테고리, 리뷰 태그, 이름 검색어) 조합
+FILTER_CASES = [
+    ([], [], [], [], [], None),
+    (["서울"], [], [], [], [], None),
+    (["강원", "전북"], ["B군"], [], [], [], None),
+    (["경기도"], ["A시", "C구"], ["가동", "도로명"], [], [], None),
+    ([], [], [], "ui", [], None),
+    ([], [], [], "ui_one", ["맛/음식", "서비스/친절"], None),
+    (["서울", "강원"], [], [], "ui", REVIEW_CATEGORIES, None),
+    ([], ["A시"], ["나동"], [], ["분위기/경관"], None),
+    ([], [], [], [], [], "장소1"),
+    (["서울"], [], [], [], ["기타"], "장소2"),
+]
+
+
+@pytest.fixture(scope="module")
+def db_path(tmp_path_factory):
+    """고정 시드 장소 데이터를 저장한 임시 DB 경로"""
+    path = str(tmp_path_factory.mktemp("travel_db") / "places.db")
+    db_manager.initialize_db(path)
+
+    rng = random.Random(20261018)
+    provinces = ["서울", "강원특별자치도", "전라북도", "경기도"]
+    places = []
+    for i in range(1500):
+        if places and rng.random() < 0.1:
+            # 같은 (이름, 주소) 중복 → 리뷰 수가 가장 많은 1건만 남아야 함
+            base = rng.choice(places)
+            name, address = base["장소명"], base["주소"]
+        else:
+            name = f"장소{rng.randint(0, 1200)}"
+            address = (f"{rng.choice(provinces)} {rng.choice(['A시', 'B군', 'C구'])} "
+                       f"{rng.choice(['가동', '나동', '123', '중앙로'])} {rng.randint(1, 9)}")
+        reviews = ", ".join(rng.sample(REVIEW_TEXTS, rng.randint(0, 3))) if rng.random() < 0.9 else ""
+        places.append({
+            "naver_place_id": str(100000 + i),
+            "장소명": name,
+            "카테고리": rng.choice(RAW_CATEGORIES),
+            "주소": address,
+            # 동점이 많도록 같은 값을 자주 뽑는다
+            "총 방문자 리뷰 수": rng.choice([0, 5, 10, 10, 50, rng.randint(0, 3000)]),
+            "총 블로그 리뷰 수": rng.choice([0, 1, rng.randint(0, 500)]),
+            "소개": "",
+            "키워드": "",
+            "방문자 리뷰": reviews,
+            "검색어": "테스트",
+        })
+
+    conn = db_manager.create_connection(path)
+    db_manager.save_places_to_db(conn, places)
+    conn.close()
+    yield path
+    db_manager.close_read_connections()
+
+
+def _ui_categories(kind):
+    """FILTER_CASES 의 카테고리 표기를 실제 UI 카테고리 목록으로 변환"""
+    ui = sorted({normalize_category_for_ui(c) for c in RAW_CATEGORIES})
+    if kind == "ui":
+        return ui
+    if kind == "ui_one":
+        return ui[:1]
+    return kind
+
+
+@pytest.mark.parametrize("review_range", REVIEW_RANGES)
+@pytest.mark.parametrize("case", FILTER_CASES)
+def test_sql_cut_matches_python_reference(db_path, monkeypatch, review_range, case):
+    provinces, cities, dongs, categories, review_categories, name = case
+    filters = {
+        "provinces": provinces,
+        "cities": cities,
+        "dongs": dongs,
+        "categories": _ui_categories(categories),
+        "review_categories": review_categories,
+        "review_range": review_range,
+        "name": name,
+    }
+    logic = TravelLogic(db_path, {}, None, None)
+
+    monkeypatch.setattr(db_manager, "WINDOW_FUNCTIONS", True)
+    in_sql = logic.search_places(filters)
+    monkeypatch.setattr(db_manager, "WINDOW_FUNCTIONS", False)
+    in_python = logic.search_places(filters)
+
+    assert [p["naver_place_id"] for p in in_sql] == [p["naver_place_id"] for p in in_python]
+
+
+@pytest.mark.parametrize("review_range, fraction", [("상위 10%", 0.1), ("상위 30%", 0.3), ("상위 50%", 0.5)])
+def test_sql_cut_keeps_top_fraction_of_deduplicated(db_path, review_range, fraction):
+    # 중복 제거 후 전체 수 N 에서 max(1, int(N * 비율))개만 남아야 함
+    logic = TravelLogic(db_path, {}, None, None)
+    everything = logic.search_places({"review_range": "전체"})
+    deduplicated = {(p["name"], p["address"]) for p in everything}
+    top = db_manager.search_places_by_region(db_path, top_fraction=fraction)
+    assert len(top) == max(1, int(len(deduplicated) * fraction))
@@ -25,7 +25,7 @@
 # 2. 장소 검색 및 필터링
 #    - search_places(): 다단계 지역 + 카테고리 + 리뷰 필터
 #    - _place_matches_filters(): 정규화 기반 정확한 매칭
-#    - _apply_review_count_filter(): 리뷰 수 상위 N% 필터
+#    - _apply_review_count_filter(): 리뷰 수 상위 N% 필터 (창 함수 미지원 SQLite용 파이썬 구현)
 #
 # 3. 비동기 작업 처리
 #    - start_article_generation(): 크롤링 → 기사 생성 파이프라인
@@ -35,7 +35,7 @@
 # - 카테고리: category_utils.py의 정규화 함수 활용
 # - 리뷰: visitor_reviews_utils.py의 태그 변환 활용
 # - 지역: DB 쿼리 + 파이썬 추가 필터링
-# - 리뷰 수: 상위 10/30/50% 선택 가능
+# - 리뷰 수: 상위 10/30/50% 선택 가능 (DB 창 함수로 컷 → 살아남은 행만 조회)
 #
 # 【워커 스레드】
 # - CrawlerWorker: 선택된 장소들의 실시간 정보 업데이트
@@ -53,9 +53,12 @@ from PyQt5.QtCore import QObject, pyqtSignal, QThread
 
 import db_manager
 import realtime_crawler
+from cancel_token import CancelToken
 from category_utils import normalize_category_for_ui
 from visitor_reviews_utils import normalize_review_for_ui
 
+# 리뷰 수 범위 → 상위 비율 ('전체' 등은 1.0: 중복 제거만)
+_REVIEW_RANGE_FRACTIONS = {"상위 10%": 0.1, "상위 30%": 0.3, "상위 50%": 0.5}
 
 # ----------------------------
 # 내부 유틸리티: 정규화 기반 필터 공용 함수
@@ -74,9 +77,14 @@ def _to_set(value):
 def _extract_place_categories(place: dict) -> set:
     """
     장소의 UI 카테고리 집합을 계산합니다.
+    - 0순위: DB에 저장 시 계산해 둔 ui_category 컬럼
     - 1순위: DB의 category 필드를 정규화
     - 2순위: 1순위가 '기타'일 경우 name, keywords까지 포함하여 재시도
     """
+    stored = place.get("ui_category")
+    if stored:
+        return _to_set(stored)
+
     name = str(place.get("name", "")).strip()
     raw_cat = place.get("category") or place.get("categories") or ""
     keywords = place.get("keywords") or ""
@@ -158,49 +166,91 @@ class CrawlerWorker(QObject):
     progress = pyqtSignal(str)
     finished = pyqtSignal(list)
     error = pyqtSignal(str)
+    stopped = pyqtSignal()
+
+    # 장소 1곳당 크롤링 마감 시간(초) - 멈춘 chromedriver가 전체 작업을 붙잡지 않도록
+    PLACE_TIMEOUT = 90
+
+    # 새로 수집한 소개를 DB에 모아 쓰는 단위 (이 개수마다 한 트랜잭션)
+    DB_FLUSH_EVERY = 10
 
-    def __init__(self, places_to_crawl):
+    def __init__(self, places_to_crawl, db_path=None, ttl_hours=None):
+        """
+        :param db_path: 소개 갱신 시각 조회/저장용 DB 경로 (None이면 DB를 쓰지 않고 항상 크롤링)
+        :param ttl_hours: 이 시간 안에 갱신된 소개는 재크롤링 생략 (None이면 realtime_crawler.INTRO_TTL_HOURS)
+        """
         super().__init__()
         self.places = places_to_crawl
+        self.db_path = db_path
+        self.ttl_hours = realtime_crawler.INTRO_TTL_HOURS if ttl_hours is None else ttl_hours
         self.is_running = True
+        self.cancel_token = CancelToken()
 
     def run(self):
-        updated_places = []
-        total = len(self.places)
-        for i, place in enumerate(self.places):
-            if not self.is_running:
-                self.progress.emit("크롤링 작업이 중단되었습니다.")
-                return
-
-            place_name = place.get("name", "알 수 없는 장소")
+        # ID → 해당 ID를 가진 장소들 (같은 ID가 두 번 선택돼도 한 번만 크롤링)
+        by_id = {}
+        for place in self.places:
             place_id = place.get("naver_place_id")
-            
-            self.progress.emit(f"({i+1}/{total}) '{place_name}' 정보 업데이트 중...")
-
             if not place_id:
-                self.progress.emit(f"'{place_name}'의 네이버 장소 ID가 없어 건너뜁니다.")
-                updated_places.append(place)
+                self.progress.emit(f"'{place.get('name', '알 수 없는 장소')}'의 네이버 장소 ID가 없어 건너뜁니다.")
                 continue
-
-            try:
-                # realtime_crawler.crawl_introduction 함수 호출 (ID는 문자열이어야 함)
-                new_intro = realtime_crawler.crawl_introduction(str(place_id))
-                if new_intro:
-                    place['introduction'] = new_intro  # 'introduction' 키로 소개 정보 업데이트
-                    self.progress.emit(f"'{place_name}' 소개 정보 업데이트 완료.")
-                else:
-                    self.progress.emit(f"'{place_name}'의 최신 소개 정보를 가져오지 못했습니다.")
-                
-                updated_places.append(place)
-
-            except Exception as e:
-                self.error.emit(f"'{place_name}' 크롤링 중 오류 발생: {e}")
-                updated_places.append(place)  # 오류 발생 시에도 목록에 포함
-        
-        self.finished.emit(updated_places)
+            by_id.setdefault(str(place_id), []).append(place)
+
+        # TTL 안에 수집된 소개는 DB 값을 그대로 사용
+        fresh = {}
+        if self.db_path and by_id and self.ttl_hours > 0:
+            fresh = db_manager.get_fresh_introductions(self.db_path, list(by_id), self.ttl_hours * 3600)
+            for place_id, intro in fresh.items():
+                for place in by_id.pop(place_id, []):
+                    place['introduction'] = intro
+            if fresh:
+                self.progress.emit(f"{len(fresh)}곳은 최근 {self.ttl_hours:g}시간 안에 수집한 소개를 사용합니다.")
+
+        pending = []  # DB에 쓸 (ID, 소개)
+        if by_id:
+            self.progress.emit(f"{len(by_id)}곳 소개 정보 동시 수집 시작 (드라이버 {min(realtime_crawler.CRAWL_WORKERS, len(by_id))}개)")
+        done = 0
+        try:
+            # 웜업된 드라이버 여러 개로 동시에 크롤링, 끝나는 순서대로 진행 상황 표시
+            with realtime_crawler.RealtimeIntroCrawler(place_timeout=self.PLACE_TIMEOUT) as crawler:
+                for place_id, new_intro in crawler.crawl_many(list(by_id), cancel_token=self.cancel_token):
+                    done += 1
+                    place_name = by_id[place_id][0].get("name", "알 수 없는 장소")
+                    if not self.is_running:
+                        continue
+                    if new_intro:
+                        for place in by_id[place_id]:
+                            place['introduction'] = new_intro  # 'introduction' 키로 소개 정보 업데이트
+                        pending.append((place_id, new_intro))
+                        if len(pending) >= self.DB_FLUSH_EVERY:
+                            self._flush_introductions(pending)
+                        self.progress.emit(f"({done}/{len(by_id)}) '{place_name}' 소개 정보 업데이트 완료.")
+                    else:
+                        self.progress.emit(f"({done}/{len(by_id)}) '{place_name}'의 최신 소개 정보를 가져오지 못했습니다.")
+        except Exception as e:
+            self.error.emit(f"소개 정보 크롤링 중 오류 발생: {e}")
+        # 중단/오류여도 이미 수집한 소개는 저장
+        self._flush_introductions(pending)
+
+        if not self.is_running:
+            self.progress.emit("크롤링 작업이 중단되었습니다.")
+            self.stopped.emit()
+            return
+
+        # 오류/실패한 장소도 원래 선택 순서대로 목록에 포함
+        self.finished.emit(list(self.places))
+
+    def _flush_introductions(self, pending):
+        """모아 둔 소개를 executemany 한 번으로 DB에 저장하고 목록 비우기"""
+        if not pending:
+            return
+        if self.db_path:
+            db_manager.update_introductions(self.db_path, pending)
+        pending.clear()
 
     def stop(self):
         self.is_running = False
+        self.cancel_token.cancel("크롤링 작업이 중단되었습니다.")
 
 
 class ArticleWorker(QObject):
@@ -263,100 +313,33 @@ class TravelLogic(QObject):
 
     def get_cities_for_provinces(self, provinces):
         """선택된 도/특별시에 속한 시/군/구 목록을 반환"""
-        cities_set = set()
-        target_provinces = provinces if provinces else db_manager.get_province_list(self.db_path)
-        for p in target_provinces:
-            try:
-                for c in db_manager.get_city_list(p, self.db_path):
-                    cities_set.add(c)
-            except Exception:
-                pass
-        return sorted(cities_set)
+        return db_manager.get_cities_for(provinces, self.db_path)
 
     def get_dongs_for_cities(self, provinces, cities):
         """선택된 도/특별시와 시/군/구에 속한 읍/면/동 목록을 반환"""
-        dongs_set = set()
-        target_provinces = provinces if provinces else db_manager.get_province_list(self.db_path)
-
-        if not cities:
-            for p in target_provinces:
-                try:
-                    for c in db_manager.get_city_list(p, self.db_path):
-                        for d in db_manager.get_dong_list(p, c, self.db_path):
-                            dongs_set.add(d)
-                except Exception:
-                    pass
-        else:
-            for p in target_provinces:
-                try:
-                    p_cities = set(db_manager.get_city_list(p, self.db_path))
-                    for c in cities:
-                        if c in p_cities:
-                            for d in db_manager.get_dong_list(p, c, self.db_path):
-                                dongs_set.add(d)
-                except Exception:
-                    pass
-        return sorted(dongs_set)
+        return db_manager.get_dongs_for(provinces, cities, self.db_path)
 
     def build_region_index(self):
         """
         자동완성을 위한 전체 지역 인덱스를 생성하여 반환.
         장소 수 기준으로 정렬하고 광역 단체도 포함하도록 개선.
+        (regions 집계 테이블에서 장소 수 순으로 한 번에 조회)
         """
         region_index = []
         region_map = {}
-        
-        conn = db_manager.create_connection(self.db_path)
-        if not conn:
-            return [], {}
 
-        try:
-            # 모든 주소와 장소 수를 미리 계산
-            address_counts = {}
-            # 1. (도, 시, 동) 레벨 카운트
-            for addr in db_manager._iter_addresses(conn):
-                parts = addr.split()
-                if len(parts) >= 1:
-                    p = db_manager._canon_province(parts[0])
-                    key_p = (p, None, None)
-                    address_counts[key_p] = address_counts.get(key_p, 0) + 1
-                if len(parts) >= 2:
-                    c = parts[1]
-                    key_c = (p, c, None)
-                    address_counts[key_c] = address_counts.get(key_c, 0) + 1
-                if len(parts) >= 3:
-                    d = db_manager._normalize_dong_for_ui(parts[2])
-                    if d and not db_manager._is_numeric_token(d):
-                        key_d = (p, c, d)
-                        address_counts[key_d] = address_counts.get(key_d, 0) + 1
-
-            # 인덱스 데이터 생성
-            for (p, c, d), count in address_counts.items():
-                if c is None and d is None: # 광역
-                    label = p
-                    info = (p, None, None)
-                elif d is None: # 시/군
-                    label = f"{p} > {c}"
-                    info = (p, c, None)
-                else: # 읍/면/동
-                    label = f"{p} > {c} > {d}"
-                    info = (p, c, d)
-                
-                # region_index에 (라벨, 장소 수, 정보) 튜플로 추가
-                region_index.append((label, count, info))
-                region_map[label] = info
-
-            # 장소 수(count) 기준으로 내림차순 정렬
-            region_index.sort(key=lambda x: x[1], reverse=True)
-
-            # 최종 반환 형식에 맞게 변환: (라벨, p, c, d)
-            final_region_index = [(item[0], item[2][0], item[2][1], item[2][2]) for item in region_index]
-
-        finally:
-            if conn:
-                conn.close()
-        
-        return final_region_index, region_map
+        for p, c, d, _count in db_manager.get_region_counts(self.db_path):
+            if c is None and d is None: # 광역
+                label = p
+            elif d is None: # 시/군
+                label = f"{p} > {c}"
+            else: # 읍/면/동
+                label = f"{p} > {c} > {d}"
+            # 최종 반환 형식: (라벨, p, c, d)
+            region_index.append((label, p, c, d))
+            region_map[label] = (p, c, d)
+
+        return region_index, region_map
 
     def search_places(self, filters):
         """필터 조건에 따라 장소를 검색하고 결과를 반환"""
@@ -369,97 +352,35 @@ class TravelLogic(QObject):
         review_range = filters.get("review_range", "상위 50%")
         search_name = filters.get("name")
 
-        filter_by_road_name = "도로명" in sel_dong_raw
-        normal_dongs = sel_dong_raw - {"도로명"}
-
+        top_fraction = _REVIEW_RANGE_FRACTIONS.get(review_range, 1.0)
+        in_db = db_manager.WINDOW_FUNCTIONS
         try:
-            search_city = sel_city[0] if len(sel_city) == 1 else None
-            search_dong = list(normal_dongs)[0] if len(normal_dongs) == 1 and not filter_by_road_name else None
-
-            target_provs = sel_prov_list if sel_prov_list else db_manager.get_province_list(self.db_path)
-            merged = {}
-
-            for pv in target_provs:
-                res = db_manager.search_places_advanced_with_dong(
-                    self.db_path, pv, search_city, search_dong, []
-                )
-                for place in res:
-                    key = (place.get('name',''), place.get('address',''))
-                    merged[key] = place
-
-            places = list(merged.values())
-
-            # 도시 다중 선택 보정
-            if sel_city and len(sel_city) > 1:
-                places = [p for p in places if any(city in (p.get('address', '') or '') for city in sel_city)]
-
-            # 동 필터링 (도로명 포함)
-            if sel_dong_raw:
-                def _get_dong_from_addr(addr):
-                    parts = (addr or "").split()
-                    if len(parts) > 2:
-                        d = parts[2]
-                        # 숫자나 숫자-숫자 형태가 아닌 경우만 동으로 간주
-                        if not (d.isdigit() or ('-' in d and all(c.isdigit() for c in d.split('-')))):
-                            return d
-                    return None
-
-                def _is_road_name(dong_part):
-                    road_suffixes = ("길", "로", "대로", "가로", "거리")
-                    return any(dong_part.endswith(s) for s in road_suffixes)
-
-                final_places = []
-                for place in places:
-                    address = place.get('address', '') or ''
-                    matched = False
-
-                    # 일반 동 이름 매칭
-                    if normal_dongs:
-                        if any(d in address for d in normal_dongs):
-                            final_places.append(place)
-                            matched = True
-                    
-                    # 도로명 매칭
-                    if not matched and filter_by_road_name:
-                        dong_part = _get_dong_from_addr(address)
-                        if dong_part and _is_road_name(dong_part):
-                            final_places.append(place)
-                
-                places = final_places
-
+            # 지역(다중 선택)/카테고리/리뷰 태그/이름 조건 + (이름, 주소) 중복 제거 + 리뷰 수 상위 N% 컷을
+            # DB에서 한 번에 처리 (창 함수) → 살아남은 행만 받아온다
+            name_terms = [t.strip() for t in search_name.split(',')] if search_name else None
+            places = db_manager.search_places_by_region(
+                self.db_path, sel_prov_list, sel_city, sorted(sel_dong_raw), sel_cats, name_terms,
+                review_tags=sorted(sel_review_cats) if in_db else None,
+                top_fraction=top_fraction if in_db else None,
+            )
         except Exception as e:
             print(f"검색 오류: {e}")
             places = []
 
-        if search_name:
-            search_terms = [term.strip().lower() for term in search_name.split(',')]
-            places = [
-                p for p in places 
-                if any(
-                    term in (p.get('name', '') or '').lower() or 
-                    term in (p.get('category', '') or '').lower() 
-                    for term in search_terms
-                )
-            ]
-
-        # ----------------------
-        # 파이썬 측 정규화 필터링
-        # ----------------------
-        sel_ui_cat_set = set(sel_cats)
-        if sel_ui_cat_set or sel_review_cats:
-            filtered = []
+        if not in_db:
+            # 창 함수 미지원 SQLite: 중복 제거 → 리뷰 태그 → 상위 N% 컷을 파이썬에서 (DB 경로와 같은 순서)
+            merged = {}
             for place in places:
-                if _place_matches_filters(place, sel_ui_cat_set, sel_review_cats):
-                    filtered.append(place)
-            places = filtered
-
-        # 리뷰 수(방문+블로그) 비중 필터
-        places = self._apply_review_count_filter(places, review_range)
+                key = (place.get('name',''), place.get('address',''))
+                merged.setdefault(key, place)
+            places = list(merged.values())
+            if sel_review_cats:
+                places = [p for p in places if _place_matches_filters(p, set(), sel_review_cats)]
+            places = self._apply_review_count_filter(places, review_range)
         return places
 
-
     def _apply_review_count_filter(self, places, review_range="상위 50%"):
-        """리뷰 수 기준으로 필터를 적용"""
+        """리뷰 수 기준으로 필터를 적용 (창 함수 미지원 SQLite용 / search_places_by_region(top_fraction) 기준 구현)"""
         if not places or review_range == "전체":
             return places
         
@@ -493,7 +414,7 @@ class TravelLogic(QObject):
         self.crawling_progress.emit("실시간 정보 수집 스레드를 시작합니다...")
         
         self.crawler_thread = QThread()
-        self.crawler_worker = CrawlerWorker(selected_places)
+        self.crawler_worker = CrawlerWorker(selected_places, db_path=self.db_path)
         self.crawler_worker.moveToThread(self.crawler_thread)
 
         # 시그널 연결
@@ -511,6 +432,8 @@ class TravelLogic(QObject):
         # 스레드 및 워커 자동 정리
         self.crawler_worker.finished.connect(self.crawler_thread.quit)
         self.crawler_worker.finished.connect(self.crawler_worker.deleteLater)
+        self.crawler_worker.stopped.connect(self.crawler_thread.quit)
+        self.crawler_worker.stopped.connect(self.crawler_worker.deleteLater)
         self.crawler_thread.finished.connect(self.crawler_thread.deleteLater)
 
         self.crawler_thread.start()
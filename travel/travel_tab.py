@@ -21,7 +21,7 @@
 # 【핵심 기능】
 # - 계층적 필터: 도 선택 → 시 목록 업데이트 → 동 목록 업데이트
 # - 지역 검색: "강원 > 강릉시 > 교동" 형태 자동완성
-# - 테이블 관리: 체크박스 선택, 정렬, 선택 항목 상단 이동
+# - 테이블 관리: 체크박스 선택(장소 ID 집합), 프록시 정렬, 선택 항목 상단 이동
 # - 랜덤 선택: 지정된 개수만큼 무작위 장소 선택
 #
 # 【이벤트 처리】
@@ -48,8 +48,7 @@
 # - article_generator_app.py: 메인 앱에서 탭으로 사용
 # ===================================================================================
 
-from PyQt5.QtWidgets import (QWidget, QMessageBox, QTableWidgetItem, QCheckBox,
-                             QHBoxLayout, QTextEdit, QApplication)
+from PyQt5.QtWidgets import QWidget, QMessageBox, QApplication
 from PyQt5.QtGui import QStandardItem
 from PyQt5.QtCore import Qt, QTimer
 from PyQt5.QtGui import QStandardItemModel
@@ -59,7 +58,10 @@ from travel_ui import Ui_TravelTab
 from travel_logic import TravelLogic
 
 # 유틸리티 및 기존 의존성 import
-from ui_components import IntItem
+from ui_components import PlaceTableModel
+
+# 테이블에 표시할 최대 결과 수 (모델/뷰는 보이는 행만 그리므로 넉넉하게)
+MAX_TABLE_ROWS = 10000
 
 PROV_CANON = {
     "서울": "서울특별시", "부산": "부산광역시", "대구": "대구광역시", "인천": "인천광역시",
@@ -151,6 +153,9 @@ class TravelTabWidget(QWidget):
         self.generate_button.clicked.connect(self.generate_article)
         self.random_button.clicked.connect(self.random_select_and_generate)
 
+        # 테이블 체크 상태 → 선택 개수 표시
+        self.place_model.checked_changed.connect(self._update_selected_count)
+
         # 로직 시그널
         self.logic.crawling_progress.connect(self._update_progress_text)
         self.logic.crawling_error.connect(self._on_crawling_error)
@@ -269,11 +274,11 @@ class TravelTabWidget(QWidget):
         # 검색 결과가 없을 때만 메시지 박스 표시 (초기 로드 제외)
         if not places and any(filters.values()):
             QMessageBox.information(self, "검색 결과", "조건에 맞는 장소를 찾을 수 없습니다.")
-            self.place_table_widget.setRowCount(0)
+            self.place_model.clear()
         else:
-            if len(places) > 1000:
-                QMessageBox.information(self, "결과 제한", f"검색 결과가 {len(places):,}개로 많아 상위 1,000개만 표시합니다.")
-                places = places[:1000]
+            if len(places) > MAX_TABLE_ROWS:
+                QMessageBox.information(self, "결과 제한", f"검색 결과가 {len(places):,}개로 많아 상위 {MAX_TABLE_ROWS:,}개만 표시합니다.")
+                places = places[:MAX_TABLE_ROWS]
             self._populate_table(places)
 
         self.search_button.setText("필터 적용")
@@ -288,77 +293,17 @@ class TravelTabWidget(QWidget):
 
 
     def _populate_table(self, places):
-        # If called from _move_checked_to_top, the list is already sorted.
-        # We can detect this by checking for the temporary key.
-        is_resorting = places and places[0].get('_is_checked') is not None
-
-        if not is_resorting:
-            sort_by = self.sort_combo.currentText()
-            if sort_by == '인기 순':
-                places.sort(key=lambda x: (x.get('total_visitor_reviews_count', 0) or 0) + (x.get('total_blog_reviews_count', 0) or 0), reverse=True)
-            elif sort_by == '이름 순':
-                places.sort(key=lambda x: x.get('name', ''))
-            elif sort_by == '주소 순':
-                def get_parts(addr):
-                    parts = (addr or '').split()
-                    return (parts[0] if len(parts)>0 else '',
-                            parts[1] if len(parts)>1 else '',
-                            ' '.join(parts[2:]) if len(parts)>2 else '')
-                places.sort(key=lambda x: get_parts(x.get('address','')))
-
-        self.place_table_widget.setSortingEnabled(False)
-        self.place_table_widget.setRowCount(len(places))
-        for i, place in enumerate(places):
-            checkbox_widget = QWidget()
-            layout = QHBoxLayout(checkbox_widget)
-            cb = QCheckBox()
-            if place.get('_is_checked', False):
-                cb.setChecked(True)
-            cb.stateChanged.connect(self._update_selected_count)
-            layout.addWidget(cb)
-            layout.setAlignment(Qt.AlignCenter)
-            layout.setContentsMargins(0,0,0,0)
-            self.place_table_widget.setCellWidget(i, 0, checkbox_widget)
-
-            self.place_table_widget.setItem(i, 1, QTableWidgetItem(place.get('name','')))
-            self.place_table_widget.setItem(i, 2, QTableWidgetItem(place.get('category','')))
-            self.place_table_widget.setItem(i, 3, QTableWidgetItem(place.get('address','')))
-            self.place_table_widget.setItem(i, 4, QTableWidgetItem(place.get('keywords','N/A')))
-
-            v = place.get('total_visitor_reviews_count', 0) or 0
-            b = place.get('total_blog_reviews_count', 0) or 0
-            try:
-                total_reviews = int(v) + int(b)
-            except Exception:
-                total_reviews = 0
-
-            item_total = IntItem(total_reviews)
-            item_total.setText(f"{total_reviews:,}")
-            item_total.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-            item_total.setToolTip(f"이용자: {v:,} / 블로그: {b:,}")
-            self.place_table_widget.setItem(i, 5, item_total)
-
-            self.place_table_widget.setItem(i, 6, QTableWidgetItem(place.get('visitor_reviews', '')))
-            intro = QTextEdit(); intro.setReadOnly(True); intro.setText(place.get('introduction', ''))
-            self.place_table_widget.setCellWidget(i, 7, intro)
-
-            self.place_table_widget.setItem(i, 8, QTableWidgetItem("0"))
-            
-            self.place_table_widget.setItem(i, 9, QTableWidgetItem(str(place.get('naver_place_id', ''))))
-
-        if is_resorting:
-            self.place_table_widget.setSortingEnabled(False)
-        else:
-            self.place_table_widget.setSortingEnabled(True)
-            current_sort = self.sort_combo.currentText()
-            if current_sort == '인기 순':
-                self.place_table_widget.sortByColumn(5, Qt.DescendingOrder)
-            elif current_sort == '이름 순':
-                self.place_table_widget.sortByColumn(1, Qt.AscendingOrder)
-            elif current_sort == '주소 순':
-                self.place_table_widget.sortByColumn(3, Qt.AscendingOrder)
-
-        self._update_selected_count()
+        """검색 결과를 모델에 넣고 정렬 옵션에 맞춰 프록시 정렬 (행 위젯 생성 없음)"""
+        self.place_model.set_places(places)
+        self.place_table_widget.setSortingEnabled(True)
+        current_sort = self.sort_combo.currentText()
+        if current_sort == '인기 순':
+            self.place_table_widget.sortByColumn(PlaceTableModel.COL_REVIEWS, Qt.DescendingOrder)
+        elif current_sort == '이름 순':
+            self.place_table_widget.sortByColumn(PlaceTableModel.COL_NAME, Qt.AscendingOrder)
+        elif current_sort == '주소 순':
+            self.place_table_widget.sortByColumn(PlaceTableModel.COL_ADDRESS, Qt.AscendingOrder)
+        self.place_table_widget.scrollToTop()
 
     def reset_filters(self):
         # ... (UI 초기화 로직) ...
@@ -369,7 +314,7 @@ class TravelTabWidget(QWidget):
         self.review_category_combo.check_all()
         self.review_range_combo.setCurrentText("상위 50%")
         self.sort_combo.setCurrentIndex(0)
-        self.place_table_widget.setRowCount(0)
+        self.place_model.clear()
 
     def generate_article(self):
         self._move_checked_to_top()
@@ -391,31 +336,16 @@ class TravelTabWidget(QWidget):
     def random_select_and_generate(self):
         import random
 
-        total_rows = self.place_table_widget.rowCount()
+        total_rows = self.place_model.rowCount()
         if total_rows == 0:
             QMessageBox.information(self, "알림", "먼저 장소를 검색해주세요.")
             return
 
-        # 모든 체크박스 해제
-        for i in range(total_rows):
-            cb = self.place_table_widget.cellWidget(i, 0).findChild(QCheckBox)
-            if cb:
-                cb.setChecked(False)
-
-        # 현재 테이블의 모든 장소 데이터 수집
-        all_places = []
-        for i in range(total_rows):
-            review_item = self.place_table_widget.item(i, 5)
-            if isinstance(review_item, IntItem):
-                total_reviews = review_item.data(Qt.UserRole) or 0
-            else:
-                total_reviews = 0
-            
-            place_data = {
-                'index': i,
-                'total_reviews': total_reviews
-            }
-            all_places.append(place_data)
+        # 모든 체크 해제
+        self.place_model.clear_checked()
+
+        # 현재 테이블의 모든 장소 (모델 행 번호, 리뷰 수)
+        all_places = [{'index': i, 'total_reviews': self.place_model.total_reviews_at(i)} for i in range(total_rows)]
 
         # 리뷰 수 기준으로 정렬 (내림차순)
         all_places.sort(key=lambda x: x['total_reviews'], reverse=True)
@@ -440,11 +370,8 @@ class TravelTabWidget(QWidget):
         # 후보 장소들 중에서 랜덤 선택
         selected_places = random.sample(candidate_places, num_to_select)
         
-        # 선택된 장소들의 체크박스 체크
-        for place in selected_places:
-            cb = self.place_table_widget.cellWidget(place['index'], 0).findChild(QCheckBox)
-            if cb:
-                cb.setChecked(True)
+        # 선택된 장소들 체크
+        self.place_model.set_checked_rows([place['index'] for place in selected_places])
         
         print(f"랜덤 선택: 리뷰 수 {selection_range}에서 {num_to_select}개 장소 선택")
         
@@ -452,43 +379,19 @@ class TravelTabWidget(QWidget):
         self.generate_article()
 
     def _get_selected_places_from_table(self):
-        selected_places = []
-        for i in range(self.place_table_widget.rowCount()):
-            cb = self.place_table_widget.cellWidget(i, 0).findChild(QCheckBox)
-            if cb and cb.isChecked():
-                name_item = self.place_table_widget.item(i, 1)
-                cat_item = self.place_table_widget.item(i, 2)
-                addr_item = self.place_table_widget.item(i, 3)
-                keyw_item = self.place_table_widget.item(i, 4)
-                vr_item = self.place_table_widget.item(i, 6)
-                intro_w = self.place_table_widget.cellWidget(i, 7)
-                id_item = self.place_table_widget.item(i, 9)
-
-                place_data = {
-                    'name': name_item.text() if name_item else '',
-                    'category': cat_item.text() if cat_item else '',
-                    'address': addr_item.text() if addr_item else '',
-                    'keywords': keyw_item.text() if keyw_item else 'N/A',
-                    'visitor_reviews': vr_item.text() if vr_item else '',
-                    'introduction': intro_w.toPlainText() if intro_w else '',
-                    'naver_place_id': id_item.text() if id_item else None
-                }
-                selected_places.append(place_data)
-        return selected_places
-
-    def _update_selected_count(self):
-        count = 0
-        for i in range(self.place_table_widget.rowCount()):
-            cb = self.place_table_widget.cellWidget(i, 0).findChild(QCheckBox)
-            if cb and cb.isChecked():
-                count += 1
-        self.selected_count_label.setText(f"선택: {count}")
+        """체크된 장소를 화면 순서대로 반환"""
+        return self.place_model.checked_places(self.place_proxy.source_rows())
+
+    def _update_selected_count(self, *_):
+        self.selected_count_label.setText(f"선택: {self.place_model.checked_count()}")
 
     def _update_progress_text(self, text):
+        self.progress_log.append(text)
         if self.progress_dialog:
             self.progress_dialog.setInformativeText(text)
 
     def _on_crawling_error(self, error_message):
+        self.progress_log.append(f"❌ {error_message}")
         if self.progress_dialog: self.progress_dialog.close()
         QMessageBox.critical(self, "크롤링 오류", error_message)
 
@@ -498,6 +401,7 @@ class TravelTabWidget(QWidget):
         self.result_text_edit.setText(article)
 
     def _on_article_error(self, error_message):
+        self.progress_log.append(f"❌ 기사 생성 오류: {error_message}")
         if self.progress_dialog: self.progress_dialog.close()
         self.result_text_edit.setText(f"기사 생성 오류: {error_message}")
 
@@ -546,48 +450,11 @@ class TravelTabWidget(QWidget):
         return q
 
     def _move_checked_to_top(self):
-        checked_rows_data = []
-        unchecked_rows_data = []
-
-        for i in range(self.place_table_widget.rowCount()):
-            cb = self.place_table_widget.cellWidget(i, 0).findChild(QCheckBox)
-            is_checked = cb and cb.isChecked()
-            
-            row_data = {
-                '_is_checked': is_checked, # 임시 정렬 키
-                'name': self.place_table_widget.item(i, 1).text() if self.place_table_widget.item(i, 1) else '',
-                'category': self.place_table_widget.item(i, 2).text() if self.place_table_widget.item(i, 2) else '',
-                'address': self.place_table_widget.item(i, 3).text() if self.place_table_widget.item(i, 3) else '',
-                'keywords': self.place_table_widget.item(i, 4).text() if self.place_table_widget.item(i, 4) else 'N/A',
-                'total_visitor_reviews_count': self.place_table_widget.item(i, 5).data(Qt.UserRole) if self.place_table_widget.item(i, 5) else 0,
-                'visitor_reviews': self.place_table_widget.item(i, 6).text() if self.place_table_widget.item(i, 6) else '',
-                'introduction': self.place_table_widget.cellWidget(i, 7).toPlainText() if self.place_table_widget.cellWidget(i, 7) else '',
-                'naver_place_id': self.place_table_widget.item(i, 9).text() if self.place_table_widget.item(i, 9) else ''
-            }
-            # IntItem에서 리뷰 수를 가져오기 위한 추가 처리
-            review_item = self.place_table_widget.item(i, 5)
-            if isinstance(review_item, IntItem):
-                row_data['total_visitor_reviews_count'] = review_item.data(Qt.UserRole)
-                # 툴팁에서 블로그 리뷰 수 파싱 (선택적)
-                tooltip = review_item.toolTip()
-                try:
-                    v_str, b_str = tooltip.split('/')
-                    row_data['total_blog_reviews_count'] = int(''.join(filter(str.isdigit, b_str)))
-                except:
-                    row_data['total_blog_reviews_count'] = 0
-            else: # Fallback
-                row_data['total_visitor_reviews_count'] = 0
-                row_data['total_blog_reviews_count'] = 0
-
-
-            if is_checked:
-                checked_rows_data.append(row_data)
-            else:
-                unchecked_rows_data.append(row_data)
-
-        # 정렬된 순서대로 다시 채우기
-        sorted_places = checked_rows_data + unchecked_rows_data
-        self._populate_table(sorted_places)
+        # 현재 화면 순서를 유지한 채 체크된 장소를 위로 모으고, 그 순서 그대로 보이도록 정렬 해제
+        rows = self.place_proxy.source_rows()
+        self.place_table_widget.setSortingEnabled(False)
+        self.place_proxy.sort(-1)
+        self.place_model.move_checked_to_top(rows)
 
 # 기존의 QWidget을 상속받는 클래스 이름은 그대로 유지하여
 # article_generator_app.py에서 수정 없이 바로 사용 가능하도록 함.
@@ -26,12 +26,13 @@
 #    - 제목 입력, 날씨 포함 옵션
 #    - 랜덤 선택, 선택 장소 기사 생성 버튼
 #    - 선택 개수 표시
+#    - 정보 수집 진행 로그 (LogView: 링 버퍼 + 묶음 갱신)
 #    - 생성된 기사 텍스트 표시 영역
 #
 # 【위젯 설정】
 # - CheckableComboBox: 다중 선택 가능한 콤보박스
 # - SelectAllCheckableComboBox: 전체 선택/해제 헤더 있는 콤보박스
-# - QTableWidget: 장소 목록 표시용 테이블
+# - QTableView + PlaceTableModel: 장소 목록 표시용 테이블 (보이는 행만 그림)
 # - QCompleter: 지역명 자동완성
 # - QTextEdit: 기사 결과 표시
 #
@@ -52,10 +53,11 @@
 
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QComboBox, QPushButton,
                              QLineEdit, QLabel, QCheckBox, QTextEdit, QCompleter,
-                             QTableWidget)
+                             QTableView)
 from PyQt5.QtCore import Qt
 
 from ui_components import CheckableComboBox, SelectAllCheckableComboBox, setup_place_table
+from log_view import LogView
 
 class Ui_TravelTab:
     """
@@ -145,8 +147,8 @@ class Ui_TravelTab:
         filter_layout.addLayout(filters_row_layout)
 
         # --- 장소 목록 ---
-        TravelTabWidget.place_table_widget = QTableWidget()
-        setup_place_table(TravelTabWidget.place_table_widget)
+        TravelTabWidget.place_table_widget = QTableView()
+        TravelTabWidget.place_model, TravelTabWidget.place_proxy = setup_place_table(TravelTabWidget.place_table_widget)
         list_layout.addWidget(TravelTabWidget.place_table_widget)
 
         # --- 하단 컨트롤 ---
@@ -171,7 +173,11 @@ class Ui_TravelTab:
         TravelTabWidget.result_text_edit = QTextEdit()
         TravelTabWidget.result_text_edit.setReadOnly(True)
 
+        # 실시간 정보 수집(크롤링) 진행 로그
+        TravelTabWidget.progress_log = LogView(title="정보 수집 로그", min_height=80)
+
         bottom_layout.addLayout(article_control_layout)
+        bottom_layout.addWidget(TravelTabWidget.progress_log)
         bottom_layout.addWidget(QLabel("--- 생성된 기사 ---"))
         bottom_layout.addWidget(TravelTabWidget.result_text_edit)
 
@@ -29,15 +29,20 @@
 #    - 헤더 클릭으로 모든 항목 토글 가능
 #    - 카테고리, 리뷰 카테고리 선택에 사용
 #
+# 4. PlaceTableModel / PlaceSortProxyModel (QAbstractTableModel / QSortFilterProxyModel)
+#    - 장소 검색 결과를 행마다 위젯 없이 모델 데이터로만 보관 → 화면에 보이는 행만 그림
+#    - 0열 체크박스는 CheckStateRole, 선택 상태는 장소 ID 집합으로 관리 (정렬/재배치해도 유지)
+#    - 정렬은 프록시가 SORT_ROLE(리뷰수는 정수, 나머지는 문자열) 기준으로 수행
+#
 # 【기능 세부사항】
 # - 동적 텍스트 업데이트: 선택 상태 변경 시 즉시 표시 텍스트 갱신
 # - 팝업 크기 조정: 항목 텍스트 길이에 따라 드롭다운 폭 자동 조정
 # - 상태 관리: checked_items(), set_checked() 등 편의 메서드 제공
 #
 # 【테이블 설정 함수】
-# - setup_place_table(): 장소 검색 결과 테이블 초기 설정
-#   * 컬럼 구성, 크기 조정, 정렬 활성화
-#   * 가로 스크롤, 행 높이 자동 조정
+# - setup_place_table(): 장소 검색 결과 테이블(QTableView) 초기 설정
+#   * 모델/프록시 연결, 컬럼 크기 조정, 정렬 활성화
+#   * 가로 스크롤, 고정 행 높이 (내용 기준 자동 높이는 전체 행을 측정하므로 사용 안 함)
 #   * 편집 금지, 워드랩 활성화
 #
 # 【사용처】
@@ -48,7 +53,7 @@
 
 from PyQt5.QtWidgets import (QComboBox, QCheckBox, QTableWidget, QTableWidgetItem, 
                              QWidget, QVBoxLayout, QHBoxLayout, QListView, QHeaderView, QAbstractItemView)
-from PyQt5.QtCore import Qt, QTimer
+from PyQt5.QtCore import Qt, QTimer, QAbstractTableModel, QModelIndex, QSortFilterProxyModel, pyqtSignal
 from PyQt5.QtGui import QStandardItemModel, QStandardItem
 
 class IntItem(QTableWidgetItem):
@@ -223,37 +228,250 @@ class SelectAllCheckableComboBox(CheckableComboBox):
         self._update_text()
 
 
-def setup_place_table(table_widget):
-    """장소 테이블 초기 설정"""
-    table_widget.setColumnCount(10)
-    table_widget.setHorizontalHeaderLabels(["", "장소명", "카테고리", "주소", "키워드", "이 리뷰수", "리뷰 요약", "소개", "sel", "id"])
-    table_widget.setColumnHidden(8, True)
-    table_widget.setColumnHidden(9, True) # id 컬럼 숨기기
-    table_widget.setSortingEnabled(True)
+def _total_reviews(place):
+    v = place.get('total_visitor_reviews_count', 0) or 0
+    b = place.get('total_blog_reviews_count', 0) or 0
+    try:
+        return int(v) + int(b), int(v), int(b)
+    except Exception:
+        return 0, 0, 0
+
+
+def place_key(place):
+    """체크 상태 집합에 쓰는 장소 식별자 (ID가 없으면 이름+주소)"""
+    pid = place.get('naver_place_id')
+    if pid not in (None, ''):
+        return str(pid)
+    return (place.get('name', ''), place.get('address', ''))
+
+
+class PlaceTableModel(QAbstractTableModel):
+    """
+    장소 검색 결과 테이블 모델
+    - 데이터는 장소 dict 목록 그대로 보관하고 data()에서 필요한 칸만 문자열로 만든다
+    - 체크 상태는 place_key 집합 (행 위젯/체크박스 객체 없음)
+    """
+    HEADERS = ["", "장소명", "카테고리", "주소", "키워드", "이 리뷰수", "리뷰 요약", "소개"]
+    COL_CHECK, COL_NAME, COL_CATEGORY, COL_ADDRESS, COL_KEYWORDS, COL_REVIEWS, COL_VISITOR_REVIEWS, COL_INTRO = range(8)
+    SORT_ROLE = Qt.UserRole
+    # 셀에 표시할 최대 글자 수 (전체 내용은 툴팁)
+    _CELL_TEXT_LIMIT = 300
 
-    header = table_widget.horizontalHeader()
-    header.setSectionResizeMode(0, QHeaderView.ResizeToContents)
+    # 체크된 장소 수
+    checked_changed = pyqtSignal(int)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._places = []
+        self._totals = []
+        self._checked = set()
+
+    # --- Qt 모델 인터페이스 ---
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._places)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole and 0 <= section < len(self.HEADERS):
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        flags = Qt.ItemIsEnabled | Qt.ItemIsSelectable
+        if index.column() == self.COL_CHECK:
+            flags |= Qt.ItemIsUserCheckable
+        return flags
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        place = self._places[index.row()]
+        col = index.column()
+
+        if col == self.COL_CHECK:
+            checked = place_key(place) in self._checked
+            if role == Qt.CheckStateRole:
+                return Qt.Checked if checked else Qt.Unchecked
+            if role == self.SORT_ROLE:
+                return 1 if checked else 0
+            return None
+
+        if col == self.COL_REVIEWS:
+            total, v, b = self._totals[index.row()]
+            if role == Qt.DisplayRole:
+                return f"{total:,}"
+            if role == self.SORT_ROLE:
+                return total
+            if role == Qt.ToolTipRole:
+                return f"이용자: {v:,} / 블로그: {b:,}"
+            if role == Qt.TextAlignmentRole:
+                return int(Qt.AlignRight | Qt.AlignVCenter)
+            return None
+
+        text = self._text(place, col)
+        if role == Qt.DisplayRole:
+            return text if len(text) <= self._CELL_TEXT_LIMIT else text[:self._CELL_TEXT_LIMIT] + "…"
+        if role == self.SORT_ROLE:
+            return text
+        if role == Qt.ToolTipRole and col in (self.COL_KEYWORDS, self.COL_VISITOR_REVIEWS, self.COL_INTRO) and text:
+            return text
+        return None
+
+    def setData(self, index, value, role=Qt.EditRole):
+        if not index.isValid() or index.column() != self.COL_CHECK or role != Qt.CheckStateRole:
+            return False
+        key = place_key(self._places[index.row()])
+        if value == Qt.Checked:
+            self._checked.add(key)
+        else:
+            self._checked.discard(key)
+        self.dataChanged.emit(index, index, [Qt.CheckStateRole])
+        self.checked_changed.emit(len(self._checked))
+        return True
+
+    def _text(self, place, col):
+        if col == self.COL_NAME:
+            return place.get('name', '') or ''
+        if col == self.COL_CATEGORY:
+            return place.get('category', '') or ''
+        if col == self.COL_ADDRESS:
+            return place.get('address', '') or ''
+        if col == self.COL_KEYWORDS:
+            return place.get('keywords', 'N/A') or ''
+        if col == self.COL_VISITOR_REVIEWS:
+            return place.get('visitor_reviews', '') or ''
+        if col == self.COL_INTRO:
+            return place.get('introduction', '') or ''
+        return ''
+
+    # --- 데이터 / 선택 관리 ---
+    def set_places(self, places):
+        """결과 목록 교체 (체크 상태 초기화)"""
+        self.beginResetModel()
+        self._places = list(places or [])
+        self._totals = [_total_reviews(p) for p in self._places]
+        self._checked = set()
+        self.endResetModel()
+        self.checked_changed.emit(0)
+
+    def clear(self):
+        self.set_places([])
+
+    def place_at(self, row):
+        return self._places[row]
+
+    def total_reviews_at(self, row):
+        return self._totals[row][0]
+
+    def is_checked(self, row):
+        return place_key(self._places[row]) in self._checked
+
+    def checked_count(self):
+        return len(self._checked)
+
+    def set_checked_rows(self, rows, checked=True):
+        """여러 행의 체크 상태를 한 번에 변경 (dataChanged 한 번)"""
+        for row in rows:
+            key = place_key(self._places[row])
+            if checked:
+                self._checked.add(key)
+            else:
+                self._checked.discard(key)
+        self._emit_check_column_changed()
+
+    def clear_checked(self):
+        self._checked = set()
+        self._emit_check_column_changed()
+
+    def _emit_check_column_changed(self):
+        if self._places:
+            self.dataChanged.emit(self.index(0, self.COL_CHECK),
+                                  self.index(len(self._places) - 1, self.COL_CHECK),
+                                  [Qt.CheckStateRole])
+        self.checked_changed.emit(len(self._checked))
+
+    def checked_places(self, rows=None):
+        """
+        체크된 장소 dict 사본 목록
+        :param rows: 결과 순서로 쓸 모델 행 순서 (None이면 모델 순서)
+        """
+        order = range(len(self._places)) if rows is None else rows
+        return [dict(self._places[r]) for r in order if place_key(self._places[r]) in self._checked]
+
+    def move_checked_to_top(self, rows):
+        """
+        주어진 행 순서(화면 순서)를 유지한 채 체크된 장소를 앞으로 모은다
+        :param rows: 모델 행 번호 목록 (화면에 보이는 순서)
+        """
+        checked = [self._places[r] for r in rows if self.is_checked(r)]
+        unchecked = [self._places[r] for r in rows if not self.is_checked(r)]
+        self.beginResetModel()
+        self._places = checked + unchecked
+        self._totals = [_total_reviews(p) for p in self._places]
+        self.endResetModel()
+
+
+class PlaceSortProxyModel(QSortFilterProxyModel):
+    """PlaceTableModel.SORT_ROLE 기준 정렬 프록시 (리뷰수는 숫자로 비교)"""
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setSortRole(PlaceTableModel.SORT_ROLE)
+
+    def source_rows(self):
+        """화면에 보이는 순서대로 원본 모델 행 번호"""
+        return [self.mapToSource(self.index(r, 0)).row() for r in range(self.rowCount())]
+
+
+def setup_place_table(table_view, model=None, proxy=None):
+    """
+    장소 테이블(QTableView) 초기 설정
+    :param model: PlaceTableModel (None이면 생성)
+    :param proxy: PlaceSortProxyModel (None이면 생성)
+    :return: (model, proxy)
+    """
+    if model is None:
+        model = PlaceTableModel(table_view)
+    if proxy is None:
+        proxy = PlaceSortProxyModel(table_view)
+    proxy.setSourceModel(model)
+    table_view.setModel(proxy)
+    table_view.setSortingEnabled(True)
+    table_view.setSelectionBehavior(QAbstractItemView.SelectRows)
+
+    header = table_view.horizontalHeader()
+    # 0(체크), 5(리뷰수): 내용 기준 폭은 행을 훑어 측정하므로 고정 폭 사용
+    header.setSectionResizeMode(0, QHeaderView.Fixed)
     # 1~4: 인터랙티브(수동폭 조절)
     for col in (1, 2, 3, 4):
         header.setSectionResizeMode(col, QHeaderView.Interactive)
-    # 5: 이 리뷰수는 내용 크기에 맞춤
-    header.setSectionResizeMode(5, QHeaderView.ResizeToContents)
+    header.setSectionResizeMode(5, QHeaderView.Interactive)
     # 6,7: 리뷰요약/소개도 인터랙티브로 (가로 스크롤 사용)
     header.setSectionResizeMode(6, QHeaderView.Interactive)
     header.setSectionResizeMode(7, QHeaderView.Interactive)
 
     # ✅ 마지막 열 늘려 채우기 끄기 + 가로 스크롤 켜기
     header.setStretchLastSection(False)
-    table_widget.setHorizontalScrollBarPolicy(Qt.ScrollBarAsNeeded)
-    table_widget.setHorizontalScrollMode(QAbstractItemView.ScrollPerPixel)
-
-    table_widget.setColumnWidth(1, 120)  # 장소명
-    table_widget.setColumnWidth(2, 120)  # 카테고리
-    table_widget.setColumnWidth(3, 240)  # 주소
-    table_widget.setColumnWidth(4, 160)  # 키워드
-    table_widget.setColumnWidth(6, 280)  # 리뷰 요약
-    table_widget.setColumnWidth(7, 320)  # 소개
-
-    table_widget.verticalHeader().setSectionResizeMode(QHeaderView.ResizeToContents)
-    table_widget.setEditTriggers(QAbstractItemView.NoEditTriggers)
-    table_widget.setWordWrap(True)
\ No newline at end of file
+    table_view.setHorizontalScrollBarPolicy(Qt.ScrollBarAsNeeded)
+    table_view.setHorizontalScrollMode(QAbstractItemView.ScrollPerPixel)
+
+    table_view.setColumnWidth(0, 32)   # 체크
+    table_view.setColumnWidth(1, 120)  # 장소명
+    table_view.setColumnWidth(2, 120)  # 카테고리
+    table_view.setColumnWidth(3, 240)  # 주소
+    table_view.setColumnWidth(4, 160)  # 키워드
+    table_view.setColumnWidth(5, 80)   # 이 리뷰수
+    table_view.setColumnWidth(6, 280)  # 리뷰 요약
+    table_view.setColumnWidth(7, 320)  # 소개
+
+    # 내용 기준 자동 높이(ResizeToContents)는 모든 행을 측정하므로 고정 높이 + 수동 조절
+    vheader = table_view.verticalHeader()
+    vheader.setSectionResizeMode(QHeaderView.Interactive)
+    vheader.setDefaultSectionSize(60)
+    table_view.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+    table_view.setEditTriggers(QAbstractItemView.NoEditTriggers)
+    table_view.setWordWrap(True)
+    return model, proxy
\ No newline at end of file
@@ -57,6 +57,8 @@ import os
 import sys
 from dotenv import load_dotenv
 
+import http_client
+
 # Custom print function to log to a file with UTF-8 encoding
 def custom_print(*args, **kwargs):
     print(*args, **kwargs)
@@ -136,7 +138,7 @@ class WeatherAPI:
         # --- DEBUGGING PRINTS END ---
         
         try:
-            response = requests.get(self.kakao_url, headers=headers, params=params, timeout=REQUEST_TIMEOUT)
+            response = http_client.get(self.kakao_url, headers=headers, params=params, timeout=REQUEST_TIMEOUT)
             if response.status_code == 200:
                 data = response.json()
                 if data['documents']:
@@ -346,7 +348,7 @@ class WeatherAPI:
                     'nx': str(grid_x), 'ny': str(grid_y)
                 }
                 
-                response = requests.get(self.kma_current_url, params=params, timeout=REQUEST_TIMEOUT)
+                response = http_client.get(self.kma_current_url, params=params, timeout=REQUEST_TIMEOUT)
                 print(f"   📡 응답 코드: {response.status_code}")
 
                 if response.status_code != 200:
@@ -455,7 +457,7 @@ class WeatherAPI:
                     'nx': str(grid_x), 'ny': str(grid_y)
                 }
                 
-                response = requests.get(self.kma_forecast_url, params=params, timeout=REQUEST_TIMEOUT)
+                response = http_client.get(self.kma_forecast_url, params=params, timeout=REQUEST_TIMEOUT)
                 print(f"   📡 응답 코드: {response.status_code}")
 
                 if response.status_code != 200:
@@ -591,7 +593,7 @@ class WeatherAPI:
                     'base_time': '2300', 'nx': str(grid_x), 'ny': str(grid_y)
                 }
                 
-                response = requests.get(self.kma_forecast_url, params=params, timeout=REQUEST_TIMEOUT)
+                response = http_client.get(self.kma_forecast_url, params=params, timeout=REQUEST_TIMEOUT)
 
                 if response.status_code != 200:
                     print(f"      ❌ HTTP 오류: {response.status_code}")
@@ -29,15 +29,15 @@
 #    - 특보 기사 생성: 발효 중인 특보 순환 선택
 #    - 기사 복사 기능
 #
-# 【비동기 처리】
-# - WeatherThread: 날씨 조회 백그라운드 처리
-# - WeatherWarningThread: 기상특보 조회 스레드
-# - ArticleGenerationThread: AI 기사 생성 스레드
+# 【비동기 처리】 (task_pool.py 공용 스레드 풀에서 실행, 동시 실행 수 APP_MAX_WORKERS)
+# - WeatherThread: 날씨 조회 작업 (선택한 지역마다 하나)
+# - WeatherWarningThread: 기상특보 조회 작업
+# - ArticleGenerationThread: AI 기사 생성 작업
 #
 # 【사용자 편의성】
 # - 빠른 검색: 주요 8개 도시 원클릭 검색
 # - 자동 지역명 확장: "광주" → "광주광역시"
-# - 진행 상황 표시: 각 작업 단계별 상태 메시지
+# - 진행 상황 표시: 각 작업 단계별 상태 메시지 + 작업 로그(LogView)
 # - 오류 처리: 친화적 오류 메시지 및 대안 제시
 #
 # 【데이터 연동】
@@ -62,10 +62,12 @@
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QGroupBox, 
                              QLineEdit, QPushButton, QLabel, QScrollArea, QApplication, QMessageBox,
                              QTabWidget, QComboBox, QTextEdit)
-from PyQt5.QtCore import Qt, QThread, pyqtSignal, QTimer
+from PyQt5.QtCore import Qt, pyqtSignal, QTimer
 from datetime import datetime
 
 from ui_components import CheckableComboBox
+from task_pool import PoolTask
+from log_view import LogView
 
 # 기존 모듈 import
 try:
@@ -117,17 +119,21 @@ def _expand_to_canonical(q: str) -> str:
         return "광주광역시 " + q.split(" ", 1)[1]
     return q
 
-class WeatherThread(QThread):
-    """날씨 검색 스레드"""
-    weather_received = pyqtSignal(dict)
-    error_occurred = pyqtSignal(str)
+class WeatherThread(PoolTask):
+    """날씨 검색 작업"""
+    class Signals(PoolTask.Signals):
+        weather_received = pyqtSignal(dict)
+        error_occurred = pyqtSignal(str)
     
     def __init__(self, city_name, weather_api):
-        super().__init__()
+        super().__init__(name=f"날씨 조회: {city_name}", group="weather")
         self.city_name = city_name
         self.weather_api = weather_api
     
-    def run(self):
+    def run_task(self):
+        # 새 조회로 대체되어 대기 중에 취소된 작업은 건너뜀
+        if self.cancel_token.cancelled:
+            return
         if not self.weather_api:
             self.error_occurred.emit("날씨 API가 설정되지 않았습니다.")
             return
@@ -137,17 +143,18 @@ class WeatherThread(QThread):
         except Exception as e:
             self.error_occurred.emit(str(e))
 
-class WeatherWarningThread(QThread):
-    """기상특보 조회 스레드 - 전국 기준으로 고정"""
-    warning_received = pyqtSignal(list)
-    error_occurred = pyqtSignal(str)
+class WeatherWarningThread(PoolTask):
+    """기상특보 조회 작업 - 전국 기준으로 고정"""
+    class Signals(PoolTask.Signals):
+        warning_received = pyqtSignal(list)
+        error_occurred = pyqtSignal(str)
     
     def __init__(self):
-        super().__init__()
+        super().__init__(name="기상특보 조회", group="weather")
         if WARNING_AVAILABLE:
             self.warning_api = WeatherWarningAPI()
     
-    def run(self):
+    def run_task(self):
         if not WARNING_AVAILABLE:
             self.error_occurred.emit("기상특보 API가 설정되지 않았습니다.")
             return
@@ -158,19 +165,20 @@ class WeatherWarningThread(QThread):
         except Exception as e:
             self.error_occurred.emit(str(e))
 
-class ArticleGenerationThread(QThread):
-    """AI 기사 생성 스레드"""
-    article_generated = pyqtSignal(dict)
-    error_occurred = pyqtSignal(str)
+class ArticleGenerationThread(PoolTask):
+    """AI 기사 생성 작업"""
+    class Signals(PoolTask.Signals):
+        article_generated = pyqtSignal(dict)
+        error_occurred = pyqtSignal(str)
     
     def __init__(self, ai_generator, data, data_type, region_names):
-        super().__init__()
+        super().__init__(name=f"AI 기사 생성: {data_type}", group="weather")
         self.ai_generator = ai_generator # 외부에서 생성된 인스턴스 사용
         self.data = data
         self.data_type = data_type
         self.region_names = region_names
     
-    def run(self):
+    def run_task(self):
         if not AI_AVAILABLE:
             self.error_occurred.emit("AI 기사 생성기가 설정되지 않았습니다.")
             return
@@ -365,6 +373,10 @@ class SimpleWeatherTabWidget(QWidget):
         self.article_status_label = QLabel("AI 기사 생성 대기 중...")
         self.article_status_label.setStyleSheet("color: #6c757d; font-style: italic; padding: 5px;")
         layout.addWidget(self.article_status_label)
+
+        # 조회/생성 작업 로그 (지역별 성공·실패 기록)
+        self.task_log = LogView(title="작업 로그", min_height=80)
+        layout.addWidget(self.task_log)
         
         return widget
     
@@ -378,11 +390,22 @@ class SimpleWeatherTabWidget(QWidget):
         self._start_weather_threads(cities)
         
     def _start_weather_threads(self, cities):
+        # 이전 조회 작업의 결과가 새 조회 결과에 섞이지 않도록 연결 해제 후 취소
+        for thread in getattr(self, "_threads", []):
+            try:
+                thread.weather_received.disconnect()
+                thread.error_occurred.disconnect()
+            except Exception:
+                pass
+            thread.stop()
         self.weather_info_label.setText(f"'{', '.join(cities)}' 날씨 조회 중...")
+        self.task_log.append(f"날씨 조회 시작: {len(cities)}개 지역")
         self.generate_weather_article_btn.setEnabled(False)
         self._weather_results = []
+        self._weather_failed = 0
         self._last_cities = cities
         self._threads = []
+        # 작업은 공용 스레드 풀에서 실행 (17개 시·도를 골라도 동시 실행은 APP_MAX_WORKERS개)
         for city in cities:
             thread = WeatherThread(city, self.weather_api)
             thread.weather_received.connect(self._on_weather_ok)
@@ -392,7 +415,13 @@ class SimpleWeatherTabWidget(QWidget):
 
     def _on_weather_ok(self, data: dict):
         self._weather_results.append(data)
-        if len(self._weather_results) == len(self._last_cities):
+        city = data.get('region_info', {}).get('user_input', '') if isinstance(data, dict) else ''
+        self.task_log.append(f"✅ {city} 날씨 수신 ({len(self._weather_results) + self._weather_failed}/{len(self._last_cities)})")
+        self._finish_weather_if_done()
+
+    def _finish_weather_if_done(self):
+        # 일부 지역이 실패해도 나머지 결과는 표시
+        if len(self._weather_results) + self._weather_failed == len(self._last_cities) and self._weather_results:
             self.weather_info_label.setText("")
             full_text = ""
             for result in self._weather_results:
@@ -411,8 +440,11 @@ class SimpleWeatherTabWidget(QWidget):
             self.article_status_label.setText("날씨 정보 준비됨 - 기사 생성 가능")
 
     def _on_weather_err(self, msg: str):
+        self._weather_failed += 1
+        self.task_log.append(f"❌ 날씨 조회 실패: {msg}")
         QMessageBox.warning(self, "날씨 오류", msg)
         self.weather_info_label.setText(f"오류: {msg}")
+        self._finish_weather_if_done()
 
     # 기상특보 관련 메서드들 - 전국 기준으로 간소화
     def search_warnings(self):
@@ -444,6 +476,7 @@ class SimpleWeatherTabWidget(QWidget):
         
         if warnings:
             self.warning_status_label.setText(f"{len(warnings)}건의 기상특보 발견")
+            self.task_log.append(f"✅ 기상특보 {len(warnings)}건 수신")
             self.generate_warning_article_btn.setEnabled(True)
             self.article_status_label.setText("기상특보 정보 준비됨 - 기사 생성 가능")
         else:
@@ -454,6 +487,7 @@ class SimpleWeatherTabWidget(QWidget):
         QMessageBox.warning(self, "기상특보 오류", msg)
         self.warning_info_label.setText(f"오류: {msg}")
         self.warning_status_label.setText("조회 실패")
+        self.task_log.append(f"❌ 기상특보 조회 실패: {msg}")
     
     # AI 기사 생성 관련 메서드들
     def generate_weather_article(self):
@@ -515,6 +549,7 @@ class SimpleWeatherTabWidget(QWidget):
         # 상태 업데이트
         type_text = "날씨" if article.get('type') == 'weather' else "기상특보"
         self.article_status_label.setText(f"{type_text} 기사 생성 완료!")
+        self.task_log.append(f"✅ {type_text} 기사 생성 완료")
         QMessageBox.information(self, "기사 생성 완료", f"{type_text} 기사가 성공적으로 생성되었습니다!")
     
     def _on_article_error(self, error_msg: str):
@@ -526,6 +561,7 @@ class SimpleWeatherTabWidget(QWidget):
         self.generate_warning_article_btn.setEnabled(bool(self._last_warnings))
         
         self.article_status_label.setText("기사 생성 실패")
+        self.task_log.append(f"❌ 기사 생성 실패: {error_msg}")
     
     def copy_article(self):
         """기사 복사"""
@@ -694,6 +694,21 @@ def fetch_articles_paged(session: requests.Session, config: CrawlConfig, query:
 # =========================
 # ✅ 본문/이미지 추출(HTML)
 # =========================
+# lxml(C 구현)이 있으면 사용하고, 없거나 실패하면 html.parser로 폴백
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = "lxml"
+except Exception:
+    HTML_PARSER = "html.parser"
+
+
+def make_soup(html: str) -> BeautifulSoup:
+    try:
+        return BeautifulSoup(html, HTML_PARSER)
+    except Exception:
+        return BeautifulSoup(html, "html.parser")
+
+
 def try_extract_from_jsonld_text(soup: BeautifulSoup):
     scripts = soup.find_all("script", attrs={"type": "application/ld+json"})
     for sc in scripts:
@@ -755,7 +770,7 @@ def best_text_block_by_heuristic(soup: BeautifulSoup):
     return best_text, best_src
 
 def extract_yna_content(html: str):
-    soup = BeautifulSoup(html, "html.parser")
+    soup = make_soup(html)
 
     for t in soup(["script", "style", "noscript"]):
         t.decompose()
@@ -801,7 +816,7 @@ def extract_yna_content(html: str):
     return "", "empty"
 
 def extract_yna_images(html: str, article_url: str):
-    soup = BeautifulSoup(html, "html.parser")
+    soup = make_soup(html)
     urls = []
     source = "empty"
 